@@ -42,6 +42,8 @@ namespace awkward {
 
     /// @brief Removes all accumulated data without resetting the type
     /// knowledge.
+    ///
+    /// This is not allowed while a list, tuple, or record is open.
     void
       clear();
 
@@ -61,6 +63,16 @@ namespace awkward {
     void
       real(double x);
 
+    /// @brief Adds `length` integer values from `x` to the accumulated
+    /// data, copying them as a block where possible.
+    void
+      integers(const int64_t* x, int64_t length);
+
+    /// @brief Adds `length` real values from `x` to the accumulated data,
+    /// copying them as a block where possible.
+    void
+      reals(const double* x, int64_t length);
+
     /// @brief Adds a complex value `x` to the accumulated data.
     void
       complex(std::complex<double> x);
@@ -28,6 +28,15 @@ namespace awkward {
     virtual void
       copy_buffer(const std::string& name, const void* source, int64_t num_bytes) = 0;
 
+    /// @brief Allocate an uninitialized buffer with `name` and `num_bytes`
+    /// in the BuffersContainer and return a pointer to it, for the caller
+    /// to fill.
+    ///
+    /// In Python, this allocates a NumPy array. A BuffersContainer that
+    /// does not keep any data may return `nullptr`.
+    virtual void*
+      empty_buffer(const std::string& name, int64_t num_bytes) = 0;
+
     /// @brief Create an array initialized to a given fill value.
     virtual void
       full_buffer(const std::string& name, int64_t length, int64_t value, const std::string& dtype) = 0;
@@ -83,6 +92,22 @@ namespace awkward {
     virtual const BuilderPtr
       real(double x) = 0;
 
+    /// @brief Adds `length` integer values from `x` to the accumulated
+    /// data, as though #integer were called for each of them.
+    ///
+    /// Builders that store integers directly override this to copy them
+    /// as a block.
+    virtual const BuilderPtr
+      integers(const int64_t* x, int64_t length);
+
+    /// @brief Adds `length` real values from `x` to the accumulated data,
+    /// as though #real were called for each of them.
+    ///
+    /// Builders that store real numbers directly override this to copy
+    /// them as a block.
+    virtual const BuilderPtr
+      reals(const double* x, int64_t length);
+
     /// @brief Adds a complex value `x` to the accumulated data.
     virtual const BuilderPtr
       complex(std::complex<double> x) = 0;
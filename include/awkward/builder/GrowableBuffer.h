@@ -8,26 +8,25 @@
 #include "awkward/kernel-dispatch.h"
 
 #include <memory>
+#include <vector>
 
 namespace awkward {
   /// @class GrowableBuffer
   ///
-  /// @brief Contiguous, one-dimensional array that can grow indefinitely
-  /// by calling #append.
+  /// @brief One-dimensional array that can grow indefinitely by calling
+  /// #append, stored as a sequence of panels.
   ///
   /// Configured by ArrayBuilderOptions, the buffer starts by reserving
-  /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial} slots.
-  /// When the number of slots used reaches the number reserved, a new
-  /// buffer is allocated that is
+  /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial} slots
+  /// in its first panel. When the number of slots used reaches the number
+  /// reserved, a new panel is allocated that makes the total reservation
   /// {@link ArrayBuilderOptions#resize ArrayBuilderOptions::resize} times
-  /// larger. Thus, a logarithmic number of reallocations are needed as
-  /// data grow.
+  /// larger. Thus, a logarithmic number of allocations are needed as data
+  /// grow, and data already filled are never copied or moved.
   ///
-  /// When {@link ArrayBuilder#snapshot ArrayBuilder::snapshot} is called,
-  /// these buffers are copied to the new Content array.
-  ///
-  /// If a GrowableBuffer resizes itself by allocating a new array, it
-  /// copies the buffer it owns.
+  /// The panels are concatenated into a contiguous array only when
+  /// the data are taken out, with #concatenate (which is what
+  /// {@link ArrayBuilder#to_buffers ArrayBuilder::to_buffers} does).
   template <typename T>
   class LIBAWKWARD_EXPORT_SYMBOL GrowableBuffer {
     using UniquePtrDeleter = decltype(kernel::array_deleter<T>());
@@ -76,12 +75,12 @@ namespace awkward {
     /// @brief Creates a GrowableBuffer from a full set of parameters.
     ///
     /// @param options Configuration options for building an array.
-    /// @param ptr Reference-counted pointer to the array buffer.
+    /// @param ptr Unique pointer to the first panel.
     /// @param length Currently used number of elements.
     /// @param reserved Currently allocated number of elements.
     ///
     /// Although the #length increments every time #append is called,
-    /// it is always less than or equal to #reserved because of reallocations.
+    /// it is always less than or equal to #reserved because of allocations.
     GrowableBuffer(const ArrayBuilderOptions& options,
                    GrowableBuffer::UniquePtr ptr,
                    size_t length,
@@ -92,67 +91,86 @@ namespace awkward {
     /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial}.
     GrowableBuffer(const ArrayBuilderOptions& options);
 
-    /// @brief Reference to a unique pointer to the array buffer.
-    const GrowableBuffer::UniquePtr&
-      ptr() const;
-
     /// @brief FIXME: needed for uproot.cpp - remove when it's gone.
-    /// Note, it transfers ownership of the array buffer.
+    /// Note, it transfers ownership of the array buffer, concatenating
+    /// the panels first if there is more than one.
     GrowableBuffer::UniquePtr
       get_ptr();
 
     /// @brief Currently used number of elements.
     ///
     /// Although the #length increments every time #append is called,
-    /// it is always less than or equal to #reserved because of reallocations.
+    /// it is always less than or equal to #reserved because of allocations.
     size_t
       length() const;
 
-    /// @brief Changes the #length in-place and possibly reallocate.
-    ///
-    /// If the `newlength` is larger than #reserved, #ptr is reallocated.
-    void
-      set_length(size_t newlength);
-
-    /// @brief Currently allocated number of elements.
+    /// @brief Currently allocated number of elements, in all panels.
     ///
     /// Although the #length increments every time #append is called,
-    /// it is always less than or equal to #reserved because of reallocations.
+    /// it is always less than or equal to #reserved because of allocations.
     size_t
       reserved() const;
 
-    /// @brief Possibly changes the #reserved and reallocate.
-    ///
-    /// The parameter only guarantees that at least `minreserved` is reserved;
-    /// if an amount less than #reserved is requested, nothing changes.
-    ///
-    /// If #reserved actually changes, #ptr is reallocated.
-    void
-      set_reserved(size_t minreserved);
+    /// @brief Number of panels that the data are stored in.
+    size_t
+      num_panels() const;
 
     /// @brief Discards accumulated data, the #reserved returns to
     /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial},
-    /// and a new #ptr is allocated.
+    /// and a new first panel is allocated.
     void
       clear();
 
-    /// @brief Inserts one `datum` into the array, possibly triggering a
-    /// reallocation.
+    /// @brief Inserts one `datum` into the array, possibly allocating a
+    /// new panel.
     ///
     /// This increases the #length by 1; if the new #length is larger than
-    /// #reserved, a new #ptr will be allocated.
+    /// #reserved, a new panel will be allocated.
     void
       append(T datum);
 
+    /// @brief Inserts `length` elements from `ptr` into the array, copying
+    /// them as blocks, and allocating at most one new panel.
+    ///
+    /// This is equivalent to calling #append on each element.
+    void
+      extend(const T* ptr, size_t length);
+
     /// @brief Returns the element at a given position in the array, without
     /// handling negative indexing or bounds-checking.
     T
       getitem_at_nowrap(int64_t at) const;
 
+    /// @brief Copies all of the panels, in order, into a contiguous array
+    /// of at least #length elements.
+    ///
+    /// If `external_pointer` is `nullptr`, nothing is copied.
+    void
+      concatenate(T* external_pointer) const;
+
+    /// @brief Returns a new GrowableBuffer with the same data, converted
+    /// to type `TO`, and the same #reserved.
+    template <typename TO>
+    GrowableBuffer<TO>
+      copy_as() const;
+
   private:
+    /// @brief Allocates a new panel with `reserved` slots and makes it
+    /// the one being filled.
+    void
+      add_panel(size_t reserved);
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
-    UniquePtr ptr_;
+    // @brief The panels, in order; the last one is being filled.
+    std::vector<UniquePtr> panels_;
+    // @brief Number of elements in each panel except the last.
+    std::vector<size_t> panel_lengths_;
+    // @brief Raw pointer to the last panel.
+    T* ptr_;
+    // @brief Number of elements in the last panel.
+    size_t panel_length_;
+    // @brief Number of slots in the last panel.
+    size_t panel_reserved_;
     // @brief See #length.
     size_t length_;
     // @brief See #reserved.
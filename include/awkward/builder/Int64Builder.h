@@ -64,6 +64,9 @@ namespace awkward {
     const BuilderPtr
       real(double x) override;
 
+    const BuilderPtr
+      integers(const int64_t* x, int64_t length) override;
+
     const BuilderPtr
       complex(std::complex<double> x) override;
 
@@ -4,6 +4,7 @@
 #define AWKWARD_FORTHINPUTBUFFER_H_
 
 #include <memory>
+#include <string>
 
 #include "awkward/common.h"
 #include "awkward/util.h"
@@ -21,6 +22,14 @@ namespace awkward {
                      int64_t offset,
                      int64_t length);
 
+    /// @brief Memory-maps the file at `path` instead of reading it.
+    ///
+    /// The mapping is private: if `writable`, pages are copied on write
+    /// and changes never reach the file. The mapping is released when the
+    /// last shared pointer to it (see #ptr) is destroyed.
+    ForthInputBuffer(const std::string& path,
+                     bool writable=false);
+
     /// @brief HERE
     uint8_t
       peek_byte(int64_t after, util::ForthError& err) noexcept;
@@ -32,7 +32,8 @@ namespace awkward {
                    int64_t recursion_max_depth=1024,
                    int64_t string_buffer_size=1024,
                    int64_t output_initial_size=1024,
-                   double output_resize_factor=1.5);
+                   double output_resize_factor=1.5,
+                   bool optimize=false);
 
     ~ForthMachineOf();
 
@@ -81,6 +82,11 @@ namespace awkward {
     double
       output_resize_factor() const noexcept;
 
+    /// @brief If true, common sequences of instructions were fused into
+    /// superinstructions when the source was compiled.
+    bool
+      optimize() const noexcept;
+
     /// @brief HERE
     const std::vector<T>
       stack() const;
@@ -167,53 +173,57 @@ namespace awkward {
     const std::shared_ptr<ForthOutputBuffer>
       output_at(int64_t index) const noexcept;
 
-    /// @brief HERE
+    /// @brief Returns the output as a NumpyArray that shares its memory.
+    ///
+    /// If `steal`, the memory is first trimmed to the output's length and
+    /// then handed over to the returned array, leaving the output empty.
+    /// The same applies to all of the `output_*_at` methods.
     const ContentPtr
-      output_NumpyArray_at(const std::string& name) const;
+      output_NumpyArray_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const ContentPtr
-      output_NumpyArray_at(int64_t index) const;
+      output_NumpyArray_at(int64_t index, bool steal=false) const;
 
     /// @brief HERE
     const Index8
-      output_Index8_at(const std::string& name) const;
+      output_Index8_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const Index8
-      output_Index8_at(int64_t index) const;
+      output_Index8_at(int64_t index, bool steal=false) const;
 
     /// @brief HERE
     const IndexU8
-      output_IndexU8_at(const std::string& name) const;
+      output_IndexU8_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const IndexU8
-      output_IndexU8_at(int64_t index) const;
+      output_IndexU8_at(int64_t index, bool steal=false) const;
 
     /// @brief HERE
     const Index32
-      output_Index32_at(const std::string& name) const;
+      output_Index32_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const Index32
-      output_Index32_at(int64_t index) const;
+      output_Index32_at(int64_t index, bool steal=false) const;
 
     /// @brief HERE
     const IndexU32
-      output_IndexU32_at(const std::string& name) const;
+      output_IndexU32_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const IndexU32
-      output_IndexU32_at(int64_t index) const;
+      output_IndexU32_at(int64_t index, bool steal=false) const;
 
     /// @brief HERE
     const Index64
-      output_Index64_at(const std::string& name) const;
+      output_Index64_at(const std::string& name, bool steal=false) const;
 
     /// @brief HERE
     const Index64
-      output_Index64_at(int64_t index) const;
+      output_Index64_at(int64_t index, bool steal=false) const;
 
     /// @brief Returns a string at 'index'.
     /// The strings are defined with an 's"' core word.
@@ -383,6 +393,15 @@ namespace awkward {
             int64_t exitdepth,
             int64_t dodepth);
 
+    /// @brief Peephole pass over the compiled bytecodes that replaces common
+    /// sequences of instructions with single superinstructions.
+    ///
+    /// Each segment is rewritten independently; since control flow only ever
+    /// enters a segment at its beginning, fusing adjacent instructions cannot
+    /// change which instruction a branch lands on.
+    void
+      optimize_bytecodes();
+
     /// @brief HERE
     void
       internal_run(bool single_step, int64_t recursion_target_depth_top); // noexcept
@@ -545,6 +564,7 @@ namespace awkward {
     std::string source_;
     int64_t output_initial_size_;
     double output_resize_factor_;
+    bool optimize_;
 
     T* stack_buffer_;
     int64_t stack_depth_;
@@ -4,6 +4,7 @@
 #define AWKWARD_FORTHOUTPUTBUFFER_H_
 
 // #include <cstring>
+#include <cstdlib>
 
 #include "awkward/common.h"
 #include "awkward/Content.h"
@@ -21,6 +22,21 @@ namespace awkward {
   /// @brief HERE
   void byteswap64(int64_t num_items, void* ptr);
 
+  /// @brief Deleter for ForthOutputBuffer memory, which is allocated with
+  /// `malloc` so that it can be grown or shrunk with `realloc`.
+  ///
+  /// When a buffer is reallocated in place, the deleter of the shared pointer
+  /// that owned the old address is disarmed.
+  template <typename OUT>
+  struct realloc_deleter {
+    bool armed = true;
+    void operator()(OUT* p) const {
+      if (armed) {
+        free(p);
+      }
+    }
+  };
+
   /// @class ForthOutputBuffer
   ///
   /// @brief HERE
@@ -55,6 +71,18 @@ namespace awkward {
     virtual const std::shared_ptr<void>
       ptr() const noexcept = 0;
 
+    /// @brief Shrinks the reserved memory to #len items. This happens in
+    /// place (without copying) unless an array still shares the buffer, in
+    /// which case nothing is done.
+    virtual void
+      trim() = 0;
+
+    /// @brief Leaves the current memory to the arrays that share it (through
+    /// #ptr or one of the `to*` methods) and starts a new, empty buffer, so
+    /// that later writes can't change those arrays.
+    virtual void
+      release() = 0;
+
     /// @brief HERE
     virtual const ContentPtr
       toNumpyArray() const = 0;
@@ -202,6 +230,7 @@ namespace awkward {
   protected:
     int64_t length_;
     int64_t reserved_;
+    int64_t initial_;
     double resize_;
   };
 
@@ -216,6 +245,12 @@ namespace awkward {
     const std::shared_ptr<void>
       ptr() const noexcept override;
 
+    void
+      trim() override;
+
+    void
+      release() override;
+
     const ContentPtr
       toNumpyArray() const override;
 
@@ -330,6 +365,11 @@ namespace awkward {
     void
       maybe_resize(int64_t next);
 
+    /// @brief Changes the reserved memory to `reservation` items, keeping
+    /// the first #len of them.
+    void
+      reallocate(int64_t reservation);
+
     /// @brief HERE
     template <typename IN>
     inline void write_one(IN value) noexcept {
@@ -89,6 +89,15 @@ namespace {
         container_[py::str(name)] = pyarray;
       }
 
+    void*
+      empty_buffer(const std::string& name, int64_t num_bytes) override {
+        py::object pyarray = py::module::import("numpy").attr("empty")(num_bytes, "u1");
+        py::array_t<uint8_t> rawarray = pyarray.cast<py::array_t<uint8_t>>();
+        py::buffer_info rawinfo = rawarray.request();
+        container_[py::str(name)] = pyarray;
+        return rawinfo.ptr;
+      }
+
     void
       full_buffer(const std::string& name, int64_t length, int64_t value, const std::string& dtype) override {
         py::object pyarray = py::module::import("numpy").attr("full")(py::int_(length), py::int_(value), py::str(dtype));
@@ -104,6 +113,11 @@ namespace {
     void
       copy_buffer(const std::string& name, const void* source, int64_t num_bytes) override { }
 
+    void*
+      empty_buffer(const std::string& name, int64_t num_bytes) override {
+        return nullptr;
+      }
+
     void
       full_buffer(const std::string& name, int64_t length, int64_t value, const std::string& dtype) override { }
   };
@@ -14,6 +14,10 @@ import awkward._v2._typetracer
 # internal
 import awkward._v2._util
 import awkward._v2._lookup
+import awkward._v2.parallel
+import awkward._v2._moments
+import awkward._v2._scans
+import awkward._v2._unique
 
 # third-party connectors
 import awkward._v2._connect.numpy
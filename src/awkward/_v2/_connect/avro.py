@@ -76,7 +76,7 @@ class ReadAvroFT:
         if debug_forth:
             print(forth_code)  # noqa: T201
 
-        machine = awkward.forth.ForthMachine64(forth_code)
+        machine = awkward.forth.ForthMachine64(forth_code, optimize=True)
         break_flag = False
         while True:
             try:
@@ -116,9 +116,9 @@ class ReadAvroFT:
 
         for elem in form_keys:
             if "offsets" in elem:
-                container[elem] = machine.output_Index64(elem)
+                container[elem] = machine.output_Index64(elem, steal=True)
             else:
-                container[elem] = machine.output_NumpyArray(elem)
+                container[elem] = machine.output_NumpyArray(elem, steal=True)
 
         self.outcontents = (self.form, self.blocks, container)
 
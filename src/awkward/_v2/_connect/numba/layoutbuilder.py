@@ -0,0 +1,585 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import ctypes
+import math
+import weakref
+
+import numba
+import numba.core.typing.templates
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+# Unlike ArrayBuilder, whose methods are calls through function pointers into
+# the type-discovering C++ builder, a LayoutBuilder has a Form that is fixed in
+# advance and its Numba type is specialized to that Form. Each node of the Form
+# has three int64 slots in a single 'state' array,
+#
+#     state[offset + 0]    length of the node
+#     state[offset + 1]    number of items reserved in the node's buffer
+#     state[offset + 2]    address of the node's buffer (0 if it has none)
+#
+# and the offset of each node is a compile-time constant of its type, so an
+# append is compiled into a bounds check and a store, with no type discovery.
+# Buffers are allocated with PyMem_Raw* so that they can be grown in compiled
+# code without reference-counted arrays in the fast path.
+
+_PyMem_RawMalloc = ctypes.CFUNCTYPE(ctypes.c_size_t, ctypes.c_size_t)(
+    ctypes.cast(ctypes.pythonapi.PyMem_RawMalloc, ctypes.c_void_p).value
+)
+_PyMem_RawRealloc = ctypes.CFUNCTYPE(ctypes.c_size_t, ctypes.c_size_t, ctypes.c_size_t)(
+    ctypes.cast(ctypes.pythonapi.PyMem_RawRealloc, ctypes.c_void_p).value
+)
+_PyMem_RawFree = ctypes.CFUNCTYPE(None, ctypes.c_size_t)(
+    ctypes.cast(ctypes.pythonapi.PyMem_RawFree, ctypes.c_void_p).value
+)
+
+_index_dtype = {v: k for k, v in ak._v2.index._dtype_to_form.items()}
+
+_reserved_names = {
+    "length",
+    "content",
+    "append",
+    "extend",
+    "clear",
+    "begin_list",
+    "end_list",
+    "append_null",
+    "append_valid",
+    "end_record",
+}
+
+
+def check_form(form):
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        if len(form.inner_shape) != 0:
+            raise ak._v2._util.error(
+                NotImplementedError(
+                    "LayoutBuilder for NumpyForm with inner_shape; use RegularForm"
+                )
+            )
+
+    elif isinstance(
+        form,
+        (
+            ak._v2.forms.ListOffsetForm,
+            ak._v2.forms.RegularForm,
+            ak._v2.forms.IndexedOptionForm,
+            ak._v2.forms.UnmaskedForm,
+        ),
+    ):
+        check_form(form.content)
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        if not form.is_tuple:
+            for field in form.fields:
+                if not field.isidentifier() or field in _reserved_names:
+                    raise ak._v2._util.error(
+                        ValueError(
+                            f"record field {field!r} cannot be a LayoutBuilder "
+                            "attribute; fields must be Python identifiers other than "
+                            + ", ".join(repr(x) for x in sorted(_reserved_names))
+                        )
+                    )
+        for content in form.contents:
+            check_form(content)
+
+    else:
+        raise ak._v2._util.error(
+            NotImplementedError(
+                f"LayoutBuilder for {type(form).__name__}; supported forms are "
+                "NumpyForm, ListOffsetForm, RegularForm, IndexedOptionForm, "
+                "UnmaskedForm, and RecordForm"
+            )
+        )
+
+
+def buffer_dtype(form):
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        if dtype == np.dtype(np.bool_):
+            return np.dtype(np.uint8)
+        return dtype
+    elif isinstance(form, ak._v2.forms.ListOffsetForm):
+        return _index_dtype[form.offsets]
+    elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+        return _index_dtype[form.index]
+    else:
+        return None
+
+
+def children(form, offset):
+    """
+    Returns (attribute name, form, offset) for each child of a node.
+    """
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        pairs = []
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        if form.is_tuple:
+            names = [f"content{i}" for i in range(len(form.contents))]
+        else:
+            names = form.fields
+        pairs = list(zip(names, form.contents))
+    else:
+        pairs = [("content", form.content)]
+
+    out = []
+    offset += 3
+    for name, content in pairs:
+        out.append((name, content, offset))
+        offset += 3 * len(nodes(content, offset))
+    return out
+
+
+def nodes(form, offset):
+    """
+    Returns (form, offset) for a node and all of its descendants.
+    """
+    out = [(form, offset)]
+    for _, content, child_offset in children(form, offset):
+        out.extend(nodes(content, child_offset))
+    return out
+
+
+def _free_buffers(state):
+    for offset in range(0, len(state), 3):
+        address = int(state[offset + 2])
+        if address != 0:
+            state[offset + 2] = 0
+            _PyMem_RawFree(address)
+
+
+class LayoutBuilder:
+    """
+    Builds an array with a fixed Form in Numba-compiled functions; see
+    #ak._v2.numba.layout_builder.
+    """
+
+    def __init__(self, form, initial=1024, resize=1.5):
+        check_form(form)
+        if initial < 1:
+            raise ak._v2._util.error(ValueError("'initial' must be at least 1"))
+        if resize <= 1:
+            raise ak._v2._util.error(ValueError("'resize' must be greater than 1"))
+
+        self._form = form
+        self._resize = resize
+        self._nodes = nodes(form, 0)
+        self._state = numpy.zeros(3 * len(self._nodes), dtype=np.int64)
+        weakref.finalize(self, _free_buffers, self._state)
+
+        for node, offset in self._nodes:
+            dtype = buffer_dtype(node)
+            if dtype is not None:
+                reserved = initial
+                if isinstance(node, ak._v2.forms.ListOffsetForm):
+                    reserved += 1
+                address = _PyMem_RawMalloc(reserved * dtype.itemsize)
+                if not address:
+                    raise ak._v2._util.error(
+                        MemoryError("could not allocate LayoutBuilder buffer")
+                    )
+                self._state[offset + 1] = reserved
+                self._state[offset + 2] = address
+                if isinstance(node, ak._v2.forms.ListOffsetForm):
+                    self._buffer(node, offset, 1)[0] = 0
+
+    @property
+    def form(self):
+        return self._form
+
+    @property
+    def numba_type(self):
+        return LayoutBuilderType(self._form, 0, self._resize)
+
+    @property
+    def _state_address(self):
+        return self._state.ctypes.data
+
+    def __len__(self):
+        return int(self._state[0])
+
+    def __repr__(self):
+        return "<LayoutBuilder length={} type={}>".format(
+            len(self), repr(str(self._form.type))
+        )
+
+    def clear(self):
+        for _, offset in self._nodes:
+            self._state[offset] = 0
+
+    def _buffer(self, form, offset, length):
+        dtype = buffer_dtype(form)
+        raw = (ctypes.c_char * (length * dtype.itemsize)).from_address(
+            int(self._state[offset + 2])
+        )
+        return numpy.frombuffer(raw, dtype=dtype)
+
+    def snapshot(self, highlevel=True, behavior=None):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array,
+                if high-level.
+
+        Copies the data accumulated so far into an array. The LayoutBuilder
+        can continue to be filled afterward without affecting the array.
+        """
+        out = self._snapshot(self._form, 0)
+        return ak._v2._util.wrap(out, behavior, highlevel)
+
+    def _snapshot(self, form, offset):
+        length = int(self._state[offset])
+        contents = [
+            self._snapshot(content, child_offset)
+            for _, content, child_offset in children(form, offset)
+        ]
+
+        if isinstance(form, ak._v2.forms.NumpyForm):
+            data = self._buffer(form, offset, length).copy()
+            if form.primitive == "bool":
+                data = data.view(np.bool_)
+            return ak._v2.contents.NumpyArray(data, parameters=form.parameters)
+
+        elif isinstance(form, ak._v2.forms.ListOffsetForm):
+            return ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index(self._buffer(form, offset, length + 1).copy()),
+                contents[0],
+                parameters=form.parameters,
+            )
+
+        elif isinstance(form, ak._v2.forms.RegularForm):
+            if contents[0].length != length * form.size:
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"RegularForm of size {form.size} has {length} lists "
+                        f"but {contents[0].length} items in its content"
+                    )
+                )
+            return ak._v2.contents.RegularArray(
+                contents[0], form.size, zeros_length=length, parameters=form.parameters
+            )
+
+        elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+            return ak._v2.contents.IndexedOptionArray(
+                ak._v2.index.Index(self._buffer(form, offset, length).copy()),
+                contents[0],
+                parameters=form.parameters,
+            )
+
+        elif isinstance(form, ak._v2.forms.UnmaskedForm):
+            if contents[0].length != length:
+                raise ak._v2._util.error(
+                    ValueError(
+                        f"UnmaskedForm has {length} items "
+                        f"but {contents[0].length} items in its content"
+                    )
+                )
+            return ak._v2.contents.UnmaskedArray(
+                contents[0], parameters=form.parameters
+            )
+
+        else:
+            for field, content in zip(form.fields, contents):
+                if content.length != length:
+                    raise ak._v2._util.error(
+                        ValueError(
+                            f"RecordForm has {length} records "
+                            f"but {content.length} items in field {field!r}"
+                        )
+                    )
+            return ak._v2.contents.RecordArray(
+                contents,
+                None if form.is_tuple else form.fields,
+                length,
+                parameters=form.parameters,
+            )
+
+
+class LayoutBuilderType(numba.types.Type):
+    def __init__(self, form, offset, resize):
+        super().__init__(
+            name="ak2.LayoutBuilderType({}, {}, {})".format(
+                form.to_json(), offset, resize
+            )
+        )
+        self.form = form
+        self.offset = offset
+        self.resize = resize
+
+    def child(self, attr):
+        for name, content, offset in children(self.form, self.offset):
+            if name == attr:
+                return LayoutBuilderType(content, offset, self.resize)
+        return None
+
+    @property
+    def offsets(self):
+        return tuple(offset for _, offset in nodes(self.form, self.offset))
+
+    @property
+    def itemsize(self):
+        return buffer_dtype(self.form).itemsize
+
+
+@numba.extending.register_model(LayoutBuilderType)
+class LayoutBuilderModel(numba.core.datamodel.models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [("state", numba.types.CPointer(numba.int64))]
+        super().__init__(dmm, fe_type, members)
+
+
+@numba.extending.unbox(LayoutBuilderType)
+def unbox_LayoutBuilder(layoutbuildertype, layoutbuilderobj, c):
+    address_obj = c.pyapi.object_getattr_string(layoutbuilderobj, "_state_address")
+
+    proxyout = c.context.make_helper(c.builder, layoutbuildertype)
+    proxyout.state = c.builder.bitcast(
+        c.pyapi.long_as_voidptr(address_obj),
+        c.context.get_value_type(numba.types.CPointer(numba.int64)),
+    )
+
+    c.pyapi.decref(address_obj)
+
+    is_error = numba.core.cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
+    return numba.extending.NativeValue(proxyout._getvalue(), is_error)
+
+
+@numba.extending.intrinsic
+def _state(typingctx, layoutbuildertype):
+    def codegen(context, builder, sig, args):
+        proxyin = context.make_helper(builder, layoutbuildertype, args[0])
+        return proxyin.state
+
+    return numba.types.CPointer(numba.int64)(layoutbuildertype), codegen
+
+
+@numba.extending.intrinsic
+def _buffer(typingctx, layoutbuildertype):
+    pointertype = numba.types.CPointer(
+        numba.from_dtype(buffer_dtype(layoutbuildertype.form))
+    )
+
+    def codegen(context, builder, sig, args):
+        proxyin = context.make_helper(builder, layoutbuildertype, args[0])
+        address = builder.load(
+            builder.gep(
+                proxyin.state,
+                [context.get_constant(numba.intp, layoutbuildertype.offset + 2)],
+            )
+        )
+        return builder.inttoptr(address, context.get_value_type(pointertype))
+
+    return pointertype(layoutbuildertype), codegen
+
+
+@numba.njit
+def _grow(state, offset, itemsize, minimum, resize):
+    reserved = max(minimum, int(math.ceil(state[offset + 1] * resize)))
+    address = _PyMem_RawRealloc(state[offset + 2], reserved * itemsize)
+    if address == 0:
+        raise MemoryError("could not grow LayoutBuilder buffer")
+    state[offset + 1] = reserved
+    state[offset + 2] = address
+
+
+@numba.core.typing.templates.infer_getattr
+class type_attributes(numba.core.typing.templates.AttributeTemplate):
+    key = LayoutBuilderType
+
+    def generic_resolve(self, layoutbuildertype, attr):
+        if attr == "length":
+            return numba.int64
+        else:
+            return layoutbuildertype.child(attr)
+
+
+@numba.extending.lower_getattr_generic(LayoutBuilderType)
+def lower_getattr_generic(context, builder, layoutbuildertype, layoutbuilderval, attr):
+    proxyin = context.make_helper(builder, layoutbuildertype, layoutbuilderval)
+    if attr == "length":
+        return builder.load(
+            builder.gep(
+                proxyin.state,
+                [context.get_constant(numba.intp, layoutbuildertype.offset)],
+            )
+        )
+    else:
+        proxyout = context.make_helper(builder, layoutbuildertype.child(attr))
+        proxyout.state = proxyin.state
+        return proxyout._getvalue()
+
+
+@numba.extending.overload(len)
+def LayoutBuilder_len(layoutbuilder):
+    if isinstance(layoutbuilder, LayoutBuilderType):
+        offset = layoutbuilder.offset
+
+        def len_impl(layoutbuilder):
+            return _state(layoutbuilder)[offset]
+
+        return len_impl
+
+
+@numba.extending.overload_method(LayoutBuilderType, "clear")
+def LayoutBuilder_clear(layoutbuilder):
+    offsets = layoutbuilder.offsets
+
+    def clear(layoutbuilder):
+        state = _state(layoutbuilder)
+        for offset in offsets:
+            state[offset] = 0
+
+    return clear
+
+
+@numba.extending.overload_method(LayoutBuilderType, "append")
+def LayoutBuilder_append(layoutbuilder, x):
+    if isinstance(layoutbuilder.form, ak._v2.forms.NumpyForm):
+        offset, itemsize, resize = (
+            layoutbuilder.offset,
+            layoutbuilder.itemsize,
+            layoutbuilder.resize,
+        )
+
+        def append(layoutbuilder, x):
+            state = _state(layoutbuilder)
+            length = state[offset]
+            if length == state[offset + 1]:
+                _grow(state, offset, itemsize, length + 1, resize)
+            _buffer(layoutbuilder)[length] = x
+            state[offset] = length + 1
+
+        return append
+
+
+@numba.extending.overload_method(LayoutBuilderType, "extend")
+def LayoutBuilder_extend(layoutbuilder, xs):
+    if isinstance(layoutbuilder.form, ak._v2.forms.NumpyForm):
+        offset, itemsize, resize = (
+            layoutbuilder.offset,
+            layoutbuilder.itemsize,
+            layoutbuilder.resize,
+        )
+
+        def extend(layoutbuilder, xs):
+            state = _state(layoutbuilder)
+            length = state[offset]
+            stop = length + len(xs)
+            if stop > state[offset + 1]:
+                _grow(state, offset, itemsize, stop, resize)
+            buffer = _buffer(layoutbuilder)
+            for i in range(len(xs)):
+                buffer[length + i] = xs[i]
+            state[offset] = stop
+
+        return extend
+
+
+@numba.extending.overload_method(LayoutBuilderType, "begin_list")
+def LayoutBuilder_begin_list(layoutbuilder):
+    if isinstance(
+        layoutbuilder.form, (ak._v2.forms.ListOffsetForm, ak._v2.forms.RegularForm)
+    ):
+
+        def begin_list(layoutbuilder):
+            return layoutbuilder.content
+
+        return begin_list
+
+
+@numba.extending.overload_method(LayoutBuilderType, "end_list")
+def LayoutBuilder_end_list(layoutbuilder):
+    if isinstance(layoutbuilder.form, ak._v2.forms.ListOffsetForm):
+        offset, itemsize, resize = (
+            layoutbuilder.offset,
+            layoutbuilder.itemsize,
+            layoutbuilder.resize,
+        )
+        content_offset = layoutbuilder.child("content").offset
+
+        def end_list(layoutbuilder):
+            state = _state(layoutbuilder)
+            length = state[offset] + 1
+            if length == state[offset + 1]:
+                _grow(state, offset, itemsize, length + 1, resize)
+            _buffer(layoutbuilder)[length] = state[content_offset]
+            state[offset] = length
+
+        return end_list
+
+    elif isinstance(layoutbuilder.form, ak._v2.forms.RegularForm):
+        offset = layoutbuilder.offset
+
+        def end_list(layoutbuilder):
+            state = _state(layoutbuilder)
+            state[offset] += 1
+
+        return end_list
+
+
+@numba.extending.overload_method(LayoutBuilderType, "append_null")
+def LayoutBuilder_append_null(layoutbuilder):
+    if isinstance(layoutbuilder.form, ak._v2.forms.IndexedOptionForm):
+        offset, itemsize, resize = (
+            layoutbuilder.offset,
+            layoutbuilder.itemsize,
+            layoutbuilder.resize,
+        )
+
+        def append_null(layoutbuilder):
+            state = _state(layoutbuilder)
+            length = state[offset]
+            if length == state[offset + 1]:
+                _grow(state, offset, itemsize, length + 1, resize)
+            _buffer(layoutbuilder)[length] = -1
+            state[offset] = length + 1
+
+        return append_null
+
+
+@numba.extending.overload_method(LayoutBuilderType, "append_valid")
+def LayoutBuilder_append_valid(layoutbuilder):
+    if isinstance(layoutbuilder.form, ak._v2.forms.IndexedOptionForm):
+        offset, itemsize, resize = (
+            layoutbuilder.offset,
+            layoutbuilder.itemsize,
+            layoutbuilder.resize,
+        )
+        content_offset = layoutbuilder.child("content").offset
+
+        def append_valid(layoutbuilder):
+            state = _state(layoutbuilder)
+            length = state[offset]
+            if length == state[offset + 1]:
+                _grow(state, offset, itemsize, length + 1, resize)
+            _buffer(layoutbuilder)[length] = state[content_offset]
+            state[offset] = length + 1
+            return layoutbuilder.content
+
+        return append_valid
+
+    elif isinstance(layoutbuilder.form, ak._v2.forms.UnmaskedForm):
+        offset = layoutbuilder.offset
+
+        def append_valid(layoutbuilder):
+            state = _state(layoutbuilder)
+            state[offset] += 1
+            return layoutbuilder.content
+
+        return append_valid
+
+
+@numba.extending.overload_method(LayoutBuilderType, "end_record")
+def LayoutBuilder_end_record(layoutbuilder):
+    if isinstance(layoutbuilder.form, ak._v2.forms.RecordForm):
+        offset = layoutbuilder.offset
+
+        def end_record(layoutbuilder):
+            state = _state(layoutbuilder)
+            state[offset] += 1
+
+        return end_record
@@ -0,0 +1,224 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import functools
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# ak.mean, ak.var, ak.std, ak.moment, ak.covar and ak.corr are combinations of
+# ak.sum and ak.count over broadcasted temporaries, such as x*weight and
+# (x - mean)**2. When the values being combined are contiguous segments of a
+# NumPy buffer (lists of numbers at axis=-1, or all numbers at axis=None),
+# each segment is instead handled by one kernel call that sums the weights,
+# the weighted values and the squared deviations from the mean, segment by
+# segment, with no full-size temporaries. Everything else goes through the
+# reducers.
+#
+# The kernels accumulate in float64, whereas the reducers compute in the
+# dtype of the temporaries, so the fused results are not bit-for-bit equal
+# to the reducers': float32 results (such as ak.std) can differ in the last
+# bits, and products of narrow integers (x*weight with uint8 weights, x**n)
+# don't overflow where the reducers' did.
+
+_dtypes = (
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+    np.float32,
+    np.float64,
+)
+
+
+class Segments:
+    """
+    The data of `x` (and `y` and `weight`, if given) as buffers with the same
+    dtype, split into segments by `offsets`. Use #Segments.of to make one.
+    """
+
+    def __init__(self, layout, offsets, datas, weight, dtype, scalar):
+        self._layout = layout
+        self._offsets = offsets
+        self._datas = datas
+        self._weight = weight
+        self._dtype = dtype
+        self._scalar = scalar
+        self._nplike = layout.nplike
+
+    @classmethod
+    def of(cls, axis, *layouts, weight=None):
+        """
+        Returns a #Segments for the layouts (ak._v2.contents.Content) or None
+        if the statistics can't be computed with the fused kernels.
+        """
+        if weight is not None:
+            layouts = layouts + (weight,)
+        first = layouts[0]
+        if not isinstance(first.nplike, ak.nplike.Numpy):
+            return None
+
+        if isinstance(first, ak._v2.contents.NumpyArray):
+            if axis is not None or any(
+                layout.length != first.length for layout in layouts
+            ):
+                return None
+            offsets = first.nplike.array([0, first.length], dtype=np.int64)
+            contents = layouts
+
+        elif isinstance(first, ak._v2.contents.ListOffsetArray):
+            if axis not in (None, -1, 1) or first.parameter("__array__") is not None:
+                return None
+            for layout in layouts[1:]:
+                if not isinstance(
+                    layout, ak._v2.contents.ListOffsetArray
+                ) or not first.nplike.array_equal(
+                    layout.offsets.data, first.offsets.data
+                ):
+                    return None
+            offsets = first.nplike.asarray(first.offsets.data, dtype=np.int64)
+            if axis is None:
+                offsets = offsets[[0, -1]]
+            contents = [layout.content for layout in layouts]
+
+        else:
+            return None
+
+        if not all(
+            isinstance(content, ak._v2.contents.NumpyArray)
+            and content.parameter("__array__") is None
+            and len(content.shape) == 1
+            and content.is_contiguous
+            and content.dtype.type in _dtypes
+            for content in contents
+        ):
+            return None
+
+        # The kernels take all values with the same dtype; for mixed dtypes,
+        # the values are converted to float64.
+        dtypes = {content.dtype for content in contents}
+        if len(dtypes) == 1:
+            datas = [content.data for content in contents]
+        else:
+            datas = [
+                first.nplike.asarray(content.data, dtype=np.float64)
+                for content in contents
+            ]
+
+        # Results have the dtype that true_divide would give the sums: float32
+        # if values and weights promote to float32 (e.g. int8 values with
+        # float32 weights), float64 otherwise.
+        promoted = functools.reduce(np.promote_types, dtypes)
+        if weight is not None and promoted == np.dtype(np.float32):
+            dtype = np.dtype(np.float32)
+        else:
+            dtype = np.dtype(np.float64)
+
+        if weight is not None:
+            datas, weight = datas[:-1], datas[-1]
+
+        return cls(first, offsets, datas, weight, dtype, axis is None)
+
+    @property
+    def length(self):
+        return len(self._offsets) - 1
+
+    def _call(self, name, outputs, *args):
+        results = [self._nplike.empty(self.length, np.float64) for _ in range(outputs)]
+        datatype = self._datas[0].dtype.type
+        self._layout._handle_error(
+            self._nplike[
+                name,
+                *([np.float64] * outputs),
+                *([datatype] * len(self._datas)),
+                datatype,
+                self._offsets.dtype.type,
+            ](
+                *results,
+                *self._datas,
+                self._weight,
+                self._offsets,
+                self.length,
+                *args,
+            )
+        )
+        return results
+
+    def moments(self):
+        """
+        Returns the sum of weights, the weighted sum and the weighted sum of
+        squared deviations from the mean of each segment.
+        """
+        return self._call("awkward_reduce_moments_offsets", 3)
+
+    def moment(self, n):
+        """
+        Returns the sum of weights and the sum of `(x*weight)**n` of each
+        segment.
+        """
+        return self._call("awkward_reduce_moment_offsets", 2, float(n))
+
+    def comoments(self):
+        """
+        Returns the sum of weights and the sums of weighted products of
+        deviations from the means `xy`, `xx` and `yy` of each segment.
+        """
+        return self._call("awkward_reduce_comoments_offsets", 4)
+
+    @property
+    def data_dtype(self):
+        """
+        The dtype of the values given to the kernels.
+        """
+        return self._datas[0].dtype
+
+    def wrap(
+        self,
+        values,
+        keepdims,
+        mask_identity,
+        behavior,
+        mask_lists=False,
+        scalar_dtype=None,
+    ):
+        """
+        Returns `values` (one per segment) in the form of the operations'
+        output: a scalar for `axis=None`, else an array that is optional if
+        `mask_identity` and nested in lists of length 1 if `keepdims`.
+
+        If `mask_lists`, those lists are also None for empty segments, as in
+        the operations that subtract the mean by broadcasting.
+
+        If `scalar_dtype` is given, a scalar has that dtype instead: at
+        `axis=None`, the reducers return NumPy scalars, whose arithmetic can
+        give a different dtype than the same arithmetic on arrays.
+        """
+        if self._scalar:
+            dtype = self._dtype if scalar_dtype is None else scalar_dtype
+            return self._nplike.asarray(values, dtype=dtype)[0]
+        values = self._nplike.asarray(values, dtype=self._dtype)
+
+        mask = ak._v2.index.Index8(
+            self._nplike.asarray(
+                self._offsets[1:] == self._offsets[:-1], dtype=np.int8
+            ),
+            nplike=self._nplike,
+        )
+        out = ak._v2.contents.NumpyArray(values, None, None, self._nplike)
+        if mask_identity:
+            out = ak._v2.contents.ByteMaskedArray(
+                mask, out, False, None, None, self._nplike
+            )
+        if keepdims:
+            out = ak._v2.contents.RegularArray(
+                out, 1, self.length, None, None, self._nplike
+            ).toListOffsetArray64(False)
+            if mask_identity and mask_lists:
+                out = ak._v2.contents.ByteMaskedArray(
+                    mask, out, False, None, None, self._nplike
+                )
+        return ak._v2._util.wrap(out, behavior)
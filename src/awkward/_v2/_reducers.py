@@ -5,9 +5,29 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
+# dtypes of the kernels that reduce contiguous sublists given by offsets,
+# rather than by parents (see NumpyArray._reduce_offsets)
+_offsets_types = (
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+    np.float32,
+    np.float64,
+)
+
+
 class Reducer:
     needs_position = False
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return False
+
     @classmethod
     def return_dtype(cls, given_dtype):
         if given_dtype in (np.bool_, np.int8, np.int16, np.int32):
@@ -80,6 +100,31 @@ class ArgMin(Reducer):
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "mM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=np.int64)
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_argmin_offsets",
+                result.dtype.type,
+                dtype,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class ArgMax(Reducer):
     name = "argmax"
@@ -129,6 +174,31 @@ class ArgMax(Reducer):
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "mM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=np.int64)
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_argmax_offsets",
+                result.dtype.type,
+                dtype,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class Count(Reducer):
     name = "count"
@@ -155,6 +225,18 @@ class Count(Reducer):
         )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return True
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        assert offsets.nplike is array.nplike
+        return ak._v2.contents.NumpyArray(
+            offsets.data[1 : outlength + 1] - offsets.data[:outlength]
+        )
+
 
 class CountNonzero(Reducer):
     name = "count_nonzero"
@@ -203,6 +285,31 @@ class CountNonzero(Reducer):
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bmM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = np.dtype(np.int64) if array.dtype.kind.upper() == "M" else array.dtype
+        result = array.nplike.empty(outlength, dtype=np.int64)
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_countnonzero_offsets",
+                result.dtype.type,
+                dtype.type,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class Sum(Reducer):
     name = "sum"
@@ -298,6 +405,34 @@ class Sum(Reducer):
         else:
             return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bm" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = np.dtype(np.int64) if array.dtype.kind == "m" else array.dtype
+        result = array.nplike.empty(outlength, dtype=cls.return_dtype(dtype))
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_sum_offsets",
+                result.dtype.type,
+                dtype.type,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        if array.dtype.kind == "m":
+            return ak._v2.contents.NumpyArray(array.nplike.asarray(result, array.dtype))
+        else:
+            return ak._v2.contents.NumpyArray(result)
+
 
 class Prod(Reducer):
     name = "prod"
@@ -367,6 +502,30 @@ class Prod(Reducer):
         else:
             return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        result = array.nplike.empty(outlength, dtype=cls.return_dtype(array.dtype))
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_prod_offsets",
+                result.dtype.type,
+                array.dtype.type,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class Any(Reducer):
     name = "any"
@@ -415,6 +574,31 @@ class Any(Reducer):
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bmM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=np.bool_)
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_sum_bool_offsets",
+                result.dtype.type,
+                dtype,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class All(Reducer):
     name = "all"
@@ -463,6 +647,31 @@ class All(Reducer):
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bmM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=np.bool_)
+        assert offsets.nplike is array.nplike
+        array._handle_error(
+            array.nplike[
+                "awkward_reduce_prod_bool_offsets",
+                result.dtype.type,
+                dtype,
+                offsets.dtype.type,
+            ](
+                result,
+                array.data,
+                offsets.data,
+                outlength,
+            )
+        )
+        return ak._v2.contents.NumpyArray(result)
+
 
 class Min(Reducer):
     name = "min"
@@ -558,6 +767,47 @@ class Min(Reducer):
         else:
             return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
 
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bmM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=dtype)
+        assert offsets.nplike is array.nplike
+        if array.dtype == np.bool_:
+            array._handle_error(
+                array.nplike[
+                    "awkward_reduce_prod_bool_offsets",
+                    result.dtype.type,
+                    array.dtype.type,
+                    offsets.dtype.type,
+                ](
+                    result,
+                    array.data,
+                    offsets.data,
+                    outlength,
+                )
+            )
+        else:
+            array._handle_error(
+                array.nplike[
+                    "awkward_reduce_min_offsets",
+                    result.dtype.type,
+                    dtype,
+                    offsets.dtype.type,
+                ](
+                    result,
+                    array.data,
+                    offsets.data,
+                    outlength,
+                    cls._min_initial(cls.initial, dtype),
+                )
+            )
+        return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
+
 
 class Max(Reducer):
     name = "max"
@@ -652,3 +902,44 @@ class Max(Reducer):
             )
         else:
             return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
+
+    @classmethod
+    def has_offsets_kernel(cls, dtype):
+        return dtype.kind in "bmM" or dtype.type in _offsets_types
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        dtype = cls.maybe_other_type(array.dtype)
+        result = array.nplike.empty(outlength, dtype=dtype)
+        assert offsets.nplike is array.nplike
+        if array.dtype == np.bool_:
+            array._handle_error(
+                array.nplike[
+                    "awkward_reduce_sum_bool_offsets",
+                    result.dtype.type,
+                    array.dtype.type,
+                    offsets.dtype.type,
+                ](
+                    result,
+                    array.data,
+                    offsets.data,
+                    outlength,
+                )
+            )
+        else:
+            array._handle_error(
+                array.nplike[
+                    "awkward_reduce_max_offsets",
+                    result.dtype.type,
+                    dtype,
+                    offsets.dtype.type,
+                ](
+                    result,
+                    array.data,
+                    offsets.data,
+                    outlength,
+                    cls._max_initial(cls.initial, dtype),
+                )
+            )
+        return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
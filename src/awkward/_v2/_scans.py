@@ -0,0 +1,167 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# ak.cumsum, ak.cumprod, ak.cummin and ak.cummax replace each value of the
+# innermost lists with the sum, product, minimum or maximum of the values
+# before it (inclusive) in the same list. Like the reducers' offsets kernels
+# (see NumpyArray._reduce_offsets), the scan kernels take a flat array and
+# the offsets of its contiguous sublists, and the output has the same
+# offsets, so it has the same structure as the input.
+
+
+class Scanner:
+    kinds = "buif"
+
+    @classmethod
+    def return_dtype(cls, given_dtype):
+        return given_dtype
+
+    @classmethod
+    def apply_offsets(cls, array, offsets, outlength):
+        assert isinstance(array, ak._v2.contents.NumpyArray)
+        assert offsets.nplike is array.nplike
+        if array.dtype.kind not in cls.kinds:
+            raise ak._v2._util.error(
+                TypeError(
+                    "cannot compute the {} of {}".format(cls.name, array.form.type)
+                )
+            )
+        data = array.nplike.ascontiguousarray(array.data)
+        if data.dtype.kind in ("M", "m"):
+            data = data.view(np.int64)
+        result = array.nplike.empty(len(data), dtype=cls.return_dtype(data.dtype))
+        array._handle_error(
+            array.nplike[
+                "awkward_scan_{}_offsets".format(cls.name[3:]),
+                result.dtype.type,
+                data.dtype.type,
+                offsets.dtype.type,
+            ](
+                result,
+                data,
+                offsets.data,
+                outlength,
+            )
+        )
+        if array.dtype.kind in ("M", "m"):
+            result = result.view(array.dtype)
+        return ak._v2.contents.NumpyArray(result)
+
+
+class CumSum(Scanner):
+    name = "cumsum"
+    kinds = "buifm"
+
+    @classmethod
+    def return_dtype(cls, given_dtype):
+        return ak._v2._reducers.Sum.return_dtype(given_dtype)
+
+
+class CumProd(Scanner):
+    name = "cumprod"
+
+    @classmethod
+    def return_dtype(cls, given_dtype):
+        return ak._v2._reducers.Prod.return_dtype(given_dtype)
+
+
+class CumMin(Scanner):
+    name = "cummin"
+    kinds = "buifmM"
+
+
+class CumMax(Scanner):
+    name = "cummax"
+    kinds = "buifmM"
+
+
+def apply(scanner, layout, axis):
+    """
+    Returns `layout` with each value of its innermost lists (or of the whole
+    array, flattened, if `axis` is None) replaced by its `scanner` scan.
+    """
+    nplike = layout.nplike
+    mindepth, maxdepth = layout.minmax_depth
+    if (
+        axis is not None
+        and axis != -1
+        and (mindepth != maxdepth or axis != maxdepth - 1)
+    ):
+        raise ak._v2._util.error(
+            NotImplementedError(
+                "{} expects axis 'None' or '-1' (the innermost lists)".format(
+                    scanner.name
+                )
+            )
+        )
+
+    if axis is None:
+        layout = ak._v2.operations.flatten(layout, axis=None, highlevel=False)
+    if layout.minmax_depth[0] == 1:
+        offsets = nplike.index_nplike.array([0, layout.length], dtype=np.int64)
+        return _scan(scanner, layout, offsets)
+
+    def action(node, **kwargs):
+        if node.is_ListType and node.content.minmax_depth[0] == 1:
+            if isinstance(node, ak._v2.contents.RegularArray):
+                length = node.length * node.size
+                offsets = (
+                    nplike.index_nplike.arange(node.length + 1, dtype=np.int64)
+                    * node.size
+                )
+                return ak._v2.contents.RegularArray(
+                    _scan(scanner, node.content[:length], offsets),
+                    node.size,
+                    node.length,
+                    parameters=node.parameters,
+                )
+            listoffsetarray = node.toListOffsetArray64(True)
+            offsets = nplike.index_nplike.asarray(listoffsetarray.offsets)
+            return ak._v2.contents.ListOffsetArray(
+                listoffsetarray.offsets,
+                _scan(scanner, listoffsetarray.content[: offsets[-1]], offsets),
+                parameters=node.parameters,
+            )
+
+    return layout.recursively_apply(action, numpy_to_regular=True)
+
+
+def _scan(scanner, content, offsets):
+    # the scan of each segment of `content` delimited by `offsets`; missing
+    # values are skipped and stay missing, and fields of records that have
+    # lists are scanned in their own innermost lists
+    nplike = content.nplike
+    items, itemoffsets, valid = ak._v2._unique.compact(content, offsets)
+
+    if isinstance(items, ak._v2.contents.EmptyArray):
+        out = items
+    elif isinstance(items, ak._v2.contents.RecordArray):
+        contents = []
+        for x in items.contents:
+            x = x[: items.length]
+            if x.minmax_depth == (1, 1):
+                contents.append(_scan(scanner, x, itemoffsets))
+            else:
+                contents.append(apply(scanner, x, -1))
+        out = ak._v2.contents.RecordArray(
+            contents, items.fields, items.length, parameters=items.parameters
+        )
+    elif isinstance(items, ak._v2.contents.NumpyArray) and len(items.shape) == 1:
+        out = scanner.apply_offsets(
+            items, ak._v2.index.Index64(itemoffsets), len(offsets) - 1
+        )
+    else:
+        raise ak._v2._util.error(
+            TypeError(
+                "cannot compute the {} of {}".format(scanner.name, items.form.type)
+            )
+        )
+
+    if valid is None:
+        return out
+    index = nplike.index_nplike.full(len(valid), -1, dtype=np.int64)
+    index[valid] = nplike.index_nplike.arange(out.length, dtype=np.int64)
+    return ak._v2.contents.IndexedOptionArray(ak._v2.index.Index64(index), out)
@@ -0,0 +1,256 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# ak.unique, ak.is_unique, ak.group_by and ak.join find the distinct items
+# (numbers, strings, or records of these) in each segment of a flat layout,
+# or the distinct keys to group or match records by. With method="hash",
+# each segment is scanned once with a hash table, which keeps the items in
+# order of first appearance; with method="sort", each segment is argsorted
+# and runs of equal items are merged, which puts them in increasing order.
+# Either way, the result is the position of the first appearance of each
+# distinct item, the number of times it appears, the index of each item's
+# distinct item in its segment, and the offsets of the segments of distinct
+# items.
+#
+# Records are reduced to numbers first: each field is replaced by a dense
+# code (equal values have equal codes) and the codes of the fields are
+# combined pairwise.
+
+_hash_dtypes = (
+    np.bool_,
+    np.int8,
+    np.int16,
+    np.int32,
+    np.int64,
+    np.uint8,
+    np.uint16,
+    np.uint32,
+    np.uint64,
+    np.float32,
+    np.float64,
+)
+
+
+def is_string(layout):
+    return layout.parameter("__array__") in ("string", "bytestring")
+
+
+def is_item(layout):
+    """
+    True if `layout` is a flat array of items that can be compared: numbers,
+    strings, or records.
+    """
+    if isinstance(layout, ak._v2.contents.NumpyArray):
+        return len(layout.shape) == 1
+    return isinstance(
+        layout, (ak._v2.contents.EmptyArray, ak._v2.contents.RecordArray)
+    ) or is_string(layout)
+
+
+def is_list_of_items(layout):
+    """
+    True if `layout` is a list-type array whose content, possibly with missing
+    values, is a flat array of items.
+    """
+    if not layout.is_ListType or is_string(layout):
+        return False
+    content = layout.content
+    if content.is_OptionType or content.is_IndexedType:
+        content = content.content
+    return is_item(content)
+
+
+def compact(content, offsets):
+    """
+    Returns the items of `content` without missing values, `offsets`
+    adjusted to them, and a boolean array of which items of `content` are
+    valid (None if there are no missing values).
+    """
+    nplike = content.nplike
+    if content.is_IndexedType and not content.is_OptionType:
+        content = content.project()
+    if not content.is_OptionType:
+        return content, offsets, None
+
+    valid = nplike.index_nplike.asarray(content.mask_as_bool(valid_when=True))
+    before = nplike.index_nplike.zeros(len(valid) + 1, dtype=np.int64)
+    nplike.index_nplike.cumsum(valid, out=before[1:])
+    return content.project(), before[offsets], valid
+
+
+def distinct(items, offsets, method):
+    """
+    Returns `first`, `counts`, `inverse`, and `outoffsets` (all int64) for the
+    segments of `items` (a flat array of items) delimited by `offsets`. If
+    `items` has missing values, None is one of the distinct items.
+    """
+    if isinstance(items, ak._v2.contents.EmptyArray):
+        items = items.toNumpyArray(np.float64)
+
+    if items.is_OptionType or isinstance(items, ak._v2.contents.RecordArray):
+        items = ak._v2.contents.NumpyArray(codes(items, method)[0])
+    elif items.is_IndexedType:
+        items = items.project()
+
+    if is_string(items):
+        if method == "hash":
+            return _hash_strings(items, offsets)
+        else:
+            return _sort(items, offsets)
+
+    if isinstance(items, ak._v2.contents.NumpyArray) and len(items.shape) == 1:
+        if items.dtype.kind in ("M", "m"):
+            items = ak._v2.contents.NumpyArray(items.data.view(np.int64))
+        if method == "hash":
+            return _hash_numbers(items, offsets)
+        else:
+            return _sort(items, offsets)
+
+    raise ak._v2._util.error(NotImplementedError("unique of " + type(items).__name__))
+
+
+def codes(layout, method):
+    """
+    Returns an int64 code for each item of `layout`, such that equal items
+    (including None) have equal codes, and the number of distinct codes. The
+    codes are dense: from 0 to that number, exclusive. With method="sort",
+    the codes are in the order of the items.
+    """
+    nplike = layout.nplike
+    if layout.is_IndexedType and not layout.is_OptionType:
+        layout = layout.project()
+
+    if layout.is_OptionType:
+        valid = nplike.index_nplike.asarray(layout.mask_as_bool(valid_when=True))
+        inner, number = codes(layout.project(), method)
+        out = nplike.index_nplike.full(layout.length, number, dtype=np.int64)
+        out[valid] = inner
+        return out, number + 1
+
+    if isinstance(layout, ak._v2.contents.RecordArray):
+        out = nplike.index_nplike.zeros(layout.length, dtype=np.int64)
+        number = 1
+        for i in range(len(layout.contents)):
+            fieldcodes, fieldnumber = codes(layout.content(i), method)
+            out, number = codes(
+                ak._v2.contents.NumpyArray(out * fieldnumber + fieldcodes), method
+            )
+        return out, number
+
+    offsets = nplike.index_nplike.array([0, layout.length], dtype=np.int64)
+    _, counts, inverse, _ = distinct(layout, offsets, method)
+    return inverse, len(counts)
+
+
+def group_carry(items, groups, counts):
+    """
+    Returns the positions of `items` in each group, where `groups` is the
+    group of each item and `counts` is the number of items in each group,
+    and the offsets of the groups in that carry. The items of each group
+    stay in their original order.
+    """
+    nplike = items.nplike
+    groupoffsets = nplike.index_nplike.zeros(len(counts) + 1, dtype=np.int64)
+    nplike.index_nplike.cumsum(counts, out=groupoffsets[1:])
+    carry = nplike.index_nplike.empty(len(groups), dtype=np.int64)
+    items._handle_error(
+        nplike[
+            "awkward_unique_group_carry",
+            carry.dtype.type,
+            groups.dtype.type,
+            groupoffsets.dtype.type,
+        ](carry, groups, len(groups), groupoffsets, len(counts))
+    )
+    return carry, groupoffsets
+
+
+def _hash_numbers(items, offsets):
+    nplike = items.nplike
+    data = nplike.ascontiguousarray(items.data)
+    if data.dtype.type not in _hash_dtypes:
+        raise ak._v2._util.error(
+            NotImplementedError("unique of {} with method='hash'".format(data.dtype))
+        )
+    outs = [nplike.index_nplike.empty(len(data), dtype=np.int64) for _ in range(3)]
+    outoffsets = nplike.index_nplike.empty(len(offsets), dtype=np.int64)
+    items._handle_error(
+        nplike[
+            "awkward_unique_hash",
+            np.int64,
+            np.int64,
+            np.int64,
+            np.int64,
+            data.dtype.type,
+            offsets.dtype.type,
+        ](*outs, outoffsets, data, offsets, len(offsets) - 1)
+    )
+    first, counts, inverse = outs
+    return first[: outoffsets[-1]], counts[: outoffsets[-1]], inverse, outoffsets
+
+
+def _hash_strings(items, offsets):
+    nplike = items.nplike
+    data, starts, stops = ak._v2.behaviors.string._string_buffers(items)
+    outs = [nplike.index_nplike.empty(items.length, dtype=np.int64) for _ in range(3)]
+    outoffsets = nplike.index_nplike.empty(len(offsets), dtype=np.int64)
+    items._handle_error(
+        nplike[
+            "awkward_unique_hash_strings",
+            np.int64,
+            np.int64,
+            np.int64,
+            np.int64,
+            data.dtype.type,
+            starts.dtype.type,
+            stops.dtype.type,
+            offsets.dtype.type,
+        ](*outs, outoffsets, data, starts, stops, offsets, len(offsets) - 1)
+    )
+    first, counts, inverse = outs
+    return first[: outoffsets[-1]], counts[: outoffsets[-1]], inverse, outoffsets
+
+
+def _sort(items, offsets):
+    # a stable argsort puts the first appearance of each item at the start of
+    # its run of equal items
+    index_nplike = items.nplike.index_nplike
+    length = items.length
+    segment = index_nplike.repeat(
+        index_nplike.arange(len(offsets) - 1, dtype=np.int64),
+        offsets[1:] - offsets[:-1],
+    )
+    local = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), items
+    ).argsort(axis=-1, ascending=True, stable=True)
+    order = index_nplike.asarray(local.content, dtype=np.int64) + offsets[segment]
+
+    starts = index_nplike.ones(length, dtype=np.bool_)
+    if length > 1:
+        if is_string(items):
+            sorted = items._carry(ak._v2.index.Index64(order), False)
+            starts[1:] = ~ak._v2.behaviors.string._string_kernel(
+                "awkward_NumpyArray_strings_equal", np.bool_, sorted[1:], sorted[:-1]
+            )
+        else:
+            sorted = index_nplike.asarray(items.data)[order]
+            starts[1:] = sorted[1:] != sorted[:-1]
+            if sorted.dtype.kind == "f":
+                nan = index_nplike.isnan(sorted)
+                starts[1:] &= ~(nan[1:] & nan[:-1])
+    starts[offsets[:-1][offsets[:-1] < offsets[1:]]] = True
+
+    before = index_nplike.zeros(length + 1, dtype=np.int64)
+    index_nplike.cumsum(starts, out=before[1:])
+    outoffsets = before[offsets]
+    positions = index_nplike.nonzero(starts)[0]
+
+    first = order[positions]
+    counts = index_nplike.empty(len(positions), dtype=np.int64)
+    counts[:-1] = positions[1:] - positions[:-1]
+    counts[-1:] = length - positions[-1:]
+    inverse = index_nplike.empty(length, dtype=np.int64)
+    inverse[order] = before[1:] - 1 - outoffsets[segment]
+    return first, counts, inverse, outoffsets
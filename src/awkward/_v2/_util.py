@@ -90,6 +90,46 @@ def tobytes(array):
         return array.tostring()
 
 
+def bytestrings_to_list(data, starts, stops):
+    raw = tobytes(data)
+    return [raw[start:stop] for start, stop in zip(starts.tolist(), stops.tolist())]
+
+
+def strings_to_list(data, starts, stops):
+    # Decodes all of the strings at once and slices the Python str by character
+    # positions; if the bytes are not valid UTF-8 or a string starts or stops in
+    # the middle of a character, each string is decoded separately, with invalid
+    # bytes escaped.
+    import numpy
+
+    raw = tobytes(data)
+    try:
+        decoded = raw.decode()
+    except UnicodeDecodeError:
+        decoded = None
+
+    if decoded is not None and len(decoded) != len(raw):
+        data = numpy.frombuffer(raw, numpy.uint8)
+        ischar = (data & 0xC0) != 0x80
+        bounds = numpy.concatenate([starts, stops])
+        if ischar[bounds[bounds < len(data)]].all():
+            charpos = numpy.zeros(len(data) + 1, numpy.int64)
+            numpy.cumsum(ischar, out=charpos[1:])
+            starts, stops = charpos[starts], charpos[stops]
+        else:
+            decoded = None
+
+    if decoded is None:
+        return [
+            raw[start:stop].decode(errors="surrogateescape")
+            for start, stop in zip(starts.tolist(), stops.tolist())
+        ]
+    else:
+        return [
+            decoded[start:stop] for start, stop in zip(starts.tolist(), stops.tolist())
+        ]
+
+
 def little_endian(array):
     return array.astype(array.dtype.newbyteorder("<"), copy=False)
 
@@ -15,7 +15,7 @@ class _HashableDict:
     def __init__(self, obj):
         self.keys = tuple(sorted(obj))
         self.values = tuple(_hashable(obj[k]) for k in self.keys)
-        self.hash = hash((_HashableDict,) + self.keys, self.values)
+        self.hash = hash((_HashableDict,) + self.keys + self.values)
 
     def __hash__(self):
         return self.hash
@@ -30,7 +30,7 @@ class _HashableDict:
 
 class _HashableList:
     def __init__(self, obj):
-        self.values = tuple(obj)
+        self.values = tuple(_hashable(x) for x in obj)
         self.hash = hash((_HashableList,) + self.values)
 
     def __hash__(self):
@@ -51,6 +51,149 @@ def _hashable(obj):
         return obj
 
 
+def _first_appearance(codes):
+    # renumbers codes in order of first appearance, as the Python loop did
+    numpy = ak.nplike.numpy
+    if len(codes) == 0:
+        return numpy.zeros(0, np.bool_), numpy.zeros(0, np.int64)
+    _, first, inverse = numpy.unique(codes, return_index=True, return_inverse=True)
+    rank = numpy.empty(len(first), dtype=np.int64)
+    rank[numpy.argsort(first)] = numpy.arange(len(first), dtype=np.int64)
+    is_first = numpy.zeros(len(codes), dtype=np.bool_)
+    is_first[first] = True
+    return is_first, rank[inverse]
+
+
+def _compress(codes):
+    return ak.nplike.numpy.unique(codes, return_inverse=True)[1].astype(np.int64)
+
+
+def _sequence_codes(elements, starts, stops):
+    # lists of equal length are compared as fixed-width byte strings
+    numpy = ak.nplike.numpy
+    elements = numpy.ascontiguousarray(elements)
+    lengths = stops - starts
+    out = numpy.empty(len(starts), dtype=np.int64)
+    base = 0
+    for length in numpy.unique(lengths):
+        selected = numpy.nonzero(lengths == length)[0]
+        if length == 0:
+            out[selected] = base
+            base += 1
+            continue
+        matrix = elements[
+            starts[selected][:, numpy.newaxis] + numpy.arange(length, dtype=np.int64)
+        ]
+        keys = numpy.ascontiguousarray(matrix).view(
+            numpy.dtype((numpy.void, int(length) * elements.itemsize))
+        )
+        uniques, inverse = numpy.unique(keys.reshape(-1), return_inverse=True)
+        out[selected] = inverse + base
+        base += len(uniques)
+    return out
+
+
+def _string_codes(layout):
+    # strings with the same hash are checked against the first string with
+    # that hash; if any of them collide, the caller compares all bytes
+    numpy = ak.nplike.numpy
+    hashes = ak._v2.behaviors.string._string_hash(layout)
+    _, first, inverse = numpy.unique(hashes, return_index=True, return_inverse=True)
+    representative = layout._carry(ak._v2.index.Index64(first[inverse]), False)
+    same = ak._v2.behaviors.string._string_kernel(
+        "awkward_NumpyArray_strings_equal", np.bool_, layout, representative
+    )
+    if numpy.all(same):
+        return inverse.astype(np.int64)
+    else:
+        return None
+
+
+def _codes(layout):
+    """
+    Returns an int64 array with equal values for equal items of `layout`
+    (in no particular order), or None if `layout` can't be encoded this way.
+    """
+    numpy = ak.nplike.numpy
+
+    if isinstance(layout, ak._v2.contents.EmptyArray):
+        return numpy.zeros(0, dtype=np.int64)
+
+    elif isinstance(layout, ak._v2.contents.NumpyArray):
+        if len(layout.inner_shape) != 0:
+            return _codes(layout.toRegularArray())
+        return _compress(numpy.asarray(layout.data))
+
+    elif isinstance(
+        layout,
+        (
+            ak._v2.contents.ListOffsetArray,
+            ak._v2.contents.ListArray,
+            ak._v2.contents.RegularArray,
+        ),
+    ):
+        if isinstance(layout, ak._v2.contents.RegularArray):
+            starts = numpy.arange(layout.length, dtype=np.int64) * layout.size
+            stops = starts + layout.size
+        elif isinstance(layout, ak._v2.contents.ListOffsetArray):
+            offsets = numpy.asarray(layout.offsets).astype(np.int64)
+            starts, stops = offsets[:-1], offsets[1:]
+        else:
+            starts = numpy.asarray(layout.starts).astype(np.int64)
+            stops = numpy.asarray(layout.stops).astype(np.int64)
+
+        if layout.parameter("__array__") in ("string", "bytestring"):
+            codes = _string_codes(layout)
+            if codes is not None:
+                return codes
+
+        content = layout.content
+        if (
+            isinstance(content, ak._v2.contents.NumpyArray)
+            and len(content.inner_shape) == 0
+            and content.dtype.kind in ("b", "i", "u")
+        ):
+            elements = numpy.asarray(content.data)
+        else:
+            elements = _codes(content)
+            if elements is None:
+                return None
+        return _sequence_codes(elements, starts, stops)
+
+    elif isinstance(layout, ak._v2.contents.RecordArray):
+        out = numpy.zeros(layout.length, dtype=np.int64)
+        for field in layout.fields:
+            codes = _codes(layout.content(field))
+            if codes is None:
+                return None
+            if len(out) != 0:
+                out = _compress(out * (codes.max() + 1) + codes)
+        return out
+
+    elif isinstance(layout, ak._v2.contents.IndexedArray):
+        codes = _codes(layout.content)
+        if codes is None:
+            return None
+        return codes[numpy.asarray(layout.index)]
+
+    elif isinstance(layout, ak._v2.contents.UnmaskedArray):
+        return _codes(layout.content)
+
+    elif layout.is_OptionType:
+        layout = layout.toIndexedOptionArray64()
+        codes = _codes(layout.content)
+        if codes is None:
+            return None
+        index = numpy.asarray(layout.index)
+        out = numpy.zeros(len(index), dtype=np.int64)
+        valid = index >= 0
+        out[valid] = codes[index[valid]] + 1
+        return out
+
+    else:
+        return None
+
+
 def _categorical_equal(one, two):
     behavior = ak._v2._util.behavior_of(one, two)
 
@@ -219,9 +362,9 @@ def to_categorical(array, highlevel=True):
         >>> ak.to_list(categorical_records) == ak.to_list(records)
         True
 
-    The check for uniqueness is currently implemented in a Python loop, so
-    conversion to categorical should be regarded as expensive. (This can
-    change, but it would always be an _n log(n)_ operation.)
+    The check for uniqueness sorts the values (strings by their 64-bit hashes,
+    other lists as fixed-width bytes grouped by length), so it is an
+    _n log(n)_ operation. Only unions fall back to a Python loop.
 
     See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
     """
@@ -243,25 +386,21 @@ def to_categorical(array, highlevel=True):
                 content = layout
                 cls = ak._v2.contents.IndexedArray
 
-            content_list = ak._v2.operations.to_list(content)
-            hashable = [_hashable(x) for x in content_list]
-
-            lookup = {}
-            is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
-            mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
-            for i, x in enumerate(hashable):
-                if x in lookup:
-                    is_first[i] = False
-                    mapping[i] = lookup[x]
-                else:
-                    is_first[i] = True
-                    lookup[x] = j = len(lookup)
-                    mapping[i] = j
+            codes = _codes(content)
+            if codes is None:
+                content_list = ak._v2.operations.to_list(content)
+                lookup = {}
+                codes = ak.nplike.numpy.empty(len(content_list), dtype=np.int64)
+                for i, x in enumerate(content_list):
+                    codes[i] = lookup.setdefault(_hashable(x), len(lookup))
+
+            is_first, mapping = _first_appearance(codes)
 
             if layout.is_IndexedType and layout.is_OptionType:
                 original_index = ak.nplike.numpy.asarray(layout.index)
-                index = mapping[original_index]
-                index[original_index < 0] = -1
+                index = ak.nplike.numpy.full(len(original_index), -1, dtype=np.int64)
+                valid = original_index >= 0
+                index[valid] = mapping[original_index[valid]]
                 index = ak._v2.index.Index64(index)
 
             elif layout.is_IndexedType:
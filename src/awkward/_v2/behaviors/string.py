@@ -104,35 +104,188 @@ class StringBehavior(Array):
             yield x.__str__()
 
 
-def _string_equal(one, two):
+def _string_buffers(layout):
+    # (bytes, starts, stops) of a list-type layout of characters, for the
+    # awkward_NumpyArray_strings_* kernels
+    nplike = layout.nplike
+    if isinstance(layout, ak._v2.contents.RegularArray):
+        starts = nplike.arange(layout.length, dtype=np.int64) * layout.size
+        stops = starts + layout.size
+    else:
+        starts = nplike.asarray(layout.starts, dtype=np.int64)
+        stops = nplike.asarray(layout.stops, dtype=np.int64)
+
+    content = layout.content
+    if isinstance(content, ak._v2.contents.NumpyArray):
+        data = nplike.ascontiguousarray(content.data).view(np.uint8)
+    else:
+        data = ak._v2.operations.to_numpy(content, allow_missing=False)
+        data = nplike.ascontiguousarray(data).view(np.uint8)
+    return data, starts, stops
+
+
+def _string_kernel(name, outdtype, one, two):
     nplike = ak.nplike.of(one, two)
-    behavior = ak._v2._util.behavior_of(one, two)
+    onedata, onestarts, onestops = _string_buffers(one)
+    twodata, twostarts, twostops = _string_buffers(two)
+    out = nplike.empty(one.length, outdtype)
+    one._handle_error(
+        nplike[
+            name,
+            out.dtype.type,
+            onedata.dtype.type,
+            onestarts.dtype.type,
+            onestops.dtype.type,
+            twodata.dtype.type,
+            twostarts.dtype.type,
+            twostops.dtype.type,
+        ](
+            out,
+            onedata,
+            onestarts,
+            onestops,
+            twodata,
+            twostarts,
+            twostops,
+            one.length,
+        )
+    )
+    return out
+
 
-    one, two = (
-        ak._v2.operations.without_parameters(one).layout,
-        ak._v2.operations.without_parameters(two).layout,
+def _string_hash(layout):
+    """
+    Returns a 64-bit hash of each string in `layout`. Equal strings have
+    equal hashes, but unequal strings can collide.
+    """
+    nplike = layout.nplike
+    data, starts, stops = _string_buffers(layout)
+    out = nplike.empty(layout.length, np.uint64)
+    layout._handle_error(
+        nplike[
+            "awkward_NumpyArray_strings_hash",
+            out.dtype.type,
+            data.dtype.type,
+            starts.dtype.type,
+            stops.dtype.type,
+        ](out, data, starts, stops, layout.length)
     )
+    return out
+
 
-    # first condition: string lengths must be the same
-    counts1 = nplike.asarray(one.count(axis=-1))
-    counts2 = nplike.asarray(two.count(axis=-1))
+def _is_string(layout):
+    return layout.parameter("__array__") in ("string", "bytestring")
 
-    out = counts1 == counts2
 
-    # only compare characters in strings that are possibly equal (same length)
-    possible = nplike.logical_and(out, counts1)
-    possible_counts = counts1[possible]
+def _string_offsets_and_data(layout):
+    # offsets (starting at zero) and bytes of a list-type layout of characters,
+    # for the vectorized operations in ak._v2.str
+    layout = layout.toListOffsetArray64(True)
+    nplike = layout.nplike
+    offsets = nplike.asarray(layout.offsets, dtype=np.int64)
+    content = layout.content
+    if isinstance(content, ak._v2.contents.NumpyArray):
+        data = content.data
+    else:
+        data = ak._v2.operations.to_numpy(content, allow_missing=False)
+    data = nplike.ascontiguousarray(data).view(np.uint8)
+    return offsets, data[: offsets[-1]]
 
-    if len(possible_counts) > 0:
-        onepossible = one[possible]
-        twopossible = two[possible]
 
-        reduced = ak._v2.operations.all(
-            ak._v2.Array(onepossible) == ak._v2.Array(twopossible), axis=-1
-        ).layout
-        # update same-length strings with a verdict about their characters
-        out[possible] = reduced.data
+def _string_layout(layout, offsets, data):
+    # a new string with the same parameters as `layout`
+    return ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets),
+        ak._v2.contents.NumpyArray(data, parameters=layout.content.parameters),
+        parameters=layout.parameters,
+    )
+
+
+def _string_char_positions(layout, data):
+    # cumulative count of characters before each byte (UTF-8 leading bytes for
+    # strings, all bytes for bytestrings), with one extra entry at the end
+    nplike = ak.nplike.of(data)
+    out = nplike.zeros(len(data) + 1, dtype=np.int64)
+    if layout.parameter("__array__") == "string":
+        nplike.cumsum((data & 0xC0) != 0x80, out=out[1:])
+    else:
+        out[1:] = nplike.arange(1, len(data) + 1, dtype=np.int64)
+    return out
+
 
+def _string_pattern(pattern):
+    if isinstance(pattern, str):
+        return pattern.encode("utf-8", "surrogateescape")
+    elif isinstance(pattern, (bytes, bytearray)):
+        return bytes(pattern)
+    else:
+        raise ak._v2._util.error(
+            TypeError(
+                "string pattern must be a str or bytes, not {}".format(
+                    type(pattern).__name__
+                )
+            )
+        )
+
+
+def _string_find_all(data, pattern):
+    # every position in `data` where `pattern` begins, possibly overlapping,
+    # possibly crossing string boundaries; the first byte is selective, so
+    # only the surviving candidates are checked against the rest
+    nplike = ak.nplike.of(data)
+    size = len(pattern)
+    if size > len(data):
+        return nplike.empty(0, dtype=np.int64)
+    candidates = nplike.nonzero(data[: len(data) - size + 1] == pattern[0])[0]
+    for k in range(1, size):
+        candidates = candidates[data[candidates + k] == pattern[k]]
+    return candidates.astype(np.int64)
+
+
+def _string_first_match(offsets, data, pattern):
+    # byte position of the first `pattern` in each string, or -1
+    nplike = ak.nplike.of(offsets, data)
+    starts, stops = offsets[:-1], offsets[1:]
+    if len(pattern) == 0:
+        return starts.copy()
+    positions = nplike.append(
+        _string_find_all(data, pattern), len(data) + len(pattern) + 1
+    )
+    candidate = positions[nplike.searchsorted(positions, starts, side="left")]
+    return nplike.where(candidate + len(pattern) <= stops, candidate, -1)
+
+
+def _string_change_case(layout, upper):
+    nplike = layout.nplike
+    offsets, data = _string_offsets_and_data(layout)
+
+    if layout.parameter("__array__") == "bytestring" or nplike.all(data < 0x80):
+        # ASCII fast path: a lookup table, which doesn't change any lengths
+        table = nplike.arange(256, dtype=np.uint8)
+        if upper:
+            table[ord("a") : ord("z") + 1] -= 32
+        else:
+            table[ord("A") : ord("Z") + 1] += 32
+        return _string_layout(layout, offsets, table[data])
+
+    else:
+        # lengths may change (e.g. "ß".upper() == "SS"), so use Python's str
+        strings = ak._v2._util.strings_to_list(data, offsets[:-1], offsets[1:])
+        if upper:
+            encoded = [x.upper().encode("utf-8", "surrogateescape") for x in strings]
+        else:
+            encoded = [x.lower().encode("utf-8", "surrogateescape") for x in strings]
+        newoffsets = nplike.zeros(len(encoded) + 1, dtype=np.int64)
+        nplike.cumsum([len(x) for x in encoded], out=newoffsets[1:])
+        newdata = nplike.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return _string_layout(layout, newoffsets, newdata)
+
+
+def _string_equal(one, two):
+    behavior = ak._v2._util.behavior_of(one, two)
+    out = _string_kernel(
+        "awkward_NumpyArray_strings_equal", np.bool_, one.layout, two.layout
+    )
     return ak._v2._util.wrap(ak._v2.contents.NumpyArray(out), behavior)
 
 
@@ -140,6 +293,17 @@ def _string_notequal(one, two):
     return ~_string_equal(one, two)
 
 
+def _string_comparison(ufunc):
+    def compare(one, two):
+        behavior = ak._v2._util.behavior_of(one, two)
+        out = _string_kernel(
+            "awkward_NumpyArray_strings_compare", np.int8, one.layout, two.layout
+        )
+        return ak._v2._util.wrap(ak._v2.contents.NumpyArray(ufunc(out, 0)), behavior)
+
+    return compare
+
+
 def _string_broadcast(layout, offsets):
     nplike = ak.nplike.of(offsets)
     offsets = nplike.asarray(offsets)
@@ -252,6 +416,15 @@ def register(behavior):
     behavior[ak.nplike.numpy.not_equal, "bytestring", "bytestring"] = _string_notequal
     behavior[ak.nplike.numpy.not_equal, "string", "string"] = _string_notequal
 
+    for ufunc in (
+        ak.nplike.numpy.less,
+        ak.nplike.numpy.less_equal,
+        ak.nplike.numpy.greater,
+        ak.nplike.numpy.greater_equal,
+    ):
+        behavior[ufunc, "bytestring", "bytestring"] = _string_comparison(ufunc)
+        behavior[ufunc, "string", "string"] = _string_comparison(ufunc)
+
     behavior["__broadcast__", "bytestring"] = _string_broadcast
     behavior["__broadcast__", "string"] = _string_broadcast
 
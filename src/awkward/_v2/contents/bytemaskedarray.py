@@ -1024,9 +1024,8 @@ class ByteMaskedArray(Content):
             behavior, json_conversions
         )
 
-        for i, isvalid in enumerate(mask):
-            if not isvalid:
-                out[i] = None
+        for i in numpy.nonzero(~mask)[0].tolist():
+            out[i] = None
 
         return out
 
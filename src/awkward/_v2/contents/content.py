@@ -879,7 +879,17 @@ class Content:
     def max(self, axis=-1, mask=True, keepdims=False, initial=None):
         return self._reduce(awkward._v2._reducers.Max(initial), axis, mask, keepdims)
 
-    def argsort(self, axis=-1, ascending=True, stable=False, kind=None, order=None):
+    _sort_kinds = (None, "radix", "quicksort", "mergesort", "heapsort", "stable")
+
+    def argsort(self, axis=-1, ascending=True, stable=False, order=None, kind=None):
+        if kind not in self._sort_kinds:
+            raise ak._v2._util.error(
+                ValueError(
+                    "kind must be one of {}, not {!r}".format(
+                        ", ".join(repr(x) for x in self._sort_kinds), kind
+                    )
+                )
+            )
         negaxis = -axis
         branch, depth = self.branch_depth
         if branch:
@@ -925,7 +935,15 @@ class Content:
             order,
         )
 
-    def sort(self, axis=-1, ascending=True, stable=False, kind=None, order=None):
+    def sort(self, axis=-1, ascending=True, stable=False, order=None, kind=None):
+        if kind not in self._sort_kinds:
+            raise ak._v2._util.error(
+                ValueError(
+                    "kind must be one of {}, not {!r}".format(
+                        ", ".join(repr(x) for x in self._sort_kinds), kind
+                    )
+                )
+            )
         negaxis = -axis
         branch, depth = self.branch_depth
         if branch:
@@ -1667,13 +1667,8 @@ class IndexedOptionArray(Content):
         nextcontent = self._content._carry(
             ak._v2.index.Index(index[not_missing]), False
         )
-        out = nextcontent._to_list(behavior, json_conversions)
-
-        for i, isvalid in enumerate(not_missing):
-            if not isvalid:
-                out.insert(i, None)
-
-        return out
+        content = iter(nextcontent._to_list(behavior, json_conversions))
+        return [next(content) if isvalid else None for isvalid in not_missing.tolist()]
 
     def _to_nplike(self, nplike):
         index = self._index._to_nplike(nplike)
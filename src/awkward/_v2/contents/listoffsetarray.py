@@ -1586,38 +1586,51 @@ class ListOffsetArray(Content):
             return out
 
         else:
-            nextlen = self._offsets[-1] - self._offsets[0]
-            nextparents = ak._v2.index.Index64.empty(nextlen, self._nplike)
+            trimmed = self._content[self.offsets[0] : self.offsets[-1]]
 
-            assert (
-                nextparents.nplike is self._nplike
-                and self._offsets.nplike is self._nplike
-            )
-            self._handle_error(
-                self._nplike[
-                    "awkward_ListOffsetArray_reduce_local_nextparents_64",
-                    nextparents.dtype.type,
-                    self._offsets.dtype.type,
-                ](
-                    nextparents.data,
-                    self._offsets.data,
-                    globalstarts_length,
+            if (
+                isinstance(trimmed, ak._v2.contents.NumpyArray)
+                and (shifts is None or not reducer.needs_position)
+                and trimmed._can_reduce_offsets(reducer)
+            ):
+                # lists of numbers: reduce each sublist directly from the
+                # offsets, without making parents for every element
+                outcontent = trimmed._reduce_offsets(
+                    reducer, self._offsets, mask, keepdims
                 )
-            )
 
-            trimmed = self._content[self.offsets[0] : self.offsets[-1]]
-            nextstarts = self.offsets[:-1]
+            else:
+                nextlen = self._offsets[-1] - self._offsets[0]
+                nextparents = ak._v2.index.Index64.empty(nextlen, self._nplike)
 
-            outcontent = trimmed._reduce_next(
-                reducer,
-                negaxis,
-                nextstarts,
-                shifts,
-                nextparents,
-                globalstarts_length,
-                mask,
-                keepdims,
-            )
+                assert (
+                    nextparents.nplike is self._nplike
+                    and self._offsets.nplike is self._nplike
+                )
+                self._handle_error(
+                    self._nplike[
+                        "awkward_ListOffsetArray_reduce_local_nextparents_64",
+                        nextparents.dtype.type,
+                        self._offsets.dtype.type,
+                    ](
+                        nextparents.data,
+                        self._offsets.data,
+                        globalstarts_length,
+                    )
+                )
+
+                nextstarts = self.offsets[:-1]
+
+                outcontent = trimmed._reduce_next(
+                    reducer,
+                    negaxis,
+                    nextstarts,
+                    shifts,
+                    nextparents,
+                    globalstarts_length,
+                    mask,
+                    keepdims,
+                )
 
             outoffsets = ak._v2.index.Index64.empty(outlength + 1, self._nplike)
             assert outoffsets.nplike is self._nplike and parents.nplike is self._nplike
@@ -2112,32 +2125,17 @@ class ListOffsetArray(Content):
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
-            content = ak._v2._util.tobytes(nextcontent.data)
-            out = [None] * starts.length
-            if convert_bytes is None:
-                for i in range(starts.length):
-                    out[i] = content[starts_data[i] : stops_data[i]]
-            else:
-                for i in range(starts.length):
-                    out[i] = convert_bytes(content[starts_data[i] : stops_data[i]])
+            out = ak._v2._util.bytestrings_to_list(
+                nextcontent.data, starts_data, stops_data
+            )
+            if convert_bytes is not None:
+                out = [convert_bytes(x) for x in out]
             return out
 
         elif self.parameter("__array__") == "string":
-            data = nextcontent.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = tostring(data[starts_data[i] : stops_data[i]])
-            return out
+            return ak._v2._util.strings_to_list(
+                nextcontent.data, starts_data, stops_data
+            )
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -2145,11 +2143,10 @@ class ListOffsetArray(Content):
                 return out
 
             content = nextcontent._to_list(behavior, json_conversions)
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts_data[i] : stops_data[i]]
-            return out
+            return [
+                content[start:stop]
+                for start, stop in zip(starts_data.tolist(), stops_data.tolist())
+            ]
 
     def _to_nplike(self, nplike):
         offsets = self._offsets._to_nplike(nplike)
@@ -882,6 +882,39 @@ class NumpyArray(Content):
                 self._nplike,
             )
 
+    _radix_sort_dtypes = (
+        np.int8,
+        np.uint8,
+        np.int16,
+        np.uint16,
+        np.int32,
+        np.uint32,
+        np.int64,
+        np.uint64,
+        np.float32,
+        np.float64,
+    )
+    _radix_sort_min_length = 1 << 16
+    _radix_sort_min_mean_sublist = 256
+
+    def _use_radix_sort(self, kind, dtype, numlists):
+        # kind="radix" asks for an LSD radix sort (where the dtype allows it);
+        # kind=None chooses it for large arrays of long sublists, where it beats
+        # comparison sorts. Radix sorting is stable.
+        if (
+            not isinstance(self._nplike, ak.nplike.Numpy)
+            or dtype.type not in self._radix_sort_dtypes
+        ):
+            return False
+        elif kind == "radix":
+            return True
+        else:
+            return (
+                kind is None
+                and self.length >= self._radix_sort_min_length
+                and self.length >= self._radix_sort_min_mean_sublist * numlists
+            )
+
     def _argsort_next(
         self,
         negaxis,
@@ -953,22 +986,53 @@ class NumpyArray(Content):
             )
             nextcarry = ak._v2.index.Index64.empty(self.__len__(), self._nplike)
             assert nextcarry.nplike is self._nplike and offsets.nplike is self._nplike
-            self._handle_error(
-                self._nplike[
+            if self._use_radix_sort(kind, dtype, offsets_length - 1):
+                # same arguments, except that the last is is_local, not stable
+                kernel = self._nplike[
+                    "awkward_argsort_radix",
+                    nextcarry.dtype.type,
+                    dtype.type,
+                    offsets.dtype.type,
+                ]
+                last_argument = True
+            else:
+                kernel = self._nplike[
                     "awkward_argsort",
                     nextcarry.dtype.type,
                     dtype.type,
                     offsets.dtype.type,
-                ](
-                    nextcarry.data,
-                    self._data,
-                    self.__len__(),
-                    offsets.data,
-                    offsets_length,
-                    ascending,
-                    stable,
+                ]
+                last_argument = stable
+            if offsets_length <= 1 or not isinstance(self._nplike, ak.nplike.Numpy):
+                self._handle_error(
+                    kernel(
+                        nextcarry.data,
+                        self._data,
+                        self.__len__(),
+                        offsets.data,
+                        offsets_length,
+                        ascending,
+                        last_argument,
+                    )
                 )
-            )
+            else:
+                # the output is local to each sublist, so ranges of sublists
+                # can be sorted independently (and in parallel)
+                def argsort_range(start, stop):
+                    first, last = int(offsets.data[start]), int(offsets.data[stop])
+                    self._handle_error(
+                        kernel(
+                            nextcarry.data[first:last],
+                            self._data[first:last],
+                            last - first,
+                            offsets.data[start : stop + 1] - first,
+                            stop - start + 1,
+                            ascending,
+                            last_argument,
+                        )
+                    )
+
+                ak._v2.parallel._map_ranges(argsort_range, offsets.data, self._nplike)
 
             if shifts is not None:
                 assert (
@@ -1063,23 +1127,73 @@ class NumpyArray(Content):
             )
             out = self._nplike.empty(self.length, dtype)
             assert offsets.nplike is self._nplike
-            self._handle_error(
-                self._nplike[  # noqa: E231
-                    "awkward_sort",
-                    dtype.type,
+            kernel = self._nplike[  # noqa: E231
+                "awkward_sort",
+                dtype.type,
+                dtype.type,
+                offsets.dtype.type,
+            ]
+            if self._use_radix_sort(kind, dtype, offsets_length[0] - 1):
+                radix = self._nplike[
+                    "awkward_argsort_radix",
+                    offsets.dtype.type,
                     dtype.type,
                     offsets.dtype.type,
-                ](
-                    out,
-                    self._data,
-                    self.shape[0],
-                    offsets.data,
-                    offsets_length[0],
-                    parents_length,
-                    ascending,
-                    stable,
+                ]
+                data = self._data.view(dtype)
+
+                def sort_range(start, stop):
+                    first, last = int(offsets.data[start]), int(offsets.data[stop])
+                    carry = self._nplike.empty(last - first, np.int64)
+                    self._handle_error(
+                        radix(
+                            carry,
+                            data[first:last],
+                            last - first,
+                            offsets.data[start : stop + 1] - first,
+                            stop - start + 1,
+                            ascending,
+                            False,
+                        )
+                    )
+                    out[first:last] = data[first:last][carry]
+
+                ak._v2.parallel._map_ranges(sort_range, offsets.data, self._nplike)
+
+            elif offsets_length[0] <= 1 or not isinstance(
+                self._nplike, ak.nplike.Numpy
+            ):
+                self._handle_error(
+                    kernel(
+                        out,
+                        self._data,
+                        self.shape[0],
+                        offsets.data,
+                        offsets_length[0],
+                        parents_length,
+                        ascending,
+                        stable,
+                    )
                 )
-            )
+            else:
+                # each range of sublists is sorted into the same range of the
+                # output, so ranges can be sorted independently (and in parallel)
+                def sort_range(start, stop):
+                    first, last = int(offsets.data[start]), int(offsets.data[stop])
+                    self._handle_error(
+                        kernel(
+                            out[first:last],
+                            self._data[first:last],
+                            last - first,
+                            offsets.data[start : stop + 1] - first,
+                            stop - start + 1,
+                            last - first,
+                            ascending,
+                            stable,
+                        )
+                    )
+
+                ak._v2.parallel._map_ranges(sort_range, offsets.data, self._nplike)
             return ak._v2.contents.NumpyArray(
                 self._nplike.asarray(out, self.dtype), None, None, self._nplike
             )
@@ -1209,6 +1323,71 @@ class NumpyArray(Content):
 
         return out
 
+    def _can_reduce_offsets(self, reducer):
+        return (
+            isinstance(self._nplike, ak.nplike.Numpy)
+            and len(self._data.shape) == 1
+            and self.is_contiguous
+            and reducer.has_offsets_kernel(self.dtype)
+        )
+
+    def _reduce_offsets(self, reducer, offsets, mask, keepdims):
+        # Same as _reduce_next for the innermost dimension of packed lists, but
+        # the sublists are given by offsets (offsets[0] == 0), so there's no
+        # need for parents, which would be one int64 per element.
+        outlength = offsets.length - 1
+
+        # Each sublist is reduced by one thread in the same order as in a
+        # single thread, so results (such as float sums) don't depend on the
+        # number of threads.
+        def reduce_range(start, stop):
+            if start == 0 and stop == outlength:
+                return reducer.apply_offsets(self, offsets, outlength).data
+            first, last = int(offsets.data[start]), int(offsets.data[stop])
+            return reducer.apply_offsets(
+                NumpyArray(self._data[first:last], None, None, self._nplike),
+                ak._v2.index.Index64(
+                    offsets.data[start : stop + 1] - first, nplike=self._nplike
+                ),
+                stop - start,
+            ).data
+
+        results = ak._v2.parallel._map_ranges(reduce_range, offsets.data, self._nplike)
+        if len(results) == 1:
+            out = NumpyArray(results[0], None, None, self._nplike)
+        else:
+            out = NumpyArray(
+                self._nplike.concatenate(results), None, None, self._nplike
+            )
+
+        if mask:
+            outmask = ak._v2.index.Index8(
+                self._nplike.asarray(
+                    offsets.data[1:] == offsets.data[:-1], dtype=np.int8
+                ),
+                nplike=self._nplike,
+            )
+            out = ak._v2.contents.ByteMaskedArray(
+                outmask,
+                out,
+                False,
+                None,
+                None,
+                self._nplike,
+            )
+
+        if keepdims:
+            out = ak._v2.contents.RegularArray(
+                out,
+                1,
+                self.length,
+                None,
+                None,
+                self._nplike,
+            )
+
+        return out
+
     def _validity_error(self, path):
         if len(self.shape) == 0:
             return f'at {path} ("{type(self)}"): shape is zero-dimensional'
@@ -1022,23 +1022,29 @@ class RecordArray(Content):
             return out
 
         if self.is_tuple and json_conversions is None:
-            contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = tuple(x[i] for x in contents)
-            return out
+            contents = [
+                x._getitem_range(slice(0, self._length))._to_list(
+                    behavior, json_conversions
+                )
+                for x in self._contents
+            ]
+            if len(contents) == 0:
+                return [()] * self._length
+            return list(zip(*contents))
 
         else:
             fields = self._fields
             if fields is None:
                 fields = [str(i) for i in range(len(self._contents))]
-            contents = [x._to_list(behavior, json_conversions) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            contents = [
+                x._getitem_range(slice(0, self._length))._to_list(
+                    behavior, json_conversions
+                )
+                for x in self._contents
+            ]
+            if len(contents) == 0:
+                return [{} for _ in range(self._length)]
+            return [dict(zip(fields, row)) for row in zip(*contents)]
 
     def _to_nplike(self, nplike):
         contents = [content._to_nplike(nplike) for content in self._contents]
@@ -1219,38 +1219,21 @@ class RegularArray(Content):
         )
 
     def _to_list(self, behavior, json_conversions):
+        length, size = self._length, self._size
+        starts = numpy.arange(length, dtype=np.int64) * size
+        stops = starts + size
+
         if self.parameter("__array__") == "bytestring":
             convert_bytes = (
                 None if json_conversions is None else json_conversions["convert_bytes"]
             )
-            content = ak._v2._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
-            if convert_bytes is None:
-                for i in range(length):
-                    out[i] = content[(i) * size : (i + 1) * size]
-            else:
-                for i in range(length):
-                    out[i] = convert_bytes(content[(i) * size : (i + 1) * size])
+            out = ak._v2._util.bytestrings_to_list(self._content.data, starts, stops)
+            if convert_bytes is not None:
+                out = [convert_bytes(x) for x in out]
             return out
 
         elif self.parameter("__array__") == "string":
-            data = self._content.data
-            if hasattr(data, "tobytes"):
-
-                def tostring(x):
-                    return x.tobytes().decode(errors="surrogateescape")
-
-            else:
-
-                def tostring(x):
-                    return x.tostring().decode(errors="surrogateescape")
-
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = tostring(data[(i) * size : (i + 1) * size])
-            return out
+            return ak._v2._util.strings_to_list(self._content.data, starts, stops)
 
         else:
             out = self._to_list_custom(behavior, json_conversions)
@@ -1258,11 +1241,10 @@ class RegularArray(Content):
                 return out
 
             content = self._content._to_list(behavior, json_conversions)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            return [
+                content[start:stop]
+                for start, stop in zip(starts.tolist(), stops.tolist())
+            ]
 
     def _to_nplike(self, nplike):
         content = self._content._to_nplike(nplike)
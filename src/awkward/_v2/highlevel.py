@@ -2307,13 +2307,38 @@ class ArrayBuilder(Sized):
                 )
             )
 
-    def snapshot(self):
+    def snapshot(self, reset=False):
         """
+        Args:
+            reset (bool): If True, the accumulated data are removed from this
+                ArrayBuilder after they are copied into the new array, so
+                that the next snapshot contains only data appended after
+                this one.
+
         Converts the currently accumulated data into an #ak.Array.
 
-        The currently accumulated data are *copied* into the new array.
+        The currently accumulated data are *copied* into the new array, so
+        taking snapshots of a growing ArrayBuilder costs time proportional to
+        its total size each time. When consuming a stream, use `reset=True` to
+        hand off each batch of data instead: every value is copied only once.
+
+        With `reset=True`, the ArrayBuilder keeps the type it has discovered
+        so far (e.g. record fields and their types), and no list, tuple, or
+        record may be open.
+
+            >>> builder = ak.ArrayBuilder()
+            >>> builder.append({"x": 1, "y": [1.1, 2.2]})
+            >>> builder.snapshot(reset=True)
+            <Array [{x: 1, y: [1.1, ...]}] type='1 * {x: int64, y: var * float64}'>
+            >>> builder.append({"x": 2, "y": []})
+            >>> builder.snapshot(reset=True)
+            <Array [{x: 2, y: []}] type='1 * {x: int64, y: var * float64}'>
+            >>> len(builder)
+            0
         """
         formstr, length, container = self._layout.to_buffers()
+        if reset:
+            self._layout.clear()
         form = ak._v2.forms.from_json(formstr)
         return ak._v2.operations.from_buffers(form, length, container, highlevel=True)
 
@@ -42,6 +42,7 @@ def register():
     import awkward._v2._connect.numba.arrayview
     import awkward._v2._connect.numba.layout
     import awkward._v2._connect.numba.builder
+    import awkward._v2._connect.numba.layoutbuilder
 
     n = ak._v2.numba
     n.ArrayViewType = awkward._v2._connect.numba.arrayview.ArrayViewType
@@ -61,6 +62,9 @@ def register():
     n.UnionArrayType = awkward._v2._connect.numba.layout.UnionArrayType
     n.ArrayBuilderType = awkward._v2._connect.numba.builder.ArrayBuilderType
     n.ArrayBuilderModel = awkward._v2._connect.numba.builder.ArrayBuilderModel
+    n.LayoutBuilder = awkward._v2._connect.numba.layoutbuilder.LayoutBuilder
+    n.LayoutBuilderType = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderType
+    n.LayoutBuilderModel = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderModel
 
     @numba.extending.typeof_impl.register(ak._v2.highlevel.Array)
     def typeof_Array(obj, c):
@@ -73,3 +77,70 @@ def register():
     @numba.extending.typeof_impl.register(ak._v2.highlevel.ArrayBuilder)
     def typeof_ArrayBuilder(obj, c):
         return obj.numba_type
+
+    @numba.extending.typeof_impl.register(n.LayoutBuilder)
+    def typeof_LayoutBuilder(obj, c):
+        return obj.numba_type
+
+
+def layout_builder(form, initial=1024, resize=1.5):
+    """
+    Args:
+        form (#ak._v2.forms.Form, dict, or str): Form of the array to build,
+            as a Form object or its JSON representation.
+        initial (int): Number of items to reserve in each buffer before it
+            first needs to grow.
+        resize (float): Factor by which buffers grow when they are full.
+
+    Creates a builder whose structure is fixed by `form`, to be filled in
+    functions compiled with `numba.njit`. Unlike #ak.ArrayBuilder, no type
+    discovery is performed and appending does not call into the C++ library:
+    each append is compiled inline into a growable buffer, so the types of the
+    values must be compatible with `form`.
+
+    Each node of the builder corresponds to a node of the `form`:
+
+    * NumpyForm: `append(x)` and `extend(array)`;
+    * ListOffsetForm and RegularForm: `begin_list()` returns the content's
+      builder and `end_list()` closes the list;
+    * IndexedOptionForm: `append_null()` and `append_valid()`, which returns
+      the content's builder;
+    * UnmaskedForm: `append_valid()`;
+    * RecordForm: each field's builder is an attribute (tuple slots are
+      named `content0`, `content1`, ...) and `end_record()` closes the record.
+
+    All nodes have `clear()`, `length`, and `len`; ListOffsetForm, RegularForm,
+    IndexedOptionForm, and UnmaskedForm nodes also have a `content` attribute.
+    Only ListOffsetForm, IndexedOptionForm, and NumpyForm nodes have buffers,
+    the others only count their items. For example,
+
+        >>> form = ak._v2.forms.from_json(
+        ...     '{"class": "ListOffsetArray", "offsets": "i64", "content": "float64"}'
+        ... )
+        >>> builder = ak._v2.numba.layout_builder(form)
+        >>> @numba.njit
+        ... def fill(builder, n):
+        ...     for i in range(n):
+        ...         content = builder.begin_list()
+        ...         for j in range(i):
+        ...             content.append(j * 1.1)
+        ...         builder.end_list()
+        ...
+        >>> fill(builder, 4)
+        >>> builder.snapshot()
+        <Array [[], [0], [0, 1.1], [0, 1.1, 2.2]] type='4 * var * float64'>
+
+    The builder can be passed to compiled functions but not returned from them.
+    """
+    register_and_check()
+
+    if isinstance(form, dict):
+        form = ak._v2.forms.from_iter(form)
+    elif isinstance(form, str):
+        form = ak._v2.forms.from_json(form)
+    if not isinstance(form, ak._v2.forms.Form):
+        raise ak._v2._util.error(
+            TypeError(f"'form' must be a Form, dict, or JSON string, not {form!r}")
+        )
+
+    return ak._v2.numba.LayoutBuilder(form, initial=initial, resize=resize)
@@ -7,6 +7,7 @@ from awkward._v2.operations.ak_argcombinations import argcombinations
 from awkward._v2.operations.ak_argmax import argmax, nanargmax
 from awkward._v2.operations.ak_argmin import argmin, nanargmin
 from awkward._v2.operations.ak_argsort import argsort
+from awkward._v2.operations.ak_argtop_k import argtop_k
 from awkward._v2.operations.ak_backend import backend
 from awkward._v2.operations.ak_broadcast_arrays import broadcast_arrays
 from awkward._v2.operations.ak_cartesian import cartesian
@@ -17,6 +18,10 @@ from awkward._v2.operations.ak_corr import corr
 from awkward._v2.operations.ak_count import count
 from awkward._v2.operations.ak_count_nonzero import count_nonzero
 from awkward._v2.operations.ak_covar import covar
+from awkward._v2.operations.ak_cummax import cummax
+from awkward._v2.operations.ak_cummin import cummin
+from awkward._v2.operations.ak_cumprod import cumprod
+from awkward._v2.operations.ak_cumsum import cumsum
 from awkward._v2.operations.ak_fields import fields
 from awkward._v2.operations.ak_fill_none import fill_none
 from awkward._v2.operations.ak_firsts import firsts
@@ -25,6 +30,7 @@ from awkward._v2.operations.ak_from_arrow import from_arrow
 from awkward._v2.operations.ak_from_arrow_schema import from_arrow_schema
 from awkward._v2.operations.ak_from_avro_file import from_avro_file
 from awkward._v2.operations.ak_from_buffers import from_buffers
+from awkward._v2.operations.ak_from_builders import from_builders
 from awkward._v2.operations.ak_from_cupy import from_cupy
 from awkward._v2.operations.ak_from_iter import from_iter
 from awkward._v2.operations.ak_from_jax import from_jax
@@ -36,10 +42,14 @@ from awkward._v2.operations.ak_from_parquet import from_parquet
 from awkward._v2.operations.ak_from_rdataframe import from_rdataframe
 from awkward._v2.operations.ak_from_regular import from_regular
 from awkward._v2.operations.ak_full_like import full_like
+from awkward._v2.operations.ak_group_by import group_by
+from awkward._v2.operations.ak_histogram import histogram
 from awkward._v2.operations.ak_isclose import isclose
 from awkward._v2.operations.ak_is_none import is_none
 from awkward._v2.operations.ak_is_tuple import is_tuple
+from awkward._v2.operations.ak_is_unique import is_unique
 from awkward._v2.operations.ak_is_valid import is_valid
+from awkward._v2.operations.ak_join import join
 from awkward._v2.operations.ak_linear_fit import linear_fit
 from awkward._v2.operations.ak_local_index import local_index
 from awkward._v2.operations.ak_mask import mask
@@ -59,6 +69,7 @@ from awkward._v2.operations.ak_prod import prod, nanprod
 from awkward._v2.operations.ak_ptp import ptp
 from awkward._v2.operations.ak_ravel import ravel
 from awkward._v2.operations.ak_run_lengths import run_lengths
+from awkward._v2.operations.ak_searchsorted import searchsorted
 from awkward._v2.operations.ak_singletons import singletons
 from awkward._v2.operations.ak_softmax import softmax
 from awkward._v2.operations.ak_sort import sort
@@ -79,8 +90,10 @@ from awkward._v2.operations.ak_to_pandas import to_pandas
 from awkward._v2.operations.ak_to_parquet import to_parquet
 from awkward._v2.operations.ak_to_rdataframe import to_rdataframe
 from awkward._v2.operations.ak_to_regular import to_regular
+from awkward._v2.operations.ak_top_k import top_k
 from awkward._v2.operations.ak_type import type
 from awkward._v2.operations.ak_unflatten import unflatten
+from awkward._v2.operations.ak_unique import unique
 from awkward._v2.operations.ak_unzip import unzip
 from awkward._v2.operations.ak_validity_error import validity_error
 from awkward._v2.operations.ak_values_astype import values_astype
@@ -92,3 +105,6 @@ from awkward._v2.operations.ak_without_parameters import without_parameters
 from awkward._v2.operations.ak_with_parameter import with_parameter
 from awkward._v2.operations.ak_zeros_like import zeros_like
 from awkward._v2.operations.ak_zip import zip
+
+# string operations, as ak._v2.str.*
+from awkward._v2.operations import str
@@ -6,7 +6,15 @@ np = ak.nplike.NumpyMetadata.instance()
 
 
 # @ak._v2._connect.numpy.implements("argsort")
-def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavior=None):
+def argsort(
+    array,
+    axis=-1,
+    ascending=True,
+    stable=True,
+    highlevel=True,
+    behavior=None,
+    kind=None,
+):
     """
     Args:
         array: Data for which to get a sorting index, possibly within nested
@@ -26,6 +34,11 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavio
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        kind (None or str): If `"radix"`, use a least-significant-digit radix
+            sort for integer and floating-point values, which is linear in
+            the number of values and stable. If None, radix sort is chosen
+            for large arrays with long lists. Other values (`"quicksort"`,
+            `"mergesort"`, `"heapsort"`, `"stable"`) use the comparison sort.
 
     For example,
 
@@ -51,12 +64,13 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True, behavio
             stable=stable,
             highlevel=highlevel,
             behavior=behavior,
+            kind=kind,
         ),
     ):
-        return _impl(array, axis, ascending, stable, highlevel, behavior)
+        return _impl(array, axis, ascending, stable, highlevel, behavior, kind)
 
 
-def _impl(array, axis, ascending, stable, highlevel, behavior):
+def _impl(array, axis, ascending, stable, highlevel, behavior, kind):
     layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
-    out = layout.argsort(axis, ascending, stable)
+    out = layout.argsort(axis, ascending, stable, kind=kind)
     return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,154 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def argtop_k(array, k, axis=-1, largest=True, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data in which to find the largest or smallest values, possibly
+            within nested lists.
+        k (int): Maximum number of positions per list.
+        axis (int): The dimension at which this operation is applied; only
+            `-1` (or the positive axis of the innermost lists) is implemented.
+        largest (bool): If True, the positions of the largest values, from
+            largest to smallest; if False, of the smallest values, from
+            smallest to largest.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the positions of the `k` largest (or smallest) values in each
+    innermost list, or of all of them if the list is shorter than `k`. This
+    is the same as `ak.argsort(array, ascending=not largest)[..., :k]`, with
+    ties in their original order and NaN first, as in #ak.argsort, but each
+    list is only partially sorted: selecting `k` of `n` values takes
+    O(n log k) rather than O(n log n).
+
+        >>> array = ak.Array([[3.3, 1.1, 5.5, 4.4], [], [2.2]])
+        >>> ak.argtop_k(array, 2)
+        <Array [[2, 3], [], [0]] type='3 * var * int64'>
+
+    None values are skipped, so a list has fewer than `k` positions if it
+    has fewer than `k` values that are not None.
+
+    See also #ak.top_k.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.argtop_k",
+        dict(
+            array=array,
+            k=k,
+            axis=axis,
+            largest=largest,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(array, k, axis, largest, highlevel, behavior)
+
+
+def _impl(array, k, axis, largest, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = _top_k(layout, k, axis, largest, True)
+    return ak._v2._util.wrap(out, behavior, highlevel)
+
+
+def _top_k(layout, k, axis, largest, positions):
+    # the positions (or values) of the top k values of each innermost list
+    nplike = layout.nplike
+    if not ak._v2._util.isint(k) or k < 0:
+        raise ak._v2._util.error(
+            ValueError("k must be a non-negative integer, not {!r}".format(k))
+        )
+    mindepth, maxdepth = layout.minmax_depth
+    if axis != -1 and (mindepth != maxdepth or axis != maxdepth - 1):
+        raise ak._v2._util.error(
+            NotImplementedError("top_k expects axis '-1' (the innermost lists)")
+        )
+
+    if layout.minmax_depth == (1, 1):
+        offsets = nplike.index_nplike.array([0, layout.length], dtype=np.int64)
+        return _select(layout, offsets, k, largest, positions)[1]
+
+    def action(node, **kwargs):
+        if node.is_ListType and node.content.minmax_depth == (1, 1):
+            if isinstance(node, ak._v2.contents.RegularArray):
+                offsets = (
+                    nplike.index_nplike.arange(node.length + 1, dtype=np.int64)
+                    * node.size
+                )
+                content = node.content[: node.length * node.size]
+            else:
+                listoffsetarray = node.toListOffsetArray64(True)
+                offsets = nplike.index_nplike.asarray(listoffsetarray.offsets)
+                content = listoffsetarray.content[: offsets[-1]]
+            outoffsets, out = _select(content, offsets, k, largest, positions)
+            parameters = None if positions else node.parameters
+
+            if isinstance(node, ak._v2.contents.RegularArray) and not (
+                content.is_OptionType
+            ):
+                return ak._v2.contents.RegularArray(
+                    out, min(k, node.size), node.length, parameters=parameters
+                )
+            return ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(outoffsets), out, parameters=parameters
+            )
+
+    return layout.recursively_apply(action, numpy_to_regular=True)
+
+
+def _select(content, offsets, k, largest, positions):
+    # the offsets and top k positions (or values) of each segment of `content`
+    nplike = content.nplike
+    index_nplike = nplike.index_nplike
+    items, itemoffsets, valid = ak._v2._unique.compact(content, offsets)
+    if isinstance(items, ak._v2.contents.EmptyArray):
+        items = items.toNumpyArray(np.float64)
+    if not isinstance(items, ak._v2.contents.NumpyArray) or len(items.shape) != 1:
+        raise ak._v2._util.error(
+            TypeError("cannot find the top k values of {}".format(items.form.type))
+        )
+
+    data = nplike.ascontiguousarray(items.data)
+    if data.dtype.kind in ("M", "m"):
+        data = data.view(np.int64)
+    if data.dtype.kind == "c":
+        raise ak._v2._util.error(
+            TypeError("cannot find the top k values of complex numbers")
+        )
+    numlists = len(offsets) - 1
+    outoffsets = index_nplike.zeros(numlists + 1, dtype=np.int64)
+    index_nplike.cumsum(
+        index_nplike.minimum(itemoffsets[1:] - itemoffsets[:-1], k),
+        out=outoffsets[1:],
+    )
+    local = index_nplike.empty(outoffsets[-1], dtype=np.int64)
+    items._handle_error(
+        nplike[
+            "awkward_top_k",
+            local.dtype.type,
+            data.dtype.type,
+            itemoffsets.dtype.type,
+        ](local, data, itemoffsets, numlists, k, largest)
+    )
+
+    segment = index_nplike.repeat(
+        index_nplike.arange(numlists, dtype=np.int64),
+        outoffsets[1:] - outoffsets[:-1],
+    )
+    index = local + itemoffsets[segment]
+    if positions:
+        if valid is not None:
+            index = index_nplike.nonzero(valid)[0][index]
+            out = ak._v2.contents.NumpyArray(index - offsets[segment])
+        else:
+            out = ak._v2.contents.NumpyArray(local)
+    else:
+        out = items._carry(ak._v2.index.Index64(index), False)
+    return outoffsets, out
@@ -82,6 +82,26 @@ def _impl(x, y, weight, axis, keepdims, mask_identity, flatten_records):
             ak._v2.operations.to_layout(weight, allow_record=False, allow_other=False)
         )
 
+    segments = ak._v2._moments.Segments.of(
+        axis, x.layout, y.layout, weight=None if weight is None else weight.layout
+    )
+    if segments is not None:
+        _, sumwxy, sumwxx, sumwyy = segments.comoments()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = sumwxy / ak.nplike.of(sumwxy).sqrt(sumwxx * sumwyy)
+        return segments.wrap(
+            out,
+            keepdims,
+            mask_identity,
+            ak._v2._util.behavior_of(x, y, weight),
+            mask_lists=True,
+            scalar_dtype=(
+                segments.data_dtype
+                if weight is None and segments.data_dtype == np.float32
+                else None
+            ),
+        )
+
     with np.errstate(invalid="ignore"):
         xmean = ak._v2.operations.ak_mean._impl(
             x, weight, axis, False, mask_identity, flatten_records
@@ -0,0 +1,48 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def cummin(array, axis=-1, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        axis (None or int): If None, flatten the array and return a flat
+            array of results, as NumPy does; if `-1` (or the positive axis of
+            the innermost lists), compute the results within each innermost
+            list. Other axes are not implemented.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Replaces each value in each innermost list with the smallest value seen so
+    far in its list (including itself), like NumPy's `np.minimum.accumulate`
+    applied to each list separately. The output has the same lists as `array`:
+
+        >>> ak.cummin(ak.Array([[1, 2, 3], [], [4, 5]]))
+        <Array [[1, 1, 1], [], [4, 4]] type='3 * var * int64'>
+
+    None values are skipped and stay None; fields of records are scanned
+    separately. A NaN is the minimum of everything after it in its list, as in
+    `np.minimum.accumulate`.
+
+    The scan is a single pass over each list, with the same offsets as the
+    input.
+
+    See also #ak.cumsum, #ak.cumprod, and #ak.cummax.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.cummin",
+        dict(array=array, axis=axis, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, axis, highlevel, behavior)
+
+
+def _impl(array, axis, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = ak._v2._scans.apply(ak._v2._scans.CumMin, layout, axis)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,181 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+def from_builders(builders, highlevel=True, behavior=None):
+    """
+    Args:
+        builders (iterable of #ak.ArrayBuilder or arrays): Partial results to
+            combine, in order. ArrayBuilders are snapshotted; arrays (such as
+            snapshots returned by other processes) are used as they are.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Combines independently filled #ak.ArrayBuilder objects into one array,
+    as though all of their data had been appended to a single ArrayBuilder.
+
+    An ArrayBuilder can only be filled by one thread at a time, but separate
+    ArrayBuilders can be filled in parallel. In Numba, a function that fills
+    an ArrayBuilder can be compiled with `nogil=True`, so that threads filling
+    different builders run concurrently:
+
+        >>> @nb.njit(nogil=True)
+        ... def fill(builder, events):
+        ...     for event in events:
+        ...         ...
+        ...
+        >>> builders = [ak.ArrayBuilder() for _ in range(num_threads)]
+        >>> with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+        ...     for builder, chunk in zip(builders, chunks):
+        ...         executor.submit(fill, builder, chunk)
+        ...
+        >>> array = ak.from_builders(builders)
+
+    (or each process of a multiprocessing pool can return a snapshot of its
+    ArrayBuilder, and the snapshots can be combined in the same way).
+
+    Each builder discovers its type from the data it sees, so the partial
+    results can have different types. They are reconciled the way that a
+    single ArrayBuilder would have done it: integers and floating-point
+    numbers are combined as floating-point, a part without missing values is
+    combined with a part that has them as an option type, a part with no data
+    at all (or only missing values) takes the type of the others, and records (or nested records) whose fields
+    differ get the union of their fields, with missing values where a part
+    did not have a field. Types that cannot be combined, such as numbers and
+    strings, become union types, as in #ak.concatenate.
+
+    The data from all of the parts are copied into one new set of buffers.
+
+    See also #ak.concatenate.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.from_builders",
+        dict(builders=builders, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(builders, highlevel, behavior)
+
+
+def _impl(builders, highlevel, behavior):
+    layouts = [
+        ak._v2.operations.to_layout(x, allow_record=False, allow_other=False)
+        for x in builders
+    ]
+    if len(layouts) == 0:
+        return ak._v2._util.wrap(ak._v2.contents.EmptyArray(), behavior, highlevel)
+
+    return ak._v2.operations.concatenate(
+        _reconcile(layouts),
+        axis=0,
+        mergebool=False,
+        highlevel=highlevel,
+        behavior=behavior,
+    )
+
+
+def _reconcile(layouts):
+    # layouts are corresponding nodes from each part; returns them with the
+    # same record fields and option-ness (recursively), ready to be merged
+    if any(isinstance(x, ak._v2.contents.IndexedOptionArray) for x in layouts):
+        layouts = [
+            (
+                x
+                if isinstance(x, ak._v2.contents.IndexedOptionArray)
+                else ak._v2.contents.IndexedOptionArray(
+                    ak._v2.index.Index64(numpy.arange(len(x), dtype=np.int64)), x
+                )
+            )
+            for x in layouts
+        ]
+
+    cores = [
+        x.content if isinstance(x, ak._v2.contents.IndexedOptionArray) else x
+        for x in layouts
+    ]
+    nonempty = [x for x in cores if not x.is_UnknownType]
+    if len(nonempty) == 0:
+        return layouts
+    first = nonempty[0]
+
+    # a part with no data takes the type of the others (as in _missing), and
+    # if it was an option type, its IndexedOptionArray is kept around it below
+    cores = [first[0:0] if x.is_UnknownType else x for x in cores]
+
+    if isinstance(first, ak._v2.contents.ListOffsetArray) and all(
+        isinstance(x, ak._v2.contents.ListOffsetArray)
+        and x.parameters == first.parameters
+        for x in cores
+    ):
+        contents = _reconcile([x.content for x in cores])
+        replaced = [
+            ak._v2.contents.ListOffsetArray(x.offsets, y, parameters=x.parameters)
+            for x, y in zip(cores, contents)
+        ]
+
+    elif isinstance(first, ak._v2.contents.RecordArray) and all(
+        isinstance(x, ak._v2.contents.RecordArray)
+        and x.is_tuple == first.is_tuple
+        and x.parameters == first.parameters
+        for x in cores
+    ):
+        if first.is_tuple:
+            if any(len(x.contents) != len(first.contents) for x in cores):
+                return layouts
+            fields = None
+            columns = [
+                _reconcile([x.content(i) for x in cores])
+                for i in range(len(first.contents))
+            ]
+        else:
+            fields = []
+            for x in cores:
+                for field in x.fields:
+                    if field not in fields:
+                        fields.append(field)
+            columns = []
+            for field in fields:
+                template = [x for x in cores if x.has_field(field)][0].content(field)
+                columns.append(
+                    _reconcile(
+                        [
+                            (
+                                x.content(field)
+                                if x.has_field(field)
+                                else _missing(template, len(x))
+                            )
+                            for x in cores
+                        ]
+                    )
+                )
+        replaced = [
+            ak._v2.contents.RecordArray(
+                list(row), fields, len(x), parameters=x.parameters
+            )
+            for x, row in zip(cores, zip(*columns))
+        ]
+
+    else:
+        replaced = cores
+
+    return [
+        (
+            ak._v2.contents.IndexedOptionArray(x.index, y, parameters=x.parameters)
+            if isinstance(x, ak._v2.contents.IndexedOptionArray)
+            else y
+        )
+        for x, y in zip(layouts, replaced)
+    ]
+
+
+def _missing(template, length):
+    # all missing values, with the same type as the template so that they merge
+    if isinstance(template, ak._v2.contents.IndexedOptionArray):
+        template = template.content
+    return ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(numpy.full(length, -1, np.int64)), template[0:0]
+    )
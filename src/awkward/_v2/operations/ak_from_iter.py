@@ -1,12 +1,24 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
+import datetime
+import numbers
+from collections.abc import Iterable, Mapping
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
 
 
 def from_iter(
-    iterable, highlevel=True, behavior=None, allow_record=True, initial=1024, resize=1.5
+    iterable,
+    highlevel=True,
+    behavior=None,
+    allow_record=True,
+    initial=1024,
+    resize=1.5,
+    form=None,
+    type=None,
 ):
     """
     Args:
@@ -23,6 +35,11 @@ def from_iter(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, or str/dict equivalent): If not None, the
+            Form of the output array, which is known in advance.
+        type (None, #ak.types.Type, or str): If not None, the type of the output
+            array, which is known in advance, as a Type object or a datashape
+            string. Only one of `form` and `type` can be given.
 
     Converts Python data into an Awkward Array.
 
@@ -48,6 +65,17 @@ def from_iter(
        * iterable, including np.ndarray: converted into
          #ak.layout.ListOffsetArray.
 
+    If a `form` or `type` is given, #ak.layout.ArrayBuilder is not used: the
+    data are converted directly into buffers for that Form, without discovering
+    (and possibly upgrading) the type as they go. The output has exactly the
+    requested Form (with the `type`, lists are #ak.layout.ListOffsetArray and
+    missing values are #ak.layout.IndexedOptionArray), and a ValueError is
+    raised if the data do not match it. Records are converted field by field,
+    and dict keys that are not fields of the Form are ignored. For example,
+
+        >>> ak.from_iter([[1, 2, 3], [], [4, 5]], type="var * float32")
+        <Array [[1, 2, 3], [], [4, 5]] type='3 * var * float32'>
+
     See also #ak.to_list.
     """
     with ak._v2._util.OperationErrorContext(
@@ -59,12 +87,16 @@ def from_iter(
             allow_record=allow_record,
             initial=initial,
             resize=resize,
+            form=form,
+            type=type,
         ),
     ):
-        return _impl(iterable, highlevel, behavior, allow_record, initial, resize)
+        return _impl(
+            iterable, highlevel, behavior, allow_record, initial, resize, form, type
+        )
 
 
-def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
+def _impl(iterable, highlevel, behavior, allow_record, initial, resize, form, tpe):
     if isinstance(iterable, dict):
         if allow_record:
             return _impl(
@@ -74,6 +106,8 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
                 False,
                 initial,
                 resize,
+                form,
+                tpe,
             )[0]
         else:
             raise ak._v2._util.error(
@@ -82,7 +116,56 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
                 )
             )
 
+    if tpe is not None:
+        if form is not None:
+            raise ak._v2._util.error(
+                TypeError("only one of 'form' and 'type' can be given")
+            )
+        if ak._v2._util.isstr(tpe):
+            tpe = ak._v2.types.from_datashape(tpe, highlevel=False)
+        if isinstance(tpe, ak._v2.types.ArrayType):
+            tpe = tpe.content
+        if not isinstance(tpe, ak._v2.types.Type):
+            raise ak._v2._util.error(
+                TypeError(
+                    "'type' argument must be a Type or its datashape string representation"
+                )
+            )
+        form = _type_to_form(tpe)
+
+    if form is not None:
+        if ak._v2._util.isstr(form):
+            if ak._v2.types.numpytype.is_primitive(form):
+                form = ak._v2.forms.NumpyForm(form)
+            else:
+                form = ak._v2.forms.from_json(form)
+        elif isinstance(form, dict):
+            form = ak._v2.forms.from_iter(form)
+        if not isinstance(form, ak._v2.forms.Form):
+            raise ak._v2._util.error(
+                TypeError(
+                    "'form' argument must be a Form or its Python dict/JSON string representation"
+                )
+            )
+
+        layout = _from_iter_form(form, list(iterable))
+        return ak._v2._util.wrap(layout, behavior, highlevel)
+
     builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+
+    if (
+        isinstance(iterable, numpy.ndarray)
+        and iterable.ndim != 0
+        and iterable.dtype.kind in "biuf"
+    ):
+        # booleans and numbers are filled from the array's buffer as one list,
+        # rather than one NumPy scalar or subarray at a time
+        builder.fromiter(iterable)
+        formstr, length, buffers = builder.to_buffers()
+        form = ak._v2.forms.from_json(formstr)
+        layout = ak._v2.operations.from_buffers(form, length, buffers, highlevel=False)
+        return ak._v2._util.wrap(layout.content, behavior, highlevel)
+
     for x in iterable:
         builder.fromiter(x)
 
@@ -92,3 +175,404 @@ def _impl(iterable, highlevel, behavior, allow_record, initial, resize):
     return ak._v2.operations.from_buffers(
         form, length, buffers, highlevel=highlevel, behavior=behavior
     )
+
+
+def _type_to_form(tpe):
+    if isinstance(tpe, ak._v2.types.UnknownType):
+        return ak._v2.forms.EmptyForm(parameters=tpe.parameters)
+
+    elif isinstance(tpe, ak._v2.types.NumpyType):
+        return ak._v2.forms.NumpyForm(tpe.primitive, parameters=tpe.parameters)
+
+    elif isinstance(tpe, ak._v2.types.ListType):
+        return ak._v2.forms.ListOffsetForm(
+            "i64", _type_to_form(tpe.content), parameters=tpe.parameters
+        )
+
+    elif isinstance(tpe, ak._v2.types.RegularType):
+        return ak._v2.forms.RegularForm(
+            _type_to_form(tpe.content), tpe.size, parameters=tpe.parameters
+        )
+
+    elif isinstance(tpe, ak._v2.types.RecordType):
+        return ak._v2.forms.RecordForm(
+            [_type_to_form(x) for x in tpe.contents],
+            None if tpe.is_tuple else tpe.fields,
+            parameters=tpe.parameters,
+        )
+
+    elif isinstance(tpe, ak._v2.types.OptionType):
+        return ak._v2.forms.IndexedOptionForm(
+            "i64", _type_to_form(tpe.content), parameters=tpe.parameters
+        )
+
+    elif isinstance(tpe, ak._v2.types.UnionType):
+        return ak._v2.forms.UnionForm(
+            "i8",
+            "i64",
+            [_type_to_form(x) for x in tpe.contents],
+            parameters=tpe.parameters,
+        )
+
+    else:
+        raise ak._v2._util.error(TypeError(f"unrecognized type: {tpe!r}"))
+
+
+_index_dtype = {
+    "i8": np.dtype(np.int8),
+    "u8": np.dtype(np.uint8),
+    "i32": np.dtype(np.int32),
+    "u32": np.dtype(np.uint32),
+    "i64": np.dtype(np.int64),
+}
+
+
+def _mismatch(form, x):
+    text = repr(x)
+    if len(text) > 80:
+        text = text[:77] + "..."
+    return ValueError(f"cannot convert {text} into type {str(form.type)!r}")
+
+
+def _is_option(form):
+    return isinstance(
+        form,
+        (
+            ak._v2.forms.IndexedOptionForm,
+            ak._v2.forms.ByteMaskedForm,
+            ak._v2.forms.BitMaskedForm,
+            ak._v2.forms.UnmaskedForm,
+        ),
+    )
+
+
+def _is_string(form):
+    return form.parameter("__array__") in ("string", "bytestring")
+
+
+def _is_list(x):
+    return isinstance(x, Iterable) and not isinstance(x, (str, bytes, Mapping))
+
+
+def _accepts(form, x):
+    # shallow check of whether x has the right kind for form, to choose
+    # the content of a union
+    if isinstance(form, ak._v2.forms.UnionForm):
+        return any(_accepts(content, x) for content in form.contents)
+
+    elif _is_option(form):
+        return x is None or _accepts(form.content, x)
+
+    elif isinstance(form, ak._v2.forms.IndexedForm):
+        return _accepts(form.content, x)
+
+    elif isinstance(form, ak._v2.forms.EmptyForm):
+        return False
+
+    elif isinstance(form, ak._v2.forms.NumpyForm):
+        if len(form.inner_shape) != 0:
+            return _is_list(x)
+        elif form.primitive == "bool":
+            return isinstance(x, (bool, np.bool_))
+        elif isinstance(x, (bool, np.bool_)):
+            return False
+        elif form.primitive.startswith(("int", "uint")):
+            return isinstance(x, numbers.Integral)
+        elif form.primitive.startswith("float"):
+            return isinstance(x, numbers.Real)
+        elif form.primitive.startswith("complex"):
+            return isinstance(x, numbers.Complex)
+        elif form.primitive.startswith("datetime"):
+            return isinstance(x, (np.datetime64, datetime.date))
+        else:
+            return isinstance(x, (np.timedelta64, datetime.timedelta))
+
+    elif _is_string(form):
+        if form.parameter("__array__") == "string":
+            return isinstance(x, str)
+        else:
+            return isinstance(x, bytes)
+
+    elif isinstance(
+        form,
+        (ak._v2.forms.ListOffsetForm, ak._v2.forms.ListForm, ak._v2.forms.RegularForm),
+    ):
+        return _is_list(x)
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        if form.is_tuple:
+            return isinstance(x, tuple) and len(x) == len(form.contents)
+        else:
+            return isinstance(x, Mapping) and all(field in x for field in form.fields)
+
+    else:
+        return False
+
+
+def _placeholder(form):
+    # a value of the right type, to fill the content of masked forms where
+    # the data are None
+    if isinstance(form, ak._v2.forms.NumpyForm):
+        dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        return numpy.zeros(form.inner_shape, dtype=dtype)[()]
+    elif _is_string(form):
+        return "" if form.parameter("__array__") == "string" else b""
+    elif isinstance(form, (ak._v2.forms.ListOffsetForm, ak._v2.forms.ListForm)):
+        return []
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        return [_placeholder(form.content)] * form.size
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        contents = [_placeholder(x) for x in form.contents]
+        if form.is_tuple:
+            return tuple(contents)
+        else:
+            return dict(zip(form.fields, contents))
+    elif isinstance(form, ak._v2.forms.UnionForm):
+        return _placeholder(form.contents[0])
+    elif _is_option(form):
+        return None
+    else:
+        return _placeholder(form.content)
+
+
+def _flatten(form, data):
+    offsets = numpy.empty(len(data) + 1, dtype=np.int64)
+    offsets[0] = 0
+    lengths = []
+    flat = []
+    for x in data:
+        if not _is_list(x):
+            raise ak._v2._util.error(_mismatch(form, x))
+        flat.extend(x)
+        lengths.append(len(flat))
+    offsets[1:] = lengths
+    return offsets, flat
+
+
+def _from_iter_form(form, data):
+    if isinstance(form, ak._v2.forms.EmptyForm):
+        if len(data) != 0:
+            raise ak._v2._util.error(_mismatch(form, data[0]))
+        return ak._v2.contents.EmptyArray(parameters=form.parameters)
+
+    elif isinstance(form, ak._v2.forms.NumpyForm):
+        dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        if len(data) == 0:
+            array = numpy.empty((0,) + form.inner_shape, dtype=dtype)
+        elif dtype.kind in "mM":
+            try:
+                array = numpy.asarray(data, dtype=dtype)
+            except (ValueError, TypeError):
+                for x in data:
+                    if not _accepts(form, x):
+                        raise ak._v2._util.error(_mismatch(form, x)) from None
+                raise ak._v2._util.error(_mismatch(form, data)) from None
+            if array.shape[1:] != form.inner_shape:
+                raise ak._v2._util.error(_mismatch(form, data))
+        else:
+            try:
+                array = numpy.asarray(data)
+            except (ValueError, TypeError):
+                array = numpy.asarray(data, dtype=np.object_)
+            if array.shape[1:] != form.inner_shape or not _kind_fits(
+                array.dtype, dtype
+            ):
+                for x in data:
+                    if numpy.asarray(x).shape != form.inner_shape or not _kind_fits(
+                        numpy.asarray(x).dtype, dtype
+                    ):
+                        raise ak._v2._util.error(_mismatch(form, x))
+                raise ak._v2._util.error(_mismatch(form, data))
+            if array.dtype.kind != "b" and dtype.kind != "b":
+                # numpy.asarray turns booleans mixed with numbers into numbers
+                for x in _booleans(data, form.inner_shape):
+                    raise ak._v2._util.error(_mismatch(form, x))
+            if array.dtype.kind in "iu" and dtype.kind in "iu" and len(array) != 0:
+                info = np.iinfo(dtype)
+                low, high = numpy.min(array), numpy.max(array)
+                if low < info.min or high > info.max:
+                    raise ak._v2._util.error(
+                        _mismatch(form, low if low < info.min else high)
+                    )
+            array = array.astype(dtype, copy=False)
+        return ak._v2.contents.NumpyArray(array, parameters=form.parameters)
+
+    elif _is_string(form) and isinstance(
+        form, (ak._v2.forms.ListOffsetForm, ak._v2.forms.ListForm)
+    ):
+        if form.parameter("__array__") == "string":
+            strings = []
+            for x in data:
+                if not isinstance(x, str):
+                    raise ak._v2._util.error(_mismatch(form, x))
+                strings.append(x.encode("utf-8"))
+        else:
+            strings = data
+            for x in data:
+                if not isinstance(x, bytes):
+                    raise ak._v2._util.error(_mismatch(form, x))
+        offsets = numpy.empty(len(strings) + 1, dtype=np.int64)
+        offsets[0] = 0
+        offsets[1:] = numpy.cumsum([len(x) for x in strings])
+        content = ak._v2.contents.NumpyArray(
+            numpy.frombuffer(b"".join(strings), dtype=np.uint8),
+            parameters=form.content.parameters,
+        )
+        return _list_from_offsets(form, offsets, content)
+
+    elif isinstance(form, (ak._v2.forms.ListOffsetForm, ak._v2.forms.ListForm)):
+        offsets, flat = _flatten(form, data)
+        return _list_from_offsets(form, offsets, _from_iter_form(form.content, flat))
+
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        offsets, flat = _flatten(form, data)
+        for i in numpy.nonzero(offsets[1:] - offsets[:-1] != form.size)[0]:
+            raise ak._v2._util.error(_mismatch(form, data[i]))
+        return ak._v2.contents.RegularArray(
+            _from_iter_form(form.content, flat),
+            form.size,
+            zeros_length=len(data),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        if form.is_tuple:
+            for x in data:
+                if not isinstance(x, tuple) or len(x) != len(form.contents):
+                    raise ak._v2._util.error(_mismatch(form, x))
+            columns = [[x[i] for x in data] for i in range(len(form.contents))]
+        else:
+            columns = []
+            for field in form.fields:
+                try:
+                    columns.append([x[field] for x in data])
+                except (KeyError, TypeError, IndexError):
+                    for x in data:
+                        if not isinstance(x, Mapping) or field not in x:
+                            raise ak._v2._util.error(_mismatch(form, x)) from None
+                    raise ak._v2._util.error(_mismatch(form, data)) from None
+        return ak._v2.contents.RecordArray(
+            [_from_iter_form(x, y) for x, y in zip(form.contents, columns)],
+            None if form.is_tuple else form.fields,
+            len(data),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+        isnone = numpy.array([x is None for x in data], dtype=np.bool_)
+        index = numpy.cumsum(~isnone) - 1
+        index[isnone] = -1
+        valid = [x for x in data if x is not None]
+        return ak._v2.contents.IndexedOptionArray(
+            ak._v2.index.Index(index.astype(_index_dtype[form.index])),
+            _from_iter_form(form.content, valid),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.IndexedForm):
+        return ak._v2.contents.IndexedArray(
+            ak._v2.index.Index(numpy.arange(len(data), dtype=_index_dtype[form.index])),
+            _from_iter_form(form.content, data),
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.ByteMaskedForm):
+        placeholder = _placeholder(form.content)
+        mask = numpy.array([x is not None for x in data], dtype=np.bool_)
+        content = _from_iter_form(
+            form.content, [placeholder if x is None else x for x in data]
+        )
+        if not form.valid_when:
+            mask = ~mask
+        return ak._v2.contents.ByteMaskedArray(
+            ak._v2.index.Index8(mask.view(np.int8)),
+            content,
+            form.valid_when,
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.BitMaskedForm):
+        placeholder = _placeholder(form.content)
+        mask = numpy.array([x is not None for x in data], dtype=np.bool_)
+        content = _from_iter_form(
+            form.content, [placeholder if x is None else x for x in data]
+        )
+        if not form.valid_when:
+            mask = ~mask
+        bits = numpy.packbits(mask, bitorder="little" if form.lsb_order else "big")
+        return ak._v2.contents.BitMaskedArray(
+            ak._v2.index.IndexU8(bits),
+            content,
+            form.valid_when,
+            len(data),
+            form.lsb_order,
+            parameters=form.parameters,
+        )
+
+    elif isinstance(form, ak._v2.forms.UnmaskedForm):
+        for x in data:
+            if x is None:
+                raise ak._v2._util.error(_mismatch(form, x))
+        return ak._v2.contents.UnmaskedArray(
+            _from_iter_form(form.content, data), parameters=form.parameters
+        )
+
+    elif isinstance(form, ak._v2.forms.UnionForm):
+        tags = numpy.empty(len(data), dtype=_index_dtype[form.tags])
+        index = numpy.empty(len(data), dtype=_index_dtype[form.index])
+        groups = [[] for _ in form.contents]
+        for i, x in enumerate(data):
+            for tag, content in enumerate(form.contents):
+                if _accepts(content, x):
+                    tags[i] = tag
+                    index[i] = len(groups[tag])
+                    groups[tag].append(x)
+                    break
+            else:
+                raise ak._v2._util.error(_mismatch(form, x))
+        return ak._v2.contents.UnionArray(
+            ak._v2.index.Index(tags),
+            ak._v2.index.Index(index),
+            [_from_iter_form(x, y) for x, y in zip(form.contents, groups)],
+            parameters=form.parameters,
+        )
+
+    else:
+        raise ak._v2._util.error(TypeError(f"unrecognized form: {form!r}"))
+
+
+def _booleans(data, inner_shape):
+    if len(inner_shape) != 0:
+        data = numpy.asarray(data, dtype=np.object_).reshape(-1)
+    return (x for x in data if isinstance(x, (bool, np.bool_)))
+
+
+def _kind_fits(given, expected):
+    if given.kind == "b":
+        return expected.kind == "b"
+    elif given.kind in "iu":
+        return expected.kind in "iufc"
+    elif given.kind == "f":
+        return expected.kind in "fc"
+    elif given.kind == "c":
+        return expected.kind == "c"
+    elif given.kind in "mM":
+        return given.kind == expected.kind
+    else:
+        return False
+
+
+def _list_from_offsets(form, offsets, content):
+    if isinstance(form, ak._v2.forms.ListOffsetForm):
+        return ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index(offsets.astype(_index_dtype[form.offsets])),
+            content,
+            parameters=form.parameters,
+        )
+    else:
+        return ak._v2.contents.ListArray(
+            ak._v2.index.Index(offsets[:-1].astype(_index_dtype[form.starts])),
+            ak._v2.index.Index(offsets[1:].astype(_index_dtype[form.stops])),
+            content,
+            parameters=form.parameters,
+        )
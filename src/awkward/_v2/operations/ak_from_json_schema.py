@@ -153,7 +153,7 @@ def _impl(
 
     for key, value in container.items():
         if value is None:
-            container[key] = specializedjson[key]
+            container[key] = specializedjson.steal(key)
 
     if schema.get("type") == "array":
         length = len(specializedjson)
@@ -0,0 +1,284 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+_aggregations = ("sum", "count", "min", "max", "mean", "first", "last")
+
+
+def group_by(
+    array,
+    key,
+    axis=0,
+    method="hash",
+    aggregations=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        array: Records to group (anything #ak.to_layout recognizes).
+        key (str or list of str): Field or fields whose values define the
+            groups: records with equal keys (including None) are in the same
+            group.
+        axis (int): If `0`, group all records of `array`, which must be an
+            array of records; if `-1`, group the records of each innermost
+            list separately.
+        method ("hash" or "sort"): If "hash", the groups are in order of the
+            first appearance of their keys; if "sort", in the order of
+            #ak.sort of the keys. See #ak.unique.
+        aggregations (None or dict): If None, return the records of each
+            group; otherwise, a dict from output field names to `"count"`
+            (the number of records in each group) or `(function, field)`,
+            where `function` is one of "sum", "count", "min", "max", "mean",
+            "first" or "last" and `field` is the field of values to aggregate.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Groups records by the values of `key`. Without `aggregations`, returns
+    the records of each group, in their original order:
+
+        >>> array = ak.Array([{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2},
+        ...                   {"x": 1, "y": 3.3}])
+        >>> ak.group_by(array, "x").tolist()
+        [[{'x': 1, 'y': 1.1}, {'x': 1, 'y': 3.3}], [{'x': 2, 'y': 2.2}]]
+
+    With `aggregations`, returns one record per group, with the key field(s)
+    and the aggregated values, without materializing the groups:
+
+        >>> ak.group_by(
+        ...     array, "x", aggregations={"n": "count", "total": ("sum", "y")}
+        ... ).tolist()
+        [{'x': 1, 'n': 2, 'total': 4.4}, {'x': 2, 'n': 1, 'total': 2.2}]
+
+    With `axis=-1`, the records in each innermost list are grouped
+    separately, so each list becomes a list of groups (or of aggregated
+    records).
+
+    As in the reducers, None values of `field` are skipped by "sum",
+    "count", "min", "max" and "mean", and "min", "max" and "mean" are None
+    for groups with no values. "first" and "last" take the value of the
+    first and last record of each group, whether it is None or not.
+
+    This is equivalent to sorting by key with #ak.argsort and splitting
+    with #ak.run_lengths and #ak.unflatten, but takes one pass over the keys.
+
+    See also #ak.unique.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.group_by",
+        dict(
+            array=array,
+            key=key,
+            axis=axis,
+            method=method,
+            aggregations=aggregations,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(array, key, axis, method, aggregations, highlevel, behavior)
+
+
+def _impl(array, key, axis, method, aggregations, highlevel, behavior):
+    if method not in ("hash", "sort"):
+        raise ak._v2._util.error(
+            ValueError("method must be 'hash' or 'sort', not {!r}".format(method))
+        )
+    if axis not in (0, -1):
+        raise ak._v2._util.error(
+            NotImplementedError("group_by expects axis '0' or '-1'")
+        )
+
+    keys = [key] if ak._v2._util.isstr(key) else list(key)
+    if aggregations is not None:
+        aggregations = [
+            _aggregation(name, aggregation, keys)
+            for name, aggregation in aggregations.items()
+        ]
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    nplike = layout.nplike
+
+    if _is_records(layout):
+        offsets = nplike.index_nplike.array([0, layout.length], dtype=np.int64)
+        items, offsets, _ = ak._v2._unique.compact(layout, offsets)
+        out = _group(items, offsets, keys, method, aggregations).content
+
+    elif axis == 0:
+        raise ak._v2._util.error(
+            ValueError("group_by with axis=0 expects an array of records")
+        )
+
+    else:
+        found = []
+
+        def action(node, **kwargs):
+            if node.is_ListType and _is_records(node.content):
+                found.append(node)
+                listoffsetarray = node.toListOffsetArray64(True)
+                offsets = nplike.index_nplike.asarray(listoffsetarray.offsets)
+                content = listoffsetarray.content[: offsets[-1]]
+                items, offsets, _ = ak._v2._unique.compact(content, offsets)
+                return _group(items, offsets, keys, method, aggregations)
+
+        out = layout.recursively_apply(action)
+        if len(found) == 0:
+            raise ak._v2._util.error(
+                ValueError("group_by expects lists of records at axis=-1")
+            )
+
+    return ak._v2._util.wrap(out, behavior, highlevel)
+
+
+def _aggregation(name, aggregation, keys):
+    if aggregation == "count":
+        aggregation = ("count", None)
+    if (
+        not isinstance(aggregation, tuple)
+        or len(aggregation) != 2
+        or aggregation[0] not in _aggregations
+        or (aggregation[1] is None and aggregation[0] != "count")
+    ):
+        raise ak._v2._util.error(
+            ValueError(
+                "aggregation {!r} must be 'count' or a tuple of a function among "
+                "{} and a field name, not {!r}".format(
+                    name, ", ".join(repr(x) for x in _aggregations), aggregation
+                )
+            )
+        )
+    if name in keys:
+        raise ak._v2._util.error(
+            ValueError("aggregation {!r} has the same name as a key".format(name))
+        )
+    return (name,) + aggregation
+
+
+def _is_records(layout):
+    if layout.is_OptionType or layout.is_IndexedType:
+        layout = layout.content
+    return isinstance(layout, ak._v2.contents.RecordArray)
+
+
+def _group(items, offsets, keys, method, aggregations):
+    # the records of each segment of `items`, grouped (or aggregated) by key,
+    # as a list of groups per segment
+    nplike = items.nplike
+    for key in keys:
+        if key not in items.fields:
+            raise ak._v2._util.error(
+                ValueError("no field {!r} in records to group".format(key))
+            )
+    if len(keys) == 1:
+        keylayout = items.content(keys[0])
+    else:
+        keylayout = ak._v2.contents.RecordArray(
+            [items.content(key) for key in keys], keys, items.length
+        )
+
+    first, counts, inverse, outoffsets = ak._v2._unique.distinct(
+        keylayout, offsets, method
+    )
+    segment = nplike.index_nplike.repeat(
+        nplike.index_nplike.arange(len(offsets) - 1, dtype=np.int64),
+        offsets[1:] - offsets[:-1],
+    )
+    groups = outoffsets[segment] + inverse
+    outoffsets = ak._v2.index.Index64(outoffsets)
+
+    if aggregations is None:
+        carry, groupoffsets = ak._v2._unique.group_carry(items, groups, counts)
+        return ak._v2.contents.ListOffsetArray(
+            outoffsets,
+            ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(groupoffsets),
+                items._carry(ak._v2.index.Index64(carry), False),
+            ),
+        )
+
+    fields = list(keys)
+    contents = [
+        items.content(key)._carry(ak._v2.index.Index64(first), False) for key in keys
+    ]
+    for name, function, field in aggregations:
+        fields.append(name)
+        contents.append(_aggregate(items, function, field, groups, counts, first))
+    return ak._v2.contents.ListOffsetArray(
+        outoffsets, ak._v2.contents.RecordArray(contents, fields, len(counts))
+    )
+
+
+def _aggregate(items, function, field, groups, counts, first):
+    nplike = items.nplike
+    numgroups = len(counts)
+    if field is None:
+        return ak._v2.contents.NumpyArray(counts)
+    if field not in items.fields:
+        raise ak._v2._util.error(
+            ValueError("no field {!r} in records to aggregate".format(field))
+        )
+    values = items.content(field)
+
+    if function == "first":
+        return values._carry(ak._v2.index.Index64(first), False)
+    if function == "last":
+        last = ak._v2._reducers.Max.apply(
+            ak._v2.contents.NumpyArray(
+                nplike.index_nplike.arange(items.length, dtype=np.int64)
+            ),
+            ak._v2.index.Index64(groups),
+            numgroups,
+        )
+        return values._carry(ak._v2.index.Index64(last.data), False)
+
+    # the other functions are reducers, with each record's group as its parent
+    optional = values.is_OptionType
+    if values.is_OptionType or values.is_IndexedType:
+        if optional:
+            groups = groups[
+                nplike.index_nplike.asarray(values.mask_as_bool(valid_when=True))
+            ]
+        values = values.project()
+    if isinstance(values, ak._v2.contents.EmptyArray):
+        # a field that is entirely None
+        values = values.toNumpyArray(np.float64)
+    if not isinstance(values, ak._v2.contents.NumpyArray) or len(values.shape) != 1:
+        raise ak._v2._util.error(
+            TypeError(
+                "cannot compute the {} of field {!r} of type {}".format(
+                    function, field, values.form.type
+                )
+            )
+        )
+    values = values.contiguous()
+    parents = ak._v2.index.Index64(groups)
+
+    if function == "count":
+        return ak._v2._reducers.Count.apply(values, parents, numgroups)
+    if function == "sum":
+        return ak._v2._reducers.Sum.apply(values, parents, numgroups)
+    if function == "min":
+        out = ak._v2._reducers.Min.apply(values, parents, numgroups)
+    elif function == "max":
+        out = ak._v2._reducers.Max.apply(values, parents, numgroups)
+    else:
+        total = ak._v2._reducers.Sum.apply(values, parents, numgroups)
+        number = ak._v2._reducers.Count.apply(values, parents, numgroups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = ak._v2.contents.NumpyArray(
+                nplike.true_divide(total.data, number.data)
+            )
+
+    if optional:
+        number = ak._v2._reducers.Count.apply(values, parents, numgroups)
+        out = ak._v2.contents.ByteMaskedArray(
+            ak._v2.index.Index8(nplike.asarray(number.data == 0, dtype=np.int8)),
+            out,
+            valid_when=False,
+        )
+    return out
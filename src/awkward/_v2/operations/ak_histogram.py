@@ -0,0 +1,388 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import functools
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def histogram(
+    array,
+    bins=10,
+    range=None,
+    weight=None,
+    axis=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        array: Numbers to histogram, possibly within nested lists.
+        bins (int or sequence of numbers): Number of equal-width bins in
+            `range` or, if a sequence, the bin edges, which must increase
+            monotonically.
+        range (None or (number, number)): The lower and upper edges of the
+            bins, if `bins` is an int. If None, the minimum and maximum of
+            `array`.
+        weight: Data that can be broadcast to `array` (anything
+            #ak.to_layout recognizes), giving a weight to each value; if
+            None, each value counts once.
+        axis (None or int): If None, make one histogram of all of the values;
+            if `-1` (or the positive axis of the innermost lists), make one
+            histogram per innermost list.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Like NumPy's
+    [histogram](https://numpy.org/doc/stable/reference/generated/numpy.histogram.html),
+    returns a tuple of the counts (the sum of weights, if `weight` is given)
+    and the bin edges. All but the last bin are half-open; the last one
+    includes its upper edge. Values outside of the bins, NaN and None are
+    not counted. As in NumPy, equally spaced bins of float32 values have
+    float32 edges, so values near an edge fall into the same bin as they
+    would in NumPy.
+
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> counts, edges = ak.histogram(array, 3, range=(0, 6))
+        >>> counts
+        <Array [1, 2, 2] type='3 * int64'>
+        >>> edges
+        array([0., 2., 4., 6.])
+
+    With `axis=-1`, the counts of each list are a list of fixed length in
+    place of the list:
+
+        >>> counts, edges = ak.histogram(array, 3, range=(0, 6), axis=-1)
+        >>> counts
+        <Array [[1, 2, 0], [0, 0, 0], [0, 0, 2]] type='3 * 3 * int64'>
+
+    The values are histogrammed where they are in the array's buffers,
+    without flattening `array` (or the broadcasted `weight`) into new
+    arrays first, and large arrays are filled in parallel (see
+    #ak._v2.parallel.set_num_threads).
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.histogram",
+        dict(
+            array=array,
+            bins=bins,
+            range=range,
+            weight=weight,
+            axis=axis,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(array, bins, range, weight, axis, highlevel, behavior)
+
+
+def _impl(array, bins, range, weight, axis, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, weight, behavior=behavior)
+    nplike = layout.nplike
+
+    mindepth, maxdepth = layout.minmax_depth
+    if (
+        axis is not None
+        and axis != -1
+        and (mindepth != maxdepth or axis != maxdepth - 1)
+    ):
+        raise ak._v2._util.error(
+            NotImplementedError(
+                "histogram expects axis 'None' or '-1' (the innermost lists)"
+            )
+        )
+
+    dtypes = []
+
+    def check(node, **kwargs):
+        if node.is_RecordType:
+            raise ak._v2._util.error(
+                TypeError("cannot histogram {}".format(node.form.type))
+            )
+        elif isinstance(node, ak._v2.contents.NumpyArray):
+            dtypes.append(node.dtype)
+
+    layout.recursively_apply(check, return_array=False)
+
+    edges, uniform = _edges(layout, bins, range, dtypes)
+    numbins = len(edges) - 1
+
+    weighted = weight is not None
+    if weighted:
+        weight = ak._v2.operations.to_layout(
+            weight, allow_record=False, allow_other=True
+        )
+        layout = ak._v2.operations.zip(
+            {"x": layout, "w": weight}, highlevel=False, behavior=behavior
+        )
+
+    if layout.minmax_depth == (1, 1):
+        starts = nplike.index_nplike.zeros(1, dtype=np.int64)
+        stops = nplike.index_nplike.full(1, layout.length, dtype=np.int64)
+        datas, starts, stops = _segments(layout, starts, stops, weighted)
+        counts = _fill(layout, datas, starts, stops, edges, uniform, False)
+        out = ak._v2.contents.NumpyArray(_counts(counts, weighted))
+
+    elif axis is None:
+        counts = nplike.zeros(numbins, dtype=np.float64)
+
+        def action(node, **kwargs):
+            if node.is_ListType and node.content.minmax_depth == (1, 1):
+                datas, starts, stops = _lists(node, weighted, True)
+                counts[:] += _fill(node, datas, starts, stops, edges, uniform, False)
+                return node
+
+        layout.recursively_apply(action, return_array=False)
+        out = ak._v2.contents.NumpyArray(_counts(counts, weighted))
+
+    else:
+
+        def action(node, **kwargs):
+            if node.is_ListType and node.content.minmax_depth == (1, 1):
+                datas, starts, stops = _lists(node, weighted, False)
+                counts = _fill(node, datas, starts, stops, edges, uniform, True)
+                return ak._v2.contents.RegularArray(
+                    ak._v2.contents.NumpyArray(_counts(counts, weighted)),
+                    numbins,
+                    node.length,
+                )
+
+        out = layout.recursively_apply(
+            action, keep_parameters=False, numpy_to_regular=True
+        )
+
+    return ak._v2._util.wrap(out, behavior, highlevel), edges
+
+
+def _edges(layout, bins, range, dtypes):
+    # the bin edges, as numpy.histogram computes them, and whether they are
+    # equally spaced; equally spaced edges have the floating-point type of
+    # the data (float32 edges for float32 data, unless the range needs more),
+    # so that values near the edges fall into the same bins as in NumPy
+    nplike = layout.nplike
+    if ak._v2._util.isint(bins):
+        if bins < 1:
+            raise ak._v2._util.error(
+                ValueError("bins must be a positive integer, not {!r}".format(bins))
+            )
+        if range is None:
+            low = ak._v2.operations.ak_min._impl(layout, None, False, None, True, False)
+            high = ak._v2.operations.ak_max._impl(
+                layout, None, False, None, True, False
+            )
+            if low is None:
+                low, high = 0.0, 1.0
+        else:
+            low, high = range
+        low, high = float(low), float(high)
+        if not (nplike.isfinite(low) and nplike.isfinite(high)):
+            raise ak._v2._util.error(
+                ValueError(
+                    "the range of the bins, [{}, {}], is not finite".format(low, high)
+                )
+            )
+        if low > high:
+            raise ak._v2._util.error(
+                ValueError(
+                    "the range of the bins, [{}, {}], is decreasing".format(low, high)
+                )
+            )
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        dtype = functools.reduce(np.promote_types, dtypes, np.dtype(np.bool_))
+        if dtype.kind == "f":
+            dtype = nplike.result_type(low, high, dtype)
+        else:
+            dtype = np.dtype(np.float64)
+        return nplike.linspace(low, high, bins + 1, dtype=dtype), True
+
+    else:
+        if range is not None:
+            raise ak._v2._util.error(
+                ValueError("range can only be given with a number of bins")
+            )
+        edges = nplike.asarray(bins, dtype=np.float64)
+        if len(edges.shape) != 1 or len(edges) < 2:
+            raise ak._v2._util.error(
+                ValueError("bins must be an integer or a sequence of edges")
+            )
+        if not nplike.all(edges[1:] >= edges[:-1]):
+            raise ak._v2._util.error(
+                ValueError("the bin edges must increase monotonically")
+            )
+        return nplike.ascontiguousarray(edges), False
+
+
+def _lists(node, weighted, together):
+    # the buffers and the segments of the innermost lists in `node`; if they
+    # are histogrammed together, contiguous lists are one segment
+    index_nplike = node.nplike.index_nplike
+    if isinstance(node, ak._v2.contents.RegularArray):
+        starts = index_nplike.arange(node.length, dtype=np.int64) * node.size
+        stops = starts + node.size
+    elif isinstance(node, ak._v2.contents.ListOffsetArray):
+        offsets = index_nplike.asarray(node.offsets, dtype=np.int64)
+        starts, stops = offsets[:-1], offsets[1:]
+    else:
+        starts = index_nplike.asarray(node.starts, dtype=np.int64)
+        stops = index_nplike.asarray(node.stops, dtype=np.int64)[: node.length]
+
+    datas, starts, stops = _segments(node.content, starts, stops, weighted)
+    if (
+        together
+        and len(starts) > 1
+        and index_nplike.array_equal(starts[1:], stops[:-1])
+    ):
+        starts, stops = starts[:1], stops[-1:]
+    return datas, starts, stops
+
+
+def _segments(content, starts, stops, weighted):
+    # the values (and weights) of `content`, a one-dimensional layout, as
+    # buffers that are indexed by starts and stops; only missing values and
+    # indirection make copies of the lists
+    nplike = content.nplike
+    index_nplike = nplike.index_nplike
+
+    def fields(layout):
+        if weighted:
+            return layout["x"], layout["w"]
+        else:
+            return (layout,)
+
+    if not content.is_OptionType and not content.is_IndexedType:
+        leaves = fields(content)
+        if all(
+            isinstance(x, ak._v2.contents.NumpyArray) and len(x.shape) == 1
+            for x in leaves
+        ):
+            return _datas(leaves), starts, stops
+
+    lists = ak._v2.contents.ListArray(
+        ak._v2.index.Index64(starts), ak._v2.index.Index64(stops), content
+    ).toListOffsetArray64(True)
+    offsets = index_nplike.asarray(lists.offsets, dtype=np.int64)
+    content = lists.content[: offsets[-1]]
+
+    keep = index_nplike.ones(content.length, dtype=np.bool_)
+    for layout in (content,) + fields(content):
+        if layout.is_OptionType:
+            keep &= index_nplike.asarray(layout.mask_as_bool(valid_when=True))
+    if not index_nplike.all(keep):
+        kept = index_nplike.zeros(content.length + 1, dtype=np.int64)
+        index_nplike.cumsum(keep, out=kept[1:])
+        offsets = kept[offsets]
+        content = content._carry(
+            ak._v2.index.Index64(index_nplike.nonzero(keep)[0]), False
+        )
+
+    leaves = []
+    for layout in fields(content):
+        while layout.is_OptionType or layout.is_IndexedType:
+            layout = layout.project()
+        leaves.append(layout)
+    return _datas(leaves), offsets[:-1], offsets[1:]
+
+
+def _datas(leaves):
+    # the buffers of the values (and float64 weights)
+    datas = []
+    for i, leaf in enumerate(leaves):
+        if isinstance(leaf, ak._v2.contents.EmptyArray):
+            leaf = leaf.toNumpyArray(np.float64)
+        if (
+            not isinstance(leaf, ak._v2.contents.NumpyArray)
+            or len(leaf.shape) != 1
+            or leaf.parameter("__array__") is not None
+            or leaf.dtype.kind not in "biuf"
+        ):
+            raise ak._v2._util.error(
+                TypeError(
+                    "cannot histogram {}".format(
+                        "weights of " + str(leaf.form.type) if i else leaf.form.type
+                    )
+                )
+            )
+        data = leaf.nplike.ascontiguousarray(leaf.data)
+        if i != 0:
+            data = data.astype(np.float64, copy=False)
+        datas.append(data)
+    return datas
+
+
+def _fill(layout, datas, starts, stops, edges, uniform, perlist):
+    # the counts in each bin, per segment if perlist; ranges of segments are
+    # filled in parallel, each into its own part of the counts or, if not
+    # perlist, into its own histogram, and these are added at the end
+    nplike = layout.nplike
+    index_nplike = nplike.index_nplike
+    values = datas[0]
+    weights = datas[1] if len(datas) > 1 else None
+    numbins = len(edges) - 1
+    edges = nplike.asarray(edges, dtype=np.float64)
+
+    if not perlist:
+        # segments can be split anywhere, so long ones are shared by threads
+        block = ak._v2.parallel._min_per_thread
+        numblocks = index_nplike.maximum((stops - starts + block - 1) // block, 1)
+        if index_nplike.any(numblocks > 1):
+            segment = index_nplike.repeat(
+                index_nplike.arange(len(starts), dtype=np.int64), numblocks
+            )
+            firstblock = index_nplike.cumsum(numblocks) - numblocks
+            within = index_nplike.arange(len(segment), dtype=np.int64) - (
+                firstblock[segment]
+            )
+            starts = starts[segment] + within * block
+            stops = index_nplike.minimum(starts + block, stops[segment])
+
+    offsets = index_nplike.zeros(len(starts) + 1, dtype=np.int64)
+    index_nplike.cumsum(stops - starts, out=offsets[1:])
+    counts = nplike.zeros(len(starts) * numbins if perlist else numbins, np.float64)
+
+    def fill(start, stop):
+        if perlist:
+            out = counts[start * numbins : stop * numbins]
+        else:
+            out = nplike.zeros(numbins, dtype=np.float64)
+        layout._handle_error(
+            nplike[
+                "awkward_histogram",
+                np.float64,
+                values.dtype.type,
+                np.float64,
+                np.int64,
+                np.int64,
+                np.float64,
+            ](
+                out,
+                values,
+                weights,
+                starts[start:stop],
+                stops[start:stop],
+                stop - start,
+                edges,
+                numbins,
+                uniform,
+                perlist,
+            )
+        )
+        return out
+
+    parts = ak._v2.parallel._map_ranges(fill, offsets, nplike)
+    if not perlist:
+        counts = parts[0]
+        for part in parts[1:]:
+            counts += part
+    return counts
+
+
+def _counts(counts, weighted):
+    if weighted:
+        return counts
+    else:
+        return counts.astype(np.int64)
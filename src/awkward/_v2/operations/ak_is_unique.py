@@ -0,0 +1,42 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def is_unique(array, axis=None, method="hash"):
+    """
+    Args:
+        array: Data containing items to check: numbers, strings, or records of
+            these.
+        axis (None or int): If None, check all items of the array; if `-1`,
+            check the items of each innermost list.
+        method ("hash" or "sort"): Find repeated items with a hash table or
+            by sorting; see #ak.unique.
+
+    Returns True if no item (other than None) appears more than once, either
+    in the whole array or in any innermost list, False otherwise.
+
+        >>> ak.is_unique(ak.Array([[1, 2, 3], [1, 2]]))
+        False
+        >>> ak.is_unique(ak.Array([[1, 2, 3], [1, 2]]), axis=-1)
+        True
+
+    See also #ak.unique.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.is_unique",
+        dict(array=array, axis=axis, method=method),
+    ):
+        return _impl(array, axis, method)
+
+
+def _impl(array, axis, method):
+    _, counts = ak._v2.operations.ak_unique._impl(
+        array, axis, method, True, False, False, None
+    )
+    counts = ak._v2.operations.flatten(counts, axis=None, highlevel=False)
+    return not counts.nplike.index_nplike.any(
+        counts.nplike.index_nplike.asarray(counts) > 1
+    )
@@ -0,0 +1,307 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def join(left, right, on, how="inner", axis=0, highlevel=True, behavior=None):
+    """
+    Args:
+        left: Records to join (anything #ak.to_layout recognizes).
+        right: Records to join to `left`.
+        on (str or list of str): Field or fields that `left` and `right` both
+            have, whose values must be equal for records to be joined.
+        how ("inner" or "left"): If "inner", only records of `left` that
+            match a record of `right` are in the output; if "left", every
+            record of `left` is in the output, with None for the fields of
+            `right` if there is no match.
+        axis (int): If `0`, join all records of `left` with all records of
+            `right`, which must be arrays of records; if `1`, join the records
+            in each list of `left` with the records in the corresponding list
+            of `right`, which must be lists of records of the same length.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns records with all of the fields of `left` and the fields of `right`
+    other than `on`, one for each pair of a `left` and a `right` record with
+    equal keys, in the order of `left` and then of `right`. Records with a
+    None key don't match anything, and missing records (None in place of a
+    record) are dropped, as in #ak.group_by. With `axis=1`, a missing list of
+    `left` is None in the output and a missing list of `right` matches
+    nothing. Fields (other than `on`) that are in both `left` and `right`
+    must be renamed before joining.
+
+    For example,
+
+        >>> particles = ak.Array([{"id": 1, "pt": 10.0}, {"id": 3, "pt": 20.0},
+        ...                       {"id": 2, "pt": 30.0}])
+        >>> truth = ak.Array([{"id": 2, "pdg": 13}, {"id": 1, "pdg": 11}])
+        >>> ak.join(particles, truth, on="id").tolist()
+        [{'id': 1, 'pt': 10.0, 'pdg': 11}, {'id': 2, 'pt': 30.0, 'pdg': 13}]
+        >>> ak.join(particles, truth, on="id", how="left").tolist()
+        [{'id': 1, 'pt': 10.0, 'pdg': 11}, {'id': 3, 'pt': 20.0, 'pdg': None},
+         {'id': 2, 'pt': 30.0, 'pdg': 13}]
+
+    The keys are matched with one pass of a hash table over the keys of both
+    arrays. The fields of the output are #ak.layout.IndexedArray (or
+    #ak.layout.IndexedOptionArray, for `how="left"`) over the fields of
+    `left` and `right`, so no field is copied until it is used.
+
+    See also #ak.zip and #ak.cartesian.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.join",
+        dict(
+            left=left,
+            right=right,
+            on=on,
+            how=how,
+            axis=axis,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(left, right, on, how, axis, highlevel, behavior)
+
+
+def _impl(left, right, on, how, axis, highlevel, behavior):
+    if how not in ("inner", "left"):
+        raise ak._v2._util.error(
+            ValueError("how must be 'inner' or 'left', not {!r}".format(how))
+        )
+    if axis not in (0, 1):
+        raise ak._v2._util.error(NotImplementedError("join expects axis '0' or '1'"))
+
+    keys = [on] if ak._v2._util.isstr(on) else list(on)
+    leftlayout = ak._v2.operations.to_layout(
+        left, allow_record=False, allow_other=False
+    )
+    rightlayout = ak._v2.operations.to_layout(
+        right, allow_record=False, allow_other=False
+    )
+    behavior = ak._v2._util.behavior_of(left, right, behavior=behavior)
+    nplike = ak.nplike.of(leftlayout, rightlayout)
+
+    if axis == 0:
+        leftoffsets = nplike.index_nplike.array([0, leftlayout.length], np.int64)
+        rightoffsets = nplike.index_nplike.array([0, rightlayout.length], np.int64)
+        out, _ = _join(
+            *_records(leftlayout, leftoffsets, "left"),
+            *_records(rightlayout, rightoffsets, "right"),
+            keys,
+            how,
+        )
+
+    else:
+        if leftlayout.length != rightlayout.length:
+            raise ak._v2._util.error(
+                ValueError(
+                    "cannot join lists of records of different lengths: "
+                    "{} and {}".format(leftlayout.length, rightlayout.length)
+                )
+            )
+        leftlists, leftoffsets, leftvalid = _lists(leftlayout)
+        rightlists, rightoffsets, _ = _lists(rightlayout)
+        content, offsets = _join(
+            *_records(leftlists.content[: leftoffsets[-1]], leftoffsets, "left"),
+            *_records(rightlists.content[: rightoffsets[-1]], rightoffsets, "right"),
+            keys,
+            how,
+        )
+        out = ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), content, parameters=leftlists.parameters
+        )
+        if leftvalid is not None:
+            out = ak._v2.contents.ByteMaskedArray(
+                ak._v2.index.Index8(leftvalid.view(np.int8)), out, valid_when=True
+            )
+
+    return ak._v2._util.wrap(out, behavior, highlevel)
+
+
+def _lists(layout):
+    # the lists of `layout` as a ListOffsetArray and its offsets, in which
+    # missing lists are empty, and which lists are valid (None if all are)
+    index_nplike = layout.nplike.index_nplike
+    valid = None
+    if layout.is_OptionType:
+        valid = index_nplike.asarray(layout.mask_as_bool(valid_when=True))
+    if layout.is_OptionType or layout.is_IndexedType:
+        layout = layout.project()
+    if not layout.is_ListType:
+        raise ak._v2._util.error(
+            ValueError("join with axis=1 expects lists of records")
+        )
+
+    lists = layout.toListOffsetArray64(True)
+    offsets = index_nplike.asarray(lists.offsets)
+    if valid is not None:
+        counts = index_nplike.zeros(len(valid), dtype=np.int64)
+        counts[valid] = offsets[1:] - offsets[:-1]
+        offsets = index_nplike.zeros(len(valid) + 1, dtype=np.int64)
+        index_nplike.cumsum(counts, out=offsets[1:])
+    return lists, offsets, valid
+
+
+def _records(layout, offsets, side):
+    # the records of `layout` without the missing ones (as in ak.group_by) and
+    # `offsets` adjusted to them; the records are None if there are no
+    # records (and no type)
+    layout, offsets, _ = ak._v2._unique.compact(layout, offsets)
+    if isinstance(layout, ak._v2.contents.EmptyArray):
+        return None, offsets
+    if not isinstance(layout, ak._v2.contents.RecordArray) or layout.is_tuple:
+        raise ak._v2._util.error(
+            ValueError(
+                "join expects {} to contain records with fields, not {}".format(
+                    side, layout.form.type
+                )
+            )
+        )
+    return layout, offsets
+
+
+def _keys(layout, keys, side):
+    # the key(s) of `layout`, and which are not None (or None if all are valid)
+    nplike = layout.nplike
+    valid = None
+    for key in keys:
+        if key not in layout.fields:
+            raise ak._v2._util.error(
+                ValueError("no field {!r} in {} records".format(key, side))
+            )
+        content = layout.content(key)
+        if content.is_OptionType:
+            mask = nplike.index_nplike.asarray(content.mask_as_bool(valid_when=True))
+            valid = mask if valid is None else valid & mask
+    if len(keys) == 1:
+        return layout.content(keys[0]), valid
+    else:
+        return (
+            ak._v2.contents.RecordArray(
+                [layout.content(key) for key in keys], keys, layout.length
+            ),
+            valid,
+        )
+
+
+def _join(left, leftoffsets, right, rightoffsets, keys, how):
+    # the joined records of each segment of `left` and `right`, and their offsets
+    if left is None:
+        return ak._v2.contents.EmptyArray(), leftoffsets
+    if right is None:
+        _keys(left, keys, "left")
+        if how == "left":
+            return left, leftoffsets
+        else:
+            empty = ak._v2.index.Index64.zeros(0, left.nplike)
+            return left._carry(empty, False), left.nplike.index_nplike.zeros_like(
+                leftoffsets
+            )
+
+    nplike = ak.nplike.of(left, right)
+    index_nplike = nplike.index_nplike
+    for field in right.fields:
+        if field not in keys and field in left.fields:
+            raise ak._v2._util.error(
+                ValueError(
+                    "field {!r} is in both left and right records; rename one "
+                    "of them".format(field)
+                )
+            )
+
+    # the keys of each list of left, followed by the keys of the same list of
+    # right, are hashed together (one hash table per list) to give each key a
+    # code that is unique across lists
+    leftkeys, leftvalid = _keys(left, keys, "left")
+    rightkeys, rightvalid = _keys(right, keys, "right")
+    numlists = len(leftoffsets) - 1
+    leftsegments = index_nplike.repeat(
+        index_nplike.arange(numlists, dtype=np.int64),
+        leftoffsets[1:] - leftoffsets[:-1],
+    )
+    rightsegments = index_nplike.repeat(
+        index_nplike.arange(numlists, dtype=np.int64),
+        rightoffsets[1:] - rightoffsets[:-1],
+    )
+    position = index_nplike.concatenate(
+        [
+            index_nplike.arange(left.length, dtype=np.int64)
+            + rightoffsets[leftsegments],
+            index_nplike.arange(right.length, dtype=np.int64)
+            + leftoffsets[rightsegments + 1],
+        ]
+    )
+    carry = index_nplike.empty(len(position), dtype=np.int64)
+    carry[position] = index_nplike.arange(len(position), dtype=np.int64)
+    combined = ak._v2.operations.concatenate([leftkeys, rightkeys], highlevel=False)
+    _, _, inverse, outoffsets = ak._v2._unique.distinct(
+        combined._carry(ak._v2.index.Index64(carry), False),
+        leftoffsets + rightoffsets,
+        "hash",
+    )
+    number = int(outoffsets[-1])
+    leftcodes = outoffsets[leftsegments] + inverse[position[: left.length]]
+    rightcodes = outoffsets[rightsegments] + inverse[position[left.length :]]
+
+    # the valid right records, grouped by code
+    rightpositions = index_nplike.arange(right.length, dtype=np.int64)
+    if rightvalid is not None:
+        rightpositions = rightpositions[rightvalid]
+        rightcodes = rightcodes[rightvalid]
+    rightcounts = ak._v2._reducers.Count.apply(
+        ak._v2.contents.NumpyArray(rightcodes),
+        ak._v2.index.Index64(rightcodes),
+        number,
+    ).data
+    rightcarry, rightgroups = ak._v2._unique.group_carry(right, rightcodes, rightcounts)
+    rightcarry = rightpositions[rightcarry]
+
+    # each left record is repeated for each of its matches (or once, as a
+    # miss, in a left join)
+    matches = rightcounts[leftcodes]
+    if leftvalid is not None:
+        matches[~leftvalid] = 0
+    rows = index_nplike.maximum(matches, 1) if how == "left" else matches
+    rowoffsets = index_nplike.zeros(left.length + 1, dtype=np.int64)
+    index_nplike.cumsum(rows, out=rowoffsets[1:])
+    length = int(rowoffsets[-1])
+
+    leftindex = index_nplike.repeat(
+        index_nplike.arange(left.length, dtype=np.int64), rows
+    )
+    local = index_nplike.arange(length, dtype=np.int64) - rowoffsets[leftindex]
+    hit = local < matches[leftindex]
+    rightindex = index_nplike.full(length, -1, dtype=np.int64)
+    rightindex[hit] = rightcarry[(rightgroups[leftcodes[leftindex]] + local)[hit]]
+
+    identity = length == left.length and bool(index_nplike.all(rows == 1))
+    fields, contents = [], []
+    for field in left.fields:
+        fields.append(field)
+        if identity:
+            contents.append(left.content(field))
+        else:
+            contents.append(
+                ak._v2.contents.IndexedArray(
+                    ak._v2.index.Index64(leftindex), left.content(field)
+                ).simplify_optiontype()
+            )
+    for field in right.fields:
+        if field not in keys:
+            fields.append(field)
+            if how == "inner":
+                content = ak._v2.contents.IndexedArray(
+                    ak._v2.index.Index64(rightindex), right.content(field)
+                )
+            else:
+                content = ak._v2.contents.IndexedOptionArray(
+                    ak._v2.index.Index64(rightindex), right.content(field)
+                )
+            contents.append(content.simplify_optiontype())
+
+    out = ak._v2.contents.RecordArray(contents, fields, length)
+    return out, rowoffsets[leftoffsets]
@@ -44,6 +44,12 @@ def mean(
 
         ak.sum(x*weight) / ak.sum(weight)
 
+    Lists of numbers at `axis=-1` (or all numbers at `axis=None`) are instead
+    summed by one kernel that accumulates in float64, for this and for
+    #ak.var, #ak.std, #ak.moment, #ak.covar and #ak.corr. The results can
+    then differ from the formulas in the last bits for float32 data, and
+    integer products like `x*weight` do not overflow.
+
     For example, with an `array` like
 
         ak.Array([[0, 1, 2, 3],
@@ -151,6 +157,17 @@ def _impl(x, weight, axis, keepdims, mask_identity, flatten_records):
             ak._v2.operations.to_layout(weight, allow_record=False, allow_other=False)
         )
 
+    segments = ak._v2._moments.Segments.of(
+        axis, x.layout, weight=None if weight is None else weight.layout
+    )
+    if segments is not None:
+        sumw, sumwx, _ = segments.moments()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = sumwx / sumw
+        return segments.wrap(
+            out, keepdims, mask_identity, ak._v2._util.behavior_of(x, weight)
+        )
+
     with np.errstate(invalid="ignore"):
         if weight is None:
             sumw = ak._v2.operations.ak_count._impl(
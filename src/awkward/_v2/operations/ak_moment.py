@@ -81,6 +81,17 @@ def _impl(x, n, weight, axis, keepdims, mask_identity, flatten_records):
             ak._v2.operations.to_layout(weight, allow_record=False, allow_other=False)
         )
 
+    segments = ak._v2._moments.Segments.of(
+        axis, x.layout, weight=None if weight is None else weight.layout
+    )
+    if segments is not None:
+        sumw, sumwxn = segments.moment(n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = sumwxn / sumw
+        return segments.wrap(
+            out, keepdims, mask_identity, ak._v2._util.behavior_of(x, weight)
+        )
+
     with np.errstate(invalid="ignore"):
         if weight is None:
             sumw = ak._v2.operations.ak_count._impl(
@@ -81,7 +81,7 @@ def run_lengths(array, highlevel=True, behavior=None):
           [{'x': 2, 'y': 2.2}],
           [{'x': 3, 'y': 3.3}]]]
 
-    See also #ak.num, #ak.argsort, #ak.unflatten.
+    See also #ak.num, #ak.argsort, #ak.unflatten, #ak.group_by.
     """
     with ak._v2._util.OperationErrorContext(
         "ak._v2.run_lengths",
@@ -0,0 +1,193 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def searchsorted(
+    sorted_lists, values, axis=-1, side="left", highlevel=True, behavior=None
+):
+    """
+    Args:
+        sorted_lists: Sorted numbers (anything #ak.to_layout recognizes):
+            either a one-dimensional array, to search in for all `values`,
+            or nested lists of numbers, sorted within each innermost list.
+        values: Numbers to search for, which are broadcast with the lists of
+            `sorted_lists` (without their innermost dimension), so that each
+            value is searched for in one list.
+        axis (int): The dimension of `sorted_lists` to search in; only `-1`
+            (or the positive axis of the innermost lists) is implemented.
+        side ("left" or "right"): If "left", return the first position at
+            which each value could be inserted into its list, keeping it
+            sorted; if "right", the last position.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Like NumPy's
+    [searchsorted](https://numpy.org/doc/stable/reference/generated/numpy.searchsorted.html),
+    but within each list. For example, with one list of values per list of
+    `sorted_lists`,
+
+        >>> times = ak.Array([[1.0, 2.0, 3.0], [], [5.0, 6.0]])
+        >>> ak.searchsorted(times, ak.Array([[2.5, 0.0], [1.0], [6.0]]))
+        <Array [[2, 0], [0], [1]] type='3 * var * int64'>
+
+    and with one value per list,
+
+        >>> ak.searchsorted(times, ak.Array([2.5, 1.0, 6.0]), side="right")
+        <Array [2, 0, 2] type='3 * int64'>
+
+    If `sorted_lists` is one-dimensional, all of the `values`, which may be
+    nested lists, are searched for in it, which bins them into the intervals
+    between its values: `ak.searchsorted(edges, array, side="right")` is
+    `np.digitize(array, edges)` for any `array` without NaN. (NaN sorts
+    before every edge here, so its index is `0`, not `len(edges)`.)
+
+    The lists must be sorted as #ak.sort sorts them: with NaN first, and
+    None, which is ignored, last. Each value is found with a binary search in
+    its list. The lists are searched where they are, unless they contain None
+    (which is removed first) or their dtype differs from that of `values`
+    (both are then converted to a common dtype); these cases make copies.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.searchsorted",
+        dict(
+            sorted_lists=sorted_lists,
+            values=values,
+            axis=axis,
+            side=side,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(sorted_lists, values, axis, side, highlevel, behavior)
+
+
+def _impl(sorted_lists, values, axis, side, highlevel, behavior):
+    if side not in ("left", "right"):
+        raise ak._v2._util.error(
+            ValueError("side must be 'left' or 'right', not {!r}".format(side))
+        )
+    layout = ak._v2.operations.to_layout(
+        sorted_lists, allow_record=False, allow_other=False
+    )
+    needles = ak._v2.operations.to_layout(values, allow_record=False, allow_other=True)
+    behavior = ak._v2._util.behavior_of(sorted_lists, values, behavior=behavior)
+    nplike = layout.nplike
+    index_nplike = nplike.index_nplike
+
+    mindepth, maxdepth = layout.minmax_depth
+    if axis != -1 and (mindepth != maxdepth or axis != maxdepth - 1):
+        raise ak._v2._util.error(
+            NotImplementedError("searchsorted expects axis '-1' (the innermost lists)")
+        )
+
+    # each value is searched for in the list given by broadcasting `values`
+    # with the index of each innermost list (or 0, if there is only one)
+    if layout.minmax_depth == (1, 1):
+        content = layout
+        offsets = index_nplike.array([0, layout.length], dtype=np.int64)
+        lists = 0
+    else:
+        found = []
+
+        def action(node, **kwargs):
+            if node.is_ListType and node.content.minmax_depth == (1, 1):
+                listoffsetarray = node.toListOffsetArray64(True)
+                offsets = index_nplike.asarray(listoffsetarray.offsets)
+                found.append((listoffsetarray.content[: offsets[-1]], offsets))
+                return ak._v2.contents.NumpyArray(
+                    index_nplike.arange(node.length, dtype=np.int64)
+                )
+
+        lists = layout.recursively_apply(
+            action, keep_parameters=False, numpy_to_regular=True
+        )
+        if len(found) != 1:
+            raise ak._v2._util.error(
+                ValueError(
+                    "searchsorted expects sorted_lists to have one type of "
+                    "innermost list"
+                )
+            )
+        ((content, offsets),) = found
+
+    items, itemoffsets, _ = ak._v2._unique.compact(content, offsets)
+    if isinstance(items, ak._v2.contents.EmptyArray):
+        items = items.toNumpyArray(np.float64)
+    if not isinstance(items, ak._v2.contents.NumpyArray) or len(items.shape) != 1:
+        raise ak._v2._util.error(
+            TypeError("cannot search in lists of {}".format(items.form.type))
+        )
+    if not isinstance(needles, ak._v2.contents.Content):
+        if isinstance(lists, ak._v2.contents.Content):
+            needles = ak._v2.contents.NumpyArray(
+                nplike.repeat(nplike.asarray(values), lists.length)
+            )
+        else:
+            needles = ak._v2.contents.NumpyArray(nplike.asarray([values]))
+            out = _search(items, itemoffsets, None, needles, side)
+            return out[0]
+
+    def search(inputs, **kwargs):
+        lists, needles = inputs
+        if isinstance(needles, ak._v2.contents.NumpyArray) and (
+            isinstance(lists, ak._v2.contents.NumpyArray)
+            or not isinstance(lists, ak._v2.contents.Content)
+        ):
+            if isinstance(lists, ak._v2.contents.Content):
+                segments = index_nplike.asarray(lists.data, dtype=np.int64)
+            else:
+                segments = None
+            return (
+                ak._v2.contents.NumpyArray(
+                    _search(items, itemoffsets, segments, needles, side)
+                ),
+            )
+
+    (out,) = ak._v2._broadcasting.broadcast_and_apply(
+        [lists, needles], search, behavior, numpy_to_regular=True
+    )
+    return ak._v2._util.wrap(out, behavior, highlevel)
+
+
+def _search(items, offsets, segments, needles, side):
+    # the position of each needle in its segment of items
+    nplike = items.nplike
+    if len(needles.shape) != 1:
+        raise ak._v2._util.error(
+            TypeError("cannot search for {}".format(needles.form.type))
+        )
+    data = nplike.asarray(items.data)
+    values = nplike.asarray(needles.data)
+    if data.dtype.kind in ("M", "m") or values.dtype.kind in ("M", "m"):
+        if data.dtype != values.dtype:
+            raise ak._v2._util.error(
+                TypeError("cannot search for {} in {}".format(values.dtype, data.dtype))
+            )
+        dtype = np.dtype(np.int64)
+        data, values = data.view(dtype), values.view(dtype)
+    else:
+        dtype = np.promote_types(data.dtype, values.dtype)
+    if dtype.kind == "c":
+        raise ak._v2._util.error(TypeError("cannot search for complex numbers"))
+    data = nplike.ascontiguousarray(data.astype(dtype, copy=False))
+    values = nplike.ascontiguousarray(values.astype(dtype, copy=False))
+    if segments is None:
+        segments = nplike.index_nplike.zeros(len(values), dtype=np.int64)
+
+    out = nplike.index_nplike.empty(len(values), dtype=np.int64)
+    items._handle_error(
+        nplike[
+            "awkward_searchsorted",
+            out.dtype.type,
+            data.dtype.type,
+            offsets.dtype.type,
+            segments.dtype.type,
+            values.dtype.type,
+        ](out, data, offsets, segments, values, len(values), side == "right")
+    )
+    return out
@@ -67,8 +67,8 @@ def _impl(array, allow_record, allow_other, numpytype):
         else:
             return array.layout
 
-    # elif isinstance(array, ak._v2.highlevel.ArrayBuilder):
-    #     return array.snapshot().layout
+    elif isinstance(array, ak._v2.highlevel.ArrayBuilder):
+        return array.snapshot().layout
 
     # elif isinstance(array, ak.layout.ArrayBuilder):
     #     return array.snapshot()
@@ -0,0 +1,52 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def top_k(array, k, axis=-1, largest=True, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data in which to find the largest or smallest values, possibly
+            within nested lists.
+        k (int): Maximum number of values per list.
+        axis (int): The dimension at which this operation is applied; only
+            `-1` (or the positive axis of the innermost lists) is implemented.
+        largest (bool): If True, the largest values, from largest to
+            smallest; if False, the smallest values, from smallest to largest.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the `k` largest (or smallest) values of each innermost list, or
+    all of them if the list is shorter than `k`. This is the same as
+    `ak.sort(array, ascending=not largest)[..., :k]`, but each list is only
+    partially sorted. For example, the 2 largest values of each list:
+
+        >>> array = ak.Array([[3.3, 1.1, 5.5, 4.4], [], [2.2]])
+        >>> ak.top_k(array, 2)
+        <Array [[5.5, 4.4], [], [2.2]] type='3 * var * float64'>
+
+    None values are skipped. See #ak.argtop_k for details.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.top_k",
+        dict(
+            array=array,
+            k=k,
+            axis=axis,
+            largest=largest,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(array, k, axis, largest, highlevel, behavior)
+
+
+def _impl(array, k, axis, largest, highlevel, behavior):
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = ak._v2.operations.ak_argtop_k._top_k(layout, k, axis, largest, False)
+    return ak._v2._util.wrap(out, behavior, highlevel)
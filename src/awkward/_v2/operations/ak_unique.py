@@ -0,0 +1,220 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def unique(
+    array,
+    axis=None,
+    method="hash",
+    return_counts=False,
+    return_inverse=False,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        array: Data containing items to deduplicate: numbers, strings, or
+            records of these.
+        axis (None or int): If None, find the distinct items among all items
+            of the array; if `-1`, find the distinct items of each innermost
+            list.
+        method ("hash" or "sort"): If "hash", find the distinct items with a
+            hash table, keeping them in order of first appearance; if "sort",
+            sort the items and return the distinct items in the order of
+            #ak.sort.
+        return_counts (bool): If True, also return the number of times each
+            distinct item appears.
+        return_inverse (bool): If True, also return the index of each item's
+            distinct item (within its list, if `axis=-1`), with the same
+            structure as `array`.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the distinct items of `array`, ignoring None, and optionally the
+    counts and inverse as a tuple.
+
+    For example,
+
+        >>> array = ak.Array([[3, 1, 3, 2], [], [5, 5, None]])
+        >>> ak.unique(array, axis=-1)
+        <Array [[3, 1, 2], [], [5]] type='3 * var * int64'>
+        >>> ak.unique(array, axis=-1, method="sort")
+        <Array [[1, 2, 3], [], [5]] type='3 * var * int64'>
+        >>> ak.unique(array)
+        <Array [3, 1, 2, 5] type='4 * int64'>
+
+    and
+
+        >>> uniques, counts, inverse = ak.unique(
+        ...     array, axis=-1, return_counts=True, return_inverse=True
+        ... )
+        >>> counts
+        <Array [[2, 1, 1], [], [2]] type='3 * var * int64'>
+        >>> inverse
+        <Array [[0, 1, 0, 2], [], [0, 0, None]] type='3 * var * ?int64'>
+
+    so that `uniques[inverse]` reproduces `array` (for `axis=-1`).
+
+    Strings are compared as strings, not lists of characters, and records are
+    equal if all of their fields are equal. All floating-point NaNs are equal
+    to each other and `-0.0` is equal to `0.0`.
+
+    The "hash" method takes time proportional to the number of items; the
+    "sort" method, proportional to n log(n) of the length of each list.
+
+    See also #ak.is_unique and #ak.run_lengths.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.unique",
+        dict(
+            array=array,
+            axis=axis,
+            method=method,
+            return_counts=return_counts,
+            return_inverse=return_inverse,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(
+            array, axis, method, return_counts, return_inverse, highlevel, behavior
+        )
+
+
+def _impl(array, axis, method, return_counts, return_inverse, highlevel, behavior):
+    if method not in ("hash", "sort"):
+        raise ak._v2._util.error(
+            ValueError("method must be 'hash' or 'sort', not {!r}".format(method))
+        )
+    if axis not in (None, -1):
+        raise ak._v2._util.error(
+            NotImplementedError("unique expects axis 'None' or '-1'")
+        )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+
+    content = layout
+    if content.is_OptionType or content.is_IndexedType:
+        content = content.content
+    if axis is None or ak._v2._unique.is_item(content):
+        uniques, counts, inverse = _all_items(layout, method, return_inverse)
+    else:
+        uniques, counts, inverse = _innermost_lists(layout, method, return_inverse)
+
+    out = (ak._v2._util.wrap(uniques, behavior, highlevel),)
+    if return_counts:
+        out = out + (ak._v2._util.wrap(counts, behavior, highlevel),)
+    if return_inverse:
+        out = out + (ak._v2._util.wrap(inverse, behavior, highlevel),)
+
+    if len(out) == 1:
+        return out[0]
+    else:
+        return out
+
+
+def _all_items(layout, method, return_inverse):
+    nplike = layout.nplike
+    found = []
+
+    def positions(node, **kwargs):
+        if ak._v2._unique.is_item(node):
+            found.append(node)
+            return ak._v2.contents.NumpyArray(
+                nplike.index_nplike.arange(node.length, dtype=np.int64)
+            )
+
+    flat = ak._v2.operations.flatten(
+        layout.recursively_apply(positions, keep_parameters=False),
+        axis=None,
+        highlevel=False,
+    )
+    if len(found) != 1:
+        raise ak._v2._util.error(
+            NotImplementedError("unique of arrays with more than one type of item")
+        )
+    (node,) = found
+
+    where = nplike.index_nplike.asarray(flat, dtype=np.int64)
+    items = node._carry(ak._v2.index.Index64(where), False)
+    offsets = nplike.index_nplike.array([0, items.length], dtype=np.int64)
+    first, counts, inverse, _ = ak._v2._unique.distinct(items, offsets, method)
+
+    uniques = items._carry(ak._v2.index.Index64(first), False)
+    counts = ak._v2.contents.NumpyArray(counts)
+
+    if return_inverse:
+        full = nplike.index_nplike.zeros(node.length, dtype=np.int64)
+        full[where] = inverse
+
+        def replace(node, **kwargs):
+            if ak._v2._unique.is_item(node):
+                return ak._v2.contents.NumpyArray(full)
+
+        inverse = layout.recursively_apply(replace, keep_parameters=False)
+
+    return uniques, counts, inverse
+
+
+def _innermost_lists(layout, method, return_inverse):
+    nplike = layout.nplike
+    results = []
+
+    def uniques(node, **kwargs):
+        if ak._v2._unique.is_list_of_items(node):
+            listoffsetarray = node.toListOffsetArray64(True)
+            offsets = nplike.index_nplike.asarray(listoffsetarray.offsets)
+            content = listoffsetarray.content[: offsets[-1]]
+            items, itemoffsets, valid = ak._v2._unique.compact(content, offsets)
+
+            first, counts, inverse, outoffsets = ak._v2._unique.distinct(
+                items, itemoffsets, method
+            )
+            outoffsets = ak._v2.index.Index64(outoffsets)
+
+            inverse = ak._v2.contents.NumpyArray(inverse)
+            if valid is not None:
+                index = nplike.index_nplike.full(len(valid), -1, dtype=np.int64)
+                index[valid] = nplike.index_nplike.arange(
+                    inverse.length, dtype=np.int64
+                )
+                inverse = ak._v2.contents.IndexedOptionArray(
+                    ak._v2.index.Index64(index), inverse
+                )
+
+            results.append(
+                (
+                    ak._v2.contents.ListOffsetArray(
+                        outoffsets, ak._v2.contents.NumpyArray(counts)
+                    ),
+                    ak._v2.contents.ListOffsetArray(listoffsetarray.offsets, inverse),
+                )
+            )
+            return ak._v2.contents.ListOffsetArray(
+                outoffsets,
+                items._carry(ak._v2.index.Index64(first), False),
+                parameters=node.parameters,
+            )
+
+    out = layout.recursively_apply(uniques)
+
+    # the same nodes are visited in the same order, so each pass picks up the
+    # results of the first
+    def pick(which):
+        iterator = iter(results)
+
+        def action(node, **kwargs):
+            if ak._v2._unique.is_list_of_items(node):
+                return next(iterator)[which]
+
+        return layout.recursively_apply(action, keep_parameters=False)
+
+    counts = pick(0)
+    inverse = pick(1) if return_inverse else None
+    return out, counts, inverse
@@ -155,6 +155,24 @@ def _impl(x, weight, ddof, axis, keepdims, mask_identity, flatten_records):
             ak._v2.operations.to_layout(weight, allow_record=False, allow_other=False)
         )
 
+    segments = ak._v2._moments.Segments.of(
+        axis, x.layout, weight=None if weight is None else weight.layout
+    )
+    if segments is not None:
+        sumw, _, sumwxx = segments.moments()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = sumwxx / sumw
+            if ddof != 0:
+                out = out * (sumw / (sumw - ddof))
+        return segments.wrap(
+            out,
+            keepdims,
+            mask_identity,
+            ak._v2._util.behavior_of(x, weight),
+            mask_lists=True,
+            scalar_dtype=np.float64 if ddof != 0 else None,
+        )
+
     with np.errstate(invalid="ignore"):
         xmean = ak._v2.operations.ak_mean._impl(
             x, weight, axis, False, mask_identity, flatten_records
@@ -0,0 +1,15 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Vectorized string operations, which work directly on the UTF-8 bytes and
+# offsets of arrays with "string" or "bytestring" parameters.
+
+from awkward._v2.operations.str.akstr_contains import contains
+from awkward._v2.operations.str.akstr_endswith import endswith
+from awkward._v2.operations.str.akstr_find import find
+from awkward._v2.operations.str.akstr_join import join
+from awkward._v2.operations.str.akstr_length import length
+from awkward._v2.operations.str.akstr_lower import lower
+from awkward._v2.operations.str.akstr_slice import slice
+from awkward._v2.operations.str.akstr_split import split
+from awkward._v2.operations.str.akstr_startswith import startswith
+from awkward._v2.operations.str.akstr_upper import upper
@@ -0,0 +1,46 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def contains(array, pattern, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        pattern (str or bytes): The substring to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns booleans in place of each string: True if `pattern` occurs in the
+    string (like Python's `pattern in string`), False otherwise.
+
+        >>> ak.str.contains(ak.Array(["one", "two", "three"]), "e")
+        <Array [True, False, True] type='3 * bool'>
+
+    See also #ak.str.find.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.contains",
+        dict(array=array, pattern=pattern, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, pattern, highlevel, behavior)
+
+
+def _impl(array, pattern, highlevel, behavior):
+    pattern = ak._v2.behaviors.string._string_pattern(pattern)
+
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            found = ak._v2.behaviors.string._string_first_match(offsets, data, pattern)
+            return ak._v2.contents.NumpyArray(found >= 0)
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,50 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def endswith(array, suffix, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        suffix (str or bytes): The suffix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns booleans in place of each string: True if the string ends with
+    `suffix`, False otherwise.
+
+        >>> ak.str.endswith(ak.Array([["one", "two"], [], ["three"]]), "e")
+        <Array [[True, False], [], [True]] type='3 * var * bool'>
+
+    See also #ak.str.startswith.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.endswith",
+        dict(array=array, suffix=suffix, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, suffix, highlevel, behavior)
+
+
+def _impl(array, suffix, highlevel, behavior):
+    suffix = ak._v2.behaviors.string._string_pattern(suffix)
+
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            nplike = layout.nplike
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            stops = offsets[1:]
+            out = stops - offsets[:-1] >= len(suffix)
+            for k, byte in enumerate(suffix):
+                out[out] = data[stops[out] - len(suffix) + k] == byte
+            return ak._v2.contents.NumpyArray(nplike.asarray(out, dtype=np.bool_))
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
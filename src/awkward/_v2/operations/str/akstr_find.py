@@ -0,0 +1,53 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def find(array, pattern, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        pattern (str or bytes): The substring to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns integers in place of each string: the position of the first
+    occurrence of `pattern`, or -1 if it does not occur, like Python's
+    `str.find`. Positions are counted in characters for strings and in bytes
+    for bytestrings.
+
+        >>> ak.str.find(ak.Array(["one", "two", "three"]), "e")
+        <Array [2, -1, 3] type='3 * int64'>
+
+    See also #ak.str.contains.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.find",
+        dict(array=array, pattern=pattern, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, pattern, highlevel, behavior)
+
+
+def _impl(array, pattern, highlevel, behavior):
+    pattern = ak._v2.behaviors.string._string_pattern(pattern)
+
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            nplike = layout.nplike
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            found = ak._v2.behaviors.string._string_first_match(offsets, data, pattern)
+            charpos = ak._v2.behaviors.string._string_char_positions(layout, data)
+            out = nplike.where(
+                found >= 0, charpos[found] - charpos[offsets[:-1]], -1
+            ).astype(np.int64)
+            return ak._v2.contents.NumpyArray(out)
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
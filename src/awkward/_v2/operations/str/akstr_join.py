@@ -0,0 +1,91 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def join(array, separator, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing lists of strings or bytestrings, possibly
+            nested in more lists, records, or option types.
+        separator (str or bytes): The substring to put between each pair of
+            strings.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Replaces each innermost list of strings with one string, the
+    concatenation of the list's strings with `separator` between them, like
+    Python's `separator.join(strings)`. The output has one less dimension than
+    the input.
+
+        >>> ak.str.join(ak.Array([["a", "b"], [], ["c", "", "d"]]), ",")
+        <Array ['a,b', '', 'c,,d'] type='3 * string'>
+
+    See also #ak.str.split.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.join",
+        dict(array=array, separator=separator, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, separator, highlevel, behavior)
+
+
+def _impl(array, separator, highlevel, behavior):
+    separator = ak._v2.behaviors.string._string_pattern(separator)
+
+    def action(layout, **kwargs):
+        if (
+            layout.is_ListType
+            and not ak._v2.behaviors.string._is_string(layout)
+            and ak._v2.behaviors.string._is_string(layout.content)
+        ):
+            nplike = layout.nplike
+            layout = layout.toListOffsetArray64(True)
+            lists = nplike.asarray(layout.offsets, dtype=np.int64)
+            strings = layout.content[: lists[-1]]
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(strings)
+            sizes = offsets[1:] - offsets[:-1]
+
+            # every string except the first in each list is preceded by a separator
+            seps = nplike.full(len(sizes), len(separator), dtype=np.int64)
+            seps[lists[:-1][lists[:-1] < lists[1:]]] = 0
+
+            total = nplike.zeros(len(sizes) + 1, dtype=np.int64)
+            nplike.cumsum(seps + sizes, out=total[1:])
+            outoffsets = total[lists]
+
+            # gather the bytes of interleaved (separator, string) pieces from the
+            # strings' data followed by one copy of the separator
+            source = nplike.concatenate(
+                [data, nplike.frombuffer(separator, dtype=np.uint8)]
+            )
+            piecesizes = nplike.stack([seps, sizes], axis=1).reshape(-1)
+            piecesources = nplike.stack(
+                [nplike.full(len(sizes), len(data), dtype=np.int64), offsets[:-1]],
+                axis=1,
+            ).reshape(-1)
+            piecestarts = nplike.zeros(len(piecesizes), dtype=np.int64)
+            nplike.cumsum(piecesizes[:-1], out=piecestarts[1:])
+            index = nplike.repeat(piecesources - piecestarts, piecesizes)
+            index += nplike.arange(len(index), dtype=np.int64)
+
+            return ak._v2.behaviors.string._string_layout(
+                strings, outoffsets, source[index]
+            )
+
+        elif ak._v2.behaviors.string._is_string(layout):
+            raise ak._v2._util.error(
+                TypeError(
+                    "ak.str.join needs lists of strings (without missing values), "
+                    "but found strings that are not directly in lists"
+                )
+            )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,46 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def length(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns integers in place of each string: the number of characters in
+    each string (like Python's `len(str)`) or the number of bytes in each
+    bytestring.
+
+        >>> ak.str.length(ak.Array(["one", "", "déjà"]))
+        <Array [3, 0, 4] type='3 * int64'>
+
+    Unlike #ak.num, this counts characters, not UTF-8 bytes.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.length",
+        dict(array=array, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, highlevel, behavior)
+
+
+def _impl(array, highlevel, behavior):
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            charpos = ak._v2.behaviors.string._string_char_positions(layout, data)
+            return ak._v2.contents.NumpyArray(
+                charpos[offsets[1:]] - charpos[offsets[:-1]]
+            )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
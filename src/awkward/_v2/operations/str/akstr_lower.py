@@ -0,0 +1,44 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def lower(array, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns the strings converted to lowercase, like Python's `str.lower`.
+
+        >>> ak.str.lower(ak.Array(["One", "TWO", "Déjà"]))
+        <Array ['one', 'two', 'déjà'] type='3 * string'>
+
+    If all of the strings are ASCII (and for all bytestrings), only the
+    letters A-Z and a-z are changed, with a lookup table over the bytes.
+    Otherwise, the strings are converted with Python's `str.lower`.
+
+    See also #ak.str.upper.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.lower",
+        dict(array=array, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, highlevel, behavior)
+
+
+def _impl(array, highlevel, behavior):
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            return ak._v2.behaviors.string._string_change_case(layout, False)
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def slice(array, start=None, stop=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        start (None or int): First character to keep; negative values count
+            backward from the end of each string. None is the beginning.
+        stop (None or int): Character to stop before; negative values count
+            backward from the end of each string. None is the end.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns `string[start:stop]` for each string, counting characters for
+    strings and bytes for bytestrings.
+
+        >>> ak.str.slice(ak.Array(["one", "two", "déjà vu"]), 1, -1)
+        <Array ['n', 'w', 'éjà v'] type='3 * string'>
+
+    The output shares its bytes with the input; only new starts and stops
+    are computed.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.slice",
+        dict(
+            array=array, start=start, stop=stop, highlevel=highlevel, behavior=behavior
+        ),
+    ):
+        return _impl(array, start, stop, highlevel, behavior)
+
+
+def _impl(array, start, stop, highlevel, behavior):
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            nplike = layout.nplike
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            charpos = ak._v2.behaviors.string._string_char_positions(layout, data)
+            firsts = charpos[offsets[:-1]]
+            counts = charpos[offsets[1:]] - firsts
+
+            # same rules as Python's slice.indices, for each string
+            if start is None:
+                charstart = nplike.zeros(len(counts), dtype=np.int64)
+            elif start < 0:
+                charstart = nplike.maximum(counts + start, 0)
+            else:
+                charstart = nplike.minimum(counts, start)
+            if stop is None:
+                charstop = counts
+            elif stop < 0:
+                charstop = nplike.maximum(counts + stop, 0)
+            else:
+                charstop = nplike.minimum(counts, stop)
+            charstop = nplike.maximum(charstart, charstop)
+
+            # byte position of each character, and of the end of the data
+            bytepos = nplike.append(
+                nplike.nonzero(charpos[1:] != charpos[:-1])[0], len(data)
+            )
+
+            def tobytes(char, bound):
+                return nplike.where(
+                    char < counts, bytepos[firsts + char], bound
+                ).astype(np.int64)
+
+            return ak._v2.contents.ListArray(
+                ak._v2.index.Index64(tobytes(charstart, offsets[1:])),
+                ak._v2.index.Index64(tobytes(charstop, offsets[1:])),
+                ak._v2.contents.NumpyArray(data, parameters=layout.content.parameters),
+                parameters=layout.parameters,
+            )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,171 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+_whitespace = b" \t\n\r\x0b\x0c"
+
+
+def split(array, separator=None, max_splits=None, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        separator (None, str, or bytes): The substring to split on. If None,
+            split on runs of ASCII whitespace and drop empty substrings, like
+            Python's `str.split()` without arguments.
+        max_splits (None or int): If not None, the maximum number of splits
+            in each string (the rest of the string is the last substring).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Replaces each string with a list of its substrings, like Python's
+    `str.split`, so the output has one more dimension than the input.
+
+        >>> ak.str.split(ak.Array(["a,b", "", "c,,d"]), ",")
+        <Array [['a', 'b'], [''], ['c', '', 'd']] type='3 * var * string'>
+        >>> ak.str.split(ak.Array(["one two  three", " "]))
+        <Array [['one', 'two', 'three'], []] type='2 * var * string'>
+
+    The substrings share their bytes with the input; only new starts and
+    stops are computed.
+
+    See also #ak.str.join.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.split",
+        dict(
+            array=array,
+            separator=separator,
+            max_splits=max_splits,
+            highlevel=highlevel,
+            behavior=behavior,
+        ),
+    ):
+        return _impl(array, separator, max_splits, highlevel, behavior)
+
+
+def _counts(nplike, whichstring, numstrings):
+    # whichstring is sorted, so the number of pieces in each string is the
+    # distance between where it starts and stops in whichstring
+    strings = nplike.arange(numstrings, dtype=np.int64)
+    return nplike.searchsorted(whichstring, strings, side="right") - (
+        nplike.searchsorted(whichstring, strings, side="left")
+    )
+
+
+def _separator_pieces(nplike, offsets, data, separator, max_splits):
+    size = len(separator)
+    positions = ak._v2.behaviors.string._string_find_all(data, separator)
+    whichstring = nplike.searchsorted(offsets, positions, side="right") - 1
+    keep = positions + size <= offsets[1:][whichstring]
+    positions, whichstring = positions[keep], whichstring[keep]
+
+    # overlapping matches are only possible if the separator overlaps itself;
+    # resolve them from left to right, as Python does
+    if size > 1 and nplike.any(
+        (positions[1:] < positions[:-1] + size) & (whichstring[1:] == whichstring[:-1])
+    ):
+        keep = nplike.zeros(len(positions), dtype=np.bool_)
+        last, laststring = -1, -1
+        for i, (position, string) in enumerate(
+            zip(positions.tolist(), whichstring.tolist())
+        ):
+            if string != laststring or position >= last + size:
+                keep[i] = True
+                last, laststring = position, string
+        positions, whichstring = positions[keep], whichstring[keep]
+
+    if max_splits is not None:
+        rank = nplike.arange(len(positions), dtype=np.int64) - nplike.searchsorted(
+            whichstring, whichstring, side="left"
+        )
+        keep = rank < max_splits
+        positions, whichstring = positions[keep], whichstring[keep]
+
+    # each string is cut into one more piece than it has separators; stable
+    # sorting by string puts each string's start first and its stop last
+    numstrings = len(offsets) - 1
+    strings = nplike.arange(numstrings, dtype=np.int64)
+    starts = nplike.concatenate([offsets[:-1], positions + size])
+    order = nplike.argsort(nplike.concatenate([strings, whichstring]), kind="stable")
+    starts = starts[order]
+    stops = nplike.concatenate([positions, offsets[1:]])
+    order = nplike.argsort(nplike.concatenate([whichstring, strings]), kind="stable")
+    stops = stops[order]
+
+    return _counts(nplike, whichstring, numstrings) + 1, starts, stops
+
+
+def _whitespace_pieces(nplike, offsets, data, max_splits):
+    numstrings = len(offsets) - 1
+    isword = nplike.ones(len(data), dtype=np.bool_)
+    for byte in _whitespace:
+        isword &= data != byte
+
+    isstart = nplike.zeros(len(data) + 1, dtype=np.bool_)
+    isstart[offsets[:-1]] = True
+    isstop = nplike.zeros(len(data) + 1, dtype=np.bool_)
+    isstop[offsets[1:]] = True
+
+    previous = nplike.concatenate([[False], isword])
+    following = nplike.concatenate([isword, [False]])
+    starts = nplike.nonzero(isword & (isstart[:-1] | ~previous[:-1]))[0]
+    stops = nplike.nonzero(isword & (isstop[1:] | ~following[1:]))[0] + 1
+    whichstring = nplike.searchsorted(offsets, starts, side="right") - 1
+
+    if max_splits is not None:
+        rank = nplike.arange(len(starts), dtype=np.int64) - nplike.searchsorted(
+            whichstring, whichstring, side="left"
+        )
+        keep = rank <= max_splits
+        last = rank[keep] == max_splits
+        starts, stops, whichstring = starts[keep], stops[keep], whichstring[keep]
+        stops[last] = offsets[1:][whichstring[last]]
+
+    counts = _counts(nplike, whichstring, numstrings)
+    return counts, starts.astype(np.int64), stops.astype(np.int64)
+
+
+def _impl(array, separator, max_splits, highlevel, behavior):
+    if separator is not None:
+        separator = ak._v2.behaviors.string._string_pattern(separator)
+        if len(separator) == 0:
+            raise ak._v2._util.error(ValueError("empty separator"))
+    if max_splits is not None and max_splits < 0:
+        max_splits = None
+
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            nplike = layout.nplike
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            if separator is None:
+                counts, starts, stops = _whitespace_pieces(
+                    nplike, offsets, data, max_splits
+                )
+            else:
+                counts, starts, stops = _separator_pieces(
+                    nplike, offsets, data, separator, max_splits
+                )
+
+            outer = nplike.zeros(len(counts) + 1, dtype=np.int64)
+            nplike.cumsum(counts, out=outer[1:])
+            return ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(outer),
+                ak._v2.contents.ListArray(
+                    ak._v2.index.Index64(starts),
+                    ak._v2.index.Index64(stops),
+                    ak._v2.contents.NumpyArray(
+                        data, parameters=layout.content.parameters
+                    ),
+                    parameters=layout.parameters,
+                ),
+            )
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,50 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def startswith(array, prefix, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Array containing strings or bytestrings, possibly nested in
+            lists, records, or option types.
+        prefix (str or bytes): The prefix to look for.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Returns booleans in place of each string: True if the string starts with
+    `prefix`, False otherwise.
+
+        >>> ak.str.startswith(ak.Array([["one", "two"], [], ["three"]]), "t")
+        <Array [[False, True], [], [True]] type='3 * var * bool'>
+
+    See also #ak.str.endswith.
+    """
+    with ak._v2._util.OperationErrorContext(
+        "ak._v2.str.startswith",
+        dict(array=array, prefix=prefix, highlevel=highlevel, behavior=behavior),
+    ):
+        return _impl(array, prefix, highlevel, behavior)
+
+
+def _impl(array, prefix, highlevel, behavior):
+    prefix = ak._v2.behaviors.string._string_pattern(prefix)
+
+    def action(layout, **kwargs):
+        if ak._v2.behaviors.string._is_string(layout):
+            nplike = layout.nplike
+            offsets, data = ak._v2.behaviors.string._string_offsets_and_data(layout)
+            starts = offsets[:-1]
+            out = offsets[1:] - starts >= len(prefix)
+            for k, byte in enumerate(prefix):
+                out[out] = data[starts[out] + k] == byte
+            return ak._v2.contents.NumpyArray(nplike.asarray(out, dtype=np.bool_))
+
+    layout = ak._v2.operations.to_layout(array, allow_record=False, allow_other=False)
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,162 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import contextlib
+import os
+import threading
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+# Segmented operations (sorting and reducing many sublists) are split into
+# ranges of whole sublists with about the same number of elements each, and
+# the ranges are given to CPU kernels in a pool of threads. The kernels are
+# called through ctypes, which releases the GIL, so the threads really do run
+# in parallel. Arrays smaller than _min_per_thread elements per thread are not
+# worth the overhead and run in the calling thread.
+
+_min_per_thread = 1 << 16
+
+_lock = threading.Lock()
+_num_threads = None
+_local = threading.local()
+_pool = None
+_pool_size = 0
+
+
+def _default_num_threads():
+    env = os.environ.get("AWKWARD_NUM_THREADS")
+    if env is not None:
+        return max(int(env), 1)
+    elif hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    else:
+        return max(os.cpu_count() or 1, 1)
+
+
+def set_num_threads(num_threads):
+    """
+    Args:
+        num_threads (None or int): Maximum number of threads to use in
+            segmented sorts and reductions. If None, use the
+            `AWKWARD_NUM_THREADS` environment variable or the number of CPUs
+            available to this process. 1 turns multithreading off.
+
+    Sets the size of the thread pool for operations such as #ak.sort,
+    #ak.argsort, #ak.sum and #ak.max at `axis=-1`, which can work on ranges of
+    sublists in parallel. Small arrays always run in a single thread.
+
+    See #ak._v2.parallel.num_threads to change it for only some calls.
+    """
+    global _num_threads
+    num_threads = _check_num_threads(num_threads)
+    with _lock:
+        _num_threads = num_threads
+
+
+def get_num_threads():
+    """
+    Returns the maximum number of threads used in segmented sorts and
+    reductions. See #ak._v2.parallel.set_num_threads.
+    """
+    override = getattr(_local, "num_threads", None)
+    if override is not None:
+        return override
+    elif _num_threads is None:
+        return _default_num_threads()
+    else:
+        return _num_threads
+
+
+@contextlib.contextmanager
+def num_threads(num_threads):
+    """
+    Args:
+        num_threads (None or int): Maximum number of threads to use in
+            segmented sorts and reductions within this context. If None, use
+            the global setting.
+
+    Changes the number of threads for the calls within a `with` block in the
+    current thread only, leaving the global setting of
+    #ak._v2.parallel.set_num_threads untouched. For example,
+
+        >>> with ak._v2.parallel.num_threads(1):
+        ...     ak._v2.sum(array, axis=-1)
+
+    reduces `array` in a single thread.
+    """
+    num_threads = _check_num_threads(num_threads)
+    previous = getattr(_local, "num_threads", None)
+    _local.num_threads = num_threads
+    try:
+        yield
+    finally:
+        _local.num_threads = previous
+
+
+def _check_num_threads(num_threads):
+    if num_threads is not None:
+        if not isinstance(num_threads, (int, np.integer)) or num_threads < 1:
+            raise ak._v2._util.error(
+                ValueError(
+                    f"num_threads must be None or a positive integer, not {num_threads!r}"
+                )
+            )
+        num_threads = int(num_threads)
+    return num_threads
+
+
+def _get_pool(num_threads):
+    # A pool that is too small is replaced, but not shut down: other threads
+    # may still be submitting to it. Its workers exit when it is no longer
+    # referenced. Each call submits at most num_threads ranges, so a larger
+    # pool does not use more threads than asked for.
+    global _pool, _pool_size
+    with _lock:
+        if _pool is None or _pool_size < num_threads:
+            import concurrent.futures
+
+            _pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=num_threads, thread_name_prefix="awkward"
+            )
+            _pool_size = num_threads
+        return _pool
+
+
+def _balanced_ranges(offsets, num_ranges):
+    # boundaries (in sublists) of up to num_ranges ranges with about the same
+    # number of elements each; a sublist is never split between ranges
+    import numpy
+
+    numlists = len(offsets) - 1
+    targets = numpy.linspace(offsets[0], offsets[-1], num_ranges + 1)[1:-1]
+    cuts = numpy.searchsorted(offsets, targets, side="left")
+    bounds = numpy.unique(numpy.concatenate([[0], cuts, [numlists]]))
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _map_ranges(function, offsets, nplike):
+    """
+    Calls `function(start, stop)` on ranges of the sublists described by
+    `offsets` (a NumPy array), in parallel if the arrays are large enough and
+    on the CPU. Returns the list of results, in order.
+    """
+    numlists = len(offsets) - 1
+    if numlists <= 0:
+        return [function(0, max(numlists, 0))]
+
+    num_threads = 1
+    if isinstance(nplike, ak.nplike.Numpy):
+        num_threads = min(
+            get_num_threads(),
+            numlists,
+            int(offsets[-1] - offsets[0]) // _min_per_thread,
+        )
+
+    if num_threads <= 1:
+        return [function(0, numlists)]
+
+    ranges = _balanced_ranges(offsets, num_threads)
+    pool = _get_pool(num_threads)
+    futures = [pool.submit(function, start, stop) for start, stop in ranges]
+    return [future.result() for future in futures]
@@ -98,6 +98,7 @@ class NumpyMetadata(Singleton):
     nat = numpy.datetime64("NaT")
     datetime_data = numpy.datetime_data
     issubdtype = numpy.issubdtype
+    promote_types = numpy.promote_types
 
     AxisError = numpy.AxisError
 
@@ -178,6 +179,14 @@ class NumpyLike(Singleton):
         # start, stop, step[, dtype=]
         return self._module.arange(*args, **kwargs)
 
+    def linspace(self, *args, **kwargs):
+        # start, stop[, num=][, dtype=]
+        return self._module.linspace(*args, **kwargs)
+
+    def result_type(self, *args):
+        # *arrays_and_dtypes
+        return self._module.result_type(*args)
+
     def meshgrid(self, *args, **kwargs):
         # *arrays, indexing="ij"
         return self._module.meshgrid(*args, **kwargs)
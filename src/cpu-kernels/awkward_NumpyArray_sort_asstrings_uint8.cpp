@@ -9,8 +9,9 @@
 
 #include "awkward/kernels.h"
 
-// This function relies on std::sort to do the right
-// thing with std::strings
+// Sorts an index of the strings with a byte-wise comparison (so that
+// strings with embedded zeros are ordered correctly), then copies each
+// string once into its sorted position.
 ERROR awkward_NumpyArray_sort_asstrings_uint8(
     uint8_t* toptr,
     const uint8_t* fromptr,
@@ -20,55 +21,47 @@ ERROR awkward_NumpyArray_sort_asstrings_uint8(
     bool ascending,
     bool stable) {
 
-  // convert array of characters to
-  // an std container of strings
-  std::vector<std::string> words;
+  std::vector<int64_t> index(offsetslength - 1);
+  std::iota(index.begin(), index.end(), 0);
 
-  for (int64_t k = 0;  k < offsetslength - 1;  k++) {
-    int64_t start = offsets[k];
-    int64_t stop = offsets[k + 1];
-    int64_t slen = start;
-    std::string strvar;
-    for (uint8_t i = (uint8_t)start;  slen < stop;  i++) {
-      slen++;
-      strvar += (char)fromptr[i];
-    }
-    words.emplace_back(strvar);
-  }
+  auto less = [&fromptr, &offsets](int64_t left, int64_t right) -> bool {
+    int64_t left_n = offsets[left + 1] - offsets[left];
+    int64_t right_n = offsets[right + 1] - offsets[right];
+    int64_t common = std::min(left_n, right_n);
+    int cmp = (common == 0) ? 0 : std::memcmp(&fromptr[offsets[left]],
+                                              &fromptr[offsets[right]],
+                                              (size_t)common);
+    return (cmp == 0) ? left_n < right_n : cmp < 0;
+  };
+  auto greater = [&less](int64_t left, int64_t right) -> bool {
+    return less(right, left);
+  };
 
-  // sort the container
   if (ascending  &&  !stable) {
-    std::sort(words.begin(), words.end(), std::less<std::string>());
+    std::sort(index.begin(), index.end(), less);
   }
   else if (!ascending  &&  !stable) {
-    std::sort(words.begin(), words.end(), std::greater<std::string>());
+    std::sort(index.begin(), index.end(), greater);
   }
   else if (ascending  &&  stable) {
-    std::stable_sort(words.begin(), words.end(), std::less<std::string>());
+    std::stable_sort(index.begin(), index.end(), less);
   }
   else if (!ascending  &&  stable) {
-    std::stable_sort(words.begin(), words.end(), std::greater<std::string>());
+    std::stable_sort(index.begin(), index.end(), greater);
   }
 
-  // convert the strings to an array of characters
-  // and fill the outer memory via a pointer
+  // copy the strings into their sorted positions and collect their
+  // lengths as the new offsets for a ListOffsetArray
+  outoffsets[0] = 0;
   int64_t k = 0;
-  for (const auto& strvar : words) {
-    std::vector<char> cstr(strvar.c_str(), strvar.c_str() + strvar.size());
-    for (const auto& c : cstr) {
-      toptr[k] = (uint8_t)c;
-      k++;
+  for (int64_t i = 0;  i < (int64_t)index.size();  i++) {
+    int64_t start = offsets[index[i]];
+    int64_t size = offsets[index[i] + 1] - start;
+    if (size > 0) {
+      std::memcpy(&toptr[k], &fromptr[start], (size_t)size);
     }
-  }
-
-  // collect sorted string lengths
-  // that are the new offsets for a ListOffsetArray
-  int64_t o = 0;
-  outoffsets[o] = (int64_t)0;
-  o++;
-  for (const auto& r : words) {
-    outoffsets[o] = outoffsets[o - 1] + (int64_t)r.size();
-    o++;
+    k += size;
+    outoffsets[i + 1] = k;
   }
 
   return success();
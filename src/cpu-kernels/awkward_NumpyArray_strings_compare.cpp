@@ -0,0 +1,39 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_NumpyArray_strings_compare.cpp", line)
+
+#include <algorithm>
+#include <cstring>
+
+#include "awkward/kernels.h"
+
+// Lexicographical byte order (the order of UTF-8 code points): -1 if the
+// left string is less than the right, 0 if equal, +1 if greater.
+ERROR awkward_NumpyArray_strings_compare(
+  int8_t* tocompare,
+  const uint8_t* leftdata,
+  const int64_t* leftstarts,
+  const int64_t* leftstops,
+  const uint8_t* rightdata,
+  const int64_t* rightstarts,
+  const int64_t* rightstops,
+  int64_t length) {
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t leftsize = leftstops[i] - leftstarts[i];
+    int64_t rightsize = rightstops[i] - rightstarts[i];
+    int64_t common = std::min(leftsize, rightsize);
+    int cmp = 0;
+    if (common > 0) {
+      cmp = std::memcmp(&leftdata[leftstarts[i]],
+                        &rightdata[rightstarts[i]],
+                        (size_t)common);
+    }
+    if (cmp == 0) {
+      tocompare[i] = (leftsize < rightsize) ? -1 : (leftsize > rightsize ? 1 : 0);
+    }
+    else {
+      tocompare[i] = (cmp < 0) ? -1 : 1;
+    }
+  }
+  return success();
+}
@@ -0,0 +1,28 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_NumpyArray_strings_equal.cpp", line)
+
+#include <cstring>
+
+#include "awkward/kernels.h"
+
+ERROR awkward_NumpyArray_strings_equal(
+  bool* toequal,
+  const uint8_t* leftdata,
+  const int64_t* leftstarts,
+  const int64_t* leftstops,
+  const uint8_t* rightdata,
+  const int64_t* rightstarts,
+  const int64_t* rightstops,
+  int64_t length) {
+  for (int64_t i = 0;  i < length;  i++) {
+    int64_t leftsize = leftstops[i] - leftstarts[i];
+    int64_t rightsize = rightstops[i] - rightstarts[i];
+    toequal[i] = (leftsize == rightsize  &&
+                  (leftsize == 0  ||
+                   std::memcmp(&leftdata[leftstarts[i]],
+                               &rightdata[rightstarts[i]],
+                               (size_t)leftsize) == 0));
+  }
+  return success();
+}
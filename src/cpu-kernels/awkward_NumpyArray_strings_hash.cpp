@@ -0,0 +1,40 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_NumpyArray_strings_hash.cpp", line)
+
+#include <cstring>
+
+#include "awkward/kernels.h"
+
+// 64-bit FNV-1a over 8-byte words (then the remaining bytes), seeded with the
+// string's length and finished with the MurmurHash3 mixer. Equal strings have
+// equal hashes; unequal strings can collide, so users must check equality.
+ERROR awkward_NumpyArray_strings_hash(
+  uint64_t* tohash,
+  const uint8_t* fromdata,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t length) {
+  const uint64_t prime = 0x100000001b3ULL;
+  for (int64_t i = 0;  i < length;  i++) {
+    const uint8_t* data = &fromdata[starts[i]];
+    int64_t size = stops[i] - starts[i];
+    uint64_t hash = 0xcbf29ce484222325ULL ^ (uint64_t)size;
+    int64_t j = 0;
+    for (;  j + 8 <= size;  j += 8) {
+      uint64_t word;
+      std::memcpy(&word, &data[j], 8);
+      hash = (hash ^ word) * prime;
+    }
+    for (;  j < size;  j++) {
+      hash = (hash ^ (uint64_t)data[j]) * prime;
+    }
+    hash ^= hash >> 33;
+    hash *= 0xff51afd7ed558ccdULL;
+    hash ^= hash >> 33;
+    hash *= 0xc4ceb9fe1a85ec53ULL;
+    hash ^= hash >> 33;
+    tohash[i] = hash;
+  }
+  return success();
+}
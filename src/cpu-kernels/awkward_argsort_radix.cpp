@@ -0,0 +1,317 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_argsort_radix.cpp", line)
+
+#include <algorithm>
+#include <cmath>
+#include <cstring>
+#include <type_traits>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+// Maps each value to an unsigned integer with the same ordering, so that
+// the values can be sorted one byte at a time. Descending order inverts the
+// keys. NaN sorts before everything else in both orders, as in awkward_argsort.
+template <typename T, typename U>
+U radix_key(T value, bool ascending) {
+  U key;
+  if (std::is_floating_point<T>::value) {
+    if (std::isnan(static_cast<double>(value))) {
+      return 0;
+    }
+    if (value == 0) {
+      value = 0;   // -0.0 and 0.0 are equal
+    }
+    std::memcpy(&key, &value, sizeof(U));
+    const U sign = (U)1 << (8*sizeof(U) - 1);
+    key = (key & sign) ? ~key : (key | sign);
+  }
+  else if (std::is_signed<T>::value) {
+    key = (U)value ^ ((U)1 << (8*sizeof(U) - 1));
+  }
+  else {
+    key = (U)value;
+  }
+  if (!ascending) {
+    key = ~key;
+  }
+  if (std::is_floating_point<T>::value  &&  key == 0) {
+    key = 1;   // reserved for NaN
+  }
+  return key;
+}
+
+// Least-significant-digit radix sort of the (key, index) pairs in one
+// sublist. The histograms of all bytes are filled in a single pass, and bytes
+// that are the same for every key are skipped. Radix sorting is stable, so the
+// result is the same as a stable comparison sort.
+template <typename U>
+void radix_sort_sublist(
+  U* keys,
+  int64_t* index,
+  U* nextkeys,
+  int64_t* nextindex,
+  int64_t length) {
+  if (length < 64) {
+    for (int64_t i = 1;  i < length;  i++) {
+      U key = keys[i];
+      int64_t idx = index[i];
+      int64_t j = i;
+      for (;  j > 0  &&  keys[j - 1] > key;  j--) {
+        keys[j] = keys[j - 1];
+        index[j] = index[j - 1];
+      }
+      keys[j] = key;
+      index[j] = idx;
+    }
+    return;
+  }
+
+  int64_t counts[sizeof(U)][256];
+  std::memset(counts, 0, sizeof(counts));
+  for (int64_t i = 0;  i < length;  i++) {
+    U key = keys[i];
+    for (size_t byte = 0;  byte < sizeof(U);  byte++) {
+      counts[byte][(key >> (8*byte)) & 0xff]++;
+    }
+  }
+
+  U* src = keys;
+  int64_t* srcindex = index;
+  U* dst = nextkeys;
+  int64_t* dstindex = nextindex;
+  for (size_t byte = 0;  byte < sizeof(U);  byte++) {
+    const int shift = (int)(8*byte);
+    int64_t* count = counts[byte];
+    if (count[(src[0] >> shift) & 0xff] == length) {
+      continue;
+    }
+    int64_t total = 0;
+    for (int64_t k = 0;  k < 256;  k++) {
+      int64_t c = count[k];
+      count[k] = total;
+      total += c;
+    }
+    for (int64_t i = 0;  i < length;  i++) {
+      int64_t pos = count[(src[i] >> shift) & 0xff]++;
+      dst[pos] = src[i];
+      dstindex[pos] = srcindex[i];
+    }
+    std::swap(src, dst);
+    std::swap(srcindex, dstindex);
+  }
+  if (src != keys) {
+    std::memcpy(keys, src, length*sizeof(U));
+    std::memcpy(index, srcindex, length*sizeof(int64_t));
+  }
+}
+
+// Sorts each sublist separately, so that the working set of each sort stays
+// small and the output is already grouped by sublist.
+template <typename T, typename U>
+ERROR awkward_argsort_radix(
+  int64_t* tocarry,
+  const T* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  int64_t maxlength = 0;
+  for (int64_t j = 0;  j < offsetslength - 1;  j++) {
+    maxlength = std::max(maxlength, offsets[j + 1] - offsets[j]);
+  }
+  std::vector<U> keys(maxlength);
+  std::vector<U> nextkeys(maxlength);
+  std::vector<int64_t> nextindex(maxlength);
+
+  for (int64_t j = 0;  j < offsetslength - 1;  j++) {
+    const int64_t start = offsets[j];
+    const int64_t sublength = offsets[j + 1] - start;
+    int64_t* index = &tocarry[start];
+    for (int64_t i = 0;  i < sublength;  i++) {
+      keys[i] = radix_key<T, U>(fromptr[start + i], ascending);
+      index[i] = i;
+    }
+    radix_sort_sublist<U>(
+      keys.data(), index, nextkeys.data(), nextindex.data(), sublength);
+    if (!is_local) {
+      for (int64_t i = 0;  i < sublength;  i++) {
+        index[i] += start;
+      }
+    }
+  }
+
+  return success();
+}
+ERROR awkward_argsort_radix_int8(
+  int64_t* tocarry,
+  const int8_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<int8_t, uint8_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_uint8(
+  int64_t* tocarry,
+  const uint8_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<uint8_t, uint8_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_int16(
+  int64_t* tocarry,
+  const int16_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<int16_t, uint16_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_uint16(
+  int64_t* tocarry,
+  const uint16_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<uint16_t, uint16_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_int32(
+  int64_t* tocarry,
+  const int32_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<int32_t, uint32_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_uint32(
+  int64_t* tocarry,
+  const uint32_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<uint32_t, uint32_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_int64(
+  int64_t* tocarry,
+  const int64_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<int64_t, uint64_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_uint64(
+  int64_t* tocarry,
+  const uint64_t* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<uint64_t, uint64_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_float32(
+  int64_t* tocarry,
+  const float* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<float, uint32_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
+ERROR awkward_argsort_radix_float64(
+  int64_t* tocarry,
+  const double* fromptr,
+  int64_t length,
+  const int64_t* offsets,
+  int64_t offsetslength,
+  bool ascending,
+  bool is_local) {
+  return awkward_argsort_radix<double, uint64_t>(
+    tocarry,
+    fromptr,
+    length,
+    offsets,
+    offsetslength,
+    ascending,
+    is_local);
+}
@@ -0,0 +1,308 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_histogram.cpp", line)
+
+#include <algorithm>
+
+#include "awkward/kernels.h"
+
+template <typename T>
+ERROR awkward_histogram(
+  double* tocounts,
+  const T* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  // adds the (weighted) counts of the values from starts[i] to stops[i] to
+  // the histogram of each list (if perlist) or to a single histogram; the
+  // bins are as in numpy.histogram: all but the last are half-open, and
+  // values outside of the edges (or NaN) are not counted
+  double low = edges[0];
+  double high = edges[numbins];
+  double scale = (double)numbins / (high - low);
+  for (int64_t i = 0;  i < outlength;  i++) {
+    double* counts = tocounts + (perlist ? i * numbins : 0);
+    for (int64_t j = starts[i];  j < stops[i];  j++) {
+      double x = (double)fromptr[j];
+      if (!(x >= low  &&  x <= high)) {
+        continue;
+      }
+      int64_t bin;
+      if (uniform) {
+        // the bin from scaling is corrected for rounding with its edges
+        bin = std::min((int64_t)((x - low) * scale), numbins - 1);
+        if (x < edges[bin]) {
+          bin--;
+        }
+        else if (x >= edges[bin + 1]  &&  bin != numbins - 1) {
+          bin++;
+        }
+      }
+      else {
+        bin = std::min(
+          (int64_t)(std::upper_bound(edges, edges + numbins + 1, x) - edges) - 1,
+          numbins - 1);
+      }
+      counts[bin] += (weightptr == nullptr ? 1.0 : weightptr[j]);
+    }
+  }
+  return success();
+}
+ERROR awkward_histogram_bool(
+  double* tocounts,
+  const bool* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<bool>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_int8(
+  double* tocounts,
+  const int8_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<int8_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_int16(
+  double* tocounts,
+  const int16_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<int16_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_int32(
+  double* tocounts,
+  const int32_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<int32_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_int64(
+  double* tocounts,
+  const int64_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<int64_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_uint8(
+  double* tocounts,
+  const uint8_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<uint8_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_uint16(
+  double* tocounts,
+  const uint16_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<uint16_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_uint32(
+  double* tocounts,
+  const uint32_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<uint32_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_uint64(
+  double* tocounts,
+  const uint64_t* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<uint64_t>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_float32(
+  double* tocounts,
+  const float* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<float>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
+ERROR awkward_histogram_float64(
+  double* tocounts,
+  const double* fromptr,
+  const double* weightptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  int64_t outlength,
+  const double* edges,
+  int64_t numbins,
+  bool uniform,
+  bool perlist) {
+  return awkward_histogram<double>(
+    tocounts,
+    fromptr,
+    weightptr,
+    starts,
+    stops,
+    outlength,
+    edges,
+    numbins,
+    uniform,
+    perlist);
+}
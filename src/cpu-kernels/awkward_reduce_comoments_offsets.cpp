@@ -0,0 +1,258 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_comoments_offsets.cpp", line)
+
+#include "awkward/kernels.h"
+
+template <typename T>
+ERROR awkward_reduce_comoments_offsets(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const T* xptr,
+  const T* yptr,
+  const T* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    // same as awkward_reduce_moments_offsets, for two variables at once
+    double sw = 0.0;
+    double swx = 0.0;
+    double swy = 0.0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      double w = (weightptr == nullptr ? 1.0 : (double)weightptr[j]);
+      sw += w;
+      swx += (double)xptr[j] * w;
+      swy += (double)yptr[j] * w;
+    }
+    double xmean = swx / sw;
+    double ymean = swy / sw;
+    double sxy = 0.0;
+    double sxx = 0.0;
+    double syy = 0.0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      double w = (weightptr == nullptr ? 1.0 : (double)weightptr[j]);
+      double dx = (double)xptr[j] - xmean;
+      double dy = (double)yptr[j] - ymean;
+      sxy += dx * dy * w;
+      sxx += dx * dx * w;
+      syy += dy * dy * w;
+    }
+    sumw[i] = sw;
+    cxy[i] = sxy;
+    m2x[i] = sxx;
+    m2y[i] = syy;
+  }
+  return success();
+}
+ERROR awkward_reduce_comoments_offsets_int8_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const int8_t* xptr,
+  const int8_t* yptr,
+  const int8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<int8_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_int16_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const int16_t* xptr,
+  const int16_t* yptr,
+  const int16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<int16_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_int32_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const int32_t* xptr,
+  const int32_t* yptr,
+  const int32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<int32_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_int64_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const int64_t* xptr,
+  const int64_t* yptr,
+  const int64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<int64_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_uint8_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const uint8_t* xptr,
+  const uint8_t* yptr,
+  const uint8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<uint8_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_uint16_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const uint16_t* xptr,
+  const uint16_t* yptr,
+  const uint16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<uint16_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_uint32_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const uint32_t* xptr,
+  const uint32_t* yptr,
+  const uint32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<uint32_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_uint64_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const uint64_t* xptr,
+  const uint64_t* yptr,
+  const uint64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<uint64_t>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_float32_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const float* xptr,
+  const float* yptr,
+  const float* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<float>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_comoments_offsets_float64_64(
+  double* sumw,
+  double* cxy,
+  double* m2x,
+  double* m2y,
+  const double* xptr,
+  const double* yptr,
+  const double* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_comoments_offsets<double>(
+    sumw,
+    cxy,
+    m2x,
+    m2y,
+    xptr,
+    yptr,
+    weightptr,
+    offsets,
+    outlength);
+}
@@ -0,0 +1,142 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_countnonzero_offsets.cpp", line)
+
+#include "awkward/kernels.h"
+
+template <typename OUT, typename IN>
+ERROR awkward_reduce_countnonzero_offsets(
+  OUT* toptr,
+  const IN* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    int64_t count = 0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      count += (fromptr[j] != 0);
+    }
+    toptr[i] = count;
+  }
+  return success();
+}
+ERROR awkward_reduce_countnonzero_offsets_bool_64(
+  int64_t* toptr,
+  const bool* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, bool>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_int8_64(
+  int64_t* toptr,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, int8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_int16_64(
+  int64_t* toptr,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, int16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_int32_64(
+  int64_t* toptr,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, int32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_int64_64(
+  int64_t* toptr,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, int64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_uint8_64(
+  int64_t* toptr,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, uint8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_uint16_64(
+  int64_t* toptr,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, uint16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_uint32_64(
+  int64_t* toptr,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, uint32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_uint64_64(
+  int64_t* toptr,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, uint64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_float32_64(
+  int64_t* toptr,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, float>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_countnonzero_offsets_float64_64(
+  int64_t* toptr,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_countnonzero_offsets<int64_t, double>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
@@ -0,0 +1,200 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_moment_offsets.cpp", line)
+
+#include <cmath>
+
+#include "awkward/kernels.h"
+
+template <typename T>
+ERROR awkward_reduce_moment_offsets(
+  double* sumw,
+  double* sumwxn,
+  const T* fromptr,
+  const T* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    double sw = 0.0;
+    double swxn = 0.0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      double w = (weightptr == nullptr ? 1.0 : (double)weightptr[j]);
+      sw += w;
+      swxn += std::pow((double)fromptr[j] * w, n);
+    }
+    sumw[i] = sw;
+    sumwxn[i] = swxn;
+  }
+  return success();
+}
+ERROR awkward_reduce_moment_offsets_int8_64(
+  double* sumw,
+  double* sumwxn,
+  const int8_t* fromptr,
+  const int8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<int8_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_int16_64(
+  double* sumw,
+  double* sumwxn,
+  const int16_t* fromptr,
+  const int16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<int16_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_int32_64(
+  double* sumw,
+  double* sumwxn,
+  const int32_t* fromptr,
+  const int32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<int32_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_int64_64(
+  double* sumw,
+  double* sumwxn,
+  const int64_t* fromptr,
+  const int64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<int64_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_uint8_64(
+  double* sumw,
+  double* sumwxn,
+  const uint8_t* fromptr,
+  const uint8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<uint8_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_uint16_64(
+  double* sumw,
+  double* sumwxn,
+  const uint16_t* fromptr,
+  const uint16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<uint16_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_uint32_64(
+  double* sumw,
+  double* sumwxn,
+  const uint32_t* fromptr,
+  const uint32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<uint32_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_uint64_64(
+  double* sumw,
+  double* sumwxn,
+  const uint64_t* fromptr,
+  const uint64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<uint64_t>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_float32_64(
+  double* sumw,
+  double* sumwxn,
+  const float* fromptr,
+  const float* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<float>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
+ERROR awkward_reduce_moment_offsets_float64_64(
+  double* sumw,
+  double* sumwxn,
+  const double* fromptr,
+  const double* weightptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  double n) {
+  return awkward_reduce_moment_offsets<double>(
+    sumw,
+    sumwxn,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength,
+    n);
+}
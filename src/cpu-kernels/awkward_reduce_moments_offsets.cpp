@@ -0,0 +1,209 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_moments_offsets.cpp", line)
+
+#include "awkward/kernels.h"
+
+template <typename T>
+ERROR awkward_reduce_moments_offsets(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const T* fromptr,
+  const T* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    // the mean is known after a first pass over the sublist, and the squared
+    // deviations from it are summed in a second pass (which, for sublists
+    // that fit in cache, doesn't read the data from memory again)
+    double sw = 0.0;
+    double swx = 0.0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      double w = (weightptr == nullptr ? 1.0 : (double)weightptr[j]);
+      sw += w;
+      swx += (double)fromptr[j] * w;
+    }
+    double mean = swx / sw;
+    double s2 = 0.0;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      double w = (weightptr == nullptr ? 1.0 : (double)weightptr[j]);
+      double delta = (double)fromptr[j] - mean;
+      s2 += delta * delta * w;
+    }
+    sumw[i] = sw;
+    sumwx[i] = swx;
+    m2[i] = s2;
+  }
+  return success();
+}
+ERROR awkward_reduce_moments_offsets_int8_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const int8_t* fromptr,
+  const int8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<int8_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_int16_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const int16_t* fromptr,
+  const int16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<int16_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_int32_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const int32_t* fromptr,
+  const int32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<int32_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_int64_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const int64_t* fromptr,
+  const int64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<int64_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_uint8_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const uint8_t* fromptr,
+  const uint8_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<uint8_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_uint16_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const uint16_t* fromptr,
+  const uint16_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<uint16_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_uint32_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const uint32_t* fromptr,
+  const uint32_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<uint32_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_uint64_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const uint64_t* fromptr,
+  const uint64_t* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<uint64_t>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_float32_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const float* fromptr,
+  const float* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<float>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_moments_offsets_float64_64(
+  double* sumw,
+  double* sumwx,
+  double* m2,
+  const double* fromptr,
+  const double* weightptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_moments_offsets<double>(
+    sumw,
+    sumwx,
+    m2,
+    fromptr,
+    weightptr,
+    offsets,
+    outlength);
+}
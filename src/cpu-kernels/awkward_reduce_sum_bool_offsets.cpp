@@ -0,0 +1,142 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_reduce_sum_bool_offsets.cpp", line)
+
+#include "awkward/kernels.h"
+
+template <typename OUT, typename IN>
+ERROR awkward_reduce_sum_bool_offsets(
+  OUT* toptr,
+  const IN* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  for (int64_t i = 0;  i < outlength;  i++) {
+    bool out = false;
+    for (int64_t j = offsets[i];  j < offsets[i + 1]  &&  !out;  j++) {
+      out = (fromptr[j] != 0);
+    }
+    toptr[i] = out;
+  }
+  return success();
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_bool_64(
+  bool* toptr,
+  const bool* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, bool>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_int8_64(
+  bool* toptr,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, int8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_int16_64(
+  bool* toptr,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, int16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_int32_64(
+  bool* toptr,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, int32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_int64_64(
+  bool* toptr,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, int64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_uint8_64(
+  bool* toptr,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, uint8_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_uint16_64(
+  bool* toptr,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, uint16_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_uint32_64(
+  bool* toptr,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, uint32_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_uint64_64(
+  bool* toptr,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, uint64_t>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_float32_64(
+  bool* toptr,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, float>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
+ERROR awkward_reduce_sum_bool_offsets_bool_float64_64(
+  bool* toptr,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_reduce_sum_bool_offsets<bool, double>(
+    toptr,
+    fromptr,
+    offsets,
+    outlength);
+}
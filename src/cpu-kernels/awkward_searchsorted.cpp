@@ -0,0 +1,244 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_searchsorted.cpp", line)
+
+#include "awkward/kernels.h"
+
+// The number of items at the start of [base, base + n) for which `before`
+// is true (it must be true for a prefix and false after), found with a
+// binary search whose only branch is the loop condition, so that the CPU
+// doesn't mispredict the comparisons of random values.
+template <typename T, typename PRED>
+int64_t awkward_searchsorted_partition(const T* base, int64_t n, PRED before) {
+  const T* first = base;
+  if (n == 0) {
+    return 0;
+  }
+  while (n > 1) {
+    int64_t half = n / 2;
+    base = before(base[half - 1]) ? base + half : base;
+    n -= half;
+  }
+  return (base - first) + (before(*base) ? 1 : 0);
+}
+
+template <typename T>
+ERROR awkward_searchsorted(
+  int64_t* toindex,
+  const T* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const T* values,
+  int64_t length,
+  bool right) {
+  // a binary search for each value in the sorted sublist given by its
+  // segment, in the order of awkward_sort: NaN before everything else
+  for (int64_t i = 0;  i < length;  i++) {
+    const T* base = fromptr + offsets[segments[i]];
+    int64_t n = offsets[segments[i] + 1] - offsets[segments[i]];
+    T value = values[i];
+    if (value != value) {
+      toindex[i] = (right ? awkward_searchsorted_partition(base, n, [](T x) {
+        return x != x;
+      }) : 0);
+    }
+    else if (right) {
+      toindex[i] = awkward_searchsorted_partition(base, n, [value](T x) {
+        return !(value < x);
+      });
+    }
+    else {
+      toindex[i] = awkward_searchsorted_partition(base, n, [value](T x) {
+        return !(x >= value);
+      });
+    }
+  }
+  return success();
+}
+ERROR awkward_searchsorted_bool(
+  int64_t* toindex,
+  const bool* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const bool* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<bool>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_int8(
+  int64_t* toindex,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const int8_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<int8_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_int16(
+  int64_t* toindex,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const int16_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<int16_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_int32(
+  int64_t* toindex,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const int32_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<int32_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_int64(
+  int64_t* toindex,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const int64_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<int64_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_uint8(
+  int64_t* toindex,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const uint8_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<uint8_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_uint16(
+  int64_t* toindex,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const uint16_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<uint16_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_uint32(
+  int64_t* toindex,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const uint32_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<uint32_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_uint64(
+  int64_t* toindex,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const uint64_t* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<uint64_t>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_float32(
+  int64_t* toindex,
+  const float* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const float* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<float>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
+ERROR awkward_searchsorted_float64(
+  int64_t* toindex,
+  const double* fromptr,
+  const int64_t* offsets,
+  const int64_t* segments,
+  const double* values,
+  int64_t length,
+  bool right) {
+  return awkward_searchsorted<double>(
+    toindex,
+    fromptr,
+    offsets,
+    segments,
+    values,
+    length,
+    right);
+}
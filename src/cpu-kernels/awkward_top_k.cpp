@@ -0,0 +1,219 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_top_k.cpp", line)
+
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+// The order of a stable argsort (see awkward_argsort): NaN first, then by
+// value, then by position.
+template <typename T>
+bool awkward_top_k_before(T l, T r, int64_t lpos, int64_t rpos, bool largest) {
+  bool lnan = std::isnan(static_cast<double>(l));
+  bool rnan = std::isnan(static_cast<double>(r));
+  if (lnan != rnan) {
+    return lnan;
+  }
+  if (!lnan  &&  l != r) {
+    return largest ? l > r : l < r;
+  }
+  return lpos < rpos;
+}
+
+template <typename T>
+ERROR awkward_top_k(
+  int64_t* tolocal,
+  const T* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  // the first min(k, n) local positions of each sublist of length n in sorted
+  // order, selected with a heap of size k (std::partial_sort), which takes
+  // O(n log k) rather than the O(n log n) of a full sort
+  std::vector<int64_t> local;
+  int64_t out = 0;
+  for (int64_t i = 0;  i < outlength;  i++) {
+    const T* segment = fromptr + offsets[i];
+    int64_t n = offsets[i + 1] - offsets[i];
+    int64_t m = std::min(k, n);
+    local.resize(n);
+    std::iota(local.begin(), local.end(), 0);
+    std::partial_sort(local.begin(), local.begin() + m, local.end(),
+                      [&segment, &largest](int64_t l, int64_t r) {
+      return awkward_top_k_before<T>(segment[l], segment[r], l, r, largest);
+    });
+    std::copy(local.begin(), local.begin() + m, tolocal + out);
+    out += m;
+  }
+  return success();
+}
+ERROR awkward_top_k_bool(
+  int64_t* tolocal,
+  const bool* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<bool>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_int8(
+  int64_t* tolocal,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<int8_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_int16(
+  int64_t* tolocal,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<int16_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_int32(
+  int64_t* tolocal,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<int32_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_int64(
+  int64_t* tolocal,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<int64_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_uint8(
+  int64_t* tolocal,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<uint8_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_uint16(
+  int64_t* tolocal,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<uint16_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_uint32(
+  int64_t* tolocal,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<uint32_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_uint64(
+  int64_t* tolocal,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<uint64_t>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_float32(
+  int64_t* tolocal,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<float>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
+ERROR awkward_top_k_float64(
+  int64_t* tolocal,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t outlength,
+  int64_t k,
+  bool largest) {
+  return awkward_top_k<double>(
+    tolocal,
+    fromptr,
+    offsets,
+    outlength,
+    k,
+    largest);
+}
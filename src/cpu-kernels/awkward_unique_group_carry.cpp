@@ -0,0 +1,21 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_unique_group_carry.cpp", line)
+
+#include <vector>
+
+#include "awkward/kernels.h"
+
+ERROR awkward_unique_group_carry(
+  int64_t* tocarry,
+  const int64_t* fromgroups,
+  int64_t length,
+  const int64_t* groupoffsets,
+  int64_t numgroups) {
+  // a counting sort: the positions of the items of each group, in order
+  std::vector<int64_t> cursor(groupoffsets, groupoffsets + numgroups);
+  for (int64_t j = 0;  j < length;  j++) {
+    tocarry[cursor[fromgroups[j]]++] = j;
+  }
+  return success();
+}
@@ -0,0 +1,300 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_unique_hash.cpp", line)
+
+#include <cmath>
+#include <cstring>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+// Values are compared by their bits, except that all NaNs are equal and
+// -0.0 equals 0.0.
+template <typename T>
+uint64_t awkward_unique_hash_key(T x) {
+  return (uint64_t)x;
+}
+template <>
+uint64_t awkward_unique_hash_key<float>(float x) {
+  if (std::isnan(x)) {
+    return 0x7fc00000;
+  }
+  x = (x == 0.0f ? 0.0f : x);
+  uint32_t bits;
+  std::memcpy(&bits, &x, sizeof(float));
+  return bits;
+}
+template <>
+uint64_t awkward_unique_hash_key<double>(double x) {
+  if (std::isnan(x)) {
+    return 0x7ff8000000000000;
+  }
+  x = (x == 0.0 ? 0.0 : x);
+  uint64_t bits;
+  std::memcpy(&bits, &x, sizeof(double));
+  return bits;
+}
+
+uint64_t awkward_unique_hash_mix(uint64_t h) {
+  h ^= h >> 33;
+  h *= 0xff51afd7ed558ccdULL;
+  h ^= h >> 33;
+  return h;
+}
+
+template <typename T>
+ERROR awkward_unique_hash(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const T* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  // an open-addressing hash table of indexes into keys, doubled whenever it
+  // becomes half full; only the used slots are reset between sublists
+  std::vector<int64_t> table(8, -1);
+  std::vector<int64_t> slots;
+  std::vector<uint64_t> keys;
+  int64_t k = 0;
+  tooffsets[0] = 0;
+  for (int64_t i = 0;  i < outlength;  i++) {
+    for (int64_t u = 0;  u < (int64_t)slots.size();  u++) {
+      table[slots[u]] = -1;
+    }
+    slots.clear();
+    keys.clear();
+    int64_t mask = (int64_t)table.size() - 1;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      uint64_t key = awkward_unique_hash_key<T>(fromptr[j]);
+      int64_t slot = (int64_t)(awkward_unique_hash_mix(key) & (uint64_t)mask);
+      while (table[slot] != -1  &&  keys[table[slot]] != key) {
+        slot = (slot + 1) & mask;
+      }
+      if (table[slot] == -1) {
+        table[slot] = (int64_t)keys.size();
+        slots.push_back(slot);
+        keys.push_back(key);
+        tofirst[k + table[slot]] = j;
+        tocounts[k + table[slot]] = 0;
+        if (2 * (int64_t)keys.size() > mask) {
+          table.assign(2 * table.size(), -1);
+          mask = (int64_t)table.size() - 1;
+          for (int64_t u = 0;  u < (int64_t)keys.size();  u++) {
+            int64_t s = (int64_t)(awkward_unique_hash_mix(keys[u]) & (uint64_t)mask);
+            while (table[s] != -1) {
+              s = (s + 1) & mask;
+            }
+            table[s] = u;
+            slots[u] = s;
+          }
+          slot = -1;
+        }
+      }
+      int64_t u = (slot == -1 ? (int64_t)keys.size() - 1 : table[slot]);
+      toinverse[j] = u;
+      tocounts[k + u]++;
+    }
+    k += (int64_t)keys.size();
+    tooffsets[i + 1] = k;
+  }
+  return success();
+}
+
+ERROR awkward_unique_hash_bool(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const bool* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<bool>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_int8(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const int8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<int8_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_int16(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const int16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<int16_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_int32(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const int32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<int32_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_int64(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const int64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<int64_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_uint8(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const uint8_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<uint8_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_uint16(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const uint16_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<uint16_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_uint32(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const uint32_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<uint32_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_uint64(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const uint64_t* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<uint64_t>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_float32(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const float* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<float>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
+
+ERROR awkward_unique_hash_float64(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const double* fromptr,
+  const int64_t* offsets,
+  int64_t outlength) {
+  return awkward_unique_hash<double>(
+    tofirst,
+    tocounts,
+    toinverse,
+    tooffsets,
+    fromptr,
+    offsets,
+    outlength);
+}
@@ -0,0 +1,86 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS_C("src/cpu-kernels/awkward_unique_hash_strings.cpp", line)
+
+#include <cstring>
+#include <vector>
+
+#include "awkward/kernels.h"
+
+ERROR awkward_unique_hash_strings(
+  int64_t* tofirst,
+  int64_t* tocounts,
+  int64_t* toinverse,
+  int64_t* tooffsets,
+  const uint8_t* fromptr,
+  const int64_t* starts,
+  const int64_t* stops,
+  const int64_t* offsets,
+  int64_t outlength) {
+  // like awkward_unique_hash, but each item is the string of bytes from
+  // starts[j] to stops[j], hashed with 64-bit FNV-1a and compared with memcmp
+  std::vector<int64_t> table(8, -1);
+  std::vector<int64_t> slots;
+  std::vector<uint64_t> hashes;
+  std::vector<int64_t> firsts;
+  int64_t k = 0;
+  tooffsets[0] = 0;
+  for (int64_t i = 0;  i < outlength;  i++) {
+    for (int64_t u = 0;  u < (int64_t)slots.size();  u++) {
+      table[slots[u]] = -1;
+    }
+    slots.clear();
+    hashes.clear();
+    firsts.clear();
+    int64_t mask = (int64_t)table.size() - 1;
+    for (int64_t j = offsets[i];  j < offsets[i + 1];  j++) {
+      int64_t size = stops[j] - starts[j];
+      uint64_t h = 0xcbf29ce484222325ULL;
+      for (int64_t b = starts[j];  b < stops[j];  b++) {
+        h ^= fromptr[b];
+        h *= 0x100000001b3ULL;
+      }
+      h ^= h >> 33;
+      h *= 0xff51afd7ed558ccdULL;
+      h ^= h >> 33;
+      int64_t slot = (int64_t)(h & (uint64_t)mask);
+      while (table[slot] != -1) {
+        int64_t other = firsts[table[slot]];
+        if (hashes[table[slot]] == h  &&
+            stops[other] - starts[other] == size  &&
+            (size == 0  ||
+             std::memcmp(&fromptr[starts[other]], &fromptr[starts[j]], size) == 0)) {
+          break;
+        }
+        slot = (slot + 1) & mask;
+      }
+      if (table[slot] == -1) {
+        table[slot] = (int64_t)hashes.size();
+        slots.push_back(slot);
+        hashes.push_back(h);
+        firsts.push_back(j);
+        tofirst[k + table[slot]] = j;
+        tocounts[k + table[slot]] = 0;
+        if (2 * (int64_t)hashes.size() > mask) {
+          table.assign(2 * table.size(), -1);
+          mask = (int64_t)table.size() - 1;
+          for (int64_t u = 0;  u < (int64_t)hashes.size();  u++) {
+            int64_t s = (int64_t)(hashes[u] & (uint64_t)mask);
+            while (table[s] != -1) {
+              s = (s + 1) & mask;
+            }
+            table[s] = u;
+            slots[u] = s;
+          }
+          slot = -1;
+        }
+      }
+      int64_t u = (slot == -1 ? (int64_t)hashes.size() - 1 : table[slot]);
+      toinverse[j] = u;
+      tocounts[k + u]++;
+    }
+    k += (int64_t)hashes.size();
+    tooffsets[i + 1] = k;
+  }
+  return success();
+}
@@ -30,6 +30,11 @@ namespace awkward {
   void
   ArrayBuilder::clear() {
     if (builder_) {
+      if (builder_.get()->active()) {
+        throw std::invalid_argument(
+          std::string("cannot clear an ArrayBuilder while a list, tuple, or "
+                      "record is open") + FILENAME(__LINE__));
+      }
       builder_.get()->clear();
     }
   }
@@ -54,6 +59,16 @@ namespace awkward {
     maybeupdate(builder_.get()->real(x));
   }
 
+  void
+  ArrayBuilder::integers(const int64_t* x, int64_t length) {
+    maybeupdate(builder_.get()->integers(x, length));
+  }
+
+  void
+  ArrayBuilder::reals(const double* x, int64_t length) {
+    maybeupdate(builder_.get()->reals(x, length));
+  }
+
   void
   ArrayBuilder::complex(std::complex<double> x) {
     maybeupdate(builder_.get()->complex(x));
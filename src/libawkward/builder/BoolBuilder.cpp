@@ -32,9 +32,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-data",
-                          buffer_.ptr().get(),
-                          (int64_t)(buffer_.length() * sizeof(bool)));
+    buffer_.concatenate(
+      reinterpret_cast<uint8_t*>(
+        container.empty_buffer(form_key.str() + "-data",
+                               (int64_t)(buffer_.length() * sizeof(bool)))));
 
     return "{\"class\": \"NumpyArray\", \"primitive\": \"bool\", \"form_key\": \""
            + form_key.str() + "\"}";
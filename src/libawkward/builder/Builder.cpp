@@ -4,4 +4,30 @@
 
 namespace awkward {
   Builder::~Builder() = default;
+
+  const BuilderPtr
+  Builder::integers(const int64_t* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      BuilderPtr out = integer(x[i]);
+      if (out  &&  out.get() != this) {
+        // this node has been replaced, so the new one takes the rest
+        BuilderPtr rest = out.get()->integers(x + i + 1, length - i - 1);
+        return rest ? rest : out;
+      }
+    }
+    return nullptr;
+  }
+
+  const BuilderPtr
+  Builder::reals(const double* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      BuilderPtr out = real(x[i]);
+      if (out  &&  out.get() != this) {
+        // this node has been replaced, so the new one takes the rest
+        BuilderPtr rest = out.get()->reals(x + i + 1, length - i - 1);
+        return rest ? rest : out;
+      }
+    }
+    return nullptr;
+  }
 }
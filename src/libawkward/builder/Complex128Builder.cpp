@@ -20,13 +20,7 @@ namespace awkward {
   Complex128Builder::fromint64(const ArrayBuilderOptions& options,
                                GrowableBuffer<int64_t> old) {
     GrowableBuffer<std::complex<double>> buffer =
-      GrowableBuffer<std::complex<double>>::empty(options, old.reserved());
-    int64_t* oldraw = old.ptr().get();
-    std::complex<double>* newraw = buffer.ptr().get();
-    for (size_t i = 0;  i < 2*old.length();  i++) {
-      newraw[i] = {static_cast<double>(oldraw[i]), 0};
-    }
-    buffer.set_length(old.length());
+      old.copy_as<std::complex<double>>();
     old.clear();
     return std::make_shared<Complex128Builder>(options, std::move(buffer));
   }
@@ -35,13 +29,7 @@ namespace awkward {
   Complex128Builder::fromfloat64(const ArrayBuilderOptions& options,
                                  GrowableBuffer<double> old) {
     GrowableBuffer<std::complex<double>> buffer =
-      GrowableBuffer<std::complex<double>>::empty(options, old.reserved());
-    double* oldraw = old.ptr().get();
-    std::complex<double>* newraw = buffer.ptr().get();
-    for (size_t i = 0;  i < old.length();  i++) {
-      newraw[i] = std::complex<double>(oldraw[i], 0);
-    }
-    buffer.set_length(old.length());
+      old.copy_as<std::complex<double>>();
     old.clear();
     return std::make_shared<Complex128Builder>(options, std::move(buffer));
   }
@@ -61,9 +49,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-data",
-                          buffer_.ptr().get(),
-                          (int64_t)(buffer_.length() * sizeof(double)) * 2);
+    buffer_.concatenate(
+      reinterpret_cast<std::complex<double>*>(
+        container.empty_buffer(form_key.str() + "-data",
+                               (int64_t)(buffer_.length() * sizeof(double)) * 2)));
 
     return "{\"class\": \"NumpyArray\", \"primitive\": \"complex128\", \"form_key\": \""
            + form_key.str() + "\"}";
@@ -40,9 +40,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-data",
-                          content_.ptr().get(),
-                          (int64_t)(content_.length() * sizeof(int64_t)));
+    content_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(form_key.str() + "-data",
+                               (int64_t)(content_.length() * sizeof(int64_t)))));
 
     std::string primitive(units_);
 
@@ -21,14 +21,7 @@ namespace awkward {
   const BuilderPtr
   Float64Builder::fromint64(const ArrayBuilderOptions& options,
                             GrowableBuffer<int64_t> old) {
-    GrowableBuffer<double> buffer =
-      GrowableBuffer<double>::empty(options, old.reserved());
-    int64_t* oldraw = old.ptr().get();
-    double* newraw = buffer.ptr().get();
-    for (size_t i = 0;  i < old.length();  i++) {
-      newraw[i] = (double)oldraw[i];
-    }
-    buffer.set_length(old.length());
+    GrowableBuffer<double> buffer = old.copy_as<double>();
     old.clear();
     return std::make_shared<Float64Builder>(options, std::move(buffer));
   }
@@ -54,9 +47,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-data",
-                          buffer_.ptr().get(),
-                          (int64_t)(buffer_.length() * sizeof(double)));
+    buffer_.concatenate(
+      reinterpret_cast<double*>(
+        container.empty_buffer(form_key.str() + "-data",
+                               (int64_t)(buffer_.length() * sizeof(double)))));
 
     return "{\"class\": \"NumpyArray\", \"primitive\": \"float64\", \"form_key\": \""
            + form_key.str() + "\"}";
@@ -103,6 +97,12 @@ namespace awkward {
     return nullptr;
   }
 
+  const BuilderPtr
+  Float64Builder::reals(const double* x, int64_t length) {
+    buffer_.extend(x, (size_t)length);
+    return nullptr;
+  }
+
   const BuilderPtr
   Float64Builder::complex(std::complex<double> x) {
     BuilderPtr out = Complex128Builder::fromfloat64(options_, std::move(buffer_));
@@ -68,9 +68,13 @@ namespace awkward {
                                     size_t length,
                                     size_t reserved)
       : options_(options)
-      , ptr_(std::move(ptr))
+      , ptr_(ptr.get())
+      , panel_length_(length)
+      , panel_reserved_(reserved)
       , length_(length)
-      , reserved_(reserved) { }
+      , reserved_(reserved) {
+    panels_.push_back(std::move(ptr));
+  }
 
   template <typename T>
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options)
@@ -79,16 +83,15 @@ namespace awkward {
                        0,
                        (size_t) options.initial()) { }
 
-  template <typename T>
-  const typename GrowableBuffer<T>::UniquePtr&
-  GrowableBuffer<T>::ptr() const {
-    return ptr_;
-  }
-
   template <typename T>
   typename GrowableBuffer<T>::UniquePtr
   GrowableBuffer<T>::get_ptr() {
-    return std::move(ptr_);
+    if (panels_.size() == 1) {
+      return std::move(panels_[0]);
+    }
+    UniquePtr ptr(reinterpret_cast<T*>(awkward_malloc((int64_t)(length_*sizeof(T)))));
+    concatenate(ptr.get());
+    return ptr;
   }
 
   template <typename T>
@@ -97,15 +100,6 @@ namespace awkward {
     return length_;
   }
 
-  template <typename T>
-  void
-  GrowableBuffer<T>::set_length(size_t newlength) {
-    if (newlength > reserved_) {
-      set_reserved(newlength);
-    }
-    length_ = newlength;
-  }
-
   template <typename T>
   size_t
   GrowableBuffer<T>::reserved() const {
@@ -113,38 +107,106 @@ namespace awkward {
   }
 
   template <typename T>
-  void
-  GrowableBuffer<T>::set_reserved(size_t minreserved) {
-    if (minreserved > reserved_) {
-      UniquePtr ptr(reinterpret_cast<T*>(awkward_malloc((int64_t)(minreserved*sizeof(T)))));
-      memcpy(ptr.get(), ptr_.get(), length_ * sizeof(T));
-      ptr_ = std::move(ptr);
-      reserved_ = minreserved;
-    }
+  size_t
+  GrowableBuffer<T>::num_panels() const {
+    return panels_.size();
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::clear() {
+    panels_.clear();
+    panel_lengths_.clear();
+    panels_.push_back(UniquePtr(reinterpret_cast<T*>(awkward_malloc(options_.initial()*(int64_t)sizeof(T)))));
+    ptr_ = panels_.back().get();
+    panel_length_ = 0;
+    panel_reserved_ = (size_t) options_.initial();
     length_ = 0;
     reserved_ = (size_t) options_.initial();
-    ptr_ = UniquePtr(reinterpret_cast<T*>(awkward_malloc(options_.initial()*(int64_t)sizeof(T))));
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::add_panel(size_t reserved) {
+    panels_.push_back(UniquePtr(reinterpret_cast<T*>(awkward_malloc((int64_t)(reserved*sizeof(T))))));
+    panel_lengths_.push_back(panel_length_);
+    ptr_ = panels_.back().get();
+    panel_length_ = 0;
+    panel_reserved_ = reserved;
+    reserved_ += reserved;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::append(T datum) {
-    if (length_ == reserved_) {
-      set_reserved((size_t)ceil(reserved_ * options_.resize()));
+    if (panel_length_ == panel_reserved_) {
+      size_t total = (size_t)ceil(reserved_ * options_.resize());
+      add_panel(total > reserved_ ? total - reserved_ : 1);
     }
-    ptr_.get()[length_] = datum;
+    ptr_[panel_length_] = datum;
+    panel_length_++;
     length_++;
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::extend(const T* ptr, size_t length) {
+    size_t fits = panel_reserved_ - panel_length_;
+    if (length <= fits) {
+      memcpy(ptr_ + panel_length_, ptr, length * sizeof(T));
+      panel_length_ += length;
+    }
+    else {
+      memcpy(ptr_ + panel_length_, ptr, fits * sizeof(T));
+      panel_length_ += fits;
+      size_t total = (size_t)ceil(reserved_ * options_.resize());
+      size_t rest = length - fits;
+      add_panel(total > reserved_ + rest ? total - reserved_ : rest);
+      memcpy(ptr_, ptr + fits, rest * sizeof(T));
+      panel_length_ = rest;
+    }
+    length_ += length;
+  }
+
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
-    return ptr_.get()[at];
+    size_t i = 0;
+    for (;  i < panel_lengths_.size();  i++) {
+      if ((size_t)at < panel_lengths_[i]) {
+        return panels_[i].get()[at];
+      }
+      at -= (int64_t)panel_lengths_[i];
+    }
+    return ptr_[at];
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate(T* external_pointer) const {
+    if (external_pointer == nullptr) {
+      return;
+    }
+    for (size_t i = 0;  i < panel_lengths_.size();  i++) {
+      memcpy(external_pointer, panels_[i].get(), panel_lengths_[i] * sizeof(T));
+      external_pointer += panel_lengths_[i];
+    }
+    memcpy(external_pointer, ptr_, panel_length_ * sizeof(T));
+  }
+
+  template <typename T>
+  template <typename TO>
+  GrowableBuffer<TO>
+  GrowableBuffer<T>::copy_as() const {
+    GrowableBuffer<TO> out = GrowableBuffer<TO>::empty(options_, reserved_);
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      const T* panel = panels_[i].get();
+      size_t length = (i < panel_lengths_.size() ? panel_lengths_[i] : panel_length_);
+      for (size_t j = 0;  j < length;  j++) {
+        out.append((TO)panel[j]);
+      }
+    }
+    return out;
   }
 
   template class EXPORT_TEMPLATE_INST GrowableBuffer<bool>;
@@ -161,4 +223,8 @@ namespace awkward {
   template class EXPORT_TEMPLATE_INST GrowableBuffer<std::complex<float>>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<std::complex<double>>;
 
+  template GrowableBuffer<double> GrowableBuffer<int64_t>::copy_as<double>() const;
+  template GrowableBuffer<std::complex<double>> GrowableBuffer<int64_t>::copy_as<std::complex<double>>() const;
+  template GrowableBuffer<std::complex<double>> GrowableBuffer<double>::copy_as<std::complex<double>>() const;
+
 }
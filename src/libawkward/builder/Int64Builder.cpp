@@ -40,9 +40,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-data",
-                          buffer_.ptr().get(),
-                          (int64_t)(buffer_.length() * sizeof(int64_t)));
+    buffer_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(form_key.str() + "-data",
+                               (int64_t)(buffer_.length() * sizeof(int64_t)))));
 
     return "{\"class\": \"NumpyArray\", \"primitive\": \"int64\", \"form_key\": \""
            + form_key.str() + "\"}";
@@ -83,6 +84,12 @@ namespace awkward {
     return nullptr;
   }
 
+  const BuilderPtr
+  Int64Builder::integers(const int64_t* x, int64_t length) {
+    buffer_.extend(x, (size_t)length);
+    return nullptr;
+  }
+
   const BuilderPtr
   Int64Builder::real(double x) {
     BuilderPtr out = Float64Builder::fromint64(options_, std::move(buffer_));
@@ -41,9 +41,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-offsets",
-                          offsets_.ptr().get(),
-                          (int64_t)(offsets_.length() * sizeof(int64_t)));
+    offsets_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(form_key.str() + "-offsets",
+                               (int64_t)(offsets_.length() * sizeof(int64_t)))));
 
     return "{\"class\": \"ListOffsetArray\", \"offsets\": \"i64\", \"content\": "
            + content_.get()->to_buffers(container, form_key_id) + ", \"form_key\": \""
@@ -119,6 +120,28 @@ namespace awkward {
     }
   }
 
+  const BuilderPtr
+  ListBuilder::integers(const int64_t* x, int64_t length) {
+    if (!begun_) {
+      return Builder::integers(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->integers(x, length));
+      return nullptr;
+    }
+  }
+
+  const BuilderPtr
+  ListBuilder::reals(const double* x, int64_t length) {
+    if (!begun_) {
+      return Builder::reals(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->reals(x, length));
+      return nullptr;
+    }
+  }
+
   const BuilderPtr
   ListBuilder::complex(std::complex<double> x) {
     if (!begun_) {
@@ -46,9 +46,10 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-index",
-                          index_.ptr().get(),
-                          (int64_t)(index_.length() * sizeof(int64_t)));
+    index_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(form_key.str() + "-index",
+                               (int64_t)(index_.length() * sizeof(int64_t)))));
 
     return "{\"class\": \"IndexedOptionArray\", \"index\": \"i64\", \"content\": "
            + content_.get()->to_buffers(container, form_key_id) + ", \"form_key\": \""
@@ -121,6 +122,28 @@ namespace awkward {
     return shared_from_this();
   }
 
+  const BuilderPtr
+  OptionBuilder::integers(const int64_t* x, int64_t length) {
+    if (!content_.get()->active()) {
+      return Builder::integers(x, length);
+    }
+    else {
+      content_.get()->integers(x, length);
+      return shared_from_this();
+    }
+  }
+
+  const BuilderPtr
+  OptionBuilder::reals(const double* x, int64_t length) {
+    if (!content_.get()->active()) {
+      return Builder::reals(x, length);
+    }
+    else {
+      content_.get()->reals(x, length);
+      return shared_from_this();
+    }
+  }
+
   const BuilderPtr
   OptionBuilder::complex(std::complex<double> x) {
     if (!content_.get()->active()) {
@@ -2,6 +2,7 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/builder/StringBuilder.cpp", line)
 
+#include <cstring>
 #include <stdexcept>
 
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -50,13 +51,15 @@ namespace awkward {
     outer_form_key << "node" << (form_key_id++);
     inner_form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(outer_form_key.str() + "-offsets",
-                          offsets_.ptr().get(),
-                          (int64_t)(offsets_.length() * sizeof(int64_t)));
+    offsets_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(outer_form_key.str() + "-offsets",
+                               (int64_t)(offsets_.length() * sizeof(int64_t)))));
 
-    container.copy_buffer(inner_form_key.str() + "-data",
-                          content_.ptr().get(),
-                          (int64_t)(content_.length() * sizeof(uint8_t)));
+    content_.concatenate(
+      reinterpret_cast<uint8_t*>(
+        container.empty_buffer(inner_form_key.str() + "-data",
+                               (int64_t)(content_.length() * sizeof(uint8_t)))));
 
     std::string char_parameter;
     std::string string_parameter;
@@ -149,15 +152,9 @@ namespace awkward {
   const BuilderPtr
   StringBuilder::string(const char* x, int64_t length, const char* encoding) {
     if (length < 0) {
-      for (int64_t i = 0;  x[i] != 0;  i++) {
-        content_.append((uint8_t)x[i]);
-      }
-    }
-    else {
-      for (int64_t i = 0;  i < length;  i++) {
-        content_.append((uint8_t)x[i]);
-      }
+      length = (int64_t)strlen(x);
     }
+    content_.extend(reinterpret_cast<const uint8_t*>(x), (size_t)length);
     offsets_.append((int64_t)content_.length());
     return shared_from_this();
   }
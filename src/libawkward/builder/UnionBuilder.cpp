@@ -49,13 +49,15 @@ namespace awkward {
     std::stringstream form_key;
     form_key << "node" << (form_key_id++);
 
-    container.copy_buffer(form_key.str() + "-tags",
-                          tags_.ptr().get(),
-                          (int64_t)(tags_.length() * sizeof(int8_t)));
+    tags_.concatenate(
+      reinterpret_cast<int8_t*>(
+        container.empty_buffer(form_key.str() + "-tags",
+                               (int64_t)(tags_.length() * sizeof(int8_t)))));
 
-    container.copy_buffer(form_key.str() + "-index",
-                          index_.ptr().get(),
-                          (int64_t)(index_.length() * sizeof(int64_t)));
+    index_.concatenate(
+      reinterpret_cast<int64_t*>(
+        container.empty_buffer(form_key.str() + "-index",
+                               (int64_t)(index_.length() * sizeof(int64_t)))));
 
     std::stringstream out;
     out << "{\"class\": \"UnionArray\", \"tags\": \"i8\", \"index\": \"i64\", \"contents\": [";
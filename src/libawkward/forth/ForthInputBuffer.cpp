@@ -2,6 +2,18 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/forth/ForthInputBuffer.cpp", line)
 
+#include <stdexcept>
+
+#ifdef _MSC_VER
+  #define NOMINMAX
+  #include <windows.h>
+#else
+  #include <fcntl.h>
+  #include <sys/mman.h>
+  #include <sys/stat.h>
+  #include <unistd.h>
+#endif
+
 #include "awkward/forth/ForthInputBuffer.h"
 
 namespace awkward {
@@ -13,6 +25,98 @@ namespace awkward {
     , length_(length)
     , pos_(0) { }
 
+  ForthInputBuffer::ForthInputBuffer(const std::string& path,
+                                     bool writable)
+    : ptr_(nullptr)
+    , offset_(0)
+    , length_(0)
+    , pos_(0) {
+#ifdef _MSC_VER
+    HANDLE file = CreateFileA(path.c_str(),
+                              GENERIC_READ,
+                              FILE_SHARE_READ,
+                              NULL,
+                              OPEN_EXISTING,
+                              FILE_ATTRIBUTE_NORMAL,
+                              NULL);
+    if (file == INVALID_HANDLE_VALUE) {
+      throw std::invalid_argument(
+        std::string("cannot open file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    LARGE_INTEGER size;
+    if (!GetFileSizeEx(file, &size)) {
+      CloseHandle(file);
+      throw std::invalid_argument(
+        std::string("cannot determine size of file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    length_ = (int64_t)size.QuadPart;
+    if (length_ == 0) {
+      // zero-length files can't be mapped, but there's nothing to read anyway
+      CloseHandle(file);
+      ptr_ = std::shared_ptr<uint8_t>(new uint8_t[1], std::default_delete<uint8_t[]>());
+      return;
+    }
+    HANDLE mapping = CreateFileMappingA(file,
+                                        NULL,
+                                        writable ? PAGE_WRITECOPY : PAGE_READONLY,
+                                        0,
+                                        0,
+                                        NULL);
+    CloseHandle(file);
+    if (mapping == NULL) {
+      throw std::invalid_argument(
+        std::string("cannot memory-map file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    void* data = MapViewOfFile(mapping, writable ? FILE_MAP_COPY : FILE_MAP_READ, 0, 0, 0);
+    CloseHandle(mapping);
+    if (data == NULL) {
+      throw std::invalid_argument(
+        std::string("cannot memory-map file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    ptr_ = std::shared_ptr<void>(data, [](void* p) { UnmapViewOfFile(p); });
+#else
+    int fd = open(path.c_str(), O_RDONLY);
+    if (fd == -1) {
+      throw std::invalid_argument(
+        std::string("cannot open file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    struct stat info;
+    if (fstat(fd, &info) != 0) {
+      close(fd);
+      throw std::invalid_argument(
+        std::string("cannot determine size of file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    length_ = (int64_t)info.st_size;
+    if (length_ == 0) {
+      // zero-length files can't be mapped, but there's nothing to read anyway
+      close(fd);
+      ptr_ = std::shared_ptr<uint8_t>(new uint8_t[1], std::default_delete<uint8_t[]>());
+      return;
+    }
+    void* data = mmap(nullptr,
+                      (size_t)length_,
+                      writable ? (PROT_READ | PROT_WRITE) : PROT_READ,
+                      MAP_PRIVATE,
+                      fd,
+                      0);
+    // the mapping stays valid after the file descriptor is closed
+    close(fd);
+    if (data == MAP_FAILED) {
+      throw std::invalid_argument(
+        std::string("cannot memory-map file for AwkwardForth input: ") + path
+        + FILENAME(__LINE__));
+    }
+    size_t mapped_length = (size_t)length_;
+    ptr_ = std::shared_ptr<void>(data, [mapped_length](void* p) { munmap(p, mapped_length); });
+#endif
+  }
+
   uint8_t
   ForthInputBuffer::peek_byte(int64_t after, util::ForthError& err) noexcept {
     if (pos_ + after + 1 > length_) {
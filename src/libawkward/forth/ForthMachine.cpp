@@ -111,8 +111,15 @@ namespace awkward {
   #define CODE_RSHIFT 68
   #define CODE_FALSE 69
   #define CODE_TRUE 70
+  // superinstructions (only generated by the optimizer)
+  #define CODE_LITERAL_WRITE 71
+  #define CODE_LITERAL_WRITE_ADD 72
+  #define CODE_LITERAL_INC 73
+  #define CODE_GET_WRITE 74
+  #define CODE_DUP_WRITE 75
+  #define CODE_DUP_WRITE_ADD 76
   // beginning of the user-defined dictionary
-  #define BOUND_DICTIONARY 71
+  #define BOUND_DICTIONARY 77
 
   const std::set<std::string> reserved_words_({
     // comments
@@ -227,10 +234,12 @@ namespace awkward {
                                        int64_t recursion_max_depth,
                                        int64_t string_buffer_size,
                                        int64_t output_initial_size,
-                                       double output_resize_factor)
+                                       double output_resize_factor,
+                                       bool optimize)
     : source_(source)
     , output_initial_size_(output_initial_size)
     , output_resize_factor_(output_resize_factor)
+    , optimize_(optimize)
 
     , stack_buffer_(new T[stack_max_depth])
     , stack_depth_(0)
@@ -655,6 +664,35 @@ namespace awkward {
           int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
           return output_names_[(IndexTypeOf<int64_t>)out_num] + " rewind";
         }
+        case CODE_LITERAL_WRITE: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 2];
+          return std::to_string(bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1]) + " "
+                 + output_names_[(IndexTypeOf<int64_t>)out_num] + " <- stack";
+        }
+        case CODE_LITERAL_WRITE_ADD: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 2];
+          return std::to_string(bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1]) + " "
+                 + output_names_[(IndexTypeOf<int64_t>)out_num] + " +<- stack";
+        }
+        case CODE_LITERAL_INC: {
+          int64_t var_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 2];
+          return std::to_string(bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1]) + " "
+                 + variable_names_[(IndexTypeOf<int64_t>)var_num] + " +!";
+        }
+        case CODE_GET_WRITE: {
+          int64_t var_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 2];
+          return variable_names_[(IndexTypeOf<int64_t>)var_num] + " @ "
+                 + output_names_[(IndexTypeOf<int64_t>)out_num] + " <- stack";
+        }
+        case CODE_DUP_WRITE: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
+          return "dup " + output_names_[(IndexTypeOf<int64_t>)out_num] + " <- stack";
+        }
+        case CODE_DUP_WRITE_ADD: {
+          int64_t out_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
+          return "dup " + output_names_[(IndexTypeOf<int64_t>)out_num] + " +<- stack";
+        }
         case CODE_STRING: {
           int64_t string_num = bytecodes_[(IndexTypeOf<int64_t>)bytecode_position + 1];
           return "s\" " + strings_[(IndexTypeOf<int64_t>)string_num] + "\"";
@@ -824,6 +862,12 @@ namespace awkward {
     return output_resize_factor_;
   }
 
+  template <typename T, typename I>
+  bool
+  ForthMachineOf<T, I>::optimize() const noexcept {
+    return optimize_;
+  }
+
   template <typename T, typename I>
   const std::vector<T>
   ForthMachineOf<T, I>::stack() const {
@@ -962,12 +1006,12 @@ namespace awkward {
 
   template <typename T, typename I>
   const ContentPtr
-  ForthMachineOf<T, I>::output_NumpyArray_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_NumpyArray_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toNumpyArray();
+        return output_NumpyArray_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -977,18 +1021,25 @@ namespace awkward {
 
   template <typename T, typename I>
   const ContentPtr
-  ForthMachineOf<T, I>::output_NumpyArray_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toNumpyArray();
+  ForthMachineOf<T, I>::output_NumpyArray_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const ContentPtr out = output->toNumpyArray();
+      output->release();
+      return out;
+    }
+    return output->toNumpyArray();
   }
 
   template <typename T, typename I>
   const Index8
-  ForthMachineOf<T, I>::output_Index8_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_Index8_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toIndex8();
+        return output_Index8_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -998,18 +1049,25 @@ namespace awkward {
 
   template <typename T, typename I>
   const Index8
-  ForthMachineOf<T, I>::output_Index8_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toIndex8();
+  ForthMachineOf<T, I>::output_Index8_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const Index8 out = output->toIndex8();
+      output->release();
+      return out;
+    }
+    return output->toIndex8();
   }
 
   template <typename T, typename I>
   const IndexU8
-  ForthMachineOf<T, I>::output_IndexU8_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_IndexU8_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toIndexU8();
+        return output_IndexU8_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -1019,18 +1077,25 @@ namespace awkward {
 
   template <typename T, typename I>
   const IndexU8
-  ForthMachineOf<T, I>::output_IndexU8_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toIndexU8();
+  ForthMachineOf<T, I>::output_IndexU8_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const IndexU8 out = output->toIndexU8();
+      output->release();
+      return out;
+    }
+    return output->toIndexU8();
   }
 
   template <typename T, typename I>
   const Index32
-  ForthMachineOf<T, I>::output_Index32_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_Index32_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toIndex32();
+        return output_Index32_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -1040,18 +1105,25 @@ namespace awkward {
 
   template <typename T, typename I>
   const Index32
-  ForthMachineOf<T, I>::output_Index32_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toIndex32();
+  ForthMachineOf<T, I>::output_Index32_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const Index32 out = output->toIndex32();
+      output->release();
+      return out;
+    }
+    return output->toIndex32();
   }
 
   template <typename T, typename I>
   const IndexU32
-  ForthMachineOf<T, I>::output_IndexU32_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_IndexU32_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toIndexU32();
+        return output_IndexU32_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -1061,18 +1133,25 @@ namespace awkward {
 
   template <typename T, typename I>
   const IndexU32
-  ForthMachineOf<T, I>::output_IndexU32_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toIndexU32();
+  ForthMachineOf<T, I>::output_IndexU32_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const IndexU32 out = output->toIndexU32();
+      output->release();
+      return out;
+    }
+    return output->toIndexU32();
   }
 
   template <typename T, typename I>
   const Index64
-  ForthMachineOf<T, I>::output_Index64_at(const std::string& name) const {
+  ForthMachineOf<T, I>::output_Index64_at(const std::string& name, bool steal) const {
     for (IndexTypeOf<int64_t> i = 0;
          i < output_names_.size()  &&  i < current_outputs_.size();
          i++) {
       if (output_names_[i] == name) {
-        return current_outputs_[i].get()->toIndex64();
+        return output_Index64_at((int64_t)i, steal);
       }
     }
     throw std::invalid_argument(
@@ -1082,8 +1161,15 @@ namespace awkward {
 
   template <typename T, typename I>
   const Index64
-  ForthMachineOf<T, I>::output_Index64_at(int64_t index) const {
-    return current_outputs_[(IndexTypeOf<int64_t>)index].get()->toIndex64();
+  ForthMachineOf<T, I>::output_Index64_at(int64_t index, bool steal) const {
+    ForthOutputBuffer* output = current_outputs_[(IndexTypeOf<int64_t>)index].get();
+    if (steal) {
+      output->trim();
+      const Index64 out = output->toIndex64();
+      output->release();
+      return out;
+    }
+    return output->toIndex64();
   }
 
   template <typename T, typename I>
@@ -1686,6 +1772,10 @@ namespace awkward {
           return 4;
         case CODE_IF_ELSE:
         case CODE_CASE_REGULAR:
+        case CODE_LITERAL_WRITE:
+        case CODE_LITERAL_WRITE_ADD:
+        case CODE_LITERAL_INC:
+        case CODE_GET_WRITE:
           return 3;
         case CODE_LITERAL:
         case CODE_IF:
@@ -1709,6 +1799,8 @@ namespace awkward {
         case CODE_REWIND:
         case CODE_STRING:
         case CODE_PRINT_STRING:
+        case CODE_DUP_WRITE:
+        case CODE_DUP_WRITE_ADD:
           return 2;
         default:
           return 1;
@@ -1873,6 +1965,123 @@ namespace awkward {
       }
       bytecodes_offsets_.push_back((int64_t)bytecodes_.size());
     }
+
+    if (optimize_) {
+      optimize_bytecodes();
+    }
+  }
+
+  template <typename T, typename I>
+  void
+  ForthMachineOf<T, I>::optimize_bytecodes() {
+    std::vector<I> bytecodes;
+    std::vector<int64_t> bytecodes_offsets;
+    bytecodes_offsets.push_back(0);
+
+    for (IndexTypeOf<int64_t> segment = 0;  segment + 1 < bytecodes_offsets_.size();  segment++) {
+      int64_t position = bytecodes_offsets_[segment];
+      int64_t stop = bytecodes_offsets_[segment + 1];
+
+      while (position < stop) {
+        int64_t length = bytecodes_per_instruction(position);
+        if (position + length > stop) {
+          length = stop - position;
+        }
+        int64_t next_position = position + length;
+
+        I bytecode = bytecodes_[(IndexTypeOf<int64_t>)position];
+        I next_bytecode = -1;
+        if (next_position < stop) {
+          next_bytecode = bytecodes_[(IndexTypeOf<int64_t>)next_position];
+        }
+
+        // '<literal> <output> <- stack' and '<literal> <output> +<- stack'
+        if (bytecode == CODE_LITERAL  &&
+            (next_bytecode == CODE_WRITE  ||  next_bytecode == CODE_WRITE_ADD)) {
+          bytecodes.push_back(next_bytecode == CODE_WRITE ? CODE_LITERAL_WRITE
+                                                          : CODE_LITERAL_WRITE_ADD);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position + 1]);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)next_position + 1]);
+          position = next_position + 2;
+        }
+
+        // '<literal> <variable> +!'
+        else if (bytecode == CODE_LITERAL  &&  next_bytecode == CODE_INC) {
+          bytecodes.push_back(CODE_LITERAL_INC);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position + 1]);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)next_position + 1]);
+          position = next_position + 2;
+        }
+
+        // '<variable> @ <output> <- stack'
+        else if (bytecode == CODE_GET  &&  next_bytecode == CODE_WRITE) {
+          bytecodes.push_back(CODE_GET_WRITE);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position + 1]);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)next_position + 1]);
+          position = next_position + 2;
+        }
+
+        // 'dup <output> <- stack' and 'dup <output> +<- stack'
+        else if (bytecode == CODE_DUP  &&
+                 (next_bytecode == CODE_WRITE  ||  next_bytecode == CODE_WRITE_ADD)) {
+          bytecodes.push_back(next_bytecode == CODE_WRITE ? CODE_DUP_WRITE
+                                                          : CODE_DUP_WRITE_ADD);
+          bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)next_position + 1]);
+          position = next_position + 2;
+        }
+
+        // '<input> *-> stack <output> <- stack' becomes '<input> *-> <output>',
+        // but only if the value passes through the stack without being truncated
+        else if (bytecode < 0  &&
+                 (~bytecode & READ_DIRECT) == 0  &&
+                 (~bytecode & READ_REPEATED) == 0  &&
+                 next_bytecode == CODE_WRITE) {
+          bool exact;
+          switch (~bytecode & READ_MASK) {
+            case READ_BOOL:
+            case READ_INT8:
+            case READ_INT16:
+            case READ_INT32:
+            case READ_UINT8:
+            case READ_UINT16:
+              exact = true;
+              break;
+            case READ_INT64:
+            case READ_UINT32:
+            case READ_ZIGZAG:
+              exact = (sizeof(T) == 8);
+              break;
+            case READ_INTP:
+              exact = (sizeof(ssize_t) <= sizeof(T));
+              break;
+            default:
+              exact = false;
+          }
+          if (exact) {
+            bytecodes.push_back(~(~bytecode | READ_DIRECT));
+            bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position + 1]);
+            bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)next_position + 1]);
+            position = next_position + 2;
+          }
+          else {
+            for (;  position < next_position;  position++) {
+              bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position]);
+            }
+          }
+        }
+
+        else {
+          for (;  position < next_position;  position++) {
+            bytecodes.push_back(bytecodes_[(IndexTypeOf<int64_t>)position]);
+          }
+        }
+      }
+
+      bytecodes_offsets.push_back((int64_t)bytecodes.size());
+    }
+
+    bytecodes_ = bytecodes;
+    bytecodes_offsets_ = bytecodes_offsets;
   }
 
   template <typename T, typename I>
@@ -3690,6 +3899,76 @@ namespace awkward {
               goto after_end_of_segment;
             }
 
+            case CODE_LITERAL_WRITE: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              T value = (T)num;
+              write_from_stack(out_num, &value);
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_LITERAL_WRITE_ADD: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              T value = (T)num;
+              write_add_from_stack(out_num, &value);
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_LITERAL_INC: {
+              I num = bytecode_get();
+              bytecodes_pointer_where()++;
+              I var_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              variables_[(IndexTypeOf<T>)var_num] += (T)num;
+              break;
+            }
+
+            case CODE_GET_WRITE: {
+              I var_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              write_from_stack(out_num, &variables_[(IndexTypeOf<T>)var_num]);
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_DUP_WRITE: {
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              write_from_stack(out_num, stack_peek());
+
+              count_writes_++;
+              break;
+            }
+
+            case CODE_DUP_WRITE_ADD: {
+              I out_num = bytecode_get();
+              bytecodes_pointer_where()++;
+              if (stack_cannot_pop()) {
+                current_error_ = util::ForthError::stack_underflow;
+                return;
+              }
+              write_add_from_stack(out_num, stack_peek());
+
+              count_writes_++;
+              break;
+            }
+
             case CODE_PUT: {
               I num = bytecode_get();
               bytecodes_pointer_where()++;
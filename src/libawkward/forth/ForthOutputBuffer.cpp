@@ -3,6 +3,9 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/forth/ForthOutputBuffer.cpp", line)
 
 #include <cmath>
+#include <cstdlib>
+#include <cstring>
+#include <new>
 
 #include "awkward/kernel-dispatch.h"
 
@@ -55,6 +58,7 @@ namespace awkward {
   ForthOutputBuffer::ForthOutputBuffer(int64_t initial, double resize)
     : length_(0)
     , reserved_(initial)
+    , initial_(initial)
     , resize_(resize) { }
 
   ForthOutputBuffer::~ForthOutputBuffer() = default;
@@ -82,10 +86,22 @@ namespace awkward {
 
   ////////// specialized
 
+  template <typename OUT>
+  std::shared_ptr<OUT>
+  malloc_buffer(int64_t num_items) {
+    // malloc(0) may return nullptr, which must not be mistaken for an error
+    OUT* ptr = reinterpret_cast<OUT*>(
+      malloc(sizeof(OUT) * (size_t)(num_items > 0 ? num_items : 1)));
+    if (ptr == nullptr) {
+      throw std::bad_alloc();
+    }
+    return std::shared_ptr<OUT>(ptr, realloc_deleter<OUT>());
+  }
+
   template <typename OUT>
   ForthOutputBufferOf<OUT>::ForthOutputBufferOf(int64_t initial, double resize)
     : ForthOutputBuffer(initial, resize)
-    , ptr_(new OUT[initial], kernel::array_deleter<OUT>()) { }
+    , ptr_(malloc_buffer<OUT>(initial)) { }
 
   template <typename OUT>
   const std::shared_ptr<void>
@@ -93,6 +109,22 @@ namespace awkward {
     return ptr_;
   }
 
+  template <typename OUT>
+  void
+  ForthOutputBufferOf<OUT>::trim() {
+    if (ptr_.use_count() == 1  &&  length_ < reserved_) {
+      reallocate(length_);
+    }
+  }
+
+  template <typename OUT>
+  void
+  ForthOutputBufferOf<OUT>::release() {
+    ptr_ = malloc_buffer<OUT>(initial_);
+    length_ = 0;
+    reserved_ = initial_;
+  }
+
   template <typename OUT>
   void
   ForthOutputBufferOf<OUT>::dup(int64_t num_times, util::ForthError& err) noexcept {
@@ -742,15 +774,39 @@ namespace awkward {
   ForthOutputBufferOf<OUT>::maybe_resize(int64_t next) {
     if (next > reserved_) {
       int64_t reservation = reserved_;
+      if (reservation < 1) {
+        reservation = 1;
+      }
       while (next > reservation) {
         reservation = (int64_t)std::ceil(reservation * resize_);
       }
-      std::shared_ptr<OUT> new_buffer = std::shared_ptr<OUT>(new OUT[reservation],
-                                                             kernel::array_deleter<OUT>());
-      std::memcpy(new_buffer.get(), ptr_.get(), sizeof(OUT) * (size_t)reserved_);
-      ptr_ = new_buffer;
-      reserved_ = reservation;
+      reallocate(reservation);
+    }
+  }
+
+  template <typename OUT>
+  void
+  ForthOutputBufferOf<OUT>::reallocate(int64_t reservation) {
+    size_t num_bytes = sizeof(OUT) * (size_t)(reservation > 0 ? reservation : 1);
+    realloc_deleter<OUT>* deleter = std::get_deleter<realloc_deleter<OUT>>(ptr_);
+    if (ptr_.use_count() == 1  &&  deleter != nullptr) {
+      // Nothing else can see this buffer, so let realloc extend or shrink it
+      // in place (which, for large buffers, avoids a copy and a transient
+      // peak of old + new memory).
+      OUT* resized = reinterpret_cast<OUT*>(realloc(ptr_.get(), num_bytes));
+      if (resized != nullptr) {
+        deleter->armed = false;
+        ptr_ = std::shared_ptr<OUT>(resized, realloc_deleter<OUT>());
+        reserved_ = reservation;
+        return;
+      }
     }
+    // Arrays share the old buffer (or realloc failed): leave it to them.
+    std::shared_ptr<OUT> new_buffer = malloc_buffer<OUT>(reservation);
+    int64_t keep = (reserved_ < reservation ? reserved_ : reservation);
+    std::memcpy(new_buffer.get(), ptr_.get(), sizeof(OUT) * (size_t)keep);
+    ptr_ = new_buffer;
+    reserved_ = reservation;
   }
 
   template class EXPORT_TEMPLATE_INST ForthOutputBufferOf<bool>;
@@ -2,6 +2,11 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/python/content.cpp", line)
 
+#include <cstring>
+#include <limits>
+#include <type_traits>
+#include <vector>
+
 #include <pybind11/numpy.h>
 #include <pybind11/complex.h>
 #include <pybind11/chrono.h>
@@ -835,13 +840,212 @@ getitem(const T& self, const py::object& obj) {
 
 ////////// ArrayBuilder
 
+namespace {
+  /// @brief Python types that #builder_fromiter checks against, looked up
+  /// once instead of importing their modules for every element.
+  ///
+  /// The handles are never released: they live as long as the interpreter.
+  struct FromiterTypes {
+    py::handle ak_Array;
+    py::handle ak_Record;
+    py::handle np_datetime64;
+    py::handle np_timedelta64;
+    py::handle np_bool_;
+    py::handle np_integer;
+    py::handle np_floating;
+  };
+
+  const FromiterTypes&
+  fromiter_types() {
+    static const FromiterTypes* types = nullptr;
+    if (types == nullptr) {
+      py::module awkward = py::module::import("awkward");
+      py::module numpy = py::module::import("numpy");
+      types = new FromiterTypes({
+        py::object(awkward.attr("Array")).release(),
+        py::object(awkward.attr("Record")).release(),
+        py::object(numpy.attr("datetime64")).release(),
+        py::object(numpy.attr("timedelta64")).release(),
+        py::object(numpy.attr("bool_")).release(),
+        py::object(numpy.attr("integer")).release(),
+        py::object(numpy.attr("floating")).release()
+      });
+    }
+    return *types;
+  }
+
+  template <typename T>
+  T
+  fromiter_load(const char* ptr) {
+    // NumPy arrays need not be aligned
+    T out;
+    std::memcpy(&out, ptr, sizeof(T));
+    return out;
+  }
+
+  /// @brief Fills a (possibly non-contiguous) NumPy array of booleans or
+  /// numbers directly from its buffer, as nested lists, without creating a
+  /// Python object per element.
+  ///
+  /// Each innermost list of numbers is appended as one block: copied
+  /// directly if it is a contiguous, aligned array of `double` or
+  /// `int64_t`, and converted into a temporary block otherwise.
+  template <typename T>
+  void
+  fromiter_strided(ak::ArrayBuilder& self,
+                   const char* data,
+                   const py::array& array,
+                   py::ssize_t dim) {
+    py::ssize_t length = array.shape(dim);
+    py::ssize_t stride = array.strides(dim);
+    bool direct = (stride == (py::ssize_t)sizeof(T)  &&
+                   reinterpret_cast<uintptr_t>(data) % alignof(T) == 0);
+    self.beginlist();
+    if (dim + 1 == array.ndim()) {
+      if (std::is_same<T, bool>::value) {
+        for (py::ssize_t i = 0;  i < length;  i++) {
+          self.boolean((bool)fromiter_load<T>(data + i*stride));
+        }
+      }
+      else if (std::is_same<T, double>::value  &&  direct) {
+        self.reals(reinterpret_cast<const double*>(data), (int64_t)length);
+      }
+      else if (std::is_floating_point<T>::value) {
+        std::vector<double> values((size_t)length);
+        for (py::ssize_t i = 0;  i < length;  i++) {
+          values[(size_t)i] = (double)fromiter_load<T>(data + i*stride);
+        }
+        self.reals(values.data(), (int64_t)length);
+      }
+      else if (std::is_same<T, int64_t>::value  &&  direct) {
+        self.integers(reinterpret_cast<const int64_t*>(data), (int64_t)length);
+      }
+      else {
+        std::vector<int64_t> values((size_t)length);
+        for (py::ssize_t i = 0;  i < length;  i++) {
+          T x = fromiter_load<T>(data + i*stride);
+          if (std::is_same<T, uint64_t>::value  &&
+              (uint64_t)x > (uint64_t)std::numeric_limits<int64_t>::max()) {
+            throw std::invalid_argument(
+              std::string("cannot convert ") + std::to_string((uint64_t)x)
+              + std::string(" (type uint64) to an array element")
+              + FILENAME(__LINE__));
+          }
+          values[(size_t)i] = (int64_t)x;
+        }
+        self.integers(values.data(), (int64_t)length);
+      }
+    }
+    else {
+      for (py::ssize_t i = 0;  i < length;  i++) {
+        fromiter_strided<T>(self, data + i*stride, array, dim + 1);
+      }
+    }
+    self.endlist();
+  }
+
+  /// @brief If every item of a Python list is a float, or every item is an
+  /// int (not a bool) that fits in 64 bits, appends them as one block and
+  /// returns true; otherwise returns false without touching the builder.
+  ///
+  /// This reads the numbers with the C API, rather than dispatching on the
+  /// type of each item in #builder_fromiter.
+  bool
+  fromiter_numbers(ak::ArrayBuilder& self, PyObject* list) {
+    Py_ssize_t length = PyList_GET_SIZE(list);
+    if (length == 0) {
+      return false;
+    }
+    if (PyFloat_CheckExact(PyList_GET_ITEM(list, 0))) {
+      std::vector<double> values((size_t)length);
+      for (Py_ssize_t i = 0;  i < length;  i++) {
+        PyObject* item = PyList_GET_ITEM(list, i);
+        if (!PyFloat_CheckExact(item)) {
+          return false;
+        }
+        values[(size_t)i] = PyFloat_AS_DOUBLE(item);
+      }
+      self.reals(values.data(), (int64_t)length);
+      return true;
+    }
+    if (PyLong_CheckExact(PyList_GET_ITEM(list, 0))) {
+      std::vector<int64_t> values((size_t)length);
+      for (Py_ssize_t i = 0;  i < length;  i++) {
+        PyObject* item = PyList_GET_ITEM(list, i);
+        int overflow = 0;
+        if (!PyLong_CheckExact(item)) {
+          return false;
+        }
+        values[(size_t)i] = (int64_t)PyLong_AsLongLongAndOverflow(item, &overflow);
+        if (overflow != 0) {
+          return false;
+        }
+      }
+      self.integers(values.data(), (int64_t)length);
+      return true;
+    }
+    return false;
+  }
+
+  /// @brief If `obj` is a NumPy array of booleans or numbers with at least
+  /// one dimension, fills it as nested lists and returns true; otherwise
+  /// returns false without touching the builder.
+  bool
+  fromiter_numpy(ak::ArrayBuilder& self, const py::handle& obj) {
+    if (!py::isinstance<py::array>(obj)) {
+      return false;
+    }
+    py::array array = py::reinterpret_borrow<py::array>(obj);
+    if (array.ndim() == 0) {
+      return false;
+    }
+    const char* data = reinterpret_cast<const char*>(array.data());
+    py::dtype dtype = array.dtype();
+    char kind = dtype.kind();
+    py::ssize_t itemsize = dtype.itemsize();
+    if (kind == 'b'  &&  itemsize == 1) {
+      fromiter_strided<bool>(self, data, array, 0);
+    }
+    else if (kind == 'i'  &&  itemsize == 1) {
+      fromiter_strided<int8_t>(self, data, array, 0);
+    }
+    else if (kind == 'i'  &&  itemsize == 2) {
+      fromiter_strided<int16_t>(self, data, array, 0);
+    }
+    else if (kind == 'i'  &&  itemsize == 4) {
+      fromiter_strided<int32_t>(self, data, array, 0);
+    }
+    else if (kind == 'i'  &&  itemsize == 8) {
+      fromiter_strided<int64_t>(self, data, array, 0);
+    }
+    else if (kind == 'u'  &&  itemsize == 1) {
+      fromiter_strided<uint8_t>(self, data, array, 0);
+    }
+    else if (kind == 'u'  &&  itemsize == 2) {
+      fromiter_strided<uint16_t>(self, data, array, 0);
+    }
+    else if (kind == 'u'  &&  itemsize == 4) {
+      fromiter_strided<uint32_t>(self, data, array, 0);
+    }
+    else if (kind == 'u'  &&  itemsize == 8) {
+      fromiter_strided<uint64_t>(self, data, array, 0);
+    }
+    else if (kind == 'f'  &&  itemsize == 4) {
+      fromiter_strided<float>(self, data, array, 0);
+    }
+    else if (kind == 'f'  &&  itemsize == 8) {
+      fromiter_strided<double>(self, data, array, 0);
+    }
+    else {
+      return false;
+    }
+    return true;
+  }
+}
+
 bool
 builder_fromiter_iscomplex(const py::handle& obj) {
-#if PY_MAJOR_VERSION < 3
-  return py::isinstance(obj, py::module::import("__builtin__").attr("complex"));
-#else
-  return py::isinstance(obj, py::module::import("builtins").attr("complex"));
-#endif
+  return PyComplex_Check(obj.ptr());
 }
 
 void
@@ -904,7 +1108,9 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.complex(obj.cast<std::complex<double>>());
   }
   else if (py::isinstance<py::bytes>(obj)) {
-    self.bytestring(obj.cast<std::string>());
+    // copied straight from the bytes object's buffer
+    self.bytestring(PyBytes_AS_STRING(obj.ptr()),
+                    (int64_t)PyBytes_GET_SIZE(obj.ptr()));
   }
   else if (py::isinstance<py::str>(obj)) {
     self.string(obj.cast<std::string>());
@@ -933,10 +1139,24 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     }
     self.endrecord();
   }
-  else if (py::isinstance(obj, py::module::import("awkward").attr("Array"))) {
+  else if (py::isinstance<py::list>(obj)) {
+    // the common case of lists, without going through the iterator protocol
+    PyObject* list = obj.ptr();
+    self.beginlist();
+    if (!fromiter_numbers(self, list)) {
+      for (Py_ssize_t i = 0;  i < PyList_GET_SIZE(list);  i++) {
+        builder_fromiter(self, PyList_GET_ITEM(list, i));
+      }
+    }
+    self.endlist();
+  }
+  else if (fromiter_numpy(self, obj)) {
+    // booleans and numbers are copied straight from the array's buffer
+  }
+  else if (py::isinstance(obj, fromiter_types().ak_Array)) {
     builder_fromiter(self, obj.attr("tolist")());
   }
-  else if (py::isinstance(obj, py::module::import("awkward").attr("Record"))) {
+  else if (py::isinstance(obj, fromiter_types().ak_Record)) {
     builder_fromiter(self, obj.attr("tolist")());
   }
   else if (py::isinstance<py::iterable>(obj)) {
@@ -950,19 +1170,19 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
   else if (py::isinstance<py::array>(obj)) {
     builder_fromiter(self, obj.attr("tolist")());
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("datetime64"))) {
+  else if (py::isinstance(obj, fromiter_types().np_datetime64)) {
     builder_datetime(self, obj);
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("timedelta64"))) {
+  else if (py::isinstance(obj, fromiter_types().np_timedelta64)) {
     builder_timedelta(self, obj);
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("bool_"))) {
+  else if (py::isinstance(obj, fromiter_types().np_bool_)) {
     self.boolean(obj.cast<bool>());
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("integer"))) {
+  else if (py::isinstance(obj, fromiter_types().np_integer)) {
     self.integer(obj.cast<int64_t>());
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("floating"))) {
+  else if (py::isinstance(obj, fromiter_types().np_floating)) {
     self.real(obj.cast<double>());
   }
   else {
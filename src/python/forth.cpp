@@ -108,6 +108,35 @@ py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
   }
 }
 
+template <typename T, typename I>
+std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>>
+forth_inputs(const ak::ForthMachineOf<T, I>& self, const py::dict& inputs) {
+  std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
+  py::object os_PathLike = py::module::import("os").attr("PathLike");
+  for (auto pair : inputs) {
+    std::string name = pair.first.cast<std::string>();
+    if (py::isinstance<py::str>(pair.second)  ||
+        py::isinstance(pair.second, os_PathLike)) {
+      // a file path: memory-map the file instead of reading it
+      std::string path = py::module::import("os").attr("fspath")(pair.second).cast<std::string>();
+      ins[name] = std::make_shared<ak::ForthInputBuffer>(path,
+                                                         self.input_must_be_writable(name));
+    }
+    else {
+      py::buffer obj = pair.second.cast<py::buffer>();
+      py::buffer_info info = obj.request(self.input_must_be_writable(name));
+      int64_t length = info.itemsize;
+      for (auto x : info.shape) {
+        length *= x;
+      }
+      std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
+          reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
+      ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
+    }
+  }
+  return ins;
+}
+
 template <typename T, typename I>
 py::class_<ak::ForthMachineOf<T, I>, std::shared_ptr<ak::ForthMachineOf<T, I>>>
 make_ForthMachineOf(const py::handle& m, const std::string& name) {
@@ -118,21 +147,24 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
                            int64_t recursion_depth,
                            int64_t string_buffer_size,
                            int64_t output_initial_size,
-                           double output_resize_factor)
+                           double output_resize_factor,
+                           bool optimize)
                         -> std::shared_ptr<ak::ForthMachineOf<T, I>> {
             return std::make_shared<ak::ForthMachineOf<T, I>>(source,
                                                               stack_size,
                                                               recursion_depth,
                                                               string_buffer_size,
                                                               output_initial_size,
-                                                              output_resize_factor);
+                                                              output_resize_factor,
+                                                              optimize);
           }),
                py::arg("source"),
                py::arg("stack_size") = 1024,
                py::arg("recursion_depth") = 1024,
                py::arg("string_buffer_size") = 1024,
                py::arg("output_initial_size") = 1024,
-               py::arg("output_resize_factor") = 1.5)
+               py::arg("output_resize_factor") = 1.5,
+               py::arg("optimize") = false)
           .def("__getitem__", [](const std::shared_ptr<ak::ForthMachineOf<T, I>>& self,
                                  const std::string& key)
                                  -> py::object {
@@ -178,6 +210,8 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
               &ak::ForthMachineOf<T, I>::output_initial_size)
           .def_property_readonly("output_resize_factor",
               &ak::ForthMachineOf<T, I>::output_resize_factor)
+          .def_property_readonly("optimize",
+              &ak::ForthMachineOf<T, I>::optimize)
           .def_property_readonly("stack",
               &ak::ForthMachineOf<T, I>::stack)
           .def("stack_push", [](ak::ForthMachineOf<T, I>& self, T value) -> void {
@@ -215,67 +249,51 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
           })
           .def("output_NumpyArray",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> py::object {
-              return box(self.get()->output_NumpyArray_at(name));
-          })
+               const std::string& name,
+               bool steal) -> py::object {
+              return box(self.get()->output_NumpyArray_at(name, steal));
+          }, py::arg("name"), py::arg("steal") = false)
           .def("output_Index8",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> ak::Index8 {
-              return self.get()->output_Index8_at(name);
-          })
+               const std::string& name,
+               bool steal) -> ak::Index8 {
+              return self.get()->output_Index8_at(name, steal);
+          }, py::arg("name"), py::arg("steal") = false)
           .def("output_IndexU8",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> ak::IndexU8 {
-              return self.get()->output_IndexU8_at(name);
-          })
+               const std::string& name,
+               bool steal) -> ak::IndexU8 {
+              return self.get()->output_IndexU8_at(name, steal);
+          }, py::arg("name"), py::arg("steal") = false)
           .def("output_Index32",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> ak::Index32 {
-              return self.get()->output_Index32_at(name);
-          })
+               const std::string& name,
+               bool steal) -> ak::Index32 {
+              return self.get()->output_Index32_at(name, steal);
+          }, py::arg("name"), py::arg("steal") = false)
           .def("output_IndexU32",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> ak::IndexU32 {
-              return self.get()->output_IndexU32_at(name);
-          })
+               const std::string& name,
+               bool steal) -> ak::IndexU32 {
+              return self.get()->output_IndexU32_at(name, steal);
+          }, py::arg("name"), py::arg("steal") = false)
           .def("output_Index64",
             [](const std::shared_ptr<ak::ForthMachineOf<T, I>> self,
-               const std::string& name) -> ak::Index64 {
-              return self.get()->output_Index64_at(name);
-          })
+               const std::string& name,
+               bool steal) -> ak::Index64 {
+              return self.get()->output_Index64_at(name, steal);
+          }, py::arg("name"), py::arg("steal") = false)
           .def("reset", &ak::ForthMachineOf<T, I>::reset)
           .def("begin", [](ak::ForthMachineOf<T, I>& self,
                            const py::dict& inputs) -> void {
-              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
-              for (auto pair : inputs) {
-                std::string name = pair.first.cast<std::string>();
-                py::buffer obj = pair.second.cast<py::buffer>();
-                py::buffer_info info = obj.request(self.input_must_be_writable(name));
-                int64_t length = info.itemsize;
-                for (auto x : info.shape) {
-                  length *= x;
-                }
-                std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
-                    reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
-                ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
-              }
+              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins =
+                forth_inputs<T, I>(self, inputs);
               self.begin(ins);
           }, py::arg("inputs") = py::dict())
           .def("begin_again", [](ak::ForthMachineOf<T, I>& self,
                            const py::dict& inputs, bool reset_instruction) -> void {
-              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
-              for (auto pair : inputs) {
-                std::string name = pair.first.cast<std::string>();
-                py::buffer obj = pair.second.cast<py::buffer>();
-                py::buffer_info info = obj.request(self.input_must_be_writable(name));
-                int64_t length = info.itemsize;
-                for (auto x : info.shape) {
-                  length *= x;
-                }
-                std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
-                    reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
-                ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
-              }
+              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins =
+                forth_inputs<T, I>(self, inputs);
               self.begin_again(ins, reset_instruction);
           }, py::arg("inputs"), py::arg("reset_instruction") = true)
           .def("step", [](ak::ForthMachineOf<T, I>& self,
@@ -336,19 +354,8 @@ make_ForthMachineOf(const py::handle& m, const std::string& name) {
                          bool raise_text_number_missing,
                          bool raise_quoted_string_missing,
                          bool raise_enumeration_missing) -> py::object {
-              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins;
-              for (auto pair : inputs) {
-                std::string name = pair.first.cast<std::string>();
-                py::buffer obj = pair.second.cast<py::buffer>();
-                py::buffer_info info = obj.request(self.input_must_be_writable(name));
-                int64_t length = info.itemsize;
-                for (auto x : info.shape) {
-                  length *= x;
-                }
-                std::shared_ptr<void> ptr = std::shared_ptr<uint8_t>(
-                    reinterpret_cast<uint8_t*>(info.ptr), pyobject_deleter<uint8_t>(obj.ptr()));
-                ins[name] = std::make_shared<ak::ForthInputBuffer>(ptr, 0, length);
-              }
+              std::map<std::string, std::shared_ptr<ak::ForthInputBuffer>> ins =
+                forth_inputs<T, I>(self, inputs);
               self.begin(ins);
               py::gil_scoped_release release;
               ak::util::ForthError err = self.resume();
@@ -514,6 +521,33 @@ make_ForthMachineOf(const py::handle& m, const std::string& name);
 template py::class_<ak::ForthMachine64, std::shared_ptr<ak::ForthMachine64>>
 make_ForthMachineOf(const py::handle& m, const std::string& name);
 
+py::object
+specializedjson_output(const ak::SpecializedJSON& self, const std::string& key, bool steal) {
+  ak::ForthOutputBuffer* output = self.output_at(key).get();
+  ak::util::dtype dtype = self.dtype_at(key);
+  if (steal) {
+    output->trim();
+  }
+  // the array owns a reference to the memory, not to the SpecializedJSON
+  std::shared_ptr<void>* owner = new std::shared_ptr<void>(output->ptr());
+  py::capsule base(owner, [](void* ptr) {
+    delete reinterpret_cast<std::shared_ptr<void>*>(ptr);
+  });
+  py::buffer_info info(
+    owner->get(),
+    (py::ssize_t)ak::util::dtype_to_itemsize(dtype),
+    ak::util::dtype_to_format(dtype),
+    1,
+    std::vector<py::ssize_t>({ (py::ssize_t)output->len() }),
+    std::vector<py::ssize_t>({ (py::ssize_t)ak::util::dtype_to_itemsize(dtype) })
+  );
+  py::array out(info, base);
+  if (steal) {
+    output->release();
+  }
+  return out;
+}
+
 py::class_<ak::SpecializedJSON, std::shared_ptr<ak::SpecializedJSON>>
 make_SpecializedJSON(const py::handle& m, const std::string& name) {
   return (py::class_<ak::SpecializedJSON,
@@ -537,20 +571,11 @@ make_SpecializedJSON(const py::handle& m, const std::string& name) {
           })
           .def_property_readonly("json_position", &ak::SpecializedJSON::json_position)
           .def("__len__", &ak::SpecializedJSON::length)
-          .def("__getitem__", [](py::object self, const std::string& key) -> py::object {
-            const std::shared_ptr<ak::SpecializedJSON> thyself =
-              self.cast<const std::shared_ptr<ak::SpecializedJSON>>();
-            ak::ForthOutputBuffer* output = thyself.get()->output_at(key).get();
-            ak::util::dtype dtype = thyself.get()->dtype_at(key);
-            py::buffer_info info(
-              output->ptr().get(),
-              (py::ssize_t)ak::util::dtype_to_itemsize(dtype),
-              ak::util::dtype_to_format(dtype),
-              1,
-              std::vector<py::ssize_t>({ (py::ssize_t)output->len() }),
-              std::vector<py::ssize_t>({ (py::ssize_t)ak::util::dtype_to_itemsize(dtype) })
-            );
-            return py::array(info, self);
+          .def("__getitem__", [](const ak::SpecializedJSON& self, const std::string& key) -> py::object {
+            return specializedjson_output(self, key, false);
+          })
+          .def("steal", [](const ak::SpecializedJSON& self, const std::string& key) -> py::object {
+            return specializedjson_output(self, key, true);
           })
 
         );
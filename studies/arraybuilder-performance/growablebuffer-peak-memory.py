@@ -0,0 +1,57 @@
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Measures the build time and peak memory (RSS) of an ArrayBuilder that grows
+# to a given size, as a test of how GrowableBuffer allocates memory. Each case
+# runs in its own process so that the peak RSS of one doesn't hide another's.
+#
+#     python growablebuffer-peak-memory.py [number of float64 values]
+
+NUM_VALUES = int(sys.argv[1]) if len(sys.argv) > 1 else 50000000
+CHUNK = 1000000
+
+
+def maxrss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(initial, resize):
+    chunk = np.random.normal(0, 1, CHUNK)
+    baseline = maxrss_mb()
+
+    builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    begintime = time.time()
+    builder.beginlist()
+    for _ in range(NUM_VALUES // CHUNK):
+        # each call is an inner list, filled in C++ from the array's buffer
+        builder.fromiter(chunk)
+    builder.endlist()
+    filltime = time.time() - begintime
+    fillrss = maxrss_mb() - baseline
+
+    begintime = time.time()
+    formstr, length, buffers = builder.to_buffers()
+    buffertime = time.time() - begintime
+    totalrss = maxrss_mb() - baseline
+
+    data_mb = NUM_VALUES * 8 / 1024**2
+    print(
+        f"initial={initial:<10d} resize={resize:<4}  "
+        f"fill {filltime:6.3f} s, peak {fillrss:7.1f} MB ({fillrss / data_mb:4.2f}x data)  "
+        f"to_buffers {buffertime:6.3f} s, peak {totalrss:7.1f} MB ({totalrss / data_mb:4.2f}x data)"
+    )
+
+
+if __name__ == "__main__" and len(sys.argv) > 2:
+    run(int(sys.argv[2]), float(sys.argv[3]))
+
+elif __name__ == "__main__":
+    for initial, resize in [(1024, 1.5), (1024, 2.0), (1024, 8.0), (NUM_VALUES, 1.5)]:
+        subprocess.check_call(
+            [sys.executable, __file__, str(NUM_VALUES), str(initial), str(resize)]
+        )
@@ -0,0 +1,129 @@
+import time
+
+import numpy as np
+import awkward as ak
+import awkward.forth
+
+# Compares the same AwkwardForth programs with and without the peephole
+# optimizer (ForthMachine*(..., optimize=True)), which fuses common instruction
+# sequences into superinstructions. The data are generated in memory with the
+# same layout as the uncompressed Avro blocks read by forth-read-jagged*-avro.py,
+# so no input files are needed.
+
+NUM_LISTS = 1000000
+MEAN_LENGTH = 5
+
+np.random.seed(12345)
+counts = np.random.poisson(MEAN_LENGTH, NUM_LISTS).astype(np.int64)
+num_items = int(counts.sum())
+content = np.random.normal(0, 1, num_items).astype(np.float32)
+ids = np.random.randint(-1000000, 1000000, num_items).astype(np.int32)
+
+
+def zigzag_varint(x):
+    x = (x << 1) ^ (x >> 63)
+    out = bytearray()
+    while True:
+        byte = x & 0x7F
+        x >>= 7
+        if x == 0:
+            out.append(byte)
+            return bytes(out)
+        out.append(byte | 0x80)
+
+
+def make_jagged1():
+    chunks = []
+    start = 0
+    for count in counts:
+        stop = start + int(count)
+        chunks.append(zigzag_varint(int(count)))
+        chunks.append(content[start:stop].tobytes())
+        start = stop
+    return np.frombuffer(b"".join(chunks), np.uint8)
+
+
+def make_records():
+    chunks = []
+    start = 0
+    for count in counts:
+        stop = start + int(count)
+        chunks.append(zigzag_varint(int(count)))
+        for i in range(start, stop):
+            chunks.append(ids[i : i + 1].tobytes())
+            chunks.append(zigzag_varint(int(ids[i])))
+        start = stop
+    return np.frombuffer(b"".join(chunks), np.uint8)
+
+
+jagged1 = """
+input stream
+output offset0 int64
+output content float32
+
+0 offset0 <- stack
+
+0 do
+  stream zigzag-> stack
+  dup offset0 +<- stack
+  stream #f-> content
+loop
+"""
+
+# The kind of code that the Avro reader generates for a list of records with
+# an option-type field: most of the instructions are reads to the stack that
+# are immediately written, literals written to masks, and counters.
+records = """
+input stream
+output offset0 int64
+output field0 int32
+output field1 int64
+output mask1 int8
+variable count
+
+0 offset0 <- stack
+
+0 do
+  stream zigzag-> stack
+  dup offset0 +<- stack
+  0 do
+    stream i-> stack field0 <- stack
+    stream zigzag-> stack field1 <- stack
+    1 mask1 <- stack
+    1 count +!
+  loop
+loop
+"""
+
+
+def run(source, data, optimize, repeat=5):
+    vm = awkward.forth.ForthMachine64(source, optimize=optimize)
+    best = None
+    for _ in range(repeat):
+        vm.begin({"stream": data})
+        vm.stack_push(NUM_LISTS)
+        begintime = time.time()
+        vm.resume()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return vm, best
+
+
+for name, source, data, items in [
+    ("jagged1", jagged1, make_jagged1(), NUM_LISTS),
+    ("records", records, make_records(), num_items),
+]:
+    plain, plain_time = run(source, data, False)
+    fused, fused_time = run(source, data, True)
+
+    for output in plain.outputs:
+        assert ak.to_list(plain[output][:100]) == ak.to_list(fused[output][:100])
+
+    print(
+        f"{name:8s} plain {1e9 * plain_time / items:6.2f} ns/item "
+        f"({plain.count_instructions} instructions)  "
+        f"optimized {1e9 * fused_time / items:6.2f} ns/item "
+        f"({fused.count_instructions} instructions)  "
+        f"speedup {plain_time / fused_time:.2f}x"
+    )
@@ -0,0 +1,54 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak.mean, ak.var, ak.moment and ak.corr at axis=-1 of lists of
+# numbers computed by one kernel per operation (the default) with the same
+# operations computed from ak.sum and ak.count of broadcasted temporaries.
+#
+#     python fused-moments.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+
+
+def jagged():
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets),
+            ak._v2.contents.NumpyArray(np.random.normal(0, 1, offsets[-1])),
+        )
+    )
+
+
+x, y, weight = jagged(), jagged(), jagged()
+
+
+def measure(function):
+    begintime = time.time()
+    function()
+    return time.time() - begintime
+
+
+of = ak._v2._moments.Segments.of
+
+for name, function in [
+    ("mean", lambda: ak._v2.operations.mean(x, axis=-1)),
+    ("var", lambda: ak._v2.operations.var(x, axis=-1)),
+    ("var weighted", lambda: ak._v2.operations.var(x, weight=weight, axis=-1)),
+    ("moment", lambda: ak._v2.operations.moment(x, 3, axis=-1)),
+    ("corr", lambda: ak._v2.operations.corr(x, y, axis=-1)),
+]:
+    ak._v2._moments.Segments.of = classmethod(lambda *args, **kwargs: None)
+    unfused = measure(function)
+    ak._v2._moments.Segments.of = of
+    fused = measure(function)
+    print(
+        f"{name:14s} unfused {unfused:6.3f} s   fused {fused:6.3f} s   ({unfused / fused:.1f}x)"
+    )
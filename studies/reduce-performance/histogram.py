@@ -0,0 +1,81 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak._v2.histogram with what it replaces: ak.flatten of the values
+# (and of the broadcasted weights) followed by np.histogram, for one histogram
+# of everything, and a Python loop of np.histogram, for one per list.
+#
+#     python histogram.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+content = np.random.normal(0, 1, offsets[-1])
+values = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+)
+weights = np.random.uniform(0, 1, len(counts))
+
+
+def best_time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begintime = time.time()
+        function()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return best
+
+
+def flattened():
+    flat = ak._v2.operations.flatten(values).to_numpy()
+    return np.histogram(flat, 100, range=(-5, 5))
+
+
+def flattened_weighted():
+    flat = ak._v2.operations.flatten(values).to_numpy()
+    broadcasted = ak._v2.operations.broadcast_arrays(weights, values)[0]
+    flat_weights = ak._v2.operations.flatten(broadcasted).to_numpy()
+    return np.histogram(flat, 100, range=(-5, 5), weights=flat_weights)
+
+
+print("one histogram")
+print(f"    flatten + np.histogram            {best_time(flattened):8.3f} s")
+for num_threads in (1, None):
+    with ak._v2.parallel.num_threads(num_threads):
+        elapsed = best_time(
+            lambda: ak._v2.operations.histogram(values, 100, range=(-5, 5))
+        )
+    threads = "(1 thread)" if num_threads == 1 else "(all threads)"
+    print(f"    ak.histogram {threads:20s} {elapsed:8.3f} s")
+
+print("one histogram, weight per list")
+print(f"    flatten + np.histogram            {best_time(flattened_weighted):8.3f} s")
+elapsed = best_time(
+    lambda: ak._v2.operations.histogram(values, 100, range=(-5, 5), weight=weights)
+)
+print(f"    ak.histogram                      {elapsed:8.3f} s")
+
+
+def loop():
+    return [
+        np.histogram(content[offsets[i] : offsets[i + 1]], 10, range=(-5, 5))[0]
+        for i in range(min(len(counts), 100000))
+    ]
+
+
+print("one histogram per list (first 100000 lists for the loop)")
+print(f"    loop of np.histogram              {best_time(loop, 1):8.3f} s")
+elapsed = best_time(
+    lambda: ak._v2.operations.histogram(values, 10, range=(-5, 5), axis=-1)
+)
+print(f"    ak.histogram                      {elapsed:8.3f} s")
@@ -0,0 +1,40 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Times reductions at axis=-1 of lists of numbers with different numbers of
+# threads (see ak._v2.parallel).
+#
+#     python parallel-reduce.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 50000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+array = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets),
+        ak._v2.contents.NumpyArray(np.random.normal(0, 1, offsets[-1])),
+    )
+)
+
+for reducer in (
+    ak._v2.operations.sum,
+    ak._v2.operations.max,
+    ak._v2.operations.argmax,
+    ak._v2.operations.any,
+):
+    times = []
+    for num_threads in (1, 2, 4, 8):
+        with ak._v2.parallel.num_threads(num_threads):
+            begintime = time.time()
+            reducer(array, axis=-1)
+            times.append(time.time() - begintime)
+    print(
+        f"{reducer.__name__:8s}"
+        + "".join(f"   {n} threads {t:6.3f} s" for n, t in zip((1, 2, 4, 8), times))
+    )
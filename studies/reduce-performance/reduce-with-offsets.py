@@ -0,0 +1,56 @@
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import awkward as ak
+
+# Compares reductions at axis=-1 of lists of numbers computed directly from the
+# list offsets (the default) with the same reductions computed from a parents
+# index, which has one int64 per element. Peak memory is what NumPy allocates
+# during the reduction, as seen by tracemalloc.
+#
+#     python reduce-with-offsets.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+array = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets),
+        ak._v2.contents.NumpyArray(
+            np.random.normal(0, 1, offsets[-1]).astype(np.float32)
+        ),
+    )
+)
+
+
+def measure(function):
+    tracemalloc.start()
+    begintime = time.time()
+    function()
+    endtime = time.time()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return endtime - begintime, peak / 1024**2
+
+
+can_reduce_offsets = ak._v2.contents.NumpyArray._can_reduce_offsets
+
+for reducer in (
+    ak._v2.operations.sum,
+    ak._v2.operations.max,
+    ak._v2.operations.argmax,
+    ak._v2.operations.count_nonzero,
+):
+    ak._v2.contents.NumpyArray._can_reduce_offsets = lambda self, reducer: False
+    parents_time, parents_memory = measure(lambda: reducer(array, axis=-1))
+    ak._v2.contents.NumpyArray._can_reduce_offsets = can_reduce_offsets
+    offsets_time, offsets_memory = measure(lambda: reducer(array, axis=-1))
+    print(
+        f"{reducer.__name__:14s} parents {parents_time:6.3f} s {parents_memory:8.1f} MB"
+        f"   offsets {offsets_time:6.3f} s {offsets_memory:8.1f} MB"
+    )
@@ -0,0 +1,54 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak.cumsum and ak.cummax on jagged lists with what they replace:
+# np.cumsum of the flat content with the sum before each list subtracted
+# (which loses precision for floats, and has no equivalent for cummax) and
+# a Python loop of np.cumsum and np.maximum.accumulate over the lists.
+#
+#     python segmented-scans.py [number of values]
+
+NUM_VALUES = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_VALUES // 10)
+offsets = np.zeros(len(counts) + 1, np.int64)
+np.cumsum(counts, out=offsets[1:])
+content = np.random.normal(0, 1, offsets[-1])
+array = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+)
+
+
+def measure(function):
+    begintime = time.time()
+    out = function()
+    return time.time() - begintime, out
+
+
+def subtracted():
+    total = np.cumsum(content)
+    before = np.concatenate([[0.0], total])[offsets[:-1]]
+    return ak._v2.operations.unflatten(total - np.repeat(before, counts), counts)
+
+
+def loop(function):
+    return [function(content[offsets[i] : offsets[i + 1]]) for i in range(len(counts))]
+
+
+elapsed, _ = measure(subtracted)
+print(f"np.cumsum minus sum before list     {elapsed:8.3f} s")
+elapsed, _ = measure(lambda: loop(np.cumsum))
+print(f"loop of np.cumsum                   {elapsed:8.3f} s")
+elapsed, _ = measure(lambda: ak._v2.operations.cumsum(array))
+print(f"ak.cumsum                           {elapsed:8.3f} s")
+elapsed, _ = measure(lambda: loop(np.maximum.accumulate))
+print(f"loop of np.maximum.accumulate       {elapsed:8.3f} s")
+elapsed, _ = measure(lambda: ak._v2.operations.cummax(array))
+print(f"ak.cummax                           {elapsed:8.3f} s")
@@ -0,0 +1,69 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak._v2.sort and ak._v2.argsort at axis=-1 with 1 thread and with
+# all available threads (ak._v2.parallel.set_num_threads) for three shapes of
+# jagged data with the same total number of elements: many short lists, a few
+# long lists, and skewed sizes (mostly short lists with some very long ones).
+#
+#     python parallel-segmented-sort.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000000
+
+np.random.seed(12345)
+
+
+def jagged(counts):
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    content = np.random.normal(0, 1, offsets[-1])
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+        )
+    )
+
+
+def skewed(total):
+    counts = np.random.poisson(3, total // 4)
+    long = np.random.choice(len(counts), 20, replace=False)
+    counts[long] = total // 40
+    return counts
+
+
+cases = [
+    ("many short", np.random.poisson(5, NUM_ELEMENTS // 5)),
+    ("few long", np.full(8, NUM_ELEMENTS // 8)),
+    ("skewed", skewed(NUM_ELEMENTS)),
+]
+
+
+def best_time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begintime = time.time()
+        function()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return best
+
+
+all_threads = ak._v2.parallel.get_num_threads()
+
+for name, counts in cases:
+    array = jagged(counts)
+    for operation in (ak._v2.operations.sort, ak._v2.operations.argsort):
+        ak._v2.parallel.set_num_threads(1)
+        single = best_time(lambda: operation(array, axis=-1))
+        ak._v2.parallel.set_num_threads(all_threads)
+        multi = best_time(lambda: operation(array, axis=-1))
+        print(
+            f"{name:10s} {operation.__name__:7s} {len(counts):9d} lists  "
+            f"1 thread {single:7.3f} s  {all_threads} threads {multi:7.3f} s  "
+            f"speedup {single / multi:.2f}x"
+        )
+
+ak._v2.parallel.set_num_threads(None)
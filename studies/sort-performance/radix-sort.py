@@ -0,0 +1,56 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak._v2.argsort at axis=-1 with a comparison sort (kind="quicksort")
+# and with the LSD radix sort (kind="radix") for several dtypes and sublist
+# lengths, all with the same total number of elements.
+#
+#     python radix-sort.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+
+def jagged(mean, dtype):
+    counts = np.random.poisson(mean, NUM_ELEMENTS // mean)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    if np.issubdtype(dtype, np.floating):
+        content = np.random.normal(0, 1, offsets[-1]).astype(dtype)
+    else:
+        content = np.random.randint(-1000000, 1000000, offsets[-1]).astype(dtype)
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+        )
+    )
+
+
+def best_time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begintime = time.time()
+        function()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return best
+
+
+for dtype in (np.int32, np.int64, np.float32, np.float64):
+    for mean in (16, 256, 4096, NUM_ELEMENTS // 4):
+        array = jagged(mean, dtype)
+        comparison = best_time(
+            lambda: ak._v2.operations.argsort(array, axis=-1, kind="quicksort")
+        )
+        radix = best_time(
+            lambda: ak._v2.operations.argsort(array, axis=-1, kind="radix")
+        )
+        print(
+            f"{np.dtype(dtype).name:8s} mean length {mean:9d}  "
+            f"comparison {comparison:7.3f} s  radix {radix:7.3f} s  "
+            f"speedup {comparison / radix:.2f}x"
+        )
@@ -0,0 +1,66 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak._v2.searchsorted with what it replaces: np.searchsorted of the
+# flattened values followed by ak.unflatten, for global edges, and a Python
+# loop of np.searchsorted over the lists, for a search within each list.
+#
+#     python searchsorted.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+content = np.random.uniform(0, 100, offsets[-1])
+values = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+)
+sorted_lists = ak._v2.operations.sort(values)
+edges = np.linspace(0, 100, 101)
+needles = np.random.uniform(0, 100, len(counts))
+
+
+def best_time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begintime = time.time()
+        function()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return best
+
+
+def flattened():
+    flat = ak._v2.operations.flatten(values).to_numpy()
+    return ak._v2.operations.unflatten(np.searchsorted(edges, flat), counts)
+
+
+print("global edges")
+print(f"    flatten + np.searchsorted + unflatten  {best_time(flattened):8.3f} s")
+elapsed = best_time(lambda: ak._v2.operations.searchsorted(edges, values))
+print(f"    ak.searchsorted                        {elapsed:8.3f} s")
+
+flat_sorted = ak._v2.operations.flatten(sorted_lists).to_numpy()
+
+
+def loop():
+    return [
+        np.searchsorted(flat_sorted[offsets[i] : offsets[i + 1]], needles[i])
+        for i in range(len(counts))
+    ]
+
+
+print("one value per list")
+print(f"    loop of np.searchsorted                {best_time(loop, 1):8.3f} s")
+elapsed = best_time(lambda: ak._v2.operations.searchsorted(sorted_lists, needles))
+print(f"    ak.searchsorted                        {elapsed:8.3f} s")
+elapsed = best_time(lambda: ak._v2.operations.searchsorted(sorted_lists, values))
+print(f"    ak.searchsorted of ~10 values per list {elapsed:8.3f} s")
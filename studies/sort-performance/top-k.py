@@ -0,0 +1,54 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak._v2.top_k and ak._v2.argtop_k with a full sort followed by a
+# slice, ak._v2.sort(...)[:, :k] and ak._v2.argsort(...)[:, :k], for the
+# "leading 4 jets out of ~50" use case and a few other k and list lengths.
+#
+#     python top-k.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+
+def jagged(mean):
+    counts = np.random.poisson(mean, NUM_ELEMENTS // mean)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    content = np.random.exponential(20, offsets[-1])
+    return ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+        )
+    )
+
+
+def best_time(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        begintime = time.time()
+        function()
+        endtime = time.time()
+        if best is None or endtime - begintime < best:
+            best = endtime - begintime
+    return best
+
+
+for mean, k in [(50, 4), (50, 1), (10, 4), (500, 10)]:
+    array = jagged(mean)
+    print(f"lists of ~{mean}, k={k}")
+    sort = best_time(
+        lambda: ak._v2.operations.sort(array, ascending=False, stable=True)[:, :k]
+    )
+    top_k = best_time(lambda: ak._v2.operations.top_k(array, k))
+    print(f"    sort[:, :k]       {sort:8.3f} s")
+    print(f"    top_k             {top_k:8.3f} s")
+    argsort = best_time(
+        lambda: ak._v2.operations.argsort(array, ascending=False, stable=True)[:, :k]
+    )
+    argtop_k = best_time(lambda: ak._v2.operations.argtop_k(array, k))
+    print(f"    argsort[:, :k]    {argsort:8.3f} s")
+    print(f"    argtop_k          {argtop_k:8.3f} s")
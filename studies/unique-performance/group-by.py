@@ -0,0 +1,58 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak.group_by (hash and sort) with grouping by ak.argsort,
+# ak.run_lengths and ak.unflatten, and ak.group_by's aggregations with
+# ak.sum and ak.count of the materialized groups.
+#
+#     python group-by.py [number of records]
+
+NUM_RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+array = ak._v2.Array(
+    {
+        "key": np.random.randint(0, 10000, NUM_RECORDS),
+        "value": np.random.normal(0, 1, NUM_RECORDS),
+    }
+)
+
+
+def measure(function):
+    begintime = time.time()
+    out = function()
+    return time.time() - begintime, out
+
+
+def emulated():
+    sorted = array[ak._v2.operations.argsort(array.key, stable=True)]
+    return ak._v2.operations.unflatten(
+        sorted, ak._v2.operations.run_lengths(sorted.key)
+    )
+
+
+elapsed, groups = measure(emulated)
+print(f"argsort + run_lengths + unflatten   {elapsed:8.3f} s")
+for method in ("hash", "sort"):
+    elapsed, _ = measure(
+        lambda: ak._v2.operations.group_by(array, "key", method=method)
+    )
+    print(f"group_by method={method!r:7s}            {elapsed:8.3f} s")
+
+elapsed, _ = measure(
+    lambda: (
+        ak._v2.operations.sum(groups.value, axis=-1),
+        ak._v2.operations.count(groups.value, axis=-1),
+    )
+)
+print(f"ak.sum + ak.count of groups         {elapsed:8.3f} s (after grouping)")
+elapsed, _ = measure(
+    lambda: ak._v2.operations.group_by(
+        array, "key", aggregations={"total": ("sum", "value"), "n": "count"}
+    )
+)
+print(f"group_by with aggregations          {elapsed:8.3f} s")
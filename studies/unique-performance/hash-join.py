@@ -0,0 +1,59 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Times ak.join of particles with a truth table within each event (axis=1)
+# and with a calibration table for all events (axis=0), and the first join
+# with Python dicts.
+#
+#     python hash-join.py [number of particles]
+
+NUM_PARTICLES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_PARTICLES // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+length = offsets[-1]
+
+
+def events(**fields):
+    return ak._v2.operations.unflatten(ak._v2.Array(fields), counts)
+
+
+particles = events(id=np.random.randint(0, 20, length), pt=np.random.random(length))
+truth = events(id=np.random.permutation(length) % 20, pdg=np.arange(length))
+calibration = ak._v2.Array({"id": np.arange(20), "scale": np.random.random(20)})
+
+
+def measure(function):
+    begintime = time.time()
+    function()
+    return time.time() - begintime
+
+
+def python():
+    for ps, ts in zip(particles.tolist(), truth.tolist()):
+        table = {}
+        for t in ts:
+            table.setdefault(t["id"], []).append(t)
+        [dict(p, pdg=t["pdg"]) for p in ps for t in table.get(p["id"], [])]
+
+
+print(
+    "ak.join axis=1 {:8.3f} s".format(
+        measure(lambda: ak._v2.operations.join(particles, truth, on="id", axis=1))
+    )
+)
+print(
+    "ak.join axis=0 {:8.3f} s".format(
+        measure(
+            lambda: ak._v2.operations.join(
+                ak._v2.operations.flatten(particles), calibration, on="id"
+            )
+        )
+    )
+)
+print("Python dicts   {:8.3f} s (axis=1, including tolist)".format(measure(python)))
@@ -0,0 +1,53 @@
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+# Compares ak.unique with method="hash" and method="sort" for lists of
+# integers, lists of strings, and all integers (axis=None), and the existing
+# sort-based Content.unique for the integers.
+#
+#     python hash-unique.py [number of elements]
+
+NUM_ELEMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+np.random.seed(12345)
+
+counts = np.random.poisson(10, NUM_ELEMENTS // 10)
+offsets = np.concatenate([[0], np.cumsum(counts)])
+
+numbers = ak._v2.Array(
+    ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets),
+        ak._v2.contents.NumpyArray(np.random.randint(0, 5, offsets[-1])),
+    )
+)
+strings = ak._v2.operations.unflatten(
+    [str(x) for x in np.random.randint(0, 1000, offsets[len(counts) // 10])],
+    counts[: len(counts) // 10],
+)
+flat = ak._v2.Array(np.random.randint(0, 100000, NUM_ELEMENTS))
+
+
+def measure(function):
+    begintime = time.time()
+    function()
+    return time.time() - begintime
+
+
+for name, array, axis in [
+    ("lists of integers", numbers, -1),
+    ("lists of strings", strings, -1),
+    ("all integers", flat, None),
+]:
+    hashed = measure(lambda: ak._v2.operations.unique(array, axis=axis))
+    sorted = measure(lambda: ak._v2.operations.unique(array, axis=axis, method="sort"))
+    print(f"{name:20s} hash {hashed:8.3f} s    sort {sorted:8.3f} s")
+
+content = ak._v2.operations.to_layout(flat)
+print(
+    "{:20s} Content.unique {:8.3f} s".format(
+        "all integers", measure(lambda: content.unique())
+    )
+)
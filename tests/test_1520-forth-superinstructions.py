@@ -0,0 +1,109 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward.forth import ForthMachine32, ForthMachine64
+
+
+def zigzag_varints(values):
+    out = []
+    for x in values:
+        x = (x << 1) ^ (x >> 63)
+        while True:
+            byte = x & 0x7F
+            x >>= 7
+            if x == 0:
+                out.append(byte)
+                break
+            out.append(byte | 0x80)
+    return np.array(out, np.uint8)
+
+
+source = """
+input stream
+output offsets int64
+output content int32
+output mask int8
+variable count
+
+0 offsets <- stack
+0 do
+  stream zigzag-> stack
+  dup offsets +<- stack
+  0 do
+    stream i-> stack content <- stack
+    1 mask <- stack
+    1 count +!
+  loop
+loop
+count @ content <- stack
+"""
+
+
+def test_optimize_flag():
+    assert not ForthMachine64(source).optimize
+    assert ForthMachine64(source, optimize=True).optimize
+
+
+@pytest.mark.parametrize("ForthMachine", [ForthMachine32, ForthMachine64])
+def test_same_results(ForthMachine):
+    counts = [3, 0, 2, 1]
+    values = np.arange(6, dtype=np.int32) * 11
+    data = np.concatenate(
+        [
+            zigzag_varints(counts[:1]),
+            values[:3].view(np.uint8),
+            zigzag_varints(counts[1:3]),
+            values[3:5].view(np.uint8),
+            zigzag_varints(counts[3:]),
+            values[5:].view(np.uint8),
+        ]
+    )
+
+    plain = ForthMachine(source)
+    fused = ForthMachine(source, optimize=True)
+    for vm in (plain, fused):
+        vm.begin({"stream": data})
+        vm.stack_push(len(counts))
+        vm.resume()
+
+    for name in ("offsets", "content", "mask"):
+        assert ak.to_list(fused[name]) == ak.to_list(plain[name])
+    assert ak.to_list(fused["offsets"]) == [0, 3, 3, 5, 6]
+    assert ak.to_list(fused["content"]) == [0, 11, 22, 33, 44, 55, 6]
+    assert fused["count"] == plain["count"] == 6
+    assert fused.stack == plain.stack == []
+    assert fused.count_reads == plain.count_reads
+    assert fused.count_writes == plain.count_writes
+    assert fused.count_instructions < plain.count_instructions
+
+
+def test_bytecodes_and_decompiled():
+    plain = ForthMachine64(source)
+    fused = ForthMachine64(source, optimize=True)
+    assert len(ak.flatten(fused.bytecodes)) < len(ak.flatten(plain.bytecodes))
+    assert "0 offsets <- stack" in fused.decompiled
+    assert "dup offsets +<- stack" in fused.decompiled
+    assert "stream i-> content" in fused.decompiled
+    assert "1 count +!" in fused.decompiled
+    assert "count @ content <- stack" in fused.decompiled
+
+    again = ForthMachine64(fused.decompiled, optimize=True)
+    assert ak.to_list(again.bytecodes) == ak.to_list(fused.bytecodes)
+
+
+def test_no_truncating_fusion():
+    # a float read to the stack is truncated before it is written, so it must
+    # not be replaced by a direct (untruncated) write
+    vm = ForthMachine32(
+        "input x output y float64 x d-> stack y <- stack", optimize=True
+    )
+    vm.run({"x": np.array([2.5], np.float64)})
+    assert ak.to_list(vm["y"]) == [2.0]
+
+
+def test_dup_write_underflow():
+    vm = ForthMachine32("output y int32 dup y +<- stack", optimize=True)
+    assert vm.run(raise_stack_underflow=False) == "stack underflow"
@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pathlib
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward.forth import ForthMachine32
+
+
+def test_file_path(tmp_path):
+    filename = tmp_path / "data.bin"
+    np.arange(10, dtype=np.int32).tofile(filename)
+
+    vm = ForthMachine32(
+        """input x output y int32
+           x len 4 / x #i-> y
+           x len x pos
+           8 x seek x i-> stack
+           -8 x skip x i-> stack"""
+    )
+    for path in (str(filename), filename, pathlib.PurePath(filename)):
+        vm.run({"x": path})
+        assert ak.to_list(vm["y"]) == list(range(10))
+        assert vm.stack == [40, 40, 2, 1]
+        assert vm.input_position("x") == 8
+
+
+def test_same_as_buffer(tmp_path):
+    filename = tmp_path / "data.bin"
+    data = np.array([1, 2, 3, 4, 5], np.float64)
+    data.tofile(filename)
+
+    vm = ForthMachine32("input x output y float64 5 x #d-> y")
+    vm.run({"x": data})
+    from_buffer = ak.to_list(vm["y"])
+    vm.run({"x": str(filename)})
+    assert ak.to_list(vm["y"]) == from_buffer
+
+    vm.begin({"x": str(filename)})
+    vm.step()
+    vm.step()
+    assert ak.to_list(vm["y"]) == from_buffer
+
+
+def test_empty_file(tmp_path):
+    filename = tmp_path / "empty.bin"
+    filename.write_bytes(b"")
+
+    vm = ForthMachine32("input x x len x end")
+    vm.run({"x": str(filename)})
+    assert vm.stack == [0, -1]
+
+    vm = ForthMachine32("input x x b-> stack")
+    assert vm.run({"x": str(filename)}, raise_read_beyond=False) == "read beyond"
+
+
+def test_missing_file(tmp_path):
+    vm = ForthMachine32("input x")
+    with pytest.raises(ValueError):
+        vm.run({"x": str(tmp_path / "does-not-exist.bin")})
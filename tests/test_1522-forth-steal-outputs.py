@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import json
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward.forth import ForthMachine32
+
+
+def test_steal_NumpyArray():
+    vm = ForthMachine32(
+        "output y float64 1000 0 do i y <- stack loop", output_initial_size=7
+    )
+    vm.run()
+    stolen = vm.output_NumpyArray("y", steal=True)
+    assert ak.to_list(stolen) == list(range(1000))
+
+    # the output is left empty and new writes don't change the stolen array
+    assert len(vm["y"]) == 0
+    vm.begin_again({}, True)
+    vm.resume()
+    assert ak.to_list(vm["y"]) == list(range(1000))
+    assert ak.to_list(stolen) == list(range(1000))
+
+
+def test_steal_Index():
+    vm = ForthMachine32("output x int64 output y int32 10 0 do i x <- stack loop")
+    vm.run()
+    stolen = vm.output_Index64("x", steal=True)
+    assert np.asarray(stolen).tolist() == list(range(10))
+    assert len(vm.output_Index64("x")) == 0
+
+    with pytest.raises(RuntimeError):
+        vm.output_Index64("y", steal=True)
+
+
+def test_no_steal_is_shared():
+    vm = ForthMachine32("output y int32 3 0 do i y <- stack loop")
+    vm.run()
+    first = vm.output_NumpyArray("y")
+    second = vm.output_NumpyArray("y")
+    assert ak.to_list(first) == ak.to_list(second) == [0, 1, 2]
+
+
+def test_growth_after_sharing():
+    # an array taken in the middle of a run must keep its values after the
+    # output buffer grows
+    vm = ForthMachine32(
+        "output y int32 5 0 do i y <- stack loop pause 100 5 do i y <- stack loop",
+        output_initial_size=5,
+    )
+    vm.run(raise_user_halt=False)
+    early = vm.output_NumpyArray("y")
+    vm.resume()
+    assert ak.to_list(early) == [0, 1, 2, 3, 4]
+    assert ak.to_list(vm["y"]) == list(range(100))
+
+
+def test_specializedjson_steal():
+    array = ak._v2.operations.from_json_schema(
+        "[[1.1, 2.2, 3.3], [], [4.4, 5.5]]",
+        {"type": "array", "items": {"type": "array", "items": {"type": "number"}}},
+    )
+    assert array.tolist() == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+
+    specializedjson = ak._ext.SpecializedJSON(
+        json.dumps([["TopLevelArray"], ["FillNumber", "node0-data", "float64"]])
+    )
+    assert specializedjson.parse_string("[1.1, 2.2, 3.3]")
+    stolen = specializedjson.steal("node0-data")
+    del specializedjson
+    assert stolen.tolist() == [1.1, 2.2, 3.3]
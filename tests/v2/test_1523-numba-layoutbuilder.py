@@ -0,0 +1,143 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+ak_numba = pytest.importorskip("awkward._v2.numba")
+
+
+def test_numpy():
+    builder = ak_numba.layout_builder(ak._v2.forms.NumpyForm("int32"), initial=2)
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            builder.append(i)
+        builder.extend(np.arange(3, dtype=np.int32))
+
+    fill(builder, 5)
+    assert len(builder) == 8
+    array = builder.snapshot()
+    assert str(array.type) == "8 * int32"
+    assert array.tolist() == [0, 1, 2, 3, 4, 0, 1, 2]
+
+    builder.clear()
+    assert builder.snapshot().tolist() == []
+
+
+def test_jagged_records():
+    form = """
+{
+    "class": "ListOffsetArray",
+    "offsets": "i64",
+    "content": {
+        "class": "RecordArray",
+        "contents": {
+            "x": "float64",
+            "y": {"class": "IndexedOptionArray", "index": "i64", "content": "int64"}
+        }
+    }
+}"""
+    builder = ak_numba.layout_builder(form, initial=1)
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            record = builder.begin_list()
+            for j in range(i):
+                record.x.append(j * 1.1)
+                if j % 2 == 0:
+                    record.y.append_valid().append(j)
+                else:
+                    record.y.append_null()
+                record.end_record()
+            builder.end_list()
+
+    fill(builder, 4)
+    array = builder.snapshot()
+    assert str(array.type) == "4 * var * {x: float64, y: ?int64}"
+    assert array.tolist() == [
+        [],
+        [{"x": 0.0, "y": 0}],
+        [{"x": 0.0, "y": 0}, {"x": 1.1, "y": None}],
+        [{"x": 0.0, "y": 0}, {"x": 1.1, "y": None}, {"x": 2.2, "y": 2}],
+    ]
+
+    @numba.njit
+    def lengths(builder):
+        return len(builder), builder.content.length, builder.content.y.content.length
+
+    assert lengths(builder) == (4, 6, 4)
+
+
+def test_regular_tuple():
+    form = ak._v2.forms.RegularForm(
+        ak._v2.forms.RecordForm(
+            [ak._v2.forms.NumpyForm("bool"), ak._v2.forms.NumpyForm("float32")], None
+        ),
+        2,
+    )
+    builder = ak_numba.layout_builder(form)
+
+    @numba.njit
+    def fill(builder):
+        for i in range(3):
+            pair = builder.begin_list()
+            for j in range(2):
+                pair.content0.append(j == 0)
+                pair.content1.append(i + j)
+                pair.end_record()
+            builder.end_list()
+
+    fill(builder)
+    array = builder.snapshot()
+    assert str(array.type) == "3 * 2 * (bool, float32)"
+    assert array.tolist() == [
+        [(True, 0.0), (False, 1.0)],
+        [(True, 1.0), (False, 2.0)],
+        [(True, 2.0), (False, 3.0)],
+    ]
+
+
+def test_errors():
+    with pytest.raises(NotImplementedError):
+        ak_numba.layout_builder(
+            ak._v2.forms.UnionForm(
+                "i8",
+                "i64",
+                [ak._v2.forms.NumpyForm("int64"), ak._v2.forms.NumpyForm("bool")],
+            )
+        )
+    with pytest.raises(ValueError):
+        ak_numba.layout_builder(
+            ak._v2.forms.RecordForm([ak._v2.forms.NumpyForm("int64")], ["length"])
+        )
+
+    @numba.njit
+    def wrong_node(builder):
+        builder.end_list()
+
+    with pytest.raises(numba.core.errors.TypingError):
+        wrong_node(ak_numba.layout_builder(ak._v2.forms.NumpyForm("int64")))
+
+
+def test_uneven_record_fields():
+    form = ak._v2.forms.RecordForm(
+        [ak._v2.forms.NumpyForm("int64"), ak._v2.forms.NumpyForm("float64")],
+        ["x", "y"],
+    )
+    builder = ak_numba.layout_builder(form)
+
+    @numba.njit
+    def fill(builder):
+        builder.x.append(1)
+        builder.x.append(2)
+        builder.y.append(1.1)
+        builder.end_record()
+
+    fill(builder)
+    with pytest.raises(ValueError):
+        builder.snapshot()
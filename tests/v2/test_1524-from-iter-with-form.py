@@ -0,0 +1,107 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_type():
+    array = ak._v2.operations.from_iter([[1, 2, 3], [], [4, 5]], type="var * float32")
+    assert str(array.type) == "3 * var * float32"
+    assert array.tolist() == [[1, 2, 3], [], [4, 5]]
+
+    array = ak._v2.operations.from_iter(
+        [{"x": 1, "y": [1.1]}, {"x": 2, "y": [], "z": 3}],
+        type='{"x": int64, "y": var * float64}',
+    )
+    assert str(array.type) == "2 * {x: int64, y: var * float64}"
+    assert array.tolist() == [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}]
+
+    array = ak._v2.operations.from_iter(
+        [("one", [1, 2]), (None, [3, 4])], type="(?string, 2 * int16)"
+    )
+    assert str(array.type) == "2 * (?string, 2 * int16)"
+    assert array.tolist() == [("one", [1, 2]), (None, [3, 4])]
+
+    array = ak._v2.operations.from_iter(
+        [1, "two", [3], None], type="?union[int64, string, var * int64]"
+    )
+    assert array.tolist() == [1, "two", [3], None]
+
+    record = ak._v2.operations.from_iter({"x": 1}, type='{"x": float64}')
+    assert isinstance(record, ak._v2.highlevel.Record)
+    assert record.tolist() == {"x": 1.0}
+
+
+def test_form():
+    form = ak._v2.forms.from_json("""{
+    "class": "ByteMaskedArray",
+    "mask": "i8",
+    "valid_when": false,
+    "content": {"class": "ListOffsetArray", "offsets": "i32", "content": "float64"}
+}""")
+    array = ak._v2.operations.from_iter([[1.1], None, [2.2, 3.3]], form=form)
+    assert array.layout.form == form
+    assert array.tolist() == [[1.1], None, [2.2, 3.3]]
+
+    form = ak._v2.forms.BitMaskedForm(
+        "u8", ak._v2.forms.NumpyForm("bool"), valid_when=True, lsb_order=True
+    )
+    data = [True, None, False, None, None, None, None, None, True]
+    array = ak._v2.operations.from_iter(data, form=form)
+    assert array.layout.form == form
+    assert array.tolist() == data
+
+    form = ak._v2.forms.ListForm("i64", "i64", ak._v2.forms.NumpyForm("int32"))
+    array = ak._v2.operations.from_iter([[1, 2], [3]], form=form.to_json())
+    assert array.layout.form == form
+    assert array.tolist() == [[1, 2], [3]]
+
+    array = ak._v2.operations.from_iter(
+        [np.datetime64("2020-01-01"), np.datetime64("2021-01-01")],
+        form="datetime64[D]",
+    )
+    assert array.layout.form == ak._v2.forms.NumpyForm("datetime64[D]")
+
+    array = ak._v2.operations.from_iter([], type="var * float64")
+    assert str(array.type) == "0 * var * float64"
+
+
+def test_same_as_arraybuilder():
+    data = [
+        {"x": i, "y": [j * 1.1 for j in range(i % 4)], "z": None if i % 3 else str(i)}
+        for i in range(100)
+    ]
+    expected = ak._v2.operations.from_iter(data)
+    array = ak._v2.operations.from_iter(data, type=expected.type.content)
+    assert array.type == expected.type
+    assert array.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "data, tpe",
+    [
+        ([1.5], "int64"),
+        ([300], "int8"),
+        ([[1], 2], "var * int64"),
+        ([None], "int64"),
+        ([{"x": 1}], '{"y": int64}'),
+        ([[1, 2, 3]], "2 * int64"),
+        (["a"], "float64"),
+        ([b"a"], "string"),
+        ([1.1], "union[string, bool]"),
+        ([True, 1], "int64"),
+        ([1, True], "float64"),
+        ([[True, 1]], "var * int64"),
+        ([[1, True]], "2 * int64"),
+        ([True, 1], "bool"),
+    ],
+)
+def test_mismatch(data, tpe):
+    with pytest.raises(ValueError, match="cannot convert"):
+        ak._v2.operations.from_iter(data, type=tpe)
+
+
+def test_form_and_type():
+    with pytest.raises(TypeError):
+        ak._v2.operations.from_iter([1], form="int64", type="int64")
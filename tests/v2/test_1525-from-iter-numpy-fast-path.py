@@ -0,0 +1,102 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+    ],
+)
+def test_dtypes(dtype):
+    rows = [np.arange(3).astype(dtype), np.arange(0).astype(dtype), np.ones(2, dtype)]
+    array = ak._v2.operations.from_iter(rows)
+    assert array.tolist() == [x.tolist() for x in rows]
+    assert (
+        array.tolist()
+        == ak._v2.operations.from_iter([x.tolist() for x in rows]).tolist()
+    )
+
+    flat = ak._v2.operations.from_iter(rows[0])
+    assert flat.tolist() == rows[0].tolist()
+    assert len(flat.layout) == 3
+
+
+def test_strided():
+    data = np.arange(2 * 3 * 4, dtype=np.int32).reshape(2, 3, 4)[:, ::2, ::-1]
+    assert ak._v2.operations.from_iter(data).tolist() == data.tolist()
+    assert ak._v2.operations.from_iter([data]).tolist() == [data.tolist()]
+
+    unaligned = np.frombuffer(b"\x00" + np.arange(5.0).tobytes(), np.float64, 5, 1)
+    assert ak._v2.operations.from_iter([unaligned]).tolist() == [
+        [0.0, 1.0, 2.0, 3.0, 4.0]
+    ]
+
+
+def test_mixed():
+    array = ak._v2.operations.from_iter(
+        [np.array([1, 2, 3]), [4.4, None], np.array([True]), np.array(5)]
+    )
+    assert array.tolist() == [[1, 2, 3], [4.4, None], [True], 5]
+
+
+def test_other_dtypes():
+    assert ak._v2.operations.from_iter([np.array(["a", "bc"])]).tolist() == [
+        ["a", "bc"]
+    ]
+    assert ak._v2.operations.from_iter(
+        [np.array(["2020-01-01"], "datetime64[D]")]
+    ).tolist() == [[np.datetime64("2020-01-01")]]
+    assert ak._v2.operations.from_iter(
+        np.array([1 + 1j, 2], np.complex128)
+    ).tolist() == [1 + 1j, 2]
+    assert ak._v2.operations.from_iter(np.array([], np.float64)).tolist() == []
+
+
+def test_uint64_overflow():
+    with pytest.raises(ValueError):
+        ak._v2.operations.from_iter([np.array([2**64 - 1], np.uint64)])
+
+
+def test_lists_of_numbers():
+    data = [[1.1, 2.2, 3.3], [], [4.4], [5.5, 6.6]]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert str(array.type) == "4 * var * float64"
+
+    data = [[1, 2], [3, 4], [5, 6]]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert str(array.type) == "3 * var * int64"
+
+    data = [[1, 2.5], [True, False], [3, None], None, [2**62, -(2**62)]]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert [type(x) for x in array[0].tolist()] == [float, float]
+    assert [type(x) for x in array[1].tolist()] == [bool, bool]
+
+    data = [[[1.5, 2.5], [3.5]], None, [[4.0]]]
+    assert ak._v2.operations.from_iter(data).tolist() == data
+
+    data = [[1, 2**63 - 1], [-(2**63)]]
+    assert ak._v2.operations.from_iter(data).tolist() == data
+
+
+def test_bytes():
+    data = [b"", b"one", b"\x00two\x00", b"x" * 1000]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert str(array.type) == "4 * bytes"
@@ -0,0 +1,51 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_numbers():
+    builder = ak._v2.highlevel.ArrayBuilder(initial=1, resize=1.5)
+    for i in range(100):
+        builder.integer(i)
+    assert builder.snapshot().tolist() == list(range(100))
+
+    # promotion copies all of the panels into the new type
+    builder.real(100.5)
+    assert builder.snapshot().tolist() == list(range(100)) + [100.5]
+    builder.complex(1j)
+    assert builder.snapshot().tolist() == list(range(100)) + [100.5, 1j]
+
+
+def test_int_to_complex():
+    builder = ak._v2.highlevel.ArrayBuilder(initial=2, resize=2)
+    for i in range(10):
+        builder.integer(i)
+    builder.complex(1 + 1j)
+    assert builder.snapshot().tolist() == list(range(10)) + [1 + 1j]
+
+
+def test_nested():
+    data = [
+        None if i % 7 == 0 else {"x": [j for j in range(i % 5)], "y": str(i)}
+        for i in range(200)
+    ]
+    builder = ak._v2.highlevel.ArrayBuilder(initial=3, resize=1.1)
+    for x in data:
+        builder.append(x)
+    assert builder.snapshot().tolist() == data
+
+
+def test_clear():
+    builder = ak._v2.highlevel.ArrayBuilder(initial=1, resize=1.5)
+    for i in range(100):
+        builder.append([i, i])
+    builder._layout.clear()
+    builder.append([1.1])
+    assert builder.snapshot().tolist() == [[1.1]]
+
+
+def test_union():
+    data = [1, "two", [3], 4.4] * 50
+    assert ak._v2.operations.from_iter(data, initial=1).tolist() == data
@@ -0,0 +1,61 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def test_records():
+    builder = ak._v2.highlevel.ArrayBuilder()
+    builder.append({"x": 1, "y": [1.1, 2.2]})
+    builder.append({"x": 2, "y": []})
+    first = builder.snapshot(reset=True)
+    assert first.tolist() == [{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}]
+    assert len(builder) == 0
+
+    # the type is kept, even for fields that don't appear in the next batch
+    builder.append({"x": 3, "y": [3.3]})
+    second = builder.snapshot(reset=True)
+    assert second.tolist() == [{"x": 3, "y": [3.3]}]
+    assert str(second.type) == "1 * {x: int64, y: var * float64}"
+
+    empty = builder.snapshot(reset=True)
+    assert len(empty) == 0
+    assert str(empty.type) == "0 * {x: int64, y: var * float64}"
+
+    # old snapshots are unaffected
+    assert first.tolist() == [{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}]
+
+
+def test_tuples_and_unions():
+    builder = ak._v2.highlevel.ArrayBuilder()
+    builder.append((1, "one"))
+    assert builder.snapshot(reset=True).tolist() == [(1, "one")]
+    builder.append((2, "two"))
+    builder.append(None)
+    builder.append(3)
+    assert builder.snapshot(reset=True).tolist() == [(2, "two"), None, 3]
+    builder.append(4)
+    assert builder.snapshot(reset=True).tolist() == [4]
+
+
+def test_stream():
+    data = [[i] * (i % 3) for i in range(1000)]
+    builder = ak._v2.highlevel.ArrayBuilder(initial=4)
+    batches = []
+    for i, x in enumerate(data):
+        builder.append(x)
+        if i % 100 == 99:
+            batches.append(builder.snapshot(reset=True))
+    assert sum((batch.tolist() for batch in batches), []) == data
+
+
+def test_open_list():
+    builder = ak._v2.highlevel.ArrayBuilder()
+    builder.append([1, 2])
+    builder.begin_list()
+    builder.integer(3)
+    with pytest.raises(ValueError):
+        builder.snapshot(reset=True)
+    builder.end_list()
+    assert builder.snapshot(reset=True).tolist() == [[1, 2], [3]]
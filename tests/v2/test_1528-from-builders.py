@@ -0,0 +1,96 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import concurrent.futures
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def builder(*items):
+    out = ak._v2.highlevel.ArrayBuilder()
+    for x in items:
+        out.append(x)
+    return out
+
+
+def test_numbers_and_options():
+    array = ak._v2.operations.from_builders(
+        [builder(1, 2), builder(3.5), builder(), builder(None, 4)]
+    )
+    assert array.tolist() == [1, 2, 3.5, None, 4]
+    assert str(array.type) == "5 * ?float64"
+
+    array = ak._v2.operations.from_builders([builder("a"), builder(None)])
+    assert array.tolist() == ["a", None]
+    assert str(array.type) == "2 * ?string"
+
+    array = ak._v2.operations.from_builders([builder({"y": "a"}), builder({"y": None})])
+    assert array.tolist() == [{"y": "a"}, {"y": None}]
+    assert str(array.type) == "2 * {y: ?string}"
+
+    assert len(ak._v2.operations.from_builders([])) == 0
+    assert ak._v2.operations.from_builders([builder(1, 2)]).tolist() == [1, 2]
+
+
+def test_same_as_one_builder():
+    data = [
+        [{"x": 1}],
+        [],
+        [{"x": 2.2, "y": "two"}, None],
+        [{"y": "three"}],
+        [{"x": 4, "z": (1, [2])}],
+    ]
+    array = ak._v2.operations.from_builders([builder(x) for x in data])
+    assert array.tolist() == ak._v2.operations.from_iter(data).tolist()
+    assert (
+        str(array.type)
+        == "5 * var * ?{x: ?float64, y: ?string, z: ?(int64, var * int64)}"
+    )
+
+
+def test_unmergeable():
+    array = ak._v2.operations.from_builders([builder(1), builder("one"), builder(True)])
+    assert array.tolist() == [1, "one", True]
+    assert str(array.type) == str(ak._v2.operations.from_iter([1, "one", True]).type)
+
+
+def test_arrays():
+    array = ak._v2.operations.from_builders(
+        [builder([1, 2]), ak._v2.operations.from_iter([[3.3]])]
+    )
+    assert array.tolist() == [[1, 2], [3.3]]
+
+
+def test_numba_threads():
+    numba = pytest.importorskip("numba")
+
+    ak._v2.numba.register()
+
+    @numba.njit(nogil=True)
+    def fill(builder, start, stop):
+        for i in range(start, stop):
+            builder.begin_list()
+            for j in range(i % 4):
+                if i % 7 == 0:
+                    builder.real(j + 0.5)
+                else:
+                    builder.integer(j)
+            builder.end_list()
+        return builder
+
+    builders = [ak._v2.highlevel.ArrayBuilder() for _ in range(4)]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(fill, x, i * 100, (i + 1) * 100)
+            for i, x in enumerate(builders)
+        ]
+        for future in futures:
+            future.result()
+
+    expected = ak._v2.highlevel.ArrayBuilder()
+    fill(expected, 0, 400)
+    assert (
+        ak._v2.operations.from_builders(builders).tolist()
+        == expected.snapshot().tolist()
+    )
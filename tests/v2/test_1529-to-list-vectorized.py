@@ -0,0 +1,103 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+
+def strings(data, offsets):
+    return ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(np.array(offsets, np.int64)),
+        ak._v2.contents.NumpyArray(
+            np.frombuffer(data, np.uint8), parameters={"__array__": "char"}
+        ),
+        parameters={"__array__": "string"},
+    )
+
+
+def test_strings():
+    data = ["hello", "", "wörld", "日本語", "x" * 20, None]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert array[1:4].tolist() == data[1:4]
+    assert array[::-1].tolist() == data[::-1]
+    assert ak._v2.operations.from_iter(["a", "b", ""]).tolist() == ["a", "b", ""]
+
+    # invalid UTF-8 and boundaries in the middle of a character are escaped
+    # string by string
+    assert strings(b"\xc3\xb6\xe6\x97\x80", [0, 2, 4, 5]).tolist() == [
+        "ö",
+        "\udce6\udc97",
+        "\udc80",
+    ]
+    assert strings(b"\xc3\xb6ab\xff", [0, 1, 2, 5]).tolist() == [
+        "\udcc3",
+        "\udcb6",
+        "ab\udcff",
+    ]
+
+
+def test_bytestrings():
+    data = [b"hello", b"", b"\xff\x00"]
+    assert ak._v2.operations.from_iter(data).tolist() == data
+    regular = ak._v2.operations.to_regular(
+        ak._v2.operations.from_iter([b"ab", b"cd"]), axis=1
+    )
+    assert regular.tolist() == [b"ab", b"cd"]
+
+
+def test_regular_strings():
+    regular = ak._v2.contents.RegularArray(
+        ak._v2.contents.NumpyArray(
+            np.frombuffer("abcdéf".encode(), np.uint8),
+            parameters={"__array__": "char"},
+        ),
+        size=3,
+        parameters={"__array__": "string"},
+    )
+    assert regular.tolist() == ["abc", "dé"]
+
+    empty = ak._v2.contents.RegularArray(
+        ak._v2.contents.NumpyArray(np.zeros(0, np.int64)), size=0, zeros_length=3
+    )
+    assert empty.tolist() == [[], [], []]
+
+
+def test_records_and_options():
+    data = [
+        {"x": 1, "y": [1.1], "z": None},
+        None,
+        {"x": 2, "y": [], "z": "two"},
+        {"x": 3, "y": [3.3, None], "z": (1, "one")},
+    ]
+    array = ak._v2.operations.from_iter(data)
+    assert array.tolist() == data
+    assert array[[3, 1, 1, 0]].tolist() == [data[3], None, None, data[0]]
+
+    tuples = ak._v2.operations.from_iter([(1, "a"), (2, "b")])
+    assert tuples.tolist() == [(1, "a"), (2, "b")]
+
+    empty = ak._v2.contents.RecordArray([], [], length=2)
+    assert empty.tolist() == [{}, {}]
+    assert ak._v2.contents.RecordArray([], None, length=2).tolist() == [(), ()]
+
+
+def test_masked():
+    content = ak._v2.contents.NumpyArray(np.arange(5))
+    bytemasked = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 1, 0, 1], np.int8)),
+        content,
+        valid_when=True,
+    )
+    assert bytemasked.tolist() == [0, None, 2, None, 4]
+    bitmasked = ak._v2.contents.BitMaskedArray(
+        ak._v2.index.IndexU8(np.array([0b10101], np.uint8)),
+        content,
+        valid_when=True,
+        length=5,
+        lsb_order=True,
+    )
+    assert bitmasked.tolist() == [0, None, 2, None, 4]
+
+    union = ak._v2.operations.from_iter([1, "two", [3], "four", 5])
+    assert union.tolist() == [1, "two", [3], "four", 5]
@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_categorical = ak._v2.behaviors.categorical.to_categorical
+to_list = ak._v2.operations.to_list
+
+
+def check(data):
+    array = ak._v2.Array(data)
+    out = to_categorical(array)
+    assert to_list(out) == to_list(array)
+    assert out.layout.parameter("__array__") == "categorical"
+
+    # categories are unique and in order of first appearance
+    expected = []
+    for x in to_list(array):
+        if x is not None and x not in expected:
+            expected.append(x)
+    assert to_list(out.layout.content) == expected
+    return out
+
+
+def test_numbers():
+    check([3.3, 1.1, 3.3, 2.2, 1.1, 0.0, -0.0])
+    check([5, 1, 5, 5, 2, 0, 1])
+    check([True, False, True])
+    check(np.array([1, 2, 1, 3], dtype=np.uint16))
+    check(np.array(["2020-01-01", "2021-01-01", "2020-01-01"], dtype="M8[D]"))
+    check([])
+
+
+def test_options():
+    out = check([3, None, 1, 3, None, 2, 1])
+    assert isinstance(out.layout, ak._v2.contents.IndexedOptionArray)
+    assert np.asarray(out.layout.index).tolist() == [0, -1, 1, 0, -1, 2, 1]
+
+    check([None, None])
+
+    # masked-out values are still categories of the masked content
+    masked = ak._v2.Array([1, 2, 1, 3, 3]).mask[[True, False, True, True, False]]
+    out = to_categorical(masked)
+    assert to_list(out) == [1, None, 1, 3, None]
+    assert to_list(out.layout.content) == [1, 2, 3]
+
+
+def test_indexed():
+    content = ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3, 2.2]))
+    index = ak._v2.index.Index64(np.array([3, 0, 1, 2, 2, 0], dtype=np.int64))
+    out = to_categorical(ak._v2.contents.IndexedArray(index, content))
+    assert to_list(out) == [2.2, 1.1, 2.2, 3.3, 3.3, 1.1]
+    # categories follow the order of the original content
+    assert to_list(out.layout.content) == [1.1, 2.2, 3.3]
+
+
+def test_strings():
+    check(["one", "two", "", "one", "three", "tw", "two", "", "one"])
+    check(["a", "a\x00", "a", "\x00", "", "\x00"])
+    check([b"ab", b"ab", b"a", b"b"])
+    check(["one", None, "two", "one", None])
+    check(ak._v2.Array(["abc", "abd", "abc", "xyz"])[::-1])
+    check(ak._v2.Array(["abc", "def", "ab", "abc"]).layout[1:])
+
+
+def test_regular_strings():
+    array = ak._v2.operations.to_regular(ak._v2.Array(["ab", "cd", "ab", "ef"]), axis=1)
+    out = to_categorical(array)
+    assert to_list(out) == ["ab", "cd", "ab", "ef"]
+    assert to_list(out.layout.content) == ["ab", "cd", "ef"]
+
+
+def test_records():
+    check(
+        [
+            {"x": 1, "y": "one"},
+            {"x": 2, "y": "one"},
+            {"x": 1, "y": "one"},
+            {"x": 1, "y": "two"},
+            {"x": 2, "y": "one"},
+        ]
+    )
+    check([(1, 1.1), (2, 2.2), (1, 1.1), (1, 2.2)])
+    check([{"x": [1, 2], "y": None}, {"x": [1, 2], "y": 3}, {"x": [1, 2], "y": None}])
+
+
+def test_lists_in_records():
+    check(
+        [
+            {"x": [1.1, 2.2]},
+            {"x": []},
+            {"x": [1.1, 2.2]},
+            {"x": [2.2, 1.1]},
+            {"x": [1.1]},
+            {"x": []},
+        ]
+    )
+
+
+def test_nested():
+    array = ak._v2.Array([["one", "two", "one"], [], ["two", "three"]])
+    out = to_categorical(array)
+    assert to_list(out) == to_list(array)
+    assert to_list(out.layout.content.content) == ["one", "two", "three"]
+
+
+def test_union_fallback():
+    check([1, "one", 1, "two", "one", 2])
+
+
+def test_large_strings():
+    np.random.seed(12345)
+    words = np.array(["a", "bb", "ccc", "dd", "e", "", "ccc2"])
+    data = words[np.random.randint(0, len(words), 10000)].tolist()
+    out = to_categorical(ak._v2.Array(data))
+    assert to_list(out) == data
+    assert len(out.layout.content) == len(set(data))
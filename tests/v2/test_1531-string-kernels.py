@@ -0,0 +1,85 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+long = "x" * 300
+
+
+def test_equal():
+    one = ak._v2.Array(["one", "two", "", "three", "a\x00b", long + "a", "é"])
+    two = ak._v2.Array(["one", "tw", "", "thref", "a\x00c", long + "a", "é"])
+    assert to_list(one == two) == [True, False, True, False, False, True, True]
+    assert to_list(one != two) == [False, True, False, True, True, False, False]
+    assert to_list(one == "one") == [True, False, False, False, False, False, False]
+
+
+def test_equal_bytestrings():
+    one = ak._v2.Array([b"one", b"two", b"\x00", b""])
+    two = ak._v2.Array([b"one", b"twp", b"", b""])
+    assert to_list(one == two) == [True, False, False, True]
+
+
+def test_equal_layouts():
+    one = ak._v2.Array(["abc", "de", "f", "abc"])
+    # ListArray with shuffled starts/stops
+    two = one[[3, 1, 0, 0]]
+    assert isinstance(two.layout, ak._v2.contents.ListArray)
+    assert to_list(one == two) == [True, True, False, True]
+
+    regular = ak._v2.operations.to_regular(ak._v2.Array(["ab", "cd", "ab"]), axis=1)
+    assert to_list(regular == ak._v2.Array(["ab", "ab", "ab"])) == [True, False, True]
+
+
+def test_nested_equal():
+    one = ak._v2.Array([["one", "two"], [], ["three"]])
+    two = ak._v2.Array([["one", "one"], [], ["three"]])
+    assert to_list(one == two) == [[True, False], [], [True]]
+
+
+def test_ordering():
+    one = ak._v2.Array(["a", "b", "ab", "", "a\x00b", "é", long + "b"])
+    two = ak._v2.Array(["b", "a", "a", "", "a\x00a", "e", long + "a"])
+    expected = [x < y for x, y in zip(to_list(one), to_list(two))]
+    assert to_list(one < two) == expected
+    assert to_list(one <= two) == [x <= y for x, y in zip(to_list(one), to_list(two))]
+    assert to_list(one > two) == [x > y for x, y in zip(to_list(one), to_list(two))]
+    assert to_list(one >= two) == [x >= y for x, y in zip(to_list(one), to_list(two))]
+
+
+def test_hash():
+    array = ak._v2.Array(["one", "two", "one", "", "", long, long, "on"])
+    hashes = ak._v2.behaviors.string._string_hash(array.layout)
+    assert hashes.dtype == np.uint64
+    assert hashes[0] == hashes[2]
+    assert hashes[3] == hashes[4]
+    assert hashes[5] == hashes[6]
+    assert len(set(hashes.tolist())) == 5
+
+    # the hash depends only on the bytes, not the layout
+    assert ak._v2.behaviors.string._string_hash(array[::-1].layout).tolist() == (
+        hashes[::-1].tolist()
+    )
+
+
+def test_sort_with_zero_bytes():
+    array = ak._v2.Array(["a\x00b", "a\x00a", "a", long + "b", long + "a"])
+    assert to_list(ak._v2.operations.sort(array)) == sorted(to_list(array))
+    assert to_list(ak._v2.operations.sort(array, ascending=False)) == sorted(
+        to_list(array), reverse=True
+    )
+
+
+def test_unique_long_strings():
+    array = ak._v2.Array([long + "b", long + "a", long + "b", "a\x00b", "a\x00a"])
+    assert to_list(array.layout.unique(axis=-1)) == sorted(set(to_list(array)))
+
+
+def test_categorical():
+    data = ["one", "two", "one", "", "three", "", "two"]
+    out = ak._v2.behaviors.categorical.to_categorical(ak._v2.Array(data))
+    assert to_list(out) == data
+    assert to_list(out.layout.content) == ["one", "two", "", "three"]
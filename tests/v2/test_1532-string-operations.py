@@ -0,0 +1,119 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+words = ["one", "two", "", "three", "déjà vu", "a,,b", " x  y ", "ⓐⓑⓒ", "tt"]
+
+
+def nested(function):
+    return [[function(x) for x in words[:3]], [], [function(x) for x in words[3:]]]
+
+
+array = ak._v2.Array([words[:3], [], words[3:]])
+
+
+def test_startswith_endswith():
+    for pattern in ["t", "tw", "", "ⓐ", "three!"]:
+        assert to_list(ak._v2.str.startswith(array, pattern)) == nested(
+            lambda x: x.startswith(pattern)
+        )
+        assert to_list(ak._v2.str.endswith(array, pattern)) == nested(
+            lambda x: x.endswith(pattern)
+        )
+
+
+def test_find_contains():
+    for pattern in ["e", "t", "vu", "", "ⓑ", ",", "xyz", "tt"]:
+        assert to_list(ak._v2.str.find(array, pattern)) == nested(
+            lambda x: x.find(pattern)
+        )
+        assert to_list(ak._v2.str.contains(array, pattern)) == nested(
+            lambda x: pattern in x
+        )
+
+
+def test_matches_do_not_cross_strings():
+    # "ab" appears only across the boundary between the two strings
+    assert to_list(ak._v2.str.contains(ak._v2.Array(["xa", "by"]), "ab")) == [
+        False,
+        False,
+    ]
+
+
+def test_length():
+    assert to_list(ak._v2.str.length(array)) == nested(len)
+    bytestrings = ak._v2.Array([x.encode() for x in words])
+    assert to_list(ak._v2.str.length(bytestrings)) == [len(x.encode()) for x in words]
+
+
+def test_lower_upper():
+    assert to_list(ak._v2.str.upper(array)) == nested(str.upper)
+    assert to_list(ak._v2.str.lower(ak._v2.str.upper(array))) == nested(
+        lambda x: x.upper().lower()
+    )
+    ascii = ak._v2.Array(["Hello", "WORLD", "123 abc"])
+    assert to_list(ak._v2.str.lower(ascii)) == ["hello", "world", "123 abc"]
+    assert to_list(ak._v2.str.upper(ascii)) == ["HELLO", "WORLD", "123 ABC"]
+    assert to_list(ak._v2.str.upper(ak._v2.Array(["straße"]))) == ["STRASSE"]
+    assert to_list(ak._v2.str.upper(ak._v2.Array([b"ab\xff"]))) == [b"AB\xff"]
+
+
+def test_slice():
+    for start, stop in [(1, -1), (None, 2), (-2, None), (2, 1), (0, 100), (-100, 3)]:
+        assert to_list(ak._v2.str.slice(array, start, stop)) == nested(
+            lambda x: x[start:stop]
+        )
+
+
+def test_split():
+    for separator in [",", " ", "t", "vu", "ⓑ"]:
+        assert to_list(ak._v2.str.split(array, separator)) == nested(
+            lambda x: x.split(separator)
+        )
+        assert to_list(ak._v2.str.split(array, separator, max_splits=1)) == nested(
+            lambda x: x.split(separator, 1)
+        )
+    assert to_list(ak._v2.str.split(array)) == nested(str.split)
+    assert to_list(ak._v2.str.split(array, max_splits=1)) == nested(
+        lambda x: x.split(None, 1)
+    )
+
+
+def test_split_overlapping_separator():
+    data = ["aaaa", "xaaay", "aa", "aaa"]
+    assert to_list(ak._v2.str.split(ak._v2.Array(data), "aa")) == [
+        x.split("aa") for x in data
+    ]
+
+
+def test_join():
+    assert to_list(ak._v2.str.join(array, "--")) == [
+        "--".join(words[:3]),
+        "",
+        "--".join(words[3:]),
+    ]
+    assert to_list(ak._v2.str.join(ak._v2.str.split(array, ","), ",")) == to_list(array)
+    assert to_list(ak._v2.str.join(ak._v2.Array([[b"a", b"b"], []]), b"")) == [
+        b"ab",
+        b"",
+    ]
+    with pytest.raises(TypeError):
+        ak._v2.str.join(ak._v2.Array([["a", None]]), "-")
+
+
+def test_options_and_records():
+    data = ak._v2.Array([{"x": "one", "y": 1}, None, {"x": "TWO", "y": 2}])
+    assert to_list(ak._v2.str.lower(data)) == [
+        {"x": "one", "y": 1},
+        None,
+        {"x": "two", "y": 2},
+    ]
+    assert to_list(ak._v2.str.length(ak._v2.Array(["a", None, "bc"]))) == [
+        1,
+        None,
+        2,
+    ]
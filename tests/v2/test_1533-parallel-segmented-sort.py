@@ -0,0 +1,90 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.fixture
+def threads(monkeypatch):
+    # split even small arrays among threads
+    monkeypatch.setattr(ak._v2.parallel, "_min_per_thread", 1)
+    ak._v2.parallel.set_num_threads(4)
+    yield
+    ak._v2.parallel.set_num_threads(None)
+
+
+def check(array):
+    python = to_list(array)
+    for ascending in (True, False):
+        for stable in (True, False):
+            sorted_ = ak._v2.operations.sort(array, ascending=ascending, stable=stable)
+            assert to_list(sorted_) == [
+                sorted(x, reverse=not ascending) for x in python
+            ]
+            index = ak._v2.operations.argsort(array, ascending=ascending, stable=stable)
+            assert to_list(array[index]) == to_list(sorted_)
+            if stable:
+                sign = 1 if ascending else -1
+                assert to_list(index) == [
+                    sorted(range(len(x)), key=lambda i: (sign * x[i], i))  # noqa: B023
+                    for x in python
+                ]
+
+
+def test_many_short_lists(threads):
+    np.random.seed(12345)
+    counts = np.random.poisson(3, 1000)
+    check(ak._v2.operations.unflatten(np.random.randint(0, 10, counts.sum()), counts))
+
+
+def test_few_long_lists(threads):
+    np.random.seed(12345)
+    counts = np.array([500, 0, 700])
+    check(ak._v2.operations.unflatten(np.random.normal(0, 1, counts.sum()), counts))
+
+
+def test_skewed_lists(threads):
+    np.random.seed(12345)
+    counts = np.concatenate([np.ones(100, np.int64), [1000], np.zeros(5, np.int64)])
+    np.random.shuffle(counts)
+    check(
+        ak._v2.operations.unflatten(
+            np.random.randint(-5, 5, counts.sum()).astype(np.int32), counts
+        )
+    )
+
+
+def test_dtypes(threads):
+    counts = np.array([2, 3, 0, 1])
+    check(
+        ak._v2.operations.unflatten(
+            np.array([True, False, True, True, False, False]), counts
+        )
+    )
+    dates = np.array([5, 3, 9, 1, 2, 7], dtype="datetime64[s]")
+    array = ak._v2.operations.unflatten(dates, counts)
+    assert to_list(ak._v2.operations.sort(array)) == [sorted(x) for x in to_list(array)]
+
+
+def test_balanced_ranges():
+    offsets = np.array([0, 10, 20, 30, 40, 50, 60, 70, 80])
+    ranges = ak._v2.parallel._balanced_ranges(offsets, 4)
+    assert ranges == [(0, 2), (2, 4), (4, 6), (6, 8)]
+
+    # a long sublist is never split
+    offsets = np.array([0, 1, 1000, 1001, 1002])
+    ranges = ak._v2.parallel._balanced_ranges(offsets, 4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 4
+    assert all(a[1] == b[0] for a, b in zip(ranges[:-1], ranges[1:]))
+
+
+def test_set_num_threads():
+    ak._v2.parallel.set_num_threads(3)
+    assert ak._v2.parallel.get_num_threads() == 3
+    ak._v2.parallel.set_num_threads(None)
+    assert ak._v2.parallel.get_num_threads() >= 1
+    with pytest.raises(ValueError):
+        ak._v2.parallel.set_num_threads(0)
@@ -0,0 +1,114 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int8,
+        np.uint8,
+        np.int16,
+        np.uint16,
+        np.int32,
+        np.uint32,
+        np.int64,
+        np.uint64,
+        np.float32,
+        np.float64,
+    ],
+)
+def test_same_as_stable_comparison_sort(dtype):
+    np.random.seed(12345)
+    counts = np.random.poisson(20, 200)
+    if np.issubdtype(dtype, np.floating):
+        content = np.random.normal(0, 100, counts.sum()).astype(dtype)
+        content[::7] = np.round(content[::7])
+    elif np.issubdtype(dtype, np.signedinteger):
+        info = np.iinfo(dtype)
+        content = np.random.randint(info.min, info.max, counts.sum(), dtype=dtype)
+        content[::5] = -1
+    else:
+        info = np.iinfo(dtype)
+        content = np.random.randint(0, info.max, counts.sum(), dtype=dtype)
+        content[::5] = 3
+    array = ak._v2.operations.unflatten(content, counts)
+
+    for ascending in (True, False):
+        expected = ak._v2.operations.argsort(array, ascending=ascending, stable=True)
+        radix = ak._v2.operations.argsort(array, ascending=ascending, kind="radix")
+        assert to_list(radix) == to_list(expected)
+
+        expected = ak._v2.operations.sort(array, ascending=ascending, stable=True)
+        radix = ak._v2.operations.sort(array, ascending=ascending, kind="radix")
+        assert to_list(radix) == to_list(expected)
+
+
+def test_special_floats():
+    array = ak._v2.Array(
+        [[np.nan, 1.0, -0.0, np.inf, 0.0, -np.inf, np.nan, -1.5], [], [np.nan]]
+    )
+    for ascending in (True, False):
+        expected = ak._v2.operations.argsort(array, ascending=ascending, stable=True)
+        radix = ak._v2.operations.argsort(array, ascending=ascending, kind="radix")
+        assert to_list(radix) == to_list(expected)
+
+
+def test_datetime():
+    array = ak._v2.Array(
+        [np.array([5, 3, 9, 3], dtype="datetime64[s]"), []], with_name=None
+    )
+    assert to_list(ak._v2.operations.sort(array, kind="radix")) == to_list(
+        ak._v2.operations.sort(array)
+    )
+
+
+def test_fallback_and_axis():
+    # dtypes without a radix kernel use the comparison sort
+    array = ak._v2.Array([[True, False, True], [False]])
+    assert to_list(ak._v2.operations.sort(array, kind="radix")) == [
+        [False, True, True],
+        [False],
+    ]
+
+    nested = ak._v2.Array([[[3, 1, 2], []], [[5, 4]]])
+    assert to_list(ak._v2.operations.sort(nested, axis=-1, kind="radix")) == [
+        [[1, 2, 3], []],
+        [[4, 5]],
+    ]
+    assert to_list(ak._v2.operations.argsort(nested, axis=1, kind="radix")) == to_list(
+        ak._v2.operations.argsort(nested, axis=1)
+    )
+
+    with pytest.raises(ValueError):
+        ak._v2.operations.sort(array, kind="bogus")
+
+
+def test_positional_arguments():
+    array = ak._v2.Array([[3, 1, 2], [5, 4]])
+    out = ak._v2.operations.sort(array, -1, True, True, False)
+    assert isinstance(out, ak._v2.contents.Content)
+    assert to_list(out) == [[1, 2, 3], [4, 5]]
+    out = ak._v2.operations.argsort(array, -1, False, True, False)
+    assert isinstance(out, ak._v2.contents.Content)
+    assert to_list(out) == [[0, 2, 1], [0, 1]]
+    assert to_list(array.layout.sort(-1, True, False, None, "radix")) == [
+        [1, 2, 3],
+        [4, 5],
+    ]
+
+
+def test_automatic(monkeypatch):
+    monkeypatch.setattr(ak._v2.contents.NumpyArray, "_radix_sort_min_length", 1)
+    monkeypatch.setattr(ak._v2.contents.NumpyArray, "_radix_sort_min_mean_sublist", 2)
+    layout = ak._v2.contents.NumpyArray(np.array([3, 1, 2]))
+    assert layout._use_radix_sort(None, layout.dtype, 1)
+    assert not layout._use_radix_sort(None, layout.dtype, 2)
+    assert not layout._use_radix_sort("quicksort", layout.dtype, 1)
+    assert to_list(ak._v2.operations.sort(ak._v2.Array([[3, 1, 2, 0]]))) == [
+        [0, 1, 2, 3]
+    ]
@@ -0,0 +1,98 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+reducers = [
+    ak._v2.operations.count,
+    ak._v2.operations.count_nonzero,
+    ak._v2.operations.sum,
+    ak._v2.operations.prod,
+    ak._v2.operations.any,
+    ak._v2.operations.all,
+    ak._v2.operations.min,
+    ak._v2.operations.max,
+    ak._v2.operations.argmin,
+    ak._v2.operations.argmax,
+]
+
+
+def with_parents(monkeypatch, function, *args, **kwargs):
+    with monkeypatch.context() as m:
+        m.setattr(
+            ak._v2.contents.NumpyArray,
+            "_can_reduce_offsets",
+            lambda self, reducer: False,
+        )
+        return function(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [np.bool_, np.int8, np.uint16, np.int32, np.uint64, np.float32, np.float64],
+)
+@pytest.mark.parametrize("reducer", reducers)
+def test_same_as_parents(monkeypatch, reducer, dtype):
+    np.random.seed(12345)
+    counts = np.random.poisson(3, 100)
+    counts[::7] = 0
+    content = np.random.randint(-3, 4, counts.sum()).astype(dtype)
+    layout = ak._v2.operations.unflatten(content, counts, highlevel=False)
+
+    for kwargs in [{}, {"keepdims": True}, {"mask_identity": True}]:
+        if (
+            reducer
+            in (
+                ak._v2.operations.prod,
+                ak._v2.operations.argmin,
+                ak._v2.operations.argmax,
+            )
+            and dtype == np.bool_
+        ):
+            continue
+        expected = with_parents(monkeypatch, reducer, layout, axis=-1, **kwargs)
+        assert to_list(reducer(layout, axis=-1, **kwargs)) == to_list(expected)
+        assert str(reducer(layout, axis=-1, **kwargs).type) == str(expected.type)
+
+
+def test_nested_and_sliced(monkeypatch):
+    array = ak._v2.Array([[[1.1, 2.2], [], [3.3]], [], [[4.4, 0.0, 5.5]]])
+    for reducer in reducers:
+        for axis in (-1, 1, 0):
+            expected = with_parents(monkeypatch, reducer, array, axis=axis)
+            assert to_list(reducer(array, axis=axis)) == to_list(expected)
+
+    # offsets that don't start at zero and a ListArray with gaps
+    for other in (array[1:], array[::-1], array[:, 1:]):
+        for reducer in reducers:
+            expected = with_parents(monkeypatch, reducer, other, axis=-1)
+            assert to_list(reducer(other, axis=-1)) == to_list(expected)
+    assert to_list(ak._v2.operations.argmax(array[::-1], axis=-1)) == [
+        [2],
+        [],
+        [1, None, 0],
+    ]
+
+
+def test_special_values():
+    array = ak._v2.Array(
+        [
+            np.array(["2020-01-01", "2019-01-01"], "datetime64[D]"),
+            np.array([], "datetime64[D]"),
+        ]
+    )
+    assert to_list(ak._v2.operations.min(array, axis=-1)) == [
+        np.datetime64("2019-01-01", "D"),
+        None,
+    ]
+    assert to_list(ak._v2.operations.argmax(array, axis=-1)) == [0, None]
+
+    array = ak._v2.Array([[np.nan, 1.0, -1.0], [np.nan]])
+    assert to_list(ak._v2.operations.min(array, axis=-1)) == [-1.0, np.inf]
+    assert to_list(ak._v2.operations.min(array, axis=-1, initial=-5)) == [-5, -5]
+
+    array = ak._v2.Array([[1 + 1j, 2], [3j]])
+    assert to_list(ak._v2.operations.sum(array, axis=-1)) == [3 + 1j, 3j]
@@ -0,0 +1,110 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import threading
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+reducers = [
+    ak._v2.operations.count,
+    ak._v2.operations.count_nonzero,
+    ak._v2.operations.sum,
+    ak._v2.operations.prod,
+    ak._v2.operations.any,
+    ak._v2.operations.all,
+    ak._v2.operations.min,
+    ak._v2.operations.max,
+    ak._v2.operations.argmin,
+    ak._v2.operations.argmax,
+]
+
+
+@pytest.mark.parametrize("reducer", reducers)
+def test_same_as_one_thread(monkeypatch, reducer):
+    monkeypatch.setattr(ak._v2.parallel, "_min_per_thread", 1)
+    np.random.seed(12345)
+    counts = np.random.poisson(3, 1000)
+    counts[::11] = 0
+    content = np.random.randint(-3, 4, counts.sum()).astype(np.int32)
+    array = ak._v2.operations.unflatten(content, counts)
+
+    for kwargs in [{}, {"keepdims": True}, {"mask_identity": True}]:
+        with ak._v2.parallel.num_threads(1):
+            expected = reducer(array, axis=-1, **kwargs)
+        with ak._v2.parallel.num_threads(4):
+            result = reducer(array, axis=-1, **kwargs)
+        assert to_list(result) == to_list(expected)
+        assert str(result.type) == str(expected.type)
+
+
+def test_float_sums_are_deterministic(monkeypatch):
+    monkeypatch.setattr(ak._v2.parallel, "_min_per_thread", 1)
+    np.random.seed(12345)
+    counts = np.concatenate([np.random.poisson(5, 500), [10000], np.zeros(3, int)])
+    np.random.shuffle(counts)
+    content = np.random.normal(0, 1e6, counts.sum()).astype(np.float32)
+    array = ak._v2.operations.unflatten(content, counts)
+
+    with ak._v2.parallel.num_threads(1):
+        expected = np.asarray(ak._v2.operations.sum(array, axis=-1))
+    for n in (2, 3, 4):
+        with ak._v2.parallel.num_threads(n):
+            result = np.asarray(ak._v2.operations.sum(array, axis=-1))
+        assert result.tobytes() == expected.tobytes()
+
+
+def test_num_threads_context():
+    ak._v2.parallel.set_num_threads(3)
+    try:
+        with ak._v2.parallel.num_threads(1):
+            assert ak._v2.parallel.get_num_threads() == 1
+            with ak._v2.parallel.num_threads(None):
+                assert ak._v2.parallel.get_num_threads() == 3
+
+            # other threads keep the global setting
+            seen = []
+            thread = threading.Thread(
+                target=lambda: seen.append(ak._v2.parallel.get_num_threads())
+            )
+            thread.start()
+            thread.join()
+            assert seen == [3]
+        assert ak._v2.parallel.get_num_threads() == 3
+
+        with pytest.raises(ValueError):
+            with ak._v2.parallel.num_threads(0):
+                pass
+    finally:
+        ak._v2.parallel.set_num_threads(None)
+
+
+def test_concurrent_num_threads(monkeypatch):
+    # calls with different num_threads in several threads resize the pool
+    # while the others are using it
+    monkeypatch.setattr(ak._v2.parallel, "_min_per_thread", 1)
+    np.random.seed(12345)
+    counts = np.random.poisson(3, 2000)
+    array = ak._v2.operations.unflatten(np.arange(counts.sum()), counts)
+    expected = to_list(ak._v2.operations.sum(array, axis=-1))
+
+    errors, results = [], []
+
+    def run(n):
+        try:
+            with ak._v2.parallel.num_threads(n):
+                for _ in range(20):
+                    results.append(to_list(ak._v2.operations.sum(array, axis=-1)))
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(results) == 160
+    assert all(result == expected for result in results)
@@ -0,0 +1,174 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def unfused(monkeypatch, function, *args, **kwargs):
+    with monkeypatch.context() as m:
+        m.setattr(ak._v2._moments.Segments, "of", lambda *args, **kwargs: None)
+        return function(*args, **kwargs)
+
+
+def check(monkeypatch, function, *args, **kwargs):
+    with np.errstate(divide="ignore"):
+        expected = unfused(monkeypatch, function, *args, **kwargs)
+        result = function(*args, **kwargs)
+    if isinstance(expected, ak._v2.Array):
+        assert str(result.type) == str(expected.type)
+        result, expected = to_list(result), to_list(expected)
+        if kwargs.get("keepdims", False):
+            result = [x if x is None else x[0] for x in result]
+            expected = [x if x is None else x[0] for x in expected]
+    else:
+        assert isinstance(result, np.floating)
+        assert result.dtype == expected.dtype
+    # float32 sums are only computed in float32 by the unfused operations
+    assert result == pytest.approx(expected, rel=1e-5, abs=1e-6, nan_ok=True)
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.uint32, np.float32, np.float64])
+@pytest.mark.parametrize("weighted", [False, True])
+def test_same_as_unfused(monkeypatch, dtype, weighted):
+    np.random.seed(12345)
+    counts = np.random.poisson(3, 100)
+    counts[::7] = 0
+    counts[1] = 1
+    x = ak._v2.operations.unflatten(
+        np.random.randint(0, 10, counts.sum()).astype(dtype), counts
+    )
+    y = ak._v2.operations.unflatten(
+        np.random.randint(0, 10, counts.sum()).astype(dtype), counts
+    )
+    weight = None
+    if weighted:
+        weight = ak._v2.operations.unflatten(
+            np.random.randint(1, 4, counts.sum()).astype(dtype), counts
+        )
+
+    for axis in (-1, 1, None):
+        for kwargs in [{}, {"keepdims": True}, {"mask_identity": False}]:
+            if axis is None and kwargs:
+                continue
+            kwargs = dict(kwargs, axis=axis, weight=weight)
+            check(monkeypatch, ak._v2.operations.mean, x, **kwargs)
+            check(monkeypatch, ak._v2.operations.var, x, **kwargs)
+            check(monkeypatch, ak._v2.operations.var, x, ddof=1, **kwargs)
+            check(monkeypatch, ak._v2.operations.std, x, **kwargs)
+            check(monkeypatch, ak._v2.operations.moment, x, 3, **kwargs)
+            check(monkeypatch, ak._v2.operations.covar, x, y, **kwargs)
+            check(monkeypatch, ak._v2.operations.corr, x, y, **kwargs)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint8, np.int32, np.float32])
+@pytest.mark.parametrize("weight_dtype", [None, np.float32, np.float64])
+def test_dtypes_same_as_unfused(monkeypatch, dtype, weight_dtype):
+    # including the dtypes of scalars at axis=None, which come from NumPy's
+    # scalar arithmetic in the unfused operations
+    counts = [3, 2, 2]
+    x = ak._v2.operations.unflatten(np.array([1, 2, 4, 5, 7, 3, 9], dtype), counts)
+    y = ak._v2.operations.unflatten(np.array([2, 1, 4, 6, 7, 1, 9], dtype), counts)
+    weight = None
+    if weight_dtype is not None:
+        weight = ak._v2.operations.unflatten(
+            np.array([1, 2, 1, 3, 1, 1, 2], weight_dtype), counts
+        )
+    for axis in (-1, None):
+        kwargs = dict(axis=axis, weight=weight)
+        check(monkeypatch, ak._v2.operations.mean, x, **kwargs)
+        check(monkeypatch, ak._v2.operations.var, x, **kwargs)
+        check(monkeypatch, ak._v2.operations.std, x, ddof=1, **kwargs)
+        check(monkeypatch, ak._v2.operations.covar, x, y, **kwargs)
+        check(monkeypatch, ak._v2.operations.corr, x, y, **kwargs)
+
+
+def test_narrow_integers_do_not_overflow():
+    # the unfused ak.moment computed x**n in the dtype of x, which overflows
+    x = ak._v2.Array(np.array([1, 2, 4, 5, 7, 3, 9], np.uint8))
+    assert ak._v2.operations.moment(x, 3, axis=None) == pytest.approx(
+        np.mean(np.array([1, 2, 4, 5, 7, 3, 9], np.float64) ** 3)
+    )
+
+
+def test_narrow_weights_do_not_overflow(monkeypatch):
+    # the unfused operations computed x*weight in the dtype of x and weight,
+    # which overflows for uint8; the fused ones give the float64 results
+    values = {
+        "x": np.array([200, 100, 250, 30], np.uint8),
+        "y": np.array([10, 250, 3, 7], np.uint8),
+        "weight": np.array([200, 3, 250, 2], np.uint8),
+    }
+    narrow = {k: ak._v2.Array(v) for k, v in values.items()}
+    wide = {k: ak._v2.Array(v.astype(np.float64)) for k, v in values.items()}
+
+    for function, args in [
+        (ak._v2.operations.mean, ("x",)),
+        (ak._v2.operations.var, ("x",)),
+        (ak._v2.operations.covar, ("x", "y")),
+        (ak._v2.operations.corr, ("x", "y")),
+    ]:
+        result = function(
+            *[narrow[k] for k in args], weight=narrow["weight"], axis=None
+        )
+        expected = unfused(
+            monkeypatch,
+            function,
+            *[wide[k] for k in args],
+            weight=wide["weight"],
+            axis=None,
+        )
+        assert result == pytest.approx(expected, rel=1e-12)
+
+    assert ak._v2.operations.mean(
+        narrow["x"], weight=narrow["weight"], axis=None
+    ) == pytest.approx(np.average(values["x"], weights=values["weight"]))
+    assert unfused(
+        monkeypatch,
+        ak._v2.operations.mean,
+        narrow["x"],
+        weight=narrow["weight"],
+        axis=None,
+    ) != pytest.approx(np.average(values["x"], weights=values["weight"]))
+
+
+def test_flat_and_fallbacks(monkeypatch):
+    flat = ak._v2.Array(np.array([1.0, 2.0, 4.0, 8.0]))
+    assert ak._v2.operations.var(flat, axis=None) == pytest.approx(np.var(flat))
+    check(monkeypatch, ak._v2.operations.mean, flat, axis=None)
+    check(monkeypatch, ak._v2.operations.mean, flat, axis=-1)
+
+    # these are not contiguous segments of numbers; the general path is used
+    nested = ak._v2.Array([[[1.0, 2.0], []], [], [[3.0, 4.0, 6.0]]])
+    missing = ak._v2.Array([[1.0, None, 3.0], [], [4.0, 5.0]])
+    for array in (nested, missing, nested[::-1]):
+        assert ak._v2._moments.Segments.of(-1, array.layout) is None
+    assert to_list(ak._v2.operations.var(missing, axis=-1)) == [1.0, None, 0.25]
+
+    x = ak._v2.Array([[1.0, 2.0, 3.0], [], [4.0, 5.0]])
+    weight = ak._v2.Array([1.0, 0.0, 2.0])
+    assert ak._v2._moments.Segments.of(-1, x.layout, weight=weight.layout) is None
+    check(monkeypatch, ak._v2.operations.mean, x, weight=weight, axis=-1)
+    assert ak._v2._moments.Segments.of(0, x.layout) is None
+
+
+def test_stability():
+    # a large offset with a small spread loses all precision in sum(x**2)
+    x = ak._v2.operations.unflatten(
+        np.array([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16, 1, 2, 3]), [4, 3]
+    )
+    assert to_list(ak._v2.operations.var(x, axis=-1)) == pytest.approx([22.5, 2 / 3])
+    assert to_list(ak._v2.operations.corr(x, x, axis=-1)) == pytest.approx([1.0, 1.0])
+
+
+def test_zero_and_negative_weights():
+    x = ak._v2.Array([[1.0, 2.0, 4.0], [5.0, 7.0], [3.0, 9.0]])
+    weight = ak._v2.Array([[1.0, -1.0, 2.0], [0.0, 0.0], [2.0, -2.0]])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = to_list(ak._v2.operations.mean(x, weight=weight, axis=-1))
+    assert result[0] == pytest.approx((1.0 - 2.0 + 8.0) / 2.0)
+    assert np.isnan(result[1])
+    assert np.isinf(result[2])
@@ -0,0 +1,201 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def reference(data, method):
+    # distinct items, counts and inverse of a Python list without None
+    keys = [np.nan if x != x else x for x in data]
+    if method == "hash":
+        distinct = []
+        for x in keys:
+            if not any(x == y or (x != x and y != y) for y in distinct):
+                distinct.append(x)
+    else:
+        # like ak.sort, NaN comes first
+        distinct = sorted(set(x for x in keys if x == x))
+        if any(x != x for x in keys):
+            distinct.insert(0, np.nan)
+    position = [
+        next(i for i, y in enumerate(distinct) if x == y or (x != x and y != y))
+        for x in keys
+    ]
+    counts = [position.count(i) for i in range(len(distinct))]
+    return distinct, counts, position
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+@pytest.mark.parametrize(
+    "dtype",
+    [np.bool_, np.int8, np.uint16, np.int32, np.int64, np.float32, np.float64],
+)
+def test_numbers(method, dtype):
+    rng = np.random.default_rng(1538)
+    counts = rng.integers(0, 20, 100)
+    content = rng.integers(0, 8, counts.sum()).astype(dtype)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    array = ak._v2.Array(
+        ak._v2.contents.ListOffsetArray(
+            ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+        )
+    )
+
+    uniques, counts, inverse = ak._v2.operations.unique(
+        array, axis=-1, method=method, return_counts=True, return_inverse=True
+    )
+    expected = [reference(x, method) for x in to_list(array)]
+    assert to_list(uniques) == [x[0] for x in expected]
+    assert to_list(counts) == [x[1] for x in expected]
+    assert to_list(inverse) == [x[2] for x in expected]
+    assert to_list(uniques[inverse]) == to_list(array)
+
+    uniques, counts, inverse = ak._v2.operations.unique(
+        array, method=method, return_counts=True, return_inverse=True
+    )
+    distinct, expected_counts, position = reference(content.tolist(), method)
+    assert to_list(uniques) == distinct
+    assert to_list(counts) == expected_counts
+    assert to_list(ak._v2.operations.flatten(inverse)) == position
+    assert str(uniques.type) == "{} * {}".format(
+        len(distinct), array.type.content.content
+    )
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_floats(method):
+    array = ak._v2.Array([[1.5, np.nan, -0.0, 0.0, np.nan, 1.5], [], [np.inf]])
+    uniques, counts = ak._v2.operations.unique(
+        array, axis=-1, method=method, return_counts=True
+    )
+    assert to_list(counts) == [[2, 2, 2], [], [1]]
+    result = to_list(uniques)
+    if method == "hash":
+        assert result[0][0] == 1.5 and np.isnan(result[0][1]) and result[0][2] == 0
+    else:
+        assert np.isnan(result[0][0]) and result[0][1] == 0 and result[0][2] == 1.5
+    assert result[1:] == [[], [np.inf]]
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_missing(method):
+    array = ak._v2.Array([[3, None, 1, 3], None, [None], [2, 2]])
+    uniques, counts, inverse = ak._v2.operations.unique(
+        array, axis=-1, method=method, return_counts=True, return_inverse=True
+    )
+    if method == "hash":
+        assert to_list(uniques) == [[3, 1], None, [], [2]]
+        assert to_list(counts) == [[2, 1], None, [], [2]]
+        assert to_list(inverse) == [[0, None, 1, 0], None, [None], [0, 0]]
+    else:
+        assert to_list(uniques) == [[1, 3], None, [], [2]]
+        assert to_list(inverse) == [[1, None, 0, 1], None, [None], [0, 0]]
+
+    uniques, inverse = ak._v2.operations.unique(
+        array, method=method, return_inverse=True
+    )
+    if method == "hash":
+        assert to_list(uniques) == [3, 1, 2]
+        assert to_list(inverse) == [[0, None, 1, 0], None, [None], [2, 2]]
+    else:
+        assert to_list(uniques) == [1, 2, 3]
+        assert to_list(inverse) == [[2, None, 0, 2], None, [None], [1, 1]]
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_strings(method):
+    array = ak._v2.Array([["b", "a", "", "b", "ab"], [], ["a", "a"]])
+    uniques, counts, inverse = ak._v2.operations.unique(
+        array, axis=-1, method=method, return_counts=True, return_inverse=True
+    )
+    if method == "hash":
+        assert to_list(uniques) == [["b", "a", "", "ab"], [], ["a"]]
+        assert to_list(counts) == [[2, 1, 1, 1], [], [2]]
+    else:
+        assert to_list(uniques) == [["", "a", "ab", "b"], [], ["a"]]
+        assert to_list(counts) == [[1, 1, 1, 2], [], [2]]
+    assert str(uniques.type) == "3 * var * string"
+    assert to_list(uniques[inverse]) == to_list(array)
+
+    assert to_list(ak._v2.operations.unique(array, method=method)) == (
+        ["b", "a", "", "ab"] if method == "hash" else ["", "a", "ab", "b"]
+    )
+    flat = ak._v2.Array(["one", "two", "one", "three"])
+    assert to_list(ak._v2.operations.unique(flat, axis=-1, method=method)) == (
+        ["one", "two", "three"] if method == "hash" else ["one", "three", "two"]
+    )
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_records(method):
+    array = ak._v2.Array(
+        [
+            [
+                {"x": 2, "y": "b"},
+                {"x": 1, "y": "b"},
+                {"x": 2, "y": "b"},
+                {"x": 2, "y": "a"},
+                {"x": 1, "y": None},
+            ],
+            [{"x": 3, "y": "c"}, {"x": 3, "y": "c"}],
+        ]
+    )
+    uniques, counts = ak._v2.operations.unique(
+        array, axis=-1, method=method, return_counts=True
+    )
+    if method == "hash":
+        assert to_list(uniques) == [
+            [
+                {"x": 2, "y": "b"},
+                {"x": 1, "y": "b"},
+                {"x": 2, "y": "a"},
+                {"x": 1, "y": None},
+            ],
+            [{"x": 3, "y": "c"}],
+        ]
+        assert to_list(counts) == [[2, 1, 1, 1], [2]]
+    else:
+        assert to_list(uniques) == [
+            [
+                {"x": 1, "y": "b"},
+                {"x": 1, "y": None},
+                {"x": 2, "y": "a"},
+                {"x": 2, "y": "b"},
+            ],
+            [{"x": 3, "y": "c"}],
+        ]
+        assert to_list(counts) == [[1, 1, 1, 2], [2]]
+    assert len(ak._v2.operations.unique(array, method=method)) == 5
+
+
+def test_nested():
+    array = ak._v2.Array([[[1, 1, 2], []], [], [[3, 2, 3, 3]]])
+    assert to_list(ak._v2.operations.unique(array, axis=-1)) == [
+        [[1, 2], []],
+        [],
+        [[3, 2]],
+    ]
+    assert to_list(ak._v2.operations.unique(array)) == [1, 2, 3]
+
+    regular = np.array([[1, 1, 2], [3, 3, 3]])
+    assert to_list(ak._v2.operations.unique(regular, axis=-1)) == [[1, 2], [3]]
+    assert to_list(ak._v2.operations.unique(regular)) == [1, 2, 3]
+
+
+def test_is_unique():
+    array = ak._v2.Array([[1, 2, 3], [1, 2], [None, None]])
+    for method in ("hash", "sort"):
+        assert not ak._v2.operations.is_unique(array, method=method)
+        assert ak._v2.operations.is_unique(array, axis=-1, method=method)
+        assert ak._v2.operations.is_unique(ak._v2.Array(["a", "b", "c"]), method=method)
+        assert not ak._v2.operations.is_unique(ak._v2.Array([[], ["a", "a"]]), axis=-1)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak._v2.operations.unique(ak._v2.Array([1, 2]), method="other")
+    with pytest.raises(NotImplementedError):
+        ak._v2.operations.unique(ak._v2.Array([[1, 2]]), axis=0)
@@ -0,0 +1,154 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+records = [
+    {"k": 3, "s": "c", "x": 1.5, "y": 1},
+    {"k": 1, "s": "a", "x": 2.5, "y": None},
+    {"k": 3, "s": "c", "x": -1.0, "y": 5},
+    {"k": 2, "s": "b", "x": 0.0, "y": None},
+    {"k": 1, "s": "a", "x": 4.0, "y": 2},
+]
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_groups(method):
+    array = ak._v2.Array(records)
+    groups = ak._v2.operations.group_by(array, "k", method=method)
+    order = [3, 1, 2] if method == "hash" else [1, 2, 3]
+    assert to_list(groups) == [[r for r in records if r["k"] == k] for k in order]
+    assert str(groups.type).startswith("3 * var * {")
+
+    groups = ak._v2.operations.group_by(array, "s", method=method)
+    assert to_list(groups.k) == [[k, k] if k != 2 else [k] for k in order]
+
+
+def test_sort_matches_run_lengths():
+    rng = np.random.default_rng(1539)
+    array = ak._v2.Array({"k": rng.integers(0, 50, 1000), "x": rng.random(1000)})
+    sorted = array[ak._v2.operations.argsort(array.k, stable=True)]
+    expected = ak._v2.operations.unflatten(
+        sorted, ak._v2.operations.run_lengths(sorted.k)
+    )
+    groups = ak._v2.operations.group_by(array, "k", method="sort")
+    assert to_list(groups) == to_list(expected)
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_aggregations(method):
+    array = ak._v2.Array(records)
+    out = ak._v2.operations.group_by(
+        array,
+        "k",
+        method=method,
+        aggregations={
+            "n": "count",
+            "total": ("sum", "x"),
+            "low": ("min", "x"),
+            "high": ("max", "x"),
+            "average": ("mean", "x"),
+            "start": ("first", "s"),
+            "end": ("last", "y"),
+            "ny": ("count", "y"),
+            "ymax": ("max", "y"),
+        },
+    )
+    expected = {
+        1: {"n": 2, "total": 6.5, "low": 2.5, "high": 4.0, "average": 3.25},
+        2: {"n": 1, "total": 0.0, "low": 0.0, "high": 0.0, "average": 0.0},
+        3: {"n": 2, "total": 0.5, "low": -1.0, "high": 1.5, "average": 0.25},
+    }
+    expected[1].update({"start": "a", "end": 2, "ny": 1, "ymax": 2})
+    expected[2].update({"start": "b", "end": None, "ny": 0, "ymax": None})
+    expected[3].update({"start": "c", "end": 5, "ny": 2, "ymax": 5})
+    order = [3, 1, 2] if method == "hash" else [1, 2, 3]
+    assert to_list(out) == [dict(k=k, **expected[k]) for k in order]
+    assert out.fields[:2] == ["k", "n"]
+    assert str(out.type.content.content("ymax")) == "?int64"
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_field_of_only_none(method):
+    array = ak._v2.Array(
+        [{"k": 1, "v": None}, {"k": 2, "v": None}, {"k": 1, "v": None}]
+    )
+    assert str(array.type) == "3 * {k: int64, v: ?unknown}"
+    out = ak._v2.operations.group_by(
+        array,
+        "k",
+        method=method,
+        aggregations={f: (f, "v") for f in ["sum", "count", "min", "max", "mean"]},
+    )
+    empty = {"sum": 0.0, "count": 0, "min": None, "max": None, "mean": None}
+    assert to_list(out) == [dict(k=1, **empty), dict(k=2, **empty)]
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_compound_key(method):
+    array = ak._v2.Array(
+        [
+            {"a": 1, "b": "x", "v": 1},
+            {"a": 1, "b": "y", "v": 2},
+            {"a": 1, "b": "x", "v": 3},
+            {"a": None, "b": "x", "v": 4},
+            {"a": None, "b": "x", "v": 5},
+        ]
+    )
+    out = ak._v2.operations.group_by(
+        array, ["a", "b"], method=method, aggregations={"v": ("sum", "v")}
+    )
+    result = to_list(out)
+    expected = [
+        {"a": 1, "b": "x", "v": 4},
+        {"a": 1, "b": "y", "v": 2},
+        {"a": None, "b": "x", "v": 9},
+    ]
+    assert result == expected
+
+
+@pytest.mark.parametrize("method", ["hash", "sort"])
+def test_sublists(method):
+    array = ak._v2.Array(
+        [
+            [{"k": 2, "x": 1}, {"k": 1, "x": 2}, {"k": 2, "x": 3}],
+            [],
+            None,
+            [{"k": 5, "x": 4}, None],
+        ]
+    )
+    groups = ak._v2.operations.group_by(array, "k", axis=-1, method=method)
+    first = [[{"k": 2, "x": 1}, {"k": 2, "x": 3}], [{"k": 1, "x": 2}]]
+    if method == "sort":
+        first = first[::-1]
+    assert to_list(groups) == [first, [], None, [[{"k": 5, "x": 4}]]]
+
+    out = ak._v2.operations.group_by(
+        array, "k", axis=-1, method=method, aggregations={"x": ("sum", "x")}
+    )
+    first = [{"k": 2, "x": 4}, {"k": 1, "x": 2}]
+    if method == "sort":
+        first = first[::-1]
+    assert to_list(out) == [first, [], None, [{"k": 5, "x": 4}]]
+
+    flat = ak._v2.Array(records)
+    assert to_list(ak._v2.operations.group_by(flat, "k", axis=-1)) == to_list(
+        ak._v2.operations.group_by(flat, "k")
+    )
+
+
+def test_errors():
+    array = ak._v2.Array(records)
+    with pytest.raises(ValueError):
+        ak._v2.operations.group_by(array, "z")
+    with pytest.raises(ValueError):
+        ak._v2.operations.group_by(array, "k", aggregations={"x": ("median", "x")})
+    with pytest.raises(ValueError):
+        ak._v2.operations.group_by(array, "k", aggregations={"k": "count"})
+    with pytest.raises(TypeError):
+        ak._v2.operations.group_by(array, "k", aggregations={"s": ("sum", "s")})
+    with pytest.raises(ValueError):
+        ak._v2.operations.group_by(ak._v2.Array([[records]]), "k", axis=0)
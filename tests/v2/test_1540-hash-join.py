@@ -0,0 +1,176 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+def reference(left, right, on, how):
+    out = []
+    for x in left:
+        matches = [
+            y for y in right if all(x[k] is not None and x[k] == y[k] for k in on)
+        ]
+        for y in matches:
+            out.append(dict(x, **{k: v for k, v in y.items() if k not in on}))
+        if how == "left" and len(matches) == 0:
+            out.append(dict(x, **{k: None for k in right[0] if k not in on}))
+    return out
+
+
+left = [
+    {"id": 1, "pt": 10.0},
+    {"id": 3, "pt": 20.0},
+    {"id": None, "pt": 25.0},
+    {"id": 2, "pt": 30.0},
+    {"id": 1, "pt": 40.0},
+]
+right = [
+    {"id": 2, "pdg": 13},
+    {"id": 1, "pdg": 11},
+    {"id": None, "pdg": 0},
+    {"id": 1, "pdg": -11},
+]
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_flat(how):
+    out = ak._v2.operations.join(
+        ak._v2.Array(left), ak._v2.Array(right), on="id", how=how
+    )
+    assert to_list(out) == reference(left, right, ["id"], how)
+    assert out.fields == ["id", "pt", "pdg"]
+
+
+def test_lazy_fields():
+    out = ak._v2.operations.join(
+        ak._v2.Array(left), ak._v2.Array(right), on="id", how="left", highlevel=False
+    )
+    assert isinstance(out.content("pt"), ak._v2.contents.IndexedArray)
+    assert isinstance(out.content("pdg"), ak._v2.contents.IndexedOptionArray)
+
+    out = ak._v2.operations.join(
+        ak._v2.Array(left[:2]), ak._v2.Array(right), on="id", highlevel=False
+    )
+    assert isinstance(out.content("pt"), ak._v2.contents.IndexedArray)
+    out = ak._v2.operations.join(
+        ak._v2.Array([left[3], left[0]]),
+        ak._v2.Array(right[:2]),
+        on="id",
+        highlevel=False,
+    )
+    assert isinstance(out.content("pt"), ak._v2.contents.NumpyArray)
+    assert to_list(out) == [
+        {"id": 2, "pt": 30.0, "pdg": 13},
+        {"id": 1, "pt": 10.0, "pdg": 11},
+    ]
+
+
+def test_compound_and_strings():
+    one = [
+        {"run": 1, "name": "a", "x": 1},
+        {"run": 1, "name": "b", "x": 2},
+        {"run": 2, "name": "a", "x": 3},
+    ]
+    two = [
+        {"run": 2, "name": "a", "calib": 0.5},
+        {"run": 1, "name": "b", "calib": 1.5},
+        {"run": 1, "name": "c", "calib": 2.5},
+    ]
+    for how in ("inner", "left"):
+        out = ak._v2.operations.join(
+            ak._v2.Array(one), ak._v2.Array(two), on=["run", "name"], how=how
+        )
+        assert to_list(out) == reference(one, two, ["run", "name"], how)
+        out = ak._v2.operations.join(
+            ak._v2.Array(one), ak._v2.Array(two)[["name", "calib"]], on="name", how=how
+        )
+        assert to_list(out) == reference(
+            one, [{"name": y["name"], "calib": y["calib"]} for y in two], ["name"], how
+        )
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_sublists(how):
+    rng = np.random.default_rng(1540)
+    lefts, rights = [], []
+    for _ in range(50):
+        lefts.append(
+            [
+                {"id": int(i), "a": float(a)}
+                for i, a in zip(rng.integers(0, 5, rng.integers(0, 6)), rng.random(6))
+            ]
+        )
+        rights.append(
+            [
+                {"id": int(i), "b": int(b)}
+                for i, b in zip(rng.integers(0, 5, rng.integers(0, 6)), range(6))
+            ]
+        )
+    out = ak._v2.operations.join(
+        ak._v2.Array(lefts), ak._v2.Array(rights), on="id", how=how, axis=1
+    )
+    expected = [
+        reference(x, y if len(y) > 0 else [{"id": None, "b": None}], ["id"], how)
+        for x, y in zip(lefts, rights)
+    ]
+    assert to_list(out) == expected
+    assert str(out.type).startswith("50 * var * {")
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_no_records(how):
+    lists = ak._v2.Array([left[:2], [], left[2:]])
+    empty = ak._v2.Array([[], [], []])
+    out = ak._v2.operations.join(lists, empty, on="id", how=how, axis=1)
+    assert to_list(out) == (to_list(lists) if how == "left" else [[], [], []])
+    assert out.fields == ["id", "pt"]
+    out = ak._v2.operations.join(empty, lists, on="id", how=how, axis=1)
+    assert to_list(out) == [[], [], []]
+
+    out = ak._v2.operations.join(ak._v2.Array(left), ak._v2.Array([]), on="id", how=how)
+    assert to_list(out) == (left if how == "left" else [])
+    out = ak._v2.operations.join(
+        ak._v2.Array([]), ak._v2.Array(right), on="id", how=how
+    )
+    assert to_list(out) == []
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_missing_records(how):
+    out = ak._v2.operations.join(
+        ak._v2.Array([left[0], None] + left[1:]),
+        ak._v2.Array([None] + right),
+        on="id",
+        how=how,
+    )
+    assert to_list(out) == reference(left, right, ["id"], how)
+
+    lists = ak._v2.Array([left[:2] + [None], None, left[2:], []])
+    others = ak._v2.Array([right, right, None, None])
+    out = ak._v2.operations.join(lists, others, on="id", how=how, axis=1)
+    assert to_list(out) == [
+        reference(left[:2], right, ["id"], how),
+        None,
+        [] if how == "inner" else [dict(x, pdg=None) for x in left[2:]],
+        [],
+    ]
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        ak._v2.operations.join(ak._v2.Array(left), ak._v2.Array(right), on="x")
+    with pytest.raises(ValueError):
+        ak._v2.operations.join(
+            ak._v2.Array(left), ak._v2.Array(right), on="id", how="outer"
+        )
+    with pytest.raises(ValueError):
+        ak._v2.operations.join(ak._v2.Array(left), ak._v2.Array(left), on="id")
+    with pytest.raises(ValueError):
+        ak._v2.operations.join(
+            ak._v2.Array([left]), ak._v2.Array([right, right]), on="id", axis=1
+        )
+    with pytest.raises(ValueError, match="records with fields, not int64"):
+        ak._v2.operations.join(ak._v2.Array([1, 2]), ak._v2.Array(right), on="id")
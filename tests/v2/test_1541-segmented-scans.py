@@ -0,0 +1,125 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+scans = {
+    "cumsum": np.cumsum,
+    "cumprod": np.cumprod,
+    "cummin": np.minimum.accumulate,
+    "cummax": np.maximum.accumulate,
+}
+
+
+def reference(function, lists):
+    return [
+        None if x is None else function(np.asarray(x)).tolist() if len(x) else []
+        for x in lists
+    ]
+
+
+@pytest.mark.parametrize("name", list(scans))
+@pytest.mark.parametrize(
+    "dtype", [np.int8, np.int64, np.uint16, np.float32, np.float64]
+)
+def test_lists(name, dtype):
+    rng = np.random.default_rng(1541)
+    counts = rng.integers(0, 8, 100)
+    content = rng.integers(1, 5, counts.sum()).astype(dtype)
+    array = ak._v2.operations.unflatten(content, counts)
+    lists = [x.tolist() for x in np.split(content, np.cumsum(counts)[:-1])]
+    out = getattr(ak._v2.operations, name)(array)
+    assert to_list(out) == reference(scans[name], lists)
+    assert out.layout.offsets.data.tolist() == array.layout.offsets.data.tolist()
+    if name in ("cummin", "cummax"):
+        assert out.layout.content.dtype == dtype
+    else:
+        assert (
+            out.layout.content.dtype == np.asarray(scans[name](np.ones(1, dtype))).dtype
+        )
+
+
+@pytest.mark.parametrize("name", list(scans))
+def test_structure(name):
+    array = ak._v2.Array([[[1, 2, None, 3], []], None, [[4, 5]], [[None]]])
+    out = getattr(ak._v2.operations, name)(array)
+    assert str(out.type) == str(array.type)
+    function = scans[name]
+    expected = [
+        (
+            [
+                [
+                    None if x is None else function(np.array(lst))[i]
+                    for x, i in zip(y, np.cumsum([x is not None for x in y]) - 1)
+                ]
+                for y, lst in ((y, [x for x in y if x is not None]) for y in outer)
+            ]
+            if outer is not None
+            else None
+        )
+        for outer in to_list(array)
+    ]
+    assert to_list(out) == expected
+
+    regular = ak._v2.operations.to_regular(
+        ak._v2.Array([[1.5, 2.0, 3.0], [4.0, -5.0, 6.0]]), axis=1
+    )
+    out = getattr(ak._v2.operations, name)(regular)
+    assert str(out.type) == "2 * 3 * float64"
+    assert to_list(out) == function(np.array(to_list(regular)), axis=1).tolist()
+
+    numpy = ak._v2.contents.NumpyArray(np.arange(1, 13).reshape(3, 4))
+    assert (
+        to_list(getattr(ak._v2.operations, name)(numpy, axis=1))
+        == function(np.arange(1, 13).reshape(3, 4), axis=1).tolist()
+    )
+
+
+def test_records_and_axes():
+    array = ak._v2.Array(
+        [[{"x": 1, "y": [1.5]}, {"x": 2, "y": [2.5, 1.0]}], [], [{"x": 3, "y": []}]]
+    )
+    out = ak._v2.operations.cumsum(array)
+    assert to_list(out) == [
+        [{"x": 1, "y": [1.5]}, {"x": 3, "y": [2.5, 3.5]}],
+        [],
+        [{"x": 3, "y": []}],
+    ]
+
+    lists = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    assert to_list(ak._v2.operations.cumsum(lists, axis=1)) == [[1, 3, 6], [], [4, 9]]
+    assert to_list(ak._v2.operations.cumsum(lists, axis=None)) == [1, 3, 6, 10, 15]
+    assert to_list(ak._v2.operations.cumsum(ak._v2.Array([1, None, 2]))) == [
+        1,
+        None,
+        3,
+    ]
+    with pytest.raises(NotImplementedError):
+        ak._v2.operations.cumsum(lists, axis=0)
+    with pytest.raises(TypeError):
+        ak._v2.operations.cumsum(ak._v2.Array([["a", "b"], ["c"]]))
+
+
+def test_nan_and_datetime():
+    array = ak._v2.Array([[3.0, np.nan, 1.0], [2.0, 1.0]])
+    assert to_list(ak._v2.operations.cummin(array)) == [
+        [3.0, pytest.approx(np.nan, nan_ok=True), pytest.approx(np.nan, nan_ok=True)],
+        [2.0, 1.0],
+    ]
+
+    times = np.array(["2020-01-03", "2020-01-01", "2020-01-02"], "datetime64[D]")
+    array = ak._v2.Array([times, times[:1]])
+    out = ak._v2.operations.cummin(array)
+    assert to_list(out) == [
+        np.minimum.accumulate(times).tolist(),
+        times[:1].tolist(),
+    ]
+    deltas = ak._v2.operations.cumsum(
+        ak._v2.Array([times - times[1], times[:1] - times[1]])
+    )
+    assert to_list(deltas)[0] == np.cumsum(times - times[1]).tolist()
+    with pytest.raises(TypeError):
+        ak._v2.operations.cumsum(array)
@@ -0,0 +1,96 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize(
+    "dtype", [np.bool_, np.int8, np.uint32, np.float32, np.float64]
+)
+def test_same_as_sort(largest, dtype):
+    rng = np.random.default_rng(1542)
+    counts = rng.integers(0, 20, 200)
+    content = rng.integers(0, 10, counts.sum()).astype(dtype)
+    if dtype == np.float64:
+        content[rng.integers(0, len(content), 20)] = np.nan
+    array = ak._v2.operations.unflatten(content, counts)
+    for k in (0, 1, 4, 30):
+        positions = ak._v2.operations.argsort(array, ascending=not largest)[:, :k]
+        assert to_list(
+            ak._v2.operations.argtop_k(array, k, largest=largest)
+        ) == to_list(positions)
+        out = ak._v2.operations.top_k(array, k, largest=largest)
+        assert out.layout.content.dtype == dtype
+        assert np.array_equal(
+            ak._v2.operations.flatten(out).to_numpy(),
+            ak._v2.operations.flatten(array[positions]).to_numpy(),
+            equal_nan=dtype == np.float64,
+        )
+
+
+def test_missing_values():
+    array = ak._v2.Array([[3, None, 5, 1], None, [], [None, 2], [4, 4, None]])
+    assert to_list(ak._v2.operations.argtop_k(array, 2)) == [
+        [2, 0],
+        None,
+        [],
+        [1],
+        [0, 1],
+    ]
+    assert to_list(ak._v2.operations.top_k(array, 2)) == [
+        [5, 3],
+        None,
+        [],
+        [2],
+        [4, 4],
+    ]
+    assert to_list(ak._v2.operations.top_k(array, 2, largest=False)) == [
+        [1, 3],
+        None,
+        [],
+        [2],
+        [4, 4],
+    ]
+    flat = ak._v2.Array([2.2, None, 5.5, 1.1])
+    assert to_list(ak._v2.operations.argtop_k(flat, 2)) == [2, 0]
+    assert to_list(ak._v2.operations.top_k(flat, 2)) == [5.5, 2.2]
+
+
+def test_structure():
+    array = ak._v2.Array(
+        [{"x": [[1, 9, 3], []], "y": 1}, {"x": [[7, 8]], "y": 2}], with_name="event"
+    )
+    out = ak._v2.operations.top_k(array.x, 2)
+    assert to_list(out) == [[[9, 3], []], [[8, 7]]]
+    assert str(out.type) == "2 * var * var * int64"
+
+    regular = ak._v2.operations.to_regular(ak._v2.Array([[1, 4, 2], [6, 5, 3]]))
+    out = ak._v2.operations.top_k(regular, 2)
+    assert str(out.type) == "2 * 2 * int64"
+    assert to_list(out) == [[4, 2], [6, 5]]
+    numpy = ak._v2.contents.NumpyArray(np.array([[1, 4, 2], [6, 5, 3]]))
+    assert to_list(ak._v2.operations.argtop_k(numpy, 5, axis=1)) == [
+        [1, 2, 0],
+        [0, 1, 2],
+    ]
+
+    times = np.array(["2020-01-03", "2020-01-01", "2020-01-02"], "datetime64[D]")
+    out = ak._v2.operations.top_k(ak._v2.Array([times]), 1, largest=False)
+    assert out.layout.content.dtype == times.dtype
+    assert to_list(ak._v2.operations.argtop_k(ak._v2.Array([times]), 1)) == [[0]]
+
+
+def test_errors():
+    array = ak._v2.Array([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        ak._v2.operations.top_k(array, -1)
+    with pytest.raises(NotImplementedError):
+        ak._v2.operations.top_k(array, 1, axis=0)
+    with pytest.raises(TypeError):
+        ak._v2.operations.top_k(ak._v2.Array([["a", "b"]]), 1)
+    with pytest.raises(TypeError):
+        ak._v2.operations.top_k(ak._v2.Array([[{"x": 1}]]), 1)
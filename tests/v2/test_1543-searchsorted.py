@@ -0,0 +1,80 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_per_list(side):
+    rng = np.random.default_rng(1543)
+    sorted_lists = [
+        np.sort(rng.integers(0, 20, rng.integers(0, 10))) for _ in range(50)
+    ]
+    values = [rng.integers(-1, 21, rng.integers(0, 5)) for _ in range(50)]
+    out = ak._v2.operations.searchsorted(
+        ak._v2.Array([x.tolist() for x in sorted_lists]),
+        ak._v2.Array([x.tolist() for x in values]),
+        side=side,
+    )
+    assert to_list(out) == [
+        np.searchsorted(x, y, side=side).tolist() for x, y in zip(sorted_lists, values)
+    ]
+
+    scalars = rng.random(50) * 20
+    out = ak._v2.operations.searchsorted(
+        ak._v2.Array([x.tolist() for x in sorted_lists]), scalars, side=side
+    )
+    assert to_list(out) == [
+        int(np.searchsorted(x, y, side=side)) for x, y in zip(sorted_lists, scalars)
+    ]
+
+
+def test_global_edges():
+    edges = np.array([0.0, 1.0, 2.5, 10.0])
+    array = ak._v2.Array([[0.5, -1.0, 2.5], [], [11.0, None], None, [[1.0]]])
+    out = ak._v2.operations.searchsorted(edges, array, side="right")
+    assert to_list(out) == [
+        np.digitize([0.5, -1.0, 2.5], edges).tolist(),
+        [],
+        [4, None],
+        None,
+        [[2]],
+    ]
+    assert ak._v2.operations.searchsorted(edges, 2.0) == 2
+    assert to_list(ak._v2.operations.searchsorted(ak._v2.Array([1, 2, 3]), 2.5)) == 2
+
+
+def test_broadcasting_and_missing():
+    sorted_lists = ak._v2.Array([[[1, 3], [2]], [], None, [[None], [5, 6, None]]])
+    out = ak._v2.operations.searchsorted(sorted_lists, ak._v2.Array([2, 0, 1, 7]))
+    assert to_list(out) == [[1, 0], [], None, [0, 2]]
+
+    out = ak._v2.operations.searchsorted(
+        sorted_lists, ak._v2.Array([[[0, 4], [2]], [], [[1]], [None, [6.5]]])
+    )
+    assert to_list(out) == [[[0, 2], [0]], [], None, [None, [2]]]
+
+    regular = ak._v2.contents.NumpyArray(np.array([[1, 2, 3], [4, 5, 6]]))
+    out = ak._v2.operations.searchsorted(regular, ak._v2.Array([[2, 3], [7]]))
+    assert to_list(out) == [[1, 2], [3]]
+
+    times = np.array(["2020-01-01", "2020-01-03"], "datetime64[D]")
+    out = ak._v2.operations.searchsorted(
+        ak._v2.Array([times]), ak._v2.Array([[np.datetime64("2020-01-02", "D")]])
+    )
+    assert to_list(out) == [[1]]
+
+
+def test_errors():
+    lists = ak._v2.Array([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        ak._v2.operations.searchsorted(lists, 1, side="middle")
+    with pytest.raises(NotImplementedError):
+        ak._v2.operations.searchsorted(lists, 1, axis=0)
+    with pytest.raises(ValueError):
+        ak._v2.operations.searchsorted(lists, ak._v2.Array([1, 2, 3]))
+    with pytest.raises(TypeError):
+        ak._v2.operations.searchsorted(ak._v2.Array([["a", "b"]]), 1)
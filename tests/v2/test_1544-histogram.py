@@ -0,0 +1,127 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.to_list
+
+
+@pytest.mark.parametrize("bins", [7, [-1.0, 0.0, 0.5, 3.0, 10.0]])
+@pytest.mark.parametrize("dtype", [np.int8, np.uint32, np.float32, np.float64])
+def test_same_as_numpy(bins, dtype):
+    rng = np.random.default_rng(1544)
+    counts = rng.integers(0, 20, 300)
+    content = (rng.random(counts.sum()) * 12 - 1).astype(dtype)
+    array = ak._v2.operations.unflatten(content, counts)
+    weight = rng.random(len(content))
+
+    out, edges = ak._v2.operations.histogram(array, bins)
+    expected, expected_edges = np.histogram(content, bins)
+    assert out.layout.dtype == np.int64
+    assert to_list(out) == expected.tolist()
+    assert edges.dtype == expected_edges.dtype
+    assert np.allclose(edges, expected_edges)
+
+    out, edges = ak._v2.operations.histogram(
+        array, bins, weight=ak._v2.operations.unflatten(weight, counts)
+    )
+    expected, _ = np.histogram(content, bins, weights=weight)
+    assert np.allclose(out.to_numpy(), expected)
+
+    out, edges = ak._v2.operations.histogram(array, bins, axis=-1)
+    assert str(out.type) == "300 * {} * int64".format(len(edges) - 1)
+    lists = np.split(content, np.cumsum(counts)[:-1])
+    assert to_list(out) == [np.histogram(x, edges)[0].tolist() for x in lists]
+
+
+def test_range_and_flat():
+    flat = ak._v2.Array([0.0, 1.0, 1.5, 2.0, np.nan, None, 5.0])
+    out, edges = ak._v2.operations.histogram(flat, 2, range=(0, 2))
+    assert to_list(out) == [1, 3]
+    assert edges.tolist() == [0.0, 1.0, 2.0]
+
+    out, edges = ak._v2.operations.histogram(ak._v2.Array([3, 3]), 2)
+    assert to_list(out) == [0, 2]
+    assert edges.tolist() == [2.5, 3.0, 3.5]
+
+    out, edges = ak._v2.operations.histogram(ak._v2.Array([[]]), 2)
+    assert to_list(out) == [0, 0]
+    assert edges.tolist() == [0.0, 0.5, 1.0]
+
+
+def test_float32_edges():
+    values = np.array([-1.2, -0.4, 0.4, 1.2, -2, 2], np.float32)
+    out, edges = ak._v2.operations.histogram(values, 5, range=(-2, 2))
+    assert to_list(out) == [1, 1, 1, 1, 2]
+    assert edges.dtype == np.float32
+    assert edges.tolist() == np.histogram(values, 5, range=(-2, 2))[1].tolist()
+
+    rng = np.random.default_rng(1544)
+    for _ in range(60):
+        values = rng.normal(0, 1, 1000).astype(np.float32).round(1)
+        out, edges = ak._v2.operations.histogram(values, 7, range=(-2.1, 2.1))
+        expected, expected_edges = np.histogram(values, 7, range=(-2.1, 2.1))
+        assert to_list(out) == expected.tolist()
+        assert edges.tolist() == expected_edges.tolist()
+
+
+def test_missing_values_and_weights():
+    array = ak._v2.Array([[1.0, None, 3.0], None, [], [2.0, 2.5]])
+    out, _ = ak._v2.operations.histogram(array, [0, 2, 4])
+    assert to_list(out) == [1, 3]
+    out, _ = ak._v2.operations.histogram(array, [0, 2, 4], axis=-1)
+    assert to_list(out) == [[1, 1], None, [0, 0], [0, 2]]
+
+    weight = ak._v2.Array([[10, 20, None], [1], [], [100, 1000]])
+    out, _ = ak._v2.operations.histogram(array, [0, 2, 4], weight=weight)
+    assert to_list(out) == [10.0, 1100.0]
+
+    out, _ = ak._v2.operations.histogram(
+        array, [0, 2, 4], weight=ak._v2.Array([2, 3, 4, 5]), axis=-1
+    )
+    assert to_list(out) == [[2.0, 2.0], None, [0.0, 0.0], [0.0, 10.0]]
+
+
+def test_structure_and_threads():
+    nested = ak._v2.Array([[[0.5, 1.5], []], [[2.5]]])
+    out, _ = ak._v2.operations.histogram(nested, 3, range=(0, 3), axis=2)
+    assert to_list(out) == [[[1, 1, 0], [0, 0, 0]], [[0, 0, 1]]]
+    out, _ = ak._v2.operations.histogram(nested, 3, range=(0, 3))
+    assert to_list(out) == [1, 1, 1]
+
+    listarray = ak._v2.contents.ListArray(
+        ak._v2.index.Index64(np.array([3, 0])),
+        ak._v2.index.Index64(np.array([5, 2])),
+        ak._v2.contents.NumpyArray(np.array([0.5, 1.5, 9.0, 2.5, 2.6])),
+    )
+    out, _ = ak._v2.operations.histogram(listarray, 3, range=(0, 3))
+    assert to_list(out) == [1, 1, 2]
+
+    content = np.random.default_rng(1544).normal(0, 1, 1000000)
+    array = ak._v2.operations.unflatten(content, np.full(1000, 1000))
+    expected, _ = np.histogram(content, 20, range=(-3, 3))
+    for num_threads in (1, 4):
+        with ak._v2.parallel.num_threads(num_threads):
+            out, _ = ak._v2.operations.histogram(array, 20, range=(-3, 3))
+            assert to_list(out) == expected.tolist()
+            out, _ = ak._v2.operations.histogram(content, 20, range=(-3, 3))
+            assert to_list(out) == expected.tolist()
+
+
+def test_errors():
+    array = ak._v2.Array([[1, 2], [3]])
+    with pytest.raises(ValueError):
+        ak._v2.operations.histogram(array, 0)
+    with pytest.raises(ValueError):
+        ak._v2.operations.histogram(array, [3, 2, 1])
+    with pytest.raises(ValueError):
+        ak._v2.operations.histogram(array, 2, range=(2, 1))
+    with pytest.raises(ValueError):
+        ak._v2.operations.histogram(ak._v2.Array([np.inf]), 2)
+    with pytest.raises(NotImplementedError):
+        ak._v2.operations.histogram(array, 2, axis=0)
+    with pytest.raises(TypeError):
+        ak._v2.operations.histogram(ak._v2.Array([["a", "b"]]), 2, range=(0, 1))
+    with pytest.raises(TypeError):
+        ak._v2.operations.histogram(ak._v2.Array([[{"x": 1}]]), 2, range=(0, 1))